@@ -6,10 +6,16 @@ plain Python, etc.) and emits JSON describing per-phase wall-time.
 
 Subclass the relevant base (:class:`MarkingMenuInitBench`,
 :class:`OptionBoxInitBench`, :class:`StandaloneUiInitBench`) to point
-at your project's UI / slot sources.  How the bench is *driven* —
-including spawning a fresh DCC instance — is the consumer's
-responsibility; uitk deliberately does not import ``maya``, ``max``,
-or any other host SDK.
+at your project's UI / slot sources.  Subsystem micro-benches
+(:class:`SwitchboardImportBench`, :class:`UiPreloadBench`,
+:class:`UiCompileBench`, :class:`SlotDispatchBench`,
+:class:`LazyRegisterBench`, :class:`ThemeSwitchBench`,
+:class:`SequencerRowsBench`, :class:`TimelineFramesBench`,
+:class:`SequencerUndoBench`, :class:`CurvePaintsBench`,
+:class:`SequencerClipsBench`, :class:`TimelineRefreshBench`, …) run
+as-is.  How the bench is *driven* — including spawning a fresh DCC
+instance — is the consumer's responsibility; uitk deliberately does
+not import ``maya``, ``max``, or any other host SDK.
 
 This package lives under ``test/`` because it is test infrastructure,
 not part of the runtime API.  Pytest sees it via the ``test/`` entry
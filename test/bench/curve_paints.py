@@ -0,0 +1,188 @@
+"""Paint-count benchmark for sequencer curve previews.
+
+Sub-row clips draw a ``curve_preview`` and expanded sub-rows a
+background curve; both go through ``CurveUtils.build_curve_path``.
+Clip previews used to rebuild their ``QPainterPath`` on every paint, so
+any repaint — playhead, hover, selection — re-evaluated every curve in
+view.  Paths are now cached per clip and per background curve until the
+segments, value range, time mapping or size change.  This bench builds
+a shown (off-screen) sequencer of ``tracks`` tracks, each expanded to
+``sub_rows`` sub-rows carrying ``clips_per_row`` curve-preview clips of
+``segments`` Bézier segments plus a background curve, then renders
+``frames`` frames per mode:
+
+  ``playhead``
+      The playhead advances one frame per frame.
+
+  ``hover``
+      A hover-style ``update()`` of one clip per frame.
+
+  ``select``
+      Selection moves to the next clip per frame.
+
+Per mode it reports ``builds`` (``build_curve_path`` calls per frame)
+and ``frame_ms`` (synchronous viewport repaint), both mean over
+``frames``.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.curve_paints                 # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class CurvePaintsBench:
+    """Count curve-path builds and time repaints of curve-heavy timelines."""
+
+    #: Modes measured, in report order.
+    MODES = ("playhead", "hover", "select")
+
+    def __init__(
+        self,
+        tracks: int = 12,
+        sub_rows: int = 3,
+        clips_per_row: int = 4,
+        segments: int = 48,
+        frames: int = 30,
+        size: tuple = (1600, 900),
+        label: str = "run",
+    ) -> None:
+        self.tracks = tracks
+        self.sub_rows = sub_rows
+        self.clips_per_row = clips_per_row
+        self.segments = segments
+        self.frames = frames
+        self.size = size
+        self.label = label
+
+    def _preview(self, start: float, span: float, phase: int) -> dict:
+        step = span / self.segments
+        keys, segs = [], []
+        for i in range(self.segments + 1):
+            keys.append((start + i * step, ((i + phase) % 5) / 4.0))
+        for (t0, v0), (t1, v1) in zip(keys, keys[1:]):
+            segs.append(
+                {"t0": t0, "v0": v0, "t1": t1, "v1": v1,
+                 "cp1": (t0 + step / 3, v0), "cp2": (t1 - step / 3, v1)}
+            )
+        return {"keys": keys, "segments": segs, "val_min": 0.0, "val_max": 1.0}
+
+    def _build(self):
+        from qtpy import QtCore
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        w.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        w.resize(*self.size)
+        with w.bulk_updates():
+            tids = [w.add_track(f"track{i:03d}") for i in range(self.tracks)]
+        for n, tid in enumerate(tids):
+            subs = []
+            for s in range(self.sub_rows):
+                name = f"attr{s}"
+                clips = [
+                    (c * 150, 120, name, "#E06666",
+                     {"curve_preview": self._preview(c * 150, 120, n + s + c)})
+                    for c in range(self.clips_per_row)
+                ]
+                subs.append((name, clips))
+            w.expand_track(tid, sub_row_data=subs)
+            for s in range(self.sub_rows):
+                w.set_bg_curve_preview(
+                    tid, f"attr{s}", self._preview(0, 600, n + s), "#6FA8DC"
+                )
+        w.show()
+        tl = w._timeline
+        tl.horizontalScrollBar().setValue(tl.horizontalScrollBar().minimum())
+        tl.verticalScrollBar().setValue(tl.verticalScrollBar().minimum())
+        return w
+
+    def _step(self, w, mode: str, frame: int, items: list) -> None:
+        if mode == "playhead":
+            w.set_playhead(frame % 600)
+        elif mode == "hover":
+            items[frame % len(items)].update()
+        elif mode == "select":
+            w._timeline._scene.clearSelection()
+            items[frame % len(items)].setSelected(True)
+
+    def _measure(self, w, mode: str, items: list) -> dict[str, Any]:
+        from unittest.mock import patch
+
+        from uitk.widgets.sequencer import CurveUtils
+
+        viewport = w._timeline.viewport()
+        frame_s = 0.0
+        with patch.object(
+            CurveUtils, "build_curve_path", wraps=CurveUtils.build_curve_path
+        ) as build:
+            for frame in range(self.frames):
+                self._step(w, mode, frame, items)
+                t0 = time.perf_counter()
+                viewport.repaint()
+                frame_s += time.perf_counter() - t0
+        return {
+            "builds": round(build.call_count / self.frames, 1),
+            "frame_ms": round(frame_s / self.frames * 1e3, 2),
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Build the timeline once and measure every mode."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("CurvePaintsBench requires an existing QApplication.")
+
+        w = self._build()
+        QtWidgets.QApplication.processEvents()
+        try:
+            tl = w._timeline
+            exposed = tl.mapToScene(tl.viewport().rect()).boundingRect()
+            items = [
+                it
+                for it in w._clip_items.values()
+                if it.clip_data.sub_row
+                and it.sceneBoundingRect().intersects(exposed)
+            ]
+            tl.viewport().repaint()  # warm caches
+            modes = {mode: self._measure(w, mode, items) for mode in self.MODES}
+        finally:
+            w.close()
+            w.deleteLater()
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "tracks": self.tracks,
+            "clips": len(items),  # in view
+            "bg_curves": self.tracks * self.sub_rows,
+            "frames": self.frames,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  tracks={result.get('tracks')}  "
+            f"curve clips in view={result.get('clips')}  "
+            f"bg curves={result.get('bg_curves')}  "
+            f"mean of {result.get('frames')} frames",
+            f"{'mode':<9} {'builds':>7} {'frame_ms':>9}",
+            "-" * 27,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(f"{mode:<9} {r['builds']:>7.1f} {r['frame_ms']:>9.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(CurvePaintsBench.format_report(CurvePaintsBench().run()))
@@ -0,0 +1,146 @@
+"""Benchmark for ``MainWindow.register_children``: eager vs. lazy registration.
+
+First show runs ``register_children`` over the whole central widget —
+the ``04_register_children`` phase of :class:`StandaloneUiInitBench`.
+Every named widget gets the full ``register_widget`` treatment (stamped
+lambdas, ``ptk.get_derived_type``, ``TooltipProxy``, signal wiring, the
+visibility policy, ``init_slot``) whether the user ever opens the tab it
+sits in or not.  This bench builds a synthetic tabbed form (``tabs``
+pages of ``per_tab`` mixed input widgets) and times, in report order:
+
+  ``eager``
+      ``register_children()`` with ``lazy_registration`` off — today's
+      first-show cost.
+
+  ``lazy``
+      The same walk with ``lazy_registration`` on: only the current page
+      registers; the rest get a pending record.
+
+  ``open_tab``
+      Lazy mode, switching to one previously unopened tab — the cost
+      moved out of first show, paid per page on demand.
+
+Per mode it reports ``ms`` (best of ``repeats``) and ``registered``
+(widgets registered once the step finishes).
+
+Run directly (offscreen is fine)::
+
+    python -m bench.lazy_register               # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class LazyRegisterBench:
+    """Time eager vs. lazy ``register_children`` over a tabbed form."""
+
+    #: Modes measured, in report order.
+    MODES = ("eager", "lazy", "open_tab")
+
+    def __init__(
+        self, tabs: int = 10, per_tab: int = 40, repeats: int = 3, label: str = "run"
+    ) -> None:
+        self.tabs = tabs
+        self.per_tab = per_tab
+        self.repeats = repeats
+        self.label = label
+        self._count = 0
+
+    def _build(self):
+        from qtpy import QtWidgets
+
+        kinds = (
+            QtWidgets.QPushButton,
+            QtWidgets.QSpinBox,
+            QtWidgets.QLineEdit,
+            QtWidgets.QCheckBox,
+        )
+        root = QtWidgets.QWidget()
+        root.setObjectName("central")
+        tab_widget = QtWidgets.QTabWidget(root)
+        tab_widget.setObjectName("tabs")
+        QtWidgets.QVBoxLayout(root).addWidget(tab_widget)
+        for t in range(self.tabs):
+            page = QtWidgets.QWidget()
+            page.setObjectName(f"page{t:02d}")
+            layout = QtWidgets.QVBoxLayout(page)
+            for i in range(self.per_tab):
+                widget = kinds[i % len(kinds)]()
+                widget.setObjectName(f"w{t:02d}_{i:03d}")
+                layout.addWidget(widget)
+            tab_widget.addTab(page, f"Tab {t}")
+        return root, tab_widget
+
+    def _sample(self, sb, mode: str):
+        from qtpy import QtCore
+
+        self._count += 1
+        root, tab_widget = self._build()
+        ui = sb.add_ui(
+            f"lazy_register_{self._count}",
+            widget=root,
+            lazy_registration=mode != "eager",
+        )
+        if mode == "open_tab":
+            # A page only receives Show once its window is visible.
+            ui.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+            ui.show()
+            t0 = time.perf_counter()
+            tab_widget.setCurrentIndex(1)  # Show event -> deferred subtree
+        else:
+            t0 = time.perf_counter()
+            ui.register_children()
+        elapsed = time.perf_counter() - t0
+        registered = len(ui.widgets)
+        ui.hide()
+        ui.deleteLater()
+        return elapsed, registered
+
+    def run(self) -> dict[str, Any]:
+        """Run every mode and return best-of-``repeats`` timings."""
+        from qtpy import QtWidgets
+        from uitk import Switchboard
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("LazyRegisterBench requires an existing QApplication.")
+
+        sb = Switchboard()
+        self._sample(sb, "eager")  # warm imports / derived-type caches
+        modes = {}
+        for mode in self.MODES:
+            samples = [self._sample(sb, mode) for _ in range(self.repeats)]
+            best, registered = min(samples)
+            modes[mode] = {"ms": round(best * 1e3, 2), "registered": registered}
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "tabs": self.tabs,
+            "per_tab": self.per_tab,
+            "repeats": self.repeats,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  tabs={result.get('tabs')}  "
+            f"per_tab={result.get('per_tab')}  best of {result.get('repeats')}",
+            f"{'mode':<10} {'ms':>10} {'registered':>11}",
+            "-" * 33,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(f"{mode:<10} {r['ms']:>10.2f} {r['registered']:>11}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(LazyRegisterBench.format_report(LazyRegisterBench().run()))
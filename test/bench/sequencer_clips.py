@@ -0,0 +1,139 @@
+"""Scaling benchmark for ``SequencerWidget`` clip storage.
+
+Tracks are indexed by id and each ``TrackData.clips`` is a dict by
+clip id, backed by a per-track
+:class:`~uitk.widgets.sequencer.ClipIntervals` sorted by start.  Before,
+``remove_clip`` scanned every track and ``list.remove``-d the id, and
+``clips(track_id)`` filtered every clip, so bulk edits of thousands of
+clips scaled quadratically.  For each clip count in ``clips`` (spread
+over tracks of ``per_track`` clips, in one ``bulk_updates`` block) this
+bench reports:
+
+  ``add_ms``
+      Adding every clip (scene items included).
+
+  ``remove_ms``
+      Removing every other clip.
+
+  ``track_us``
+      One ``clips(track_id)`` call.
+
+  ``range_us``
+      One ``clips_in_range`` call over a ``window``-frame span of one
+      track, averaged over ``queries`` spans.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.sequencer_clips              # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class SequencerClipsBench:
+    """Time clip add/remove/lookup against a growing number of clips."""
+
+    def __init__(
+        self,
+        clips: tuple = (1000, 5000, 20000, 50000),
+        per_track: int = 100,
+        queries: int = 200,
+        window: float = 100.0,
+        label: str = "run",
+    ) -> None:
+        self.clips = clips
+        self.per_track = per_track
+        self.queries = queries
+        self.window = window
+        self.label = label
+
+    def _measure(self, count: int) -> dict[str, Any]:
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        n_tracks = max(1, count // self.per_track)
+        try:
+            t0 = time.perf_counter()
+            with w.bulk_updates():
+                tids = [w.add_track(f"track{i:05d}") for i in range(n_tracks)]
+                cids = [
+                    w.add_clip(tids[i % n_tracks], (i // n_tracks) * 30, 20)
+                    for i in range(count)
+                ]
+            add = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            for i in range(self.queries):
+                w.clips(tids[i % n_tracks])
+            track = (time.perf_counter() - t0) / self.queries
+
+            span = self.per_track * 30
+            t0 = time.perf_counter()
+            for i in range(self.queries):
+                start = (i * 37) % span
+                w.clips_in_range(start, start + self.window, tids[i % n_tracks])
+            rng = (time.perf_counter() - t0) / self.queries
+
+            t0 = time.perf_counter()
+            with w.bulk_updates():
+                for cid in cids[::2]:
+                    w.remove_clip(cid)
+            remove = time.perf_counter() - t0
+        finally:
+            w.close()
+            w.deleteLater()
+        return {
+            "tracks": n_tracks,
+            "add_ms": round(add * 1e3, 1),
+            "remove_ms": round(remove * 1e3, 1),
+            "track_us": round(track * 1e6, 2),
+            "range_us": round(rng * 1e6, 2),
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Measure every clip count in :attr:`clips`."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("SequencerClipsBench requires an existing QApplication.")
+
+        counts = {}
+        for count in self.clips:
+            counts[count] = self._measure(count)
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "per_track": self.per_track,
+            "window": self.window,
+            "clips": counts,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  {result.get('per_track')} clips "
+            f"per track  range window={result.get('window')}",
+            f"{'clips':>7} {'tracks':>7} {'add_ms':>9} {'remove_ms':>10} "
+            f"{'track_us':>9} {'range_us':>9}",
+            "-" * 56,
+        ]
+        for count, r in (result.get("clips") or {}).items():
+            lines.append(
+                f"{count:>7} {r['tracks']:>7} {r['add_ms']:>9.1f} "
+                f"{r['remove_ms']:>10.1f} {r['track_us']:>9.2f} "
+                f"{r['range_us']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(SequencerClipsBench.format_report(SequencerClipsBench().run()))
@@ -0,0 +1,147 @@
+"""Benchmark for ``SequencerWidget`` row-layout lookups vs. track count.
+
+Every ``ClipItem._sync_geometry`` asks ``_row_position`` where its row
+sits, ``_update_scene_rect`` asks for ``_total_row_height`` and the
+timeline background walks ``_visual_rows``.  These read the cached,
+prefix-summed :class:`~uitk.widgets.sequencer.RowLayout`; before it each
+call re-walked every row, so a full refresh with one clip per track was
+O(n²).  For each track count in ``tracks`` (every ``expand_every``-th
+track expanded to ``sub_rows`` sub-rows, one clip per track) this bench
+reports:
+
+  ``build_ms``
+      Rebuilding the layout after an invalidation (expand/collapse/remove).
+
+  ``lookup_us``
+      One ``_row_position`` call, averaged over every track.
+
+  ``total_us``
+      One ``_total_row_height`` call.
+
+  ``refresh_ms``
+      ``TimelineView._refresh_all`` — every clip re-syncs its geometry.
+
+Timings are best of ``repeats``.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.sequencer_rows               # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class SequencerRowsBench:
+    """Time row-layout queries against a growing number of tracks."""
+
+    def __init__(
+        self,
+        tracks: tuple = (50, 500, 2000),
+        expand_every: int = 10,
+        sub_rows: int = 3,
+        repeats: int = 3,
+        label: str = "run",
+    ) -> None:
+        self.tracks = tracks
+        self.expand_every = expand_every
+        self.sub_rows = sub_rows
+        self.repeats = repeats
+        self.label = label
+
+    def _build(self, count: int):
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        subs = [(f"attr{i}", []) for i in range(self.sub_rows)]
+        with w.bulk_updates():
+            tids = [w.add_track(f"track{i:05d}") for i in range(count)]
+            for i, tid in enumerate(tids):
+                w.add_clip(tid, start=i % 100, duration=20)
+        for tid in tids[:: self.expand_every]:
+            w.expand_track(tid, sub_row_data=subs)
+        return w, tids
+
+    @staticmethod
+    def _best(fn, repeats: int) -> float:
+        samples = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - t0)
+        return min(samples)
+
+    def _measure(self, count: int) -> dict[str, Any]:
+        w, tids = self._build(count)
+
+        def rebuild():
+            w._invalidate_rows()
+            w._rows()
+
+        def lookups():
+            for tid in tids:
+                w._row_position(tid)
+
+        build = self._best(rebuild, self.repeats)
+        lookup = self._best(lookups, self.repeats) / max(1, len(tids))
+        total = self._best(w._total_row_height, self.repeats)
+        refresh = self._best(w._timeline._refresh_all, self.repeats)
+        rows = len(w._visual_rows())
+        w.close()
+        w.deleteLater()
+        return {
+            "rows": rows,
+            "build_ms": round(build * 1e3, 2),
+            "lookup_us": round(lookup * 1e6, 2),
+            "total_us": round(total * 1e6, 2),
+            "refresh_ms": round(refresh * 1e3, 1),
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Measure every track count in :attr:`tracks`."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("SequencerRowsBench requires an existing QApplication.")
+
+        counts = {}
+        for count in self.tracks:
+            counts[count] = self._measure(count)
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "repeats": self.repeats,
+            "expand_every": self.expand_every,
+            "sub_rows": self.sub_rows,
+            "tracks": counts,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  expand every "
+            f"{result.get('expand_every')} x{result.get('sub_rows')} sub-rows  "
+            f"best of {result.get('repeats')}",
+            f"{'tracks':>7} {'rows':>6} {'build_ms':>9} {'lookup_us':>10} "
+            f"{'total_us':>9} {'refresh_ms':>11}",
+            "-" * 57,
+        ]
+        for count, r in (result.get("tracks") or {}).items():
+            lines.append(
+                f"{count:>7} {r['rows']:>6} {r['build_ms']:>9.2f} "
+                f"{r['lookup_us']:>10.2f} {r['total_us']:>9.2f} "
+                f"{r['refresh_ms']:>11.1f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(SequencerRowsBench.format_report(SequencerRowsBench().run()))
@@ -0,0 +1,145 @@
+"""Benchmark for ``SequencerWidget`` undo capture, undo and redo at scale.
+
+Undo steps record the prior state of only the clips an edit touches (see
+:mod:`uitk.widgets.sequencer._undo`); the former full snapshot copied
+every clip on every step, so drag latency and stack memory grew with the
+timeline instead of the edit.  This bench builds ``clips`` clips across
+``tracks`` tracks, then performs ``steps`` simulated drags of
+``group`` clips, each ``moves`` mouse moves long (one merged undo step
+per drag), and reports:
+
+  ``capture_us``
+      One ``_capture_undo`` call, averaged over every move of every drag.
+
+  ``stack_kb``
+      Python heap held by the full undo stack (``tracemalloc``).
+
+  ``undo_ms`` / ``redo_ms``
+      One ``undo()`` / ``redo()``, averaged over the whole stack.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.sequencer_undo               # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import Any
+
+
+class SequencerUndoBench:
+    """Time and size undo steps on a large timeline."""
+
+    def __init__(
+        self,
+        clips: int = 10000,
+        tracks: int = 100,
+        steps: int = 50,
+        group: int = 4,
+        moves: int = 20,
+        label: str = "run",
+    ) -> None:
+        self.clips = clips
+        self.tracks = tracks
+        self.steps = steps
+        self.group = group
+        self.moves = moves
+        self.label = label
+
+    def _build(self):
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        with w.bulk_updates():
+            tids = [w.add_track(f"track{i:04d}") for i in range(self.tracks)]
+            per_track = max(1, self.clips // self.tracks)
+            cids = [
+                w.add_clip(tids[i // per_track % self.tracks], (i % per_track) * 30, 20)
+                for i in range(self.clips)
+            ]
+        return w, cids
+
+    def _drag(self, w, cids) -> float:
+        """One merged drag step over *cids*; returns the capture time."""
+        key = object()
+        spent = 0.0
+        for _ in range(self.moves):
+            t0 = time.perf_counter()
+            w._capture_undo(cids, merge_key=key)
+            spent += time.perf_counter() - t0
+            for cid in cids:
+                w._clips[cid].start += 1
+        return spent
+
+    def run(self) -> dict[str, Any]:
+        """Build the timeline and measure capture, memory, undo and redo."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("SequencerUndoBench requires an existing QApplication.")
+
+        w, cids = self._build()
+        w._max_undo = max(w._max_undo, self.steps)
+        try:
+            stride = max(1, len(cids) // max(1, self.steps))
+            tracemalloc.start()
+            base = tracemalloc.take_snapshot()
+            capture = 0.0
+            for step in range(self.steps):
+                first = (step * stride) % max(1, len(cids) - self.group)
+                capture += self._drag(w, cids[first : first + self.group])
+            held = tracemalloc.take_snapshot().compare_to(base, "filename")
+            tracemalloc.stop()
+            stack_bytes = sum(d.size_diff for d in held if d.size_diff > 0)
+
+            depth = len(w._undo_stack)
+            t0 = time.perf_counter()
+            while w._undo_stack:
+                w.undo()
+            undo = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            while w._redo_stack:
+                w.redo()
+            redo = time.perf_counter() - t0
+        finally:
+            w.close()
+            w.deleteLater()
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "clips": self.clips,
+            "steps": self.steps,
+            "group": self.group,
+            "moves": self.moves,
+            "depth": depth,
+            "capture_us": round(capture / (self.steps * self.moves) * 1e6, 2),
+            "stack_kb": round(stack_bytes / 1024, 1),
+            "undo_ms": round(undo / max(1, depth) * 1e3, 3),
+            "redo_ms": round(redo / max(1, depth) * 1e3, 3),
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        return "\n".join(
+            [
+                f"# {result.get('label', 'run')}  clips={result.get('clips')}  "
+                f"{result.get('steps')} drags x {result.get('moves')} moves of "
+                f"{result.get('group')} clips  depth={result.get('depth')}",
+                f"{'capture_us':>11} {'stack_kb':>9} {'undo_ms':>8} {'redo_ms':>8}",
+                "-" * 39,
+                f"{result['capture_us']:>11.2f} {result['stack_kb']:>9.1f} "
+                f"{result['undo_ms']:>8.3f} {result['redo_ms']:>8.3f}",
+            ]
+        )
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(SequencerUndoBench.format_report(SequencerUndoBench().run()))
@@ -0,0 +1,122 @@
+"""Microbenchmark for ``SlotWrapper`` dispatch: calls per second per mode.
+
+Every signal emission goes through ``SlotWrapper.__call__`` →
+``_invoke``.  The default path pushes a ``WaitCursor`` override,
+installs and removes the modal busy-cursor filter on the
+``QApplication``, resolves a ``Cancelable`` timeout and records slot
+history — fixed per-call cost that a slider's ``valueChanged`` pays on
+every tick.  Modes, in report order:
+
+  ``direct``
+      The slot function called bare — the floor.
+
+  ``default``
+      Full dispatch through ``SlotWrapper``.
+
+  ``no_busy``
+      ``widget.no_busy_indicator = True`` — the older opt-out, which
+      skips only the cursor/filter work.
+
+  ``fast``
+      ``@FastSlot()`` — skips cursor, filter, timeout and history.
+
+Per mode it reports ``calls_per_s`` and ``us_per_call`` (best of
+``repeats`` samples of ``calls`` emissions each, made by calling the
+wrapper the way a connected signal does).
+
+Run directly (offscreen is fine)::
+
+    python -m bench.slot_dispatch               # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Optional
+
+
+class SlotDispatchBench:
+    """Time ``SlotWrapper`` dispatch with and without the fast path."""
+
+    #: Emissions per sample.
+    CALLS = 1000
+    #: Modes measured, in report order.
+    MODES = ("direct", "default", "no_busy", "fast")
+
+    def __init__(
+        self, calls: Optional[int] = None, repeats: int = 3, label: str = "run"
+    ) -> None:
+        self.calls = calls or self.CALLS
+        self.repeats = repeats
+        self.label = label
+
+    def _make(self, sb, mode: str):
+        from qtpy import QtWidgets
+        from uitk.switchboard import FastSlot, SlotWrapper
+
+        def slot(value, widget=None):
+            return value
+
+        widget = QtWidgets.QSlider()
+        if mode == "direct":
+            return widget, slot
+        if mode == "no_busy":
+            widget.no_busy_indicator = True
+        if mode == "fast":
+            slot = FastSlot()(slot)
+        return widget, SlotWrapper(slot, widget, sb)
+
+    def _sample(self, target) -> float:
+        calls = self.calls
+        t0 = time.perf_counter()
+        for i in range(calls):
+            target(i)
+        return time.perf_counter() - t0
+
+    def run(self) -> dict[str, Any]:
+        """Run every mode and return best-of-``repeats`` throughput."""
+        from qtpy import QtWidgets
+        from uitk import Switchboard
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("SlotDispatchBench requires an existing QApplication.")
+
+        sb = Switchboard()
+        modes = {}
+        for mode in self.MODES:
+            widget, target = self._make(sb, mode)
+            target(0)  # warm signature cache / imports
+            best = min(self._sample(target) for _ in range(self.repeats))
+            widget.deleteLater()
+            modes[mode] = {
+                "calls_per_s": round(self.calls / best),
+                "us_per_call": round(best / self.calls * 1e6, 3),
+            }
+        return {
+            "label": self.label,
+            "calls": self.calls,
+            "repeats": self.repeats,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  calls={result.get('calls')}  "
+            f"best of {result.get('repeats')}",
+            f"{'mode':<10} {'calls/s':>12} {'us/call':>10}",
+            "-" * 34,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(f"{mode:<10} {r['calls_per_s']:>12,} {r['us_per_call']:>10.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(SlotDispatchBench.format_report(SlotDispatchBench().run()))
@@ -0,0 +1,131 @@
+"""Import-time benchmark for ``Switchboard`` construction, eager vs lazy widgets.
+
+What a process pays to get from ``import uitk`` to a constructed
+:class:`Switchboard` is dominated by the widget registry: the recursive
+extend over ``uitk/widgets`` imports every widget module (sequencer,
+marking menu, editors, …) whether or not a tool ever uses them.
+``Switchboard(lazy_widgets=True)`` records those classes by name only
+and imports a module the first time a ``.ui`` or a
+``registered_widgets`` lookup references it.
+
+Imports are cached per interpreter, so each sample runs in a **fresh
+child process** (``sys.executable``) — timing two modes back to back in
+one process would measure the second one against a warm
+``sys.modules``.  The child inherits the environment (set
+``QT_QPA_PLATFORM=offscreen`` for headless runs); the scan index under
+``UITK_CACHE_ROOT`` is warmed by one discarded run first, so both modes
+are measured against the same warm index and differ only in imports.
+
+Per sample the child reports:
+
+  ``construct_ms``
+      ``from uitk import Switchboard`` + ``Switchboard(...)``.
+
+  ``first_lookup_ms``
+      ``sb.registered_widgets.<WIDGET>`` — in lazy mode this is where the
+      one deferred import lands.
+
+  ``widget_modules``
+      ``uitk.widgets.*`` entries in ``sys.modules`` after construction.
+
+Run directly::
+
+    python -m bench.switchboard_import          # from uitk/test
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+_CHILD = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+from qtpy import QtWidgets
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+t0 = time.perf_counter()
+from uitk import Switchboard
+sb = Switchboard(lazy_widgets={lazy!r})
+t1 = time.perf_counter()
+modules = sum(1 for m in list(sys.modules) if m.startswith("uitk.widgets"))
+getattr(sb.registered_widgets, {widget!r})
+t2 = time.perf_counter()
+print(json.dumps({{
+    "construct_ms": (t1 - t0) * 1000,
+    "first_lookup_ms": (t2 - t1) * 1000,
+    "widget_modules": modules,
+}}))
+"""
+
+
+class SwitchboardImportBench:
+    """Time ``Switchboard`` construction in fresh interpreters, per widget mode."""
+
+    #: Widget resolved after construction (the "tool uses one widget" case).
+    WIDGET = "PushButton"
+
+    def __init__(
+        self, repeats: int = 5, widget: Optional[str] = None, label: str = "run"
+    ) -> None:
+        self.repeats = repeats
+        self.widget = widget or self.WIDGET
+        self.label = label
+
+    def _sample(self, lazy: bool) -> dict[str, float]:
+        code = _CHILD.format(root=str(_PACKAGE_ROOT), lazy=lazy, widget=self.widget)
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=dict(os.environ),
+        ).stdout
+        # Last line: construction may log to stdout before the report.
+        return json.loads(out.strip().splitlines()[-1])
+
+    def run(self) -> dict[str, Any]:
+        """Run both modes and return best-of-``repeats`` per metric."""
+        self._sample(lazy=False)  # warm the scan index + OS file cache
+
+        modes = {}
+        for name, lazy in (("eager", False), ("lazy", True)):
+            samples = [self._sample(lazy) for _ in range(self.repeats)]
+            modes[name] = {
+                "construct_ms_best": round(min(s["construct_ms"] for s in samples), 3),
+                "first_lookup_ms_best": round(
+                    min(s["first_lookup_ms"] for s in samples), 3
+                ),
+                "widget_modules": samples[-1]["widget_modules"],
+            }
+        return {
+            "label": self.label,
+            "widget": self.widget,
+            "repeats": self.repeats,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  widget={result.get('widget')}  "
+            f"best of {result.get('repeats')}",
+            f"{'mode':<10} {'construct ms':>14} {'lookup ms':>12} {'widget mods':>12}",
+            "-" * 52,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(
+                f"{mode:<10} {r['construct_ms_best']:>14.2f} "
+                f"{r['first_lookup_ms_best']:>12.2f} {r['widget_modules']:>12}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(SwitchboardImportBench.format_report(SwitchboardImportBench().run()))
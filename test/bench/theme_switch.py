@@ -0,0 +1,140 @@
+"""Benchmark for ``StyleSheet`` theme switches per ``shared_scope``.
+
+In the default ``"widget"`` scope every styled widget receives the full
+rendered ``style.qss`` (~41 KB) through its own ``setStyleSheet``, so a
+window styled with ``recursive=True`` makes Qt parse and cascade one
+private copy per widget — on creation and again on every theme switch.
+``"window"`` / ``"app"`` install the sheet once per top-level window /
+once on the ``QApplication``.  This bench builds a shown (off-screen)
+window of ``widgets`` mixed controls, styles it recursively, and
+reports per scope:
+
+  ``apply_ms``
+      First ``StyleSheet.set(window, recursive=True)``.
+
+  ``switch_ms``
+      ``StyleSheet.set_theme`` light ↔ dark, best of ``repeats``.
+
+  ``sheets``
+      Widgets (window included) holding a private stylesheet copy.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.theme_switch                # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class ThemeSwitchBench:
+    """Time theme application and switching in each ``shared_scope``."""
+
+    #: Scopes measured, in report order.
+    SCOPES = ("widget", "window", "app")
+
+    def __init__(self, widgets: int = 1000, repeats: int = 2, label: str = "run") -> None:
+        self.widgets = widgets
+        self.repeats = repeats
+        self.label = label
+
+    def _build(self):
+        from qtpy import QtCore, QtWidgets
+
+        kinds = (
+            QtWidgets.QPushButton,
+            QtWidgets.QSpinBox,
+            QtWidgets.QLineEdit,
+            QtWidgets.QCheckBox,
+            QtWidgets.QLabel,
+        )
+        window = QtWidgets.QMainWindow()
+        window.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        central = QtWidgets.QWidget()
+        grid = QtWidgets.QGridLayout(central)
+        columns = 20
+        for i in range(self.widgets - 1):  # the central widget is one of them
+            widget = kinds[i % len(kinds)]()
+            widget.setObjectName(f"w{i:04d}")
+            grid.addWidget(widget, i // columns, i % columns)
+        window.setCentralWidget(central)
+        window.show()
+        return window
+
+    def _measure(self, scope: str) -> dict[str, Any]:
+        from qtpy import QtWidgets
+        from uitk.themes.style_sheet import StyleSheet
+
+        StyleSheet.set_shared_scope(scope)
+        window = self._build()
+        QtWidgets.QApplication.processEvents()
+
+        t0 = time.perf_counter()
+        StyleSheet().set(window, theme="light", recursive=True)
+        QtWidgets.QApplication.processEvents()
+        apply_s = time.perf_counter() - t0
+
+        switches = []
+        for theme in ("dark", "light") * self.repeats:
+            t0 = time.perf_counter()
+            StyleSheet.set_theme(theme)
+            QtWidgets.QApplication.processEvents()
+            switches.append(time.perf_counter() - t0)
+
+        styled = [window] + window.findChildren(QtWidgets.QWidget)
+        sheets = sum(1 for w in styled if w.styleSheet())
+        window.hide()
+        window.deleteLater()
+        QtWidgets.QApplication.processEvents()
+        return {
+            "apply_ms": round(apply_s * 1e3, 1),
+            "switch_ms": round(min(switches) * 1e3, 1),
+            "sheets": sheets,
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Measure every scope; restores the ``"widget"`` scope afterwards."""
+        from qtpy import QtWidgets
+        from uitk.themes.style_sheet import StyleSheet
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("ThemeSwitchBench requires an existing QApplication.")
+
+        previous = StyleSheet.shared_scope
+        try:
+            scopes = {scope: self._measure(scope) for scope in self.SCOPES}
+        finally:
+            StyleSheet.set_shared_scope(previous)
+        return {
+            "label": self.label,
+            "widgets": self.widgets,
+            "repeats": self.repeats,
+            "scopes": scopes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  widgets={result.get('widgets')}  "
+            f"best of {result.get('repeats')}",
+            f"{'scope':<8} {'apply_ms':>10} {'switch_ms':>10} {'sheets':>7}",
+            "-" * 38,
+        ]
+        for scope, r in (result.get("scopes") or {}).items():
+            lines.append(
+                f"{scope:<8} {r['apply_ms']:>10.1f} {r['switch_ms']:>10.1f} "
+                f"{r['sheets']:>7}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(ThemeSwitchBench.format_report(ThemeSwitchBench().run()))
@@ -0,0 +1,177 @@
+"""Benchmark for ``TimelineView`` frame times on a long, expanded timeline.
+
+``TimelineView.drawBackground`` used to fill every visual row, mask every
+clip out of a ``QRegion`` and rebuild every background curve path on each
+paint, however little of the timeline was exposed.  It now blits cached
+stripe tiles for the exposed rows only, masks only exposed clips and
+reuses curve paths until the zoom or the rows change.  This bench builds
+a shown (off-screen) sequencer of ``tracks`` tracks with
+``clips_per_track`` clips each, every ``expand_every``-th track expanded
+to ``sub_rows`` sub-rows carrying a background curve, then renders
+``frames`` frames per mode:
+
+  ``repaint``
+      Nothing changes between frames.
+
+  ``pan``
+      Vertical scroll by ``pan_step`` px per frame.
+
+  ``scrub``
+      The playhead advances one frame per frame.
+
+Per mode it reports ``frame_ms`` (synchronous viewport repaint) and
+``bg_ms`` (``drawBackground`` alone, into an off-screen image of the
+visible scene rect), both mean over ``frames``.
+
+Run directly (offscreen is fine)::
+
+    python -m bench.timeline_frames              # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class TimelineFramesBench:
+    """Time timeline repaints while idle, panning and scrubbing."""
+
+    #: Modes measured, in report order.
+    MODES = ("repaint", "pan", "scrub")
+
+    def __init__(
+        self,
+        tracks: int = 500,
+        clips_per_track: int = 4,
+        expand_every: int = 5,
+        sub_rows: int = 3,
+        frames: int = 30,
+        size: tuple = (1600, 900),
+        pan_step: int = 37,
+        label: str = "run",
+    ) -> None:
+        self.tracks = tracks
+        self.clips_per_track = clips_per_track
+        self.expand_every = expand_every
+        self.sub_rows = sub_rows
+        self.frames = frames
+        self.size = size
+        self.pan_step = pan_step
+        self.label = label
+
+    def _preview(self, phase: int) -> dict:
+        segments = []
+        for i in range(64):
+            t0, t1 = i * 10, (i + 1) * 10
+            v0, v1 = ((i + phase) % 7) / 6.0, ((i + phase + 1) % 7) / 6.0
+            segments.append(
+                {"t0": t0, "v0": v0, "t1": t1, "v1": v1,
+                 "cp1": (t0 + 3, v0), "cp2": (t1 - 3, v1)}
+            )
+        return {"segments": segments, "val_min": 0.0, "val_max": 1.0}
+
+    def _build(self):
+        from qtpy import QtCore
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        w.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        w.resize(*self.size)
+        subs = [(f"attr{i}", []) for i in range(self.sub_rows)]
+        with w.bulk_updates():
+            tids = [w.add_track(f"track{i:05d}") for i in range(self.tracks)]
+            for i, tid in enumerate(tids):
+                for c in range(self.clips_per_track):
+                    w.add_clip(tid, start=c * 160 + i % 40, duration=100)
+        for n, tid in enumerate(tids[:: self.expand_every]):
+            w.expand_track(tid, sub_row_data=subs)
+            for s, (name, _) in enumerate(subs):
+                w.set_bg_curve_preview(tid, name, self._preview(n + s))
+        w.show()
+        return w
+
+    def _step(self, w, mode: str, frame: int) -> None:
+        tl = w._timeline
+        if mode == "pan":
+            bar = tl.verticalScrollBar()
+            value = bar.value() + self.pan_step
+            bar.setValue(value if value <= bar.maximum() else 0)
+        elif mode == "scrub":
+            w.set_playhead(frame % 600)
+
+    def _measure(self, w, mode: str) -> dict[str, Any]:
+        from qtpy import QtCore, QtGui
+
+        tl = w._timeline
+        viewport = tl.viewport()
+        frame_s = bg_s = 0.0
+        for frame in range(self.frames):
+            self._step(w, mode, frame)
+            t0 = time.perf_counter()
+            viewport.repaint()
+            frame_s += time.perf_counter() - t0
+
+            rect = tl.mapToScene(viewport.rect()).boundingRect()
+            image = QtGui.QImage(
+                int(rect.width()), int(rect.height()), QtGui.QImage.Format_ARGB32
+            )
+            painter = QtGui.QPainter(image)
+            painter.translate(-rect.left(), -rect.top())
+            t0 = time.perf_counter()
+            tl.drawBackground(painter, QtCore.QRectF(rect))
+            bg_s += time.perf_counter() - t0
+            painter.end()
+        return {
+            "frame_ms": round(frame_s / self.frames * 1e3, 2),
+            "bg_ms": round(bg_s / self.frames * 1e3, 2),
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Build the timeline once and measure every mode."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("TimelineFramesBench requires an existing QApplication.")
+
+        w = self._build()
+        QtWidgets.QApplication.processEvents()
+        try:
+            w._timeline.viewport().repaint()  # warm caches
+            modes = {mode: self._measure(w, mode) for mode in self.MODES}
+            rows = len(w._visual_rows())
+        finally:
+            w.close()
+            w.deleteLater()
+            QtWidgets.QApplication.processEvents()
+        return {
+            "label": self.label,
+            "tracks": self.tracks,
+            "rows": rows,
+            "clips": self.tracks * self.clips_per_track,
+            "frames": self.frames,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  tracks={result.get('tracks')}  "
+            f"rows={result.get('rows')}  clips={result.get('clips')}  "
+            f"mean of {result.get('frames')} frames",
+            f"{'mode':<8} {'frame_ms':>9} {'bg_ms':>8}",
+            "-" * 27,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(f"{mode:<8} {r['frame_ms']:>9.2f} {r['bg_ms']:>8.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(TimelineFramesBench.format_report(TimelineFramesBench().run()))
@@ -0,0 +1,161 @@
+"""Benchmark for ``TimelineView`` scene-rect and refresh bookkeeping.
+
+``_update_scene_rect`` used to take the max end over every clip, marker
+and gap overlay, and ``_refresh_all`` walked ``scene.items()`` (keyframe
+children included) on every resize, expand and collapse.  Right edges
+now live in a sorted extent index that only touched clips, markers and
+gaps are re-indexed into, and row changes re-sync only the tracks below
+the change.  For each clip count in ``clips`` (spread over tracks of
+``per_track`` clips on a shown, off-screen sequencer) this bench reports
+the mean over ``repeats`` of:
+
+  ``nudge_us``
+      Moving one clip a frame, then ``_update_scene_rect``.
+
+  ``resize_ms``
+      One viewport resize (the view's own ``resizeEvent`` refresh).
+
+  ``expand_ms``
+      Expanding then collapsing the middle track (one sub-row clip).
+
+  ``zoom_ms``
+      One zoom step — every clip still re-syncs, so this stays O(n).
+
+Run directly (offscreen is fine)::
+
+    python -m bench.timeline_refresh             # from uitk/test
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class TimelineRefreshBench:
+    """Time scene-rect updates and partial refreshes on large timelines."""
+
+    def __init__(
+        self,
+        clips: tuple = (1000, 10000, 50000),
+        per_track: int = 100,
+        repeats: int = 20,
+        size: tuple = (1600, 900),
+        label: str = "run",
+    ) -> None:
+        self.clips = clips
+        self.per_track = per_track
+        self.repeats = repeats
+        self.size = size
+        self.label = label
+
+    def _build(self, count: int):
+        from qtpy import QtCore
+        from uitk.widgets.sequencer import SequencerWidget
+
+        w = SequencerWidget()
+        w.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        w.resize(*self.size)
+        n_tracks = max(1, count // self.per_track)
+        with w.bulk_updates():
+            tids = [w.add_track(f"track{i:05d}") for i in range(n_tracks)]
+            cids = [
+                w.add_clip(tids[i % n_tracks], (i // n_tracks) * 30, 20)
+                for i in range(count)
+            ]
+            for m in range(20):
+                w.add_marker(m * 100)
+            for g in range(20):
+                w.add_gap_overlay(g * 150 + 20, g * 150 + 30)
+        w.show()
+        return w, tids, cids
+
+    def _mean(self, fn) -> float:
+        t0 = time.perf_counter()
+        for i in range(self.repeats):
+            fn(i)
+        return (time.perf_counter() - t0) / self.repeats
+
+    def _measure(self, count: int) -> dict[str, Any]:
+        from qtpy import QtWidgets
+
+        app = QtWidgets.QApplication.instance()
+        w, tids, cids = self._build(count)
+        app.processEvents()
+        tl = w._timeline
+        try:
+            cd = w.get_clip(cids[len(cids) // 2])
+            tl._update_scene_rect()  # settle Qt's first rect change
+
+            def nudge(i):
+                cd.start += 1 if i % 2 else -1
+                w._touch_keys((cd.clip_id,))
+                tl._update_scene_rect()
+
+            def resize(i):
+                w.resize(self.size[0], self.size[1] + (1 if i % 2 else -1))
+                app.processEvents()
+
+            mid = tids[len(tids) // 2]
+
+            def expand(i):
+                w.expand_track(mid, sub_row_data=[("tx", [(0, 10)])])
+                w.collapse_track(mid)
+
+            ppu = tl.pixels_per_unit
+
+            def zoom(i):
+                tl.pixels_per_unit = ppu * (1.15 if i % 2 else 1.0)
+
+            return {
+                "tracks": len(tids),
+                "nudge_us": round(self._mean(nudge) * 1e6, 1),
+                "resize_ms": round(self._mean(resize) * 1e3, 2),
+                "expand_ms": round(self._mean(expand) * 1e3, 2),
+                "zoom_ms": round(self._mean(zoom) * 1e3, 2),
+            }
+        finally:
+            w.close()
+            w.deleteLater()
+            app.processEvents()
+
+    def run(self) -> dict[str, Any]:
+        """Measure every clip count in :attr:`clips`."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("TimelineRefreshBench requires an existing QApplication.")
+
+        return {
+            "label": self.label,
+            "per_track": self.per_track,
+            "repeats": self.repeats,
+            "clips": {count: self._measure(count) for count in self.clips},
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  {result.get('per_track')} clips "
+            f"per track  mean of {result.get('repeats')}",
+            f"{'clips':>7} {'tracks':>7} {'nudge_us':>9} {'resize_ms':>10} "
+            f"{'expand_ms':>10} {'zoom_ms':>9}",
+            "-" * 57,
+        ]
+        for count, r in (result.get("clips") or {}).items():
+            lines.append(
+                f"{count:>7} {r['tracks']:>7} {r['nudge_us']:>9.1f} "
+                f"{r['resize_ms']:>10.2f} {r['expand_ms']:>10.2f} "
+                f"{r['zoom_ms']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(TimelineRefreshBench.format_report(TimelineRefreshBench().run()))
@@ -0,0 +1,99 @@
+"""Benchmark for ``UiCompiler.compile_ui``: in-process generator vs. uic.
+
+``compile_ui`` used to spawn ``uic`` once per .ui; the process start-up
+(~150-200 ms) dominated ``python -m uitk.compile`` and ``precompile_async``
+on projects with dozens of forms.  The in-process generator
+(:mod:`uitk.ui_codegen`) emits the same module without a subprocess.
+
+Per generator it reports:
+
+  ``per_file_ms``
+      Best-of-``repeats`` mean ``compile_ui`` time per file, serial.
+
+  ``total_ms``
+      The whole corpus, serial (the ``-j 1`` CLI / single-thread case).
+
+The corpus is ``COPIES`` copies of ``uitk/examples/example.ui`` written
+to a temp dir.  No ``QApplication`` is needed.
+
+Run directly::
+
+    python -m bench.ui_compile                  # from uitk/test
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+_EXAMPLE_UI = Path(__file__).resolve().parents[2] / "uitk" / "examples" / "example.ui"
+
+
+class UiCompileBench:
+    """Time ``compile_ui`` over a corpus, per generator."""
+
+    #: Copies of the example .ui in the corpus.
+    COPIES = 20
+    #: Generators measured, in report order.
+    GENERATORS = ("uic", "python")
+
+    def __init__(
+        self, copies: Optional[int] = None, repeats: int = 3, label: str = "run"
+    ) -> None:
+        self.copies = copies or self.COPIES
+        self.repeats = repeats
+        self.label = label
+
+    def _sample(self, files: list, generator: str) -> float:
+        from uitk.compile import UiCompiler
+
+        t0 = time.perf_counter()
+        for ui in files:
+            UiCompiler.compile_ui(ui, generator=generator)
+        return (time.perf_counter() - t0) * 1000
+
+    def run(self) -> dict[str, Any]:
+        """Run every generator and return best-of-``repeats`` timings."""
+        tmp = Path(tempfile.mkdtemp(prefix="uitk_compile_bench_"))
+        try:
+            xml = _EXAMPLE_UI.read_text(encoding="utf-8")
+            files = []
+            for i in range(self.copies):
+                files.append(tmp / f"bench_{i:03d}.ui")
+                files[-1].write_text(xml, encoding="utf-8")
+            generators = {}
+            for generator in self.GENERATORS:
+                self._sample(files[:1], generator)  # warm imports / uic binary
+                total = min(self._sample(files, generator) for _ in range(self.repeats))
+                generators[generator] = {
+                    "total_ms": round(total, 3),
+                    "per_file_ms": round(total / len(files), 3),
+                }
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return {
+            "label": self.label,
+            "copies": self.copies,
+            "repeats": self.repeats,
+            "generators": generators,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  files={result.get('copies')}  "
+            f"best of {result.get('repeats')}",
+            f"{'generator':<10} {'total ms':>10} {'per file ms':>12}",
+            "-" * 34,
+        ]
+        for name, r in (result.get("generators") or {}).items():
+            lines.append(f"{name:<10} {r['total_ms']:>10.2f} {r['per_file_ms']:>12.3f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(UiCompileBench.format_report(UiCompileBench().run()))
@@ -0,0 +1,166 @@
+"""Benchmark for ``Switchboard.load_all_ui``: wall time vs. event-loop stalls.
+
+A warm-all-UIs pass at host startup is judged by two numbers, and the
+load modes trade one for the other:
+
+  ``serial``
+      ``load_all_ui(workers=0)`` — the original fully serial, blocking
+      loop: every parse, hash check, import and construction on the GUI
+      thread.  The event loop is frozen for the whole pass.
+
+  ``parallel``
+      ``load_all_ui()`` — ``prepare`` (XML parse, compiled-loader hash
+      check, module import) runs in a thread pool while the GUI thread
+      builds; still blocking, so the stall equals the (shorter) wall time.
+
+  ``background``
+      ``load_all_ui(background=True)`` — same prepare pool, construction
+      time-sliced from a ``QTimer``; the host keeps processing events
+      between UIs.
+
+Per mode it reports:
+
+  ``wall_ms``
+      Kick-off to the last UI built.
+
+  ``max_stall_ms``
+      Longest gap between ticks of a 1 ms heartbeat ``QTimer`` running
+      alongside the load — the longest the host's event loop went
+      unserviced.
+
+The corpus is ``COPIES`` copies of ``uitk/examples/example.ui`` (16
+custom widgets) written to a temp dir; each sample uses a fresh
+``Switchboard`` so loader caches start cold (imports stay warm
+in-process, as they would in a host after its first UI).
+
+Run directly (offscreen is fine)::
+
+    python -m bench.ui_preload                  # from uitk/test
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+_EXAMPLE_UI = Path(__file__).resolve().parents[2] / "uitk" / "examples" / "example.ui"
+
+
+class UiPreloadBench:
+    """Time ``load_all_ui`` per mode, with an event-loop heartbeat."""
+
+    #: Copies of the example .ui in the corpus.
+    COPIES = 40
+    #: Modes measured, in report order.
+    MODES = ("serial", "parallel", "background")
+
+    def __init__(
+        self,
+        copies: Optional[int] = None,
+        repeats: int = 3,
+        loader: str = "runtime",
+        label: str = "run",
+    ) -> None:
+        self.copies = copies or self.COPIES
+        self.repeats = repeats
+        self.loader = loader
+        self.label = label
+
+    def _write_corpus(self, root: Path) -> None:
+        xml = _EXAMPLE_UI.read_text(encoding="utf-8")
+        for i in range(self.copies):
+            (root / f"bench_{i:03d}.ui").write_text(xml, encoding="utf-8")
+
+    def _sample(self, ui_dir: str, mode: str) -> dict[str, float]:
+        from qtpy import QtCore, QtWidgets
+        from uitk import Switchboard
+
+        sb = Switchboard(ui_source=ui_dir, base_dir=0, loader=self.loader)
+        loop = QtCore.QEventLoop()
+        beats: list[float] = []
+        heartbeat = QtCore.QTimer()
+        heartbeat.setInterval(1)
+        heartbeat.timeout.connect(lambda: beats.append(time.perf_counter()))
+        marks: dict[str, Any] = {}
+
+        def finish(forms):
+            marks["t1"] = time.perf_counter()
+            marks["forms"] = forms
+            QtCore.QTimer.singleShot(5, loop.quit)  # let the heartbeat resume
+
+        def kickoff():
+            marks["t0"] = time.perf_counter()
+            beats.append(marks["t0"])
+            if mode == "background":
+                sb.load_all_ui(background=True).finished.connect(finish)
+            else:
+                finish(sb.load_all_ui(workers=0 if mode == "serial" else None))
+
+        heartbeat.start()
+        QtCore.QTimer.singleShot(0, kickoff)
+        loop.exec_() if hasattr(loop, "exec_") else loop.exec()
+        heartbeat.stop()
+
+        window = [b for b in beats if b <= marks["t1"]] + [marks["t1"]]
+        max_stall = max(b - a for a, b in zip(window, window[1:]))
+        for form in marks["forms"]:
+            if form is not None:
+                form.deleteLater()
+        QtWidgets.QApplication.processEvents()
+        return {
+            "wall_ms": (marks["t1"] - marks["t0"]) * 1000,
+            "max_stall_ms": max_stall * 1000,
+        }
+
+    def run(self) -> dict[str, Any]:
+        """Run every mode and return best-of-``repeats`` per metric."""
+        from qtpy import QtWidgets
+
+        if QtWidgets.QApplication.instance() is None:
+            raise RuntimeError("UiPreloadBench requires an existing QApplication.")
+
+        tmp = tempfile.mkdtemp(prefix="uitk_preload_bench_")
+        try:
+            self._write_corpus(Path(tmp))
+            self._sample(tmp, "serial")  # warm imports + OS file cache
+            modes = {}
+            for mode in self.MODES:
+                samples = [self._sample(tmp, mode) for _ in range(self.repeats)]
+                modes[mode] = {
+                    k: round(min(s[k] for s in samples), 3)
+                    for k in ("wall_ms", "max_stall_ms")
+                }
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return {
+            "label": self.label,
+            "loader": self.loader,
+            "copies": self.copies,
+            "repeats": self.repeats,
+            "modes": modes,
+        }
+
+    @staticmethod
+    def format_report(result: dict[str, Any]) -> str:
+        """Human-readable table for the result of :meth:`run`."""
+        lines = [
+            f"# {result.get('label', 'run')}  loader={result.get('loader')}  "
+            f"uis={result.get('copies')}  best of {result.get('repeats')}",
+            f"{'mode':<12} {'wall ms':>10} {'max stall ms':>14}",
+            "-" * 38,
+        ]
+        for mode, r in (result.get("modes") or {}).items():
+            lines.append(f"{mode:<12} {r['wall_ms']:>10.2f} {r['max_stall_ms']:>14.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from qtpy import QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(UiPreloadBench.format_report(UiPreloadBench().run()))
@@ -7,9 +7,13 @@ Covers:
 - hash_ui_source is stable on identical bytes and changes on any byte
 - compiled_path_for derives the paired _ui.py path
 - is_compiled_fresh returns False when missing, True after compile, False on edit
+- the FreshnessManifest fast path answers unchanged pairs from stat data alone and
+  falls back to the hash on any signature change (racy-fresh .ui files included)
 - compile_ui writes a file with the embedded constants and qtpy-rewritten imports
 - read_embedded_hash / read_embedded_tags / read_embedded_base_class round-trip
 - _ui.py without a __source_hash__ header is treated as STALE (uitk owns _ui.py end-to-end)
+- the in-process generator builds the same widget trees as uic on the .ui corpus,
+  and compile_ui falls back to uic for constructs it doesn't cover
 """
 
 import os
@@ -18,7 +22,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from conftest import BaseTestCase
+from conftest import BaseTestCase, QtBaseTestCase
 
 from uitk.compile import UiCompiler as compile_mod
 
@@ -460,6 +464,102 @@ class MtimeStalenessGuard(BaseTestCase):
         self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
 
 
+class FreshnessManifestFastPath(BaseTestCase):
+    """Unchanged pairs are fresh from two stats; any change goes back to the hash."""
+
+    def setUp(self):
+        super().setUp()
+        from uitk.compile import FreshnessManifest
+
+        if not FreshnessManifest.STAT_FAST_PATH:
+            self.skipTest("stat fast path is off on this platform")
+        self.Manifest = FreshnessManifest
+        self.tmp = tempfile.mkdtemp()
+        self.ui = _write_sample(Path(self.tmp))
+        self.py = compile_mod.compiled_path_for(self.ui)
+        self._backdate(self.ui)  # out of the racy window
+        self.py.write_text(
+            f'__source_hash__ = "{compile_mod.hash_ui_source(self.ui)}"\n',
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    @staticmethod
+    def _backdate(path, seconds=60):
+        t = os.path.getmtime(path) - seconds
+        os.utime(path, (t, t))
+
+    def _no_hashing(self):
+        from unittest import mock
+
+        return mock.patch.object(
+            compile_mod, "hash_ui_source", side_effect=AssertionError("hashed")
+        )
+
+    def test_proven_pair_is_fresh_without_hashing(self):
+        self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
+        with self._no_hashing():
+            self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
+
+    def test_compile_ui_records_the_pair(self):
+        compile_mod.compile_ui(self.ui)
+        with self._no_hashing():
+            self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
+
+    def test_manifest_persists_across_instances(self):
+        compile_mod.is_compiled_fresh(self.ui, self.py)
+        self.assertTrue(self.Manifest.shared().save())
+        fresh = self.Manifest(self.Manifest.shared().path)
+        self.assertEqual(
+            fresh.lookup(self.ui, self.py), compile_mod.hash_ui_source(self.ui)
+        )
+
+    def test_records_are_saved_once_per_batch(self):
+        from unittest import mock
+
+        from uitk.managers.disk_cache import DiskCache
+
+        manifest = self.Manifest(Path(self.tmp) / "manifest.json")
+        sig = self.Manifest.signature(self.ui)
+        with mock.patch.object(
+            DiskCache, "save_json", wraps=DiskCache.save_json
+        ) as save_json:
+            for i in range(5):
+                manifest.record(f"{self.ui}.{i}", self.py, "hash", sig)
+            self.assertEqual(save_json.call_count, 0)
+            self.assertTrue(manifest.save())
+            self.assertFalse(manifest.save())  # nothing new
+        self.assertEqual(save_json.call_count, 1)
+        self.assertEqual(len(self.Manifest(manifest.path).entries), 5)
+
+    def test_same_size_edit_with_restored_mtime_is_stale(self):
+        compile_mod.is_compiled_fresh(self.ui, self.py)
+        mtime = os.stat(self.ui).st_mtime_ns
+        self.ui.write_text(SAMPLE_UI.replace("alpha", "ALPHA"), encoding="utf-8")
+        os.utime(self.ui, ns=(mtime, mtime))  # mtime-preserving transport
+        self.assertFalse(compile_mod.is_compiled_fresh(self.ui, self.py))
+
+    def test_rewritten_artifact_is_rechecked(self):
+        compile_mod.is_compiled_fresh(self.ui, self.py)
+        self.py.write_text("# raw uic output\n", encoding="utf-8")
+        self.assertFalse(compile_mod.is_compiled_fresh(self.ui, self.py))
+
+    def test_fast_path_off_without_trusted_ctime(self):
+        from unittest import mock
+
+        with mock.patch.object(self.Manifest, "STAT_FAST_PATH", False):
+            self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
+            self.assertIsNone(self.Manifest.shared().lookup(self.ui, self.py))
+
+    def test_recently_modified_ui_is_not_fast_pathed(self):
+        self.ui.write_text(SAMPLE_UI, encoding="utf-8")  # mtime = now
+        self.assertTrue(compile_mod.is_compiled_fresh(self.ui, self.py))
+        self.assertIsNone(self.Manifest.shared().lookup(self.ui, self.py))
+
+
 class PrecompileAsync(BaseTestCase):
     """Background pre-compile via a daemon thread + uic thread pool.
 
@@ -592,5 +692,361 @@ class BindingDetection(BaseTestCase):
         self.assertIn("python", argv)
 
 
+# Exercises every construct the in-process generator claims to cover.
+FEATURE_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Feature</class>
+ <widget class="QMainWindow" name="Feature">
+  <property name="geometry"><rect><x>0</x><y>0</y><width>400</width><height>300</height></rect></property>
+  <property name="windowTitle"><string>Feature</string></property>
+  <property name="uitk_tags" stdset="0"><string>a,b</string></property>
+  <property name="flag" stdset="0"><bool>true</bool></property>
+  <property name="count" stdset="0"><number>3</number></property>
+  <widget class="QWidget" name="centralwidget">
+   <layout class="QGridLayout" name="gridLayout" rowstretch="0,1" columnminimumwidth="40,0">
+    <property name="leftMargin"><number>3</number></property>
+    <property name="horizontalSpacing"><number>5</number></property>
+    <item row="0" column="0" colspan="2">
+     <widget class="QLabel" name="label">
+      <property name="sizePolicy"><sizepolicy hsizetype="Expanding" vsizetype="Fixed"><horstretch>1</horstretch><verstretch>0</verstretch></sizepolicy></property>
+      <property name="font"><font><family>Arial</family><pointsize>12</pointsize><italic>true</italic><underline>true</underline></font></property>
+      <property name="cursor"><cursorShape>PointingHandCursor</cursorShape></property>
+      <property name="toolTip"><string>tip</string></property>
+      <property name="text"><string notr="true">raw</string></property>
+      <property name="alignment"><set>Qt::AlignRight|Qt::AlignTrailing|Qt::AlignVCenter</set></property>
+      <property name="buddy"><cstring>lineEdit</cstring></property>
+      <property name="frameShape"><enum>QFrame::StyledPanel</enum></property>
+     </widget>
+    </item>
+    <item row="1" column="0" alignment="Qt::AlignLeft">
+     <widget class="QLineEdit" name="lineEdit">
+      <property name="text"><string comment="c">hello</string></property>
+     </widget>
+    </item>
+    <item row="1" column="1">
+     <spacer name="horizontalSpacer">
+      <property name="orientation"><enum>Qt::Horizontal</enum></property>
+      <property name="sizeHint" stdset="0"><size><width>40</width><height>20</height></size></property>
+     </spacer>
+    </item>
+    <item row="2" column="0">
+     <widget class="QTabWidget" name="tabWidget">
+      <property name="currentIndex"><number>1</number></property>
+      <widget class="QWidget" name="tab">
+       <attribute name="title"><string>Tab 1</string></attribute>
+       <layout class="QFormLayout" name="formLayout">
+        <item row="0" column="0"><widget class="QLabel" name="label_2"><property name="text"><string>Name</string></property></widget></item>
+        <item row="0" column="1"><widget class="QComboBox" name="comboBox"><property name="currentIndex"><number>1</number></property><item><property name="text"><string>one</string></property></item><item><property name="text"><string>two</string></property></item></widget></item>
+        <item row="1" column="0" colspan="2"><widget class="QCheckBox" name="checkBox"><property name="checked"><bool>true</bool></property></widget></item>
+       </layout>
+      </widget>
+      <widget class="QWidget" name="tab_2">
+       <attribute name="title"><string>Tab 2</string></attribute>
+       <attribute name="toolTip"><string>tt</string></attribute>
+       <layout class="QHBoxLayout" stretch="1,0">
+        <item><widget class="QListWidget" name="listWidget"><property name="currentRow"><number>0</number></property><item><property name="text"><string>x</string></property></item></widget></item>
+        <item>
+         <layout class="QVBoxLayout" name="inner">
+          <item><widget class="QPushButton" name="pushButton"><property name="default"><bool>true</bool></property><property name="text"><string>Go</string></property></widget></item>
+          <item><spacer name="vs"><property name="orientation"><enum>Qt::Vertical</enum></property><property name="sizeType"><enum>QSizePolicy::Fixed</enum></property><property name="sizeHint" stdset="0"><size><width>20</width><height>10</height></size></property></spacer></item>
+         </layout>
+        </item>
+       </layout>
+      </widget>
+     </widget>
+    </item>
+    <item row="2" column="1">
+     <widget class="QStackedWidget" name="stack">
+      <property name="currentIndex"><number>1</number></property>
+      <widget class="QWidget" name="page"/>
+      <widget class="QWidget" name="page2"/>
+     </widget>
+    </item>
+    <item row="3" column="0">
+     <widget class="QTreeWidget" name="tree">
+      <attribute name="headerVisible"><bool>false</bool></attribute>
+      <column><property name="text"><string>A</string></property></column>
+     </widget>
+    </item>
+    <item row="3" column="1">
+     <widget class="QScrollArea" name="scroll">
+      <property name="widgetResizable"><bool>true</bool></property>
+      <widget class="QWidget" name="scrollContents">
+       <property name="geometry"><rect><x>0</x><y>0</y><width>98</width><height>28</height></rect></property>
+      </widget>
+     </widget>
+    </item>
+    <item row="4" column="0">
+     <widget class="QDoubleSpinBox" name="dsb"><property name="value"><double>1.500000000000000</double></property><property name="suffix"><string> cm</string></property></widget>
+    </item>
+    <item row="4" column="1">
+     <widget class="QToolBox" name="toolBox">
+      <widget class="QWidget" name="tbpage"><attribute name="label"><string>Page</string></attribute></widget>
+     </widget>
+    </item>
+   </layout>
+  </widget>
+  <widget class="QMenuBar" name="menubar">
+   <property name="geometry"><rect><x>0</x><y>0</y><width>400</width><height>22</height></rect></property>
+   <widget class="QMenu" name="menuFile">
+    <property name="title"><string>File</string></property>
+    <addaction name="actionOpen"/>
+    <addaction name="separator"/>
+   </widget>
+   <addaction name="menuFile"/>
+  </widget>
+  <widget class="QStatusBar" name="statusbar"/>
+  <widget class="QToolBar" name="toolBar">
+   <attribute name="toolBarArea"><enum>LeftToolBarArea</enum></attribute>
+   <attribute name="toolBarBreak"><bool>false</bool></attribute>
+   <addaction name="actionOpen"/>
+  </widget>
+  <action name="actionOpen">
+   <property name="checkable"><bool>true</bool></property>
+   <property name="icon"><iconset><normaloff>missing.png</normaloff></iconset></property>
+   <property name="text"><string>Open</string></property>
+   <property name="shortcut"><string>Ctrl+O</string></property>
+  </action>
+ </widget>
+ <tabstops><tabstop>lineEdit</tabstop><tabstop>comboBox</tabstop></tabstops>
+ <resources/>
+ <connections>
+  <connection><sender>pushButton</sender><signal>clicked()</signal><receiver>lineEdit</receiver><slot>clear()</slot></connection>
+ </connections>
+</ui>
+"""
+
+# Free (layout-less) placement, splitters, lines, z-order, promoted widgets.
+FREE_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Free</class>
+ <widget class="QWidget" name="Free">
+  <property name="geometry"><rect><x>0</x><y>0</y><width>320</width><height>240</height></rect></property>
+  <widget class="QFrame" name="frame">
+   <property name="geometry"><rect><x>5</x><y>6</y><width>200</width><height>100</height></rect></property>
+   <property name="frameShape"><enum>QFrame::Box</enum></property>
+   <property name="font"><font><weight>75</weight><bold>true</bold><strikeout>true</strikeout></font></property>
+   <widget class="QLabel" name="inner">
+    <property name="geometry"><rect><x>1</x><y>2</y><width>50</width><height>20</height></rect></property>
+    <property name="pixmap"><pixmap>missing.png</pixmap></property>
+   </widget>
+  </widget>
+  <widget class="Line" name="line">
+   <property name="geometry"><rect><x>0</x><y>110</y><width>300</width><height>3</height></rect></property>
+   <property name="orientation"><enum>Qt::Horizontal</enum></property>
+  </widget>
+  <widget class="QSplitter" name="splitter">
+   <property name="geometry"><rect><x>0</x><y>120</y><width>300</width><height>100</height></rect></property>
+   <property name="orientation"><enum>Qt::Vertical</enum></property>
+   <widget class="PushButton" name="button"><property name="text"><string>B</string></property></widget>
+   <widget class="QSpinBox" name="spin"><property name="maximum"><number>7</number></property></widget>
+  </widget>
+  <zorder>splitter</zorder>
+  <zorder>frame</zorder>
+ </widget>
+ <customwidgets>
+  <customwidget>
+   <class>PushButton</class>
+   <extends>QPushButton</extends>
+   <header>uitk.widgets.pushButton</header>
+  </customwidget>
+ </customwidgets>
+ <resources/>
+ <connections>
+  <connection><sender>spin</sender><signal>valueChanged(int)</signal><receiver>Free</receiver><slot>close()</slot></connection>
+ </connections>
+</ui>
+"""
+
+_EXAMPLE_UI = Path(__file__).resolve().parents[1] / "uitk" / "examples" / "example.ui"
+
+
+def _tree_snapshot(form) -> dict:
+    """Comparable description of a built form: objects, properties, layouts, items."""
+    from qtpy import QtCore, QtGui, QtWidgets
+
+    def norm(value):
+        if isinstance(value, QtCore.QObject):
+            return value.objectName()
+        if isinstance(value, QtGui.QIcon):
+            return ("icon", value.isNull())
+        if isinstance(value, QtGui.QPixmap):
+            return ("pixmap", value.size().toTuple())
+        if isinstance(value, QtGui.QFont):
+            return value.toString()
+        if isinstance(value, QtWidgets.QSizePolicy):
+            return (
+                value.horizontalPolicy(),
+                value.verticalPolicy(),
+                value.horizontalStretch(),
+                value.verticalStretch(),
+            )
+        if isinstance(value, QtGui.QCursor):
+            return value.shape()
+        if isinstance(value, QtGui.QKeySequence):
+            return value.toString()
+        return repr(value) if type(value).__repr__ is object.__repr__ else value
+
+    def describe(obj):
+        meta = obj.metaObject()
+        props = {}
+        for i in range(meta.propertyCount()):
+            name = meta.property(i).name()
+            props[name] = norm(obj.property(name))
+        for name in obj.dynamicPropertyNames():
+            name = bytes(name).decode()
+            try:
+                props[name] = norm(obj.property(name))
+            except RuntimeError:  # C++-only value type (Qt internals)
+                props[name] = "<unconvertible>"
+        entry = {
+            "class": meta.className(),
+            "parent": obj.parent().objectName() if obj.parent() else None,
+            "props": props,
+        }
+        if isinstance(obj, QtWidgets.QLayout):
+            items = []
+            for i in range(obj.count()):
+                item = obj.itemAt(i)
+                if item.widget():
+                    kind = item.widget().objectName()
+                elif item.layout():
+                    kind = item.layout().objectName()
+                else:
+                    spacer = item.spacerItem()
+                    kind = (
+                        "spacer",
+                        spacer.sizeHint().toTuple(),
+                        spacer.sizePolicy().horizontalPolicy(),
+                        spacer.sizePolicy().verticalPolicy(),
+                    )
+                if isinstance(obj, (QtWidgets.QGridLayout, QtWidgets.QFormLayout)):
+                    position = obj.getItemPosition(i)
+                elif isinstance(obj, QtWidgets.QBoxLayout):
+                    position = obj.stretch(i)
+                else:
+                    position = None
+                items.append((kind, position, int(item.alignment())))
+            entry["items"] = items
+            if isinstance(obj, QtWidgets.QGridLayout):
+                entry["grid"] = (
+                    [obj.rowStretch(r) for r in range(obj.rowCount())],
+                    [obj.columnMinimumWidth(c) for c in range(obj.columnCount())],
+                )
+        if isinstance(obj, QtWidgets.QWidget):
+            entry["actions"] = [
+                a.text() or a.objectName() for a in QtWidgets.QWidget.actions(obj)
+            ]
+            entry["tab_next"] = obj.nextInFocusChain().objectName()
+        if isinstance(obj, QtWidgets.QComboBox):
+            entry["texts"] = [obj.itemText(i) for i in range(obj.count())]
+        if isinstance(obj, QtWidgets.QListWidget):
+            entry["texts"] = [obj.item(i).text() for i in range(obj.count())]
+        if isinstance(obj, QtWidgets.QTreeWidget):
+            entry["texts"] = [obj.headerItem().text(i) for i in range(obj.columnCount())]
+        if isinstance(obj, QtWidgets.QTabWidget):
+            entry["texts"] = [(obj.tabText(i), obj.tabToolTip(i)) for i in range(obj.count())]
+        if isinstance(obj, QtWidgets.QToolBox):
+            entry["texts"] = [obj.itemText(i) for i in range(obj.count())]
+        if isinstance(obj, QtWidgets.QMainWindow):
+            entry["areas"] = [
+                (tb.objectName(), obj.toolBarArea(tb))
+                for tb in obj.findChildren(QtWidgets.QToolBar)
+            ]
+        return entry
+
+    objects = [form] + form.findChildren(QtCore.QObject)
+    return {o.objectName(): describe(o) for o in objects if o.objectName()}
+
+
+class InProcessGenerator(QtBaseTestCase):
+    """The in-process generator must build the same widget trees as uic.
+
+    Each .ui in the corpus is compiled twice (``generator="python"`` and
+    ``"uic"``), both modules are imported and instantiated, and the trees
+    are compared object by object: class, parent, every Qt and dynamic
+    property, layout items and positions, item texts, actions, tab chain.
+    """
+
+    CORPUS = {"feature": FEATURE_UI, "free": FREE_UI, "sample": SAMPLE_UI}
+
+    def setUp(self):
+        super().setUp()
+        try:
+            compile_mod._detect_binding()
+        except FileNotFoundError:
+            self.skipTest("No Qt uic compiler on PATH")
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def _build(self, ui: Path, generator: str):
+        import importlib.util
+        from qtpy import QtWidgets
+
+        out = self.tmp / f"{ui.stem}_{generator}_ui.py"
+        compile_mod.compile_ui(ui, out, generator=generator)
+        spec = importlib.util.spec_from_file_location(f"_gen_{out.stem}", out)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        form = self.track_widget(getattr(QtWidgets, module.__base_class__)())
+        getattr(module, f"Ui_{module.__form_class__}")().setupUi(form)
+        return form, out.read_text(encoding="utf-8")
+
+    def _assert_same_tree(self, ui: Path):
+        py_form, py_source = self._build(ui, "python")
+        uic_form, _ = self._build(ui, "uic")
+        self.assertIn("uitk.ui_codegen", py_source)  # really the in-process path
+        expected, actual = _tree_snapshot(uic_form), _tree_snapshot(py_form)
+        self.assertEqual(sorted(actual), sorted(expected))
+        for name in expected:
+            self.assertEqual(actual[name], expected[name], f"{ui.name}: {name}")
+
+    def test_repo_example_ui_matches_uic(self):
+        ui = self.tmp / "example.ui"
+        shutil.copy(_EXAMPLE_UI, ui)
+        self._assert_same_tree(ui)
+
+    def test_inline_corpus_matches_uic(self):
+        for stem, xml in self.CORPUS.items():
+            with self.subTest(ui=stem):
+                ui = self.tmp / f"{stem}.ui"
+                ui.write_text(xml, encoding="utf-8")
+                self._assert_same_tree(ui)
+
+    def test_auto_falls_back_to_uic_for_unsupported_constructs(self):
+        from uitk.ui_codegen import UnsupportedUiError
+
+        ui = self.tmp / "palette.ui"
+        ui.write_text(
+            SAMPLE_UI.replace(
+                "<resources/>",
+                "<resources><include location='icons.qrc'/></resources>",
+            ),
+            encoding="utf-8",
+        )
+        with self.assertRaises(UnsupportedUiError):
+            compile_mod.compile_ui(ui, generator="python")
+        text = compile_mod.compile_ui(ui).read_text(encoding="utf-8")
+        self.assertNotIn("uitk.ui_codegen", text)
+        self.assertIn("Ui_SampleForm", text)
+        self.assertIn("from qtpy", text)
+
+    def test_default_generator_does_not_spawn_uic(self):
+        import subprocess
+        from unittest import mock
+
+        ui = _write_sample(self.tmp)
+        with mock.patch.object(subprocess, "run", side_effect=AssertionError("uic")):
+            out = compile_mod.compile_ui(ui)
+        self.assertTrue(compile_mod.is_compiled_fresh(ui, out))
+
+    def test_unknown_generator_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_mod.compile_ui(_write_sample(self.tmp), generator="cpp")
+
+
 if __name__ == "__main__":
     unittest.main()
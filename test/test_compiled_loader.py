@@ -96,6 +96,32 @@ class CompiledLoaderBasic(QtBaseTestCase):
         self.assertIsNotNone(btn)
         self.assertEqual(btn.text(), "OK")
 
+    def test_prepare_compiles_and_imports_ahead_of_load(self):
+        from unittest.mock import patch
+
+        self.sb._loader.prepare(str(self.ui))
+        self.assertTrue(compile_mod.compiled_path_for(self.ui).exists())
+        # The GUI-thread load is left with setupUi alone.
+        with patch.object(compile_mod, "ensure_compiled", side_effect=AssertionError):
+            widget = self.sb.load_ui(str(self.ui))
+        self.assertEqual(widget.objectName(), "Foo")
+
+    def test_worker_header_resolver_only_reads_lazy_registry(self):
+        from unittest.mock import patch
+
+        sb = Switchboard(
+            ui_source=self.dir,
+            log_level="WARNING",
+            loader="compiled",
+            lazy_widgets=True,
+        )
+        registry = sb.registry.widget_registry
+        with patch.object(
+            registry, "resolve_deferred", side_effect=AssertionError
+        ):
+            module = sb._loader._resolve_header_readonly("PushButton", "")
+        self.assertEqual(module, "uitk.widgets.pushButton")
+
     def test_tags_resolved_via_loader_lazily(self):
         # Init no longer eagerly parses; _get_ui_tags() lazy-loads on first
         # request and caches. Via the compiled-loader path this auto-compiles
@@ -0,0 +1,139 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Unit tests for uitk.managers.icon_disk_cache (IconDiskCache).
+
+Covers:
+- Keys: content, color, size and scale each produce a distinct entry.
+- PNG round trip; best-effort writes into an unwritable root.
+- The size cap evicting least recently used files; stale version
+  directories swept on first write.
+- IconManager integration: a warm cache skips colorize + rasterize and
+  yields the same pixels; nothing is written while ``persist`` is off.
+
+Run standalone: python -m test.test_icon_disk_cache
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from conftest import QtBaseTestCase, setup_qt_application
+
+app = setup_qt_application()
+
+from qtpy import QtCore, QtGui
+from uitk.managers.icon_disk_cache import IconDiskCache
+from uitk.managers.icon_manager import IconManager
+
+
+def _image(color="#ff0000", size=8):
+    image = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32)
+    image.fill(QtGui.QColor(color))
+    return image
+
+
+class TestIconDiskCache(QtBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache = IconDiskCache(self.tmp / "icons", persist=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def test_key_covers_content_color_size_and_scale(self):
+        h = IconDiskCache.content_hash("<svg/>")
+        other = IconDiskCache.content_hash("<svg></svg>")
+        keys = {
+            IconDiskCache.key(h, "#ffffff", (16, 16), 1.0),
+            IconDiskCache.key(h, "#000000", (16, 16), 1.0),
+            IconDiskCache.key(h, "#ffffff", (24, 24), 1.0),
+            IconDiskCache.key(h, "#ffffff", (16, 16), 2.0),
+            IconDiskCache.key(other, "#ffffff", (16, 16), 1.0),
+        }
+        self.assertEqual(len(keys), 5)
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.load("a"))
+        self.assertTrue(self.cache.store("a", _image()))
+        loaded = self.cache.load("a")
+        self.assertEqual(loaded.pixelColor(0, 0), QtGui.QColor("#ff0000"))
+        self.assertEqual(list(self.cache.path.glob("*.tmp")), [])
+
+    def test_unwritable_root_degrades(self):
+        blocker = self.tmp / "file"
+        blocker.write_text("x")
+        cache = IconDiskCache(blocker, persist=True)
+        self.assertFalse(cache.store("a", _image()))
+        self.assertIsNone(cache.load("a"))
+
+    def test_size_cap_evicts_least_recently_used(self):
+        self.cache.store("probe", _image())
+        one = self.cache.size_bytes()
+        self.cache.clear()
+
+        cache = IconDiskCache(self.tmp / "icons", persist=True, max_bytes=one * 3)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.store(key, _image())
+            file = cache.path / f"{key}.png"
+            # Distinct, ordered mtimes regardless of filesystem granularity.
+            t = 1_000_000 + i * 10
+            os.utime(file, (t, t))
+        cache.load("a")  # a is now the most recent
+        cache.store("d", _image())  # over the cap
+        stored = sorted(p.stem for p in cache.path.glob("*.png"))
+        self.assertNotIn("b", stored)
+        self.assertIn("a", stored)
+        self.assertIn("d", stored)
+        self.assertLessEqual(cache.size_bytes(), one * 3)
+
+    def test_stale_versions_are_swept(self):
+        stale = self.cache.root / "v0"
+        stale.mkdir(parents=True)
+        (stale / "old.png").write_bytes(b"")
+        self.cache.store("a", _image())
+        self.assertFalse(stale.exists())
+        self.assertTrue((self.cache.path / "a.png").exists())
+
+
+class TestIconManagerDiskCache(QtBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = Path(tempfile.mkdtemp())
+        self.disk = IconDiskCache(self.tmp / "icons", persist=True)
+        IconManager.disk_cache = self.disk
+        IconManager.clear_cache()
+
+    def tearDown(self):
+        IconManager.disk_cache = None
+        IconManager.clear_cache()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def _pixels(self, icon):
+        return icon.pixmap(QtCore.QSize(16, 16)).toImage()
+
+    def test_warm_cache_skips_colorize_and_render(self):
+        cold = IconManager.get("save", (16, 16), "#5285a6")
+        self.assertTrue(list(self.disk.path.glob("*.png")))
+
+        IconManager.clear_cache()  # a fresh process: only the disk tier left
+        with patch.object(IconManager, "_colorize_svg") as colorize, patch.object(
+            IconManager, "_rasterize"
+        ) as rasterize:
+            warm = IconManager.get("save", (16, 16), "#5285a6")
+        colorize.assert_not_called()
+        rasterize.assert_not_called()
+        self.assertEqual(self._pixels(warm), self._pixels(cold))
+
+    def test_disabled_cache_writes_nothing(self):
+        self.disk.persist = False
+        IconManager.get("save", (16, 16), "#5285a6")
+        self.assertFalse(self.disk.path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
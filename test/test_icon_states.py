@@ -11,6 +11,7 @@ Run standalone: python -m test.test_icon_states
 """
 
 import unittest
+from unittest.mock import patch
 
 from conftest import QtBaseTestCase, setup_qt_application
 
@@ -393,6 +394,228 @@ class TestRegisterIconDirInvalidatesCache(IconTestCase):
             self.assertNotEqual(resolved, packaged_svg)
 
 
+class TestIconManagerCaches(IconTestCase):
+    """The icon LRU, the byte-bounded SVG cache and their counters."""
+
+    def setUp(self):
+        super().setUp()
+        IconManager.clear_cache()
+        IconManager.reset_cache_stats()
+        self._limits = (IconManager._MAX_CACHE_SIZE, IconManager._MAX_SVG_CACHE_BYTES)
+
+    def tearDown(self):
+        IconManager._MAX_CACHE_SIZE, IconManager._MAX_SVG_CACHE_BYTES = self._limits
+        IconManager.clear_cache()
+        super().tearDown()
+
+    def test_hits_and_misses_are_counted(self):
+        first = IconManager.get("save", (16, 16), "#000000")
+        again = IconManager.get("save", (16, 16), "#000000")
+        self.assertIs(again, first)
+        stats = IconManager.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["svg_misses"], 1)
+
+    def test_lru_evicts_least_recently_used(self):
+        IconManager._MAX_CACHE_SIZE = 2
+        IconManager.get("save", (16, 16), "#000000")
+        IconManager.get("save", (16, 16), "#111111")
+        IconManager.get("save", (16, 16), "#000000")  # touch: now most recent
+        IconManager.get("save", (16, 16), "#222222")
+        keys = list(IconManager._cache)
+        self.assertEqual(
+            keys, [("save", (16, 16), "#000000"), ("save", (16, 16), "#222222")]
+        )
+        self.assertEqual(IconManager.get_cache_stats()["evictions"], 1)
+
+    def test_svg_cache_is_byte_bounded(self):
+        sizes = {
+            name: len(IconManager._load_svg_content(name).encode("utf-8"))
+            for name in ("save", "close", "pin")
+        }
+        IconManager.clear_cache()
+        IconManager._MAX_SVG_CACHE_BYTES = sizes["close"] + sizes["pin"]
+        for name in ("save", "close", "pin"):
+            IconManager._load_svg_content(name)
+        stats = IconManager.get_cache_stats()
+        self.assertEqual(list(IconManager._svg_cache), ["close", "pin"])
+        self.assertEqual(stats["svg_cache_bytes"], sizes["close"] + sizes["pin"])
+        self.assertEqual(stats["svg_evictions"], 1)
+
+    def test_oversized_svg_is_not_cached(self):
+        IconManager._MAX_SVG_CACHE_BYTES = 10
+        self.assertTrue(IconManager._load_svg_content("save"))
+        self.assertEqual(len(IconManager._svg_cache), 0)
+        self.assertEqual(IconManager.get_cache_stats()["svg_cache_bytes"], 0)
+
+    def test_clear_cache_resets_byte_total(self):
+        IconManager._load_svg_content("save")
+        IconManager.clear_cache()
+        self.assertEqual(IconManager.get_cache_stats()["svg_cache_bytes"], 0)
+
+
+class TestIconManagerAsyncRendering(IconTestCase):
+    """set_icon(async_render=True): worker-thread rasterization, placeholder
+    until the render lands, then the same pixels as a synchronous render."""
+
+    def setUp(self):
+        super().setUp()
+        IconManager.clear_cache()
+
+    def tearDown(self):
+        IconManager.finish_pending_renders()
+        IconManager.clear_cache()
+        super().tearDown()
+
+    def _button(self):
+        return self.track_widget(QtWidgets.QPushButton())
+
+    def test_placeholder_then_swap_in(self):
+        button = self._button()
+        IconManager.set_icon(button, "save", size=16, color=OFF, async_render=True)
+        self.assertTrue(button.icon().isNull())
+        self.assertEqual(button.iconSize(), QtCore.QSize(16, 16))
+        self.assertEqual(IconManager.get_cache_stats()["pending_renders"], 1)
+
+        self.assertEqual(IconManager.finish_pending_renders(), 1)
+        self.assertFalse(button.icon().isNull())
+        self.assertEqual(_icon_image(button), _reference_image("save", button, OFF))
+
+    def test_rasterizes_off_the_gui_thread(self):
+        import threading
+
+        threads = []
+        rasterize = IconManager._rasterize
+
+        def spy(*args):
+            threads.append(threading.current_thread())
+            return rasterize(*args)
+
+        with patch.object(IconManager, "_rasterize", side_effect=spy):
+            IconManager.set_icon(self._button(), "save", size=16, async_render=True)
+            IconManager.finish_pending_renders()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_timer_delivers_without_blocking(self):
+        button = self._button()
+        IconManager.set_icon(button, "save", size=16, color=OFF, async_render=True)
+        deadline = QtCore.QDeadlineTimer(5000)
+        while button.icon().isNull() and not deadline.hasExpired():
+            QtWidgets.QApplication.processEvents()
+        self.assertFalse(button.icon().isNull())
+        self.assertIn(("save", (16, 16), OFF), IconManager._cache)
+
+    def test_same_key_shares_one_job(self):
+        a, b = self._button(), self._button()
+        IconManager.set_icon(a, "save", size=16, color=OFF, async_render=True)
+        IconManager.set_icon(b, "save", size=16, color=OFF, async_render=True)
+        self.assertEqual(len(IconManager._pending_renders), 1)
+        IconManager.finish_pending_renders()
+        self.assertEqual(a.icon().cacheKey(), b.icon().cacheKey())
+        self.assertEqual(_icon_image(a), _icon_image(b))
+
+    def test_later_set_icon_wins_over_stale_render(self):
+        button = self._button()
+        IconManager.set_icon(button, "save", size=16, color=OFF, async_render=True)
+        IconManager.set_icon(button, "close", size=16, color=OFF, async_render=False)
+        IconManager.finish_pending_renders()
+        self.assertEqual(_icon_image(button), _reference_image("close", button, OFF))
+
+    def test_cached_icon_is_set_synchronously(self):
+        IconManager.get("save", (16, 16), OFF)
+        button = self._button()
+        IconManager.set_icon(button, "save", size=16, color=OFF, async_render=True)
+        self.assertFalse(button.icon().isNull())
+        self.assertEqual(IconManager.get_cache_stats()["pending_renders"], 0)
+
+
+class TestIconSweepIndex(IconTestCase):
+    """update_widget_icons visits only the swept window's indexed widgets,
+    short-circuits repeat sweeps and defers hidden windows on request."""
+
+    def _window(self, buttons=2):
+        window = self.track_widget(QtWidgets.QWidget())
+        layout = QtWidgets.QVBoxLayout(window)
+        for _ in range(buttons):
+            button = QtWidgets.QPushButton(window)
+            layout.addWidget(button)
+            IconManager.set_icon(button, "cube", size=(15, 15))
+        return window
+
+    def _buttons(self, window):
+        return window.findChildren(QtWidgets.QPushButton)
+
+    def test_other_windows_are_not_visited(self):
+        a, b = self._window(), self._window()
+        with patch.object(
+            IconManager, "_set_widget_icon", wraps=IconManager._set_widget_icon
+        ) as set_icon:
+            IconManager.update_widget_icons(a, THEME)
+        touched = {call.args[0] for call in set_icon.call_args_list}
+        self.assertEqual(touched, set(self._buttons(a)))
+        for button in self._buttons(b):
+            self.assertNotEqual(IconManager._last_update_color[id(button)], THEME)
+
+    def test_repeat_sweep_of_swept_window_is_free(self):
+        window = self._window()
+        IconManager.update_widget_icons(window, THEME)
+        with patch.object(IconManager, "_sweep") as sweep:
+            IconManager.update_widget_icons(window, THEME)
+        sweep.assert_not_called()
+
+        # A newly registered widget makes the window dirty again.
+        button = QtWidgets.QPushButton(window)
+        IconManager.set_icon(button, "cube", size=(15, 15))
+        IconManager.update_widget_icons(window, THEME)
+        self.assertEqual(_icon_image(button), _reference_image("cube", button, THEME))
+
+    def test_widget_registered_before_parenting_is_swept(self):
+        window = self._window(buttons=0)
+        button = QtWidgets.QPushButton()
+        IconManager.set_icon(button, "cube", size=(15, 15))
+        window.layout().addWidget(button)
+
+        IconManager.update_widget_icons(window, THEME)
+        self.assertEqual(_icon_image(button), _reference_image("cube", button, THEME))
+
+    def test_hidden_window_is_deferred_until_shown(self):
+        window = self._window()
+        window.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        button = self._buttons(window)[0]
+        IconManager.update_widget_icons(window, THEME, defer_hidden=True)
+        self.assertNotEqual(IconManager._last_update_color[id(button)], THEME)
+
+        window.show()
+        self.assertEqual(IconManager._last_update_color[id(button)], THEME)
+        self.assertEqual(_icon_image(button), _reference_image("cube", button, THEME))
+
+    def test_visible_window_is_swept_immediately(self):
+        window = self._window()
+        window.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+        window.show()
+        button = self._buttons(window)[0]
+        IconManager.update_widget_icons(window, THEME, defer_hidden=True)
+        self.assertEqual(IconManager._last_update_color[id(button)], THEME)
+
+    def test_tree_refreshed_once_per_color(self):
+        from uitk.widgets.treeWidget import TreeWidget
+
+        window = self._window(buttons=0)
+        tree = TreeWidget(window)
+        tree.set_item_icon(QtWidgets.QTreeWidgetItem(tree), "cube")
+        with patch.object(TreeWidget, "refresh_item_icons") as refresh:
+            IconManager.update_widget_icons(window, THEME)
+            IconManager.update_widget_icons(tree, THEME)
+        refresh.assert_called_once_with(THEME)
+
+    def test_default_color_change_keeps_rendered_icons(self):
+        IconManager.get("cube", (15, 15), OFF)
+        IconManager.set_default_color(THEME)
+        self.assertIn(("cube", (15, 15), OFF), IconManager._cache)
+
+
 class TestSetLabelIcon(IconTestCase):
     """set_label_icon composites a themed icon into a text-only widget (QLabel
     has no setIcon) via rich text, preserving the plain text out-of-band."""
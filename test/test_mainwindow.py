@@ -1192,6 +1192,111 @@ class TestMainWindowRegistrationEdgeCases(QtBaseTestCase):
         self.assertIn(widget, window.widgets)
 
 
+class TestMainWindowLazyRegistration(QtBaseTestCase):
+    """Tests for batched and lazy register_children."""
+
+    def setUp(self):
+        super().setUp()
+        self.sb = MockSwitchboard()
+
+    def _build(self, lazy=True):
+        """A window whose central widget is a 3-tab QTabWidget, 2 buttons per tab."""
+        from uitk.widgets.mainWindow import MainWindow
+
+        window = self.track_widget(
+            MainWindow("LazyWindow", self.sb, lazy_registration=lazy)
+        )
+        tabs = QtWidgets.QTabWidget()
+        tabs.setObjectName("tabs")
+        for t in range(3):
+            page = QtWidgets.QWidget()
+            page.setObjectName(f"page{t}")
+            layout = QtWidgets.QVBoxLayout(page)
+            for b in range(2):
+                button = QtWidgets.QPushButton(page)
+                button.setObjectName(f"b{t}{b}")
+                layout.addWidget(button)
+            tabs.addTab(page, f"Tab {t}")
+        window.setCentralWidget(tabs)
+        return window, tabs
+
+    def _registered(self, window):
+        return {w.objectName() for w in window.widgets}
+
+    def test_eager_by_default(self):
+        """Without lazy_registration every named widget registers on the walk."""
+        window, _ = self._build(lazy=False)
+        window.register_children()
+        self.assertTrue({"b00", "b11", "b21"} <= self._registered(window))
+        self.assertEqual(window._deferred_registrations, {})
+
+    def test_lazy_defers_unopened_pages(self):
+        """Only the current tab's widgets register; other pages are deferred."""
+        window, tabs = self._build()
+        window.register_children()
+        registered = self._registered(window)
+        self.assertTrue({"page0", "b00", "b01"} <= registered)
+        self.assertFalse({"b10", "b11", "b20", "b21"} & registered)
+        self.assertEqual(
+            {w.objectName() for w in window._deferred_registrations},
+            {"page1", "page2"},
+        )
+
+    def test_lazy_page_registers_on_first_show(self):
+        """Switching to a deferred tab registers its subtree."""
+        window, tabs = self._build()
+        window.show()
+        self.assertNotIn("b10", self._registered(window))
+        tabs.setCurrentIndex(1)
+        registered = self._registered(window)
+        self.assertTrue({"page1", "b10", "b11"} <= registered)
+        self.assertNotIn("b20", registered)
+        self.assertEqual(
+            [w.objectName() for w in window._deferred_registrations], ["page2"]
+        )
+
+    def test_register_deferred_flushes_everything(self):
+        """register_deferred registers every pending subtree."""
+        window, _ = self._build()
+        window.register_children()
+        self.assertEqual(window.register_deferred(), 2)
+        self.assertTrue({"b10", "b11", "b20", "b21"} <= self._registered(window))
+        self.assertEqual(window._deferred_registrations, {})
+
+    def test_attribute_access_registers_deferred_widget(self):
+        """ui.<name> still resolves a widget inside a deferred page."""
+        window, _ = self._build()
+        window.register_children()
+        button = window.b21
+        self.assertEqual(button.objectName(), "b21")
+        self.assertIn(button, window.widgets)
+
+    def test_nested_register_children_is_batched(self):
+        """init_slot's register_children is skipped while the walk registers the widget."""
+        window, tabs = self._build(lazy=False)
+        walks = []
+        original = type(tabs).findChildren
+
+        def counting_find(widget, *args, **kwargs):
+            walks.append(widget.objectName())
+            return original(widget, *args, **kwargs)
+
+        self.sb.init_slot = lambda widget: widget.register_children()
+        with patch.object(QtWidgets.QWidget, "findChildren", counting_find):
+            window.register_children()
+        self.assertEqual(walks.count("page1"), 1)
+        self.assertIn("b11", self._registered(window))
+
+    def test_register_children_outside_walk_still_runs(self):
+        """A widget's register_children picks up children added after its walk."""
+        window, _ = self._build(lazy=False)
+        window.register_children()
+        late = QtWidgets.QPushButton(window.page0)
+        late.setObjectName("late")
+        window.page0.register_children()
+        self.assertIn(late, window.widgets)
+
+
 class TestMainWindowStyleEdgeCases(QtBaseTestCase):
     """Edge case tests for stylesheet handling."""
 
@@ -1716,6 +1821,20 @@ class TestStateLoadFiresConnectedSlots(QtBaseTestCase):
         )
 
 
+class TestMainWindowFlushState(QtBaseTestCase):
+    """Hiding/closing a window flushes its write-behind state writes."""
+
+    def test_hide_flushes_pending_state(self):
+        from uitk.widgets.mainWindow import MainWindow
+
+        window = self.track_widget(MainWindow("TestWindow", MockSwitchboard()))
+        window.state.write_behind_ms = 10_000
+        window.state.save_value("slider/valueChanged", 42)
+        self.assertTrue(window.state.pending_keys)
+        window.on_hide.emit()
+        self.assertFalse(window.state.pending_keys)
+
+
 class TestRunWhenReady(QtBaseTestCase):
     """``MainWindow.run_when_ready`` defers a callback until the UI's children
     are registered (first show), or runs it immediately if already shown.
@@ -9,6 +9,7 @@ This module tests the registry system backing Switchboard discovery:
 - Location checks (case-normalized, extensionless)
 - Descriptor guards and container bookkeeping
 - Deprecated ``uitk.file_manager`` aliases
+- The persisted class-name scan index (``ScanIndex``)
 
 Run standalone: python -m test.test_registry_manager
 """
@@ -20,13 +21,14 @@ import shutil
 import sys
 import tempfile
 import unittest
+import unittest.mock
 import warnings
 from collections import namedtuple
 from pathlib import Path
 
 from conftest import BaseTestCase, EXAMPLES_DIR, WIDGETS_DIR
 
-from uitk.managers.registry_manager import FileRegistry, RegistryManager
+from uitk.managers.registry_manager import FileRegistry, RegistryManager, ScanIndex
 from pythontk.core_utils.namedtuple_container import NamedTupleContainer
 
 TEMP_ROOT = Path(__file__).parent / "temp_tests"
@@ -362,6 +364,193 @@ class TestDescriptorGuardsAndBookkeeping(TempTreeTestCase):
         self.assertFalse(self.manager.remove_container("ui_registry"))
 
 
+class TestScanIndex(TempTreeTestCase):
+    """The class-name index lets a later scan skip parsing unchanged files."""
+
+    CLASS_FIELDS = ["classname", "classobj", "filename", "filepath"]
+
+    def setUp(self):
+        super().setUp()
+        (self.tmp / "no_classes.py").write_text("VALUE = 1\n", encoding="utf-8")
+        self.index_path = self.tmp / "index" / "scan_index.json"
+
+    def _scan(self, index):
+        manager = RegistryManager(scan_index=index)
+        return manager.create(
+            "widget_registry", str(self.tmp), fields=self.CLASS_FIELDS, inc_files="*.py"
+        )
+
+    def _count_parses(self):
+        calls = []
+        real = ScanIndex._parse_class_names
+
+        def counting(filepath):
+            calls.append(os.path.basename(filepath))
+            return real(filepath)
+
+        patcher = unittest.mock.patch.object(
+            ScanIndex, "_parse_class_names", staticmethod(counting)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    def test_rows_match_unindexed_scan(self):
+        indexed = self._scan(ScanIndex(self.index_path))
+        plain = self._scan(False)
+        key = lambda r: (r.classname, r.filepath)
+        self.assertEqual(
+            sorted((r.classname, r.filename) for r in indexed.named_tuples),
+            sorted((r.classname, r.filename) for r in plain.named_tuples),
+        )
+        for a, b in zip(
+            sorted(indexed.named_tuples, key=key), sorted(plain.named_tuples, key=key)
+        ):
+            self.assertEqual(a.classobj.__name__, b.classobj.__name__)
+
+    def test_class_names_follow_direct_scan_order(self):
+        path = self.tmp / "nested_classes.py"
+        path.write_text(
+            "class A:\n    class Inner:\n        pass\n\n\nclass B:\n    pass\n",
+            encoding="utf-8",
+        )
+        # ast.walk order, as ptk.get_classes_from_path lists them.
+        self.assertEqual(
+            ScanIndex._parse_class_names(str(path)), ["A", "B", "Inner"]
+        )
+
+    def test_index_is_persisted_and_reused(self):
+        calls = self._count_parses()
+        self._scan(ScanIndex(self.index_path))
+        self.assertEqual(
+            sorted(calls), ["no_classes.py", "sample_registry_mod.py"]
+        )
+        self.assertTrue(self.index_path.is_file())
+
+        calls.clear()
+        registry = self._scan(ScanIndex(self.index_path))  # fresh process, same file
+        self.assertEqual(calls, [])
+        self.assertIn("SampleWidget", registry.get("classname"))
+
+    def test_changed_file_is_rescanned(self):
+        calls = self._count_parses()
+        self._scan(ScanIndex(self.index_path))
+        (self.tmp / "sample_registry_mod.py").write_text(
+            SAMPLE_MODULE + "\n\nclass AddedWidget:\n    pass\n", encoding="utf-8"
+        )
+        calls.clear()
+        registry = self._scan(ScanIndex(self.index_path))
+        self.assertEqual(calls, ["sample_registry_mod.py"])
+        self.assertIn("AddedWidget", registry.get("classname"))
+
+    def test_class_fields_without_objects_skip_import(self):
+        manager = RegistryManager(scan_index=ScanIndex(self.index_path))
+        with unittest.mock.patch.object(
+            manager, "_import_scanned_module", side_effect=AssertionError
+        ):
+            registry = manager.create(
+                "names", str(self.tmp), fields=["classname", "filepath"], inc_files="*.py"
+            )
+        self.assertEqual(
+            sorted(registry.get("classname")), ["OtherWidget", "SampleWidget"]
+        )
+
+    def test_foreign_version_is_ignored(self):
+        self.index_path.parent.mkdir(parents=True)
+        self.index_path.write_text('{"version": -1, "files": {}}', encoding="utf-8")
+        index = ScanIndex(self.index_path)
+        self.assertEqual(index.entries, {})
+        self._scan(index)
+        self.assertEqual(ScanIndex(self.index_path).entries.keys(), index.entries.keys())
+
+    def test_prune_drops_missing_files(self):
+        index = ScanIndex(self.index_path)
+        self._scan(index)
+        os.remove(self.tmp / "no_classes.py")
+        self.assertEqual(index.prune(), 1)
+        self.assertEqual(len(ScanIndex(self.index_path).entries), 1)
+
+
+class TestLazyRegistry(TempTreeTestCase):
+    """``lazy=True`` records class rows by name and imports on first lookup."""
+
+    CLASS_FIELDS = ["classname", "classobj", "filename", "filepath"]
+
+    def setUp(self):
+        super().setUp()
+        self.manager = RegistryManager(
+            scan_index=ScanIndex(self.tmp / "index" / "scan_index.json")
+        )
+        self.imports = []
+        real = self.manager._import_scanned_module
+
+        def counting(filepath):
+            self.imports.append(os.path.basename(filepath))
+            return real(filepath)
+
+        self.manager._import_scanned_module = counting
+
+    def _create(self, **metadata):
+        return self.manager.create(
+            "widget_registry",
+            str(self.tmp),
+            fields=self.CLASS_FIELDS,
+            inc_files="*.py",
+            lazy=True,
+            **metadata,
+        )
+
+    def test_scan_records_names_without_importing(self):
+        registry = self._create()
+        self.assertEqual(self.imports, [])
+        self.assertEqual(
+            sorted(registry.get("classname")), ["OtherWidget", "SampleWidget"]
+        )
+        # Name/path queries never need the live class.
+        self.assertEqual(
+            registry.get(classname="SampleWidget", return_field="filename"),
+            "sample_registry_mod",
+        )
+        self.assertEqual(self.imports, [])
+
+    def test_classobj_lookup_imports_once(self):
+        registry = self._create()
+        cls = registry.get(classname="SampleWidget", return_field="classobj")
+        self.assertEqual(cls.__name__, "SampleWidget")
+        # The sibling class in the same file was bound by the same import.
+        other = registry.get(classname="OtherWidget", return_field="classobj")
+        self.assertEqual(other.__name__, "OtherWidget")
+        self.assertEqual(self.imports, ["sample_registry_mod.py"])
+
+    def test_unknown_class_imports_nothing(self):
+        registry = self._create()
+        self.assertIsNone(registry.get(classname="Missing", return_field="classobj"))
+        self.assertEqual(self.imports, [])
+
+    def test_failed_import_drops_rows(self):
+        (self.tmp / "broken_mod.py").write_text(
+            "class Broken:\n    pass\n\nraise RuntimeError('boom')\n",
+            encoding="utf-8",
+        )
+        registry = self._create()
+        self.assertIn("Broken", registry.get("classname"))
+        self.assertIsNone(registry.get(classname="Broken", return_field="classobj"))
+        self.assertNotIn("Broken", registry.get("classname"))
+
+    def test_works_without_scan_index(self):
+        manager = RegistryManager(scan_index=False)
+        registry = manager.create(
+            "widget_registry",
+            str(self.tmp),
+            fields=self.CLASS_FIELDS,
+            inc_files="*.py",
+            lazy=True,
+        )
+        self.assertIsNone(registry.named_tuples[0].classobj)
+        cls = registry.get(classname="SampleWidget", return_field="classobj")
+        self.assertEqual(cls.__name__, "SampleWidget")
+
+
 class TestPackageSurface(BaseTestCase):
     """Real-tree smoke tests + deprecated alias wiring."""
 
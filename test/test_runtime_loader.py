@@ -9,6 +9,8 @@ Covers:
 - Direct .ui load yields a widget tree with the expected names/children.
 - Tag read happens via single XML parse with mtime-keyed caching.
 - ``on_tags_written`` invalidates the metadata cache.
+- The metadata cache is process-wide (shared between loaders), safe to
+  fill from worker threads, and round-trips through its optional disk tier.
 - Custom widget classes registered against a known registry are resolved
   via ``QUiLoader.registerCustomWidget``.
 - The ``loader`` kwarg also accepts a class object and a pre-built
@@ -31,6 +33,7 @@ from qtpy import QtWidgets
 from uitk.compile import UiCompiler as compile_mod
 from uitk.loaders.runtime import RuntimeLoader
 from uitk.loaders.compiled import CompiledLoader
+from uitk.loaders.metadata import UiMetadataCache
 from uitk.switchboard import Switchboard
 
 
@@ -214,7 +217,7 @@ class RuntimeLoaderCustomWidgets(QtBaseTestCase):
 
 
 class RuntimeLoaderTags(QtBaseTestCase):
-    """uitk_tags read directly from XML; cache keyed by mtime."""
+    """uitk_tags read directly from XML; cache keyed by stat signature."""
 
     def setUp(self):
         super().setUp()
@@ -280,5 +283,195 @@ class RuntimeLoaderTags(QtBaseTestCase):
         self.assertEqual(self.loader.read_ui_tags(str(self.ui)), {"edge"})
 
 
+class SharedMetadataCache(QtBaseTestCase):
+    """UiMetadataCache: one lock-protected map per process, optional disk tier."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.ui = _write(Path(self.tmp))
+        self.cache = UiMetadataCache.shared()
+        self.cache.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def _counting(self):
+        from unittest.mock import patch
+
+        original = compile_mod.extract_metadata
+        calls = []
+
+        def counting(ui_path):
+            calls.append(ui_path)
+            return original(ui_path)
+
+        return calls, patch.object(compile_mod, "extract_metadata", side_effect=counting)
+
+    def test_loaders_share_one_cache(self):
+        sb = Switchboard(ui_source=self.tmp, base_dir=0, loader="runtime")
+        first, second = RuntimeLoader(sb), RuntimeLoader(sb)
+        self.assertIs(first._metadata_cache, second._metadata_cache)
+        calls, patched = self._counting()
+        with patched:
+            first.read_ui_tags(str(self.ui))
+            self.assertEqual(second.read_ui_tags(str(self.ui)), {"editor", "polygon"})
+            CompiledLoader(sb).read_ui_tags(str(self.ui))
+        self.assertEqual(len(calls), 1)
+
+    def test_concurrent_gets_from_workers(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        paths = [str(_write(Path(self.tmp), f"Form{i}")) for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(self.cache.get, paths * 4))
+        self.assertEqual(len(self.cache), len(paths))
+        for metadata in results:
+            self.assertEqual(metadata["uitk_tags"], ["editor", "polygon"])
+
+    def test_unreadable_file_yields_fallback(self):
+        missing = str(Path(self.tmp) / "missing.ui")
+        self.assertEqual(self.cache.get(missing)["uitk_tags"], [])
+        self.assertEqual(self.cache.get(missing)["base_class"], "QWidget")
+
+    def test_invalidate_forces_reparse(self):
+        calls, patched = self._counting()
+        with patched:
+            self.cache.get(str(self.ui))
+            self.cache.invalidate(str(self.ui))
+            self.assertNotIn(str(self.ui), self.cache)
+            self.cache.get(str(self.ui))
+        self.assertEqual(len(calls), 2)
+
+    def test_disk_tier_round_trip(self):
+        store = Path(self.tmp) / "ui_metadata.json"
+        writer = UiMetadataCache(store, persist=True)
+        expected = writer.get(str(self.ui))
+        self.assertTrue(writer.save())
+        self.assertFalse(writer.save())  # nothing new since
+
+        reader = UiMetadataCache(store, persist=True)
+        calls, patched = self._counting()
+        with patched:
+            self.assertEqual(reader.get(str(self.ui)), expected)
+        self.assertEqual(calls, [])
+
+    def test_disk_tier_ignores_changed_file(self):
+        store = Path(self.tmp) / "ui_metadata.json"
+        writer = UiMetadataCache(store, persist=True)
+        writer.get(str(self.ui))
+        writer.save()
+
+        self.ui.write_text(SAMPLE_UI.replace("editor,polygon", "edge"), encoding="utf-8")
+        future = time.time() + 2
+        os.utime(self.ui, (future, future))
+        reader = UiMetadataCache(store, persist=True)
+        self.assertEqual(reader.get(str(self.ui))["uitk_tags"], ["edge"])
+
+    def test_disk_tier_off_by_default(self):
+        store = Path(self.tmp) / "ui_metadata.json"
+        cache = UiMetadataCache(store)
+        cache.get(str(self.ui))
+        self.assertFalse(cache.save())
+        self.assertFalse(store.exists())
+
+
+class LoadAllUiPreload(QtBaseTestCase):
+    """``Switchboard.load_all_ui`` prepares off-thread and builds on the GUI thread."""
+
+    NAMES = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta"]
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        for name in self.NAMES:
+            (Path(self.tmp) / f"{name}.ui").write_text(
+                SAMPLE_UI.replace("Foo", name), encoding="utf-8"
+            )
+        self.sb = Switchboard(ui_source=self.tmp, base_dir=0, loader="runtime")
+        self.filepaths = self.sb.registry.ui_registry.get("filepath")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def _names(self, forms):
+        for form in forms:
+            if form is not None:
+                self.track_widget(form)
+        return [form.objectName() if form is not None else None for form in forms]
+
+    def test_blocking_prepares_on_workers_and_builds_in_order(self):
+        import threading
+
+        prepare_threads = []
+        original = self.sb._loader.prepare
+
+        def recording(path):
+            prepare_threads.append(threading.current_thread())
+            return original(path)
+
+        self.sb._loader.prepare = recording
+        forms = self.sb.load_all_ui(workers=3)
+        expected = [Path(p).stem for p in self.filepaths]
+        self.assertEqual(self._names(forms), expected)
+        self.assertEqual(len(prepare_threads), len(self.NAMES))
+        self.assertNotIn(threading.main_thread(), prepare_threads)
+        # Every metadata parse was done ahead of the GUI-thread load.
+        for path in self.filepaths:
+            self.assertIn(path, self.sb._loader._metadata_cache)
+
+    def test_serial_matches_parallel(self):
+        serial = self._names(self.sb.load_all_ui(workers=0))
+        self.assertEqual(serial, self._names(self.sb.load_all_ui()))
+
+    def test_background_builds_from_event_loop(self):
+        from qtpy.QtTest import QTest
+        from uitk.loaders import UiPreloader
+
+        done, progress = [], []
+        preloader = self.sb.load_all_ui(background=True, slice_ms=0)
+        self.assertIsInstance(preloader, UiPreloader)
+        preloader.progress.connect(lambda *a: progress.append(a))
+        preloader.finished.connect(done.append)
+        self.assertFalse(preloader.is_finished())  # nothing built synchronously
+        for _ in range(200):
+            if done:
+                break
+            QTest.qWait(10)
+        self.assertEqual(len(done), 1)
+        self.assertEqual(len(self._names(done[0])), len(self.NAMES))
+        self.assertEqual([p[1] for p in progress], list(range(1, len(self.NAMES) + 1)))
+
+    def test_blocking_propagates_load_error(self):
+        (Path(self.tmp) / "Alpha.ui").write_text("<ui><not closed", encoding="utf-8")
+        with self.assertRaises(RuntimeError):
+            self._names(self.sb.load_all_ui())
+
+    def test_background_records_error_and_continues(self):
+        from qtpy.QtTest import QTest
+
+        bad = str(Path(self.tmp) / "Alpha.ui")
+        Path(bad).write_text("<ui><not closed", encoding="utf-8")
+        preloader = self.sb.load_all_ui(background=True)
+        for _ in range(200):
+            if preloader.is_finished():
+                break
+            QTest.qWait(10)
+        self.assertEqual(len(self._names(preloader.results)), len(self.NAMES))
+        self.assertEqual([os.path.normcase(p) for p in preloader.errors], [os.path.normcase(bad)])
+
+    def test_loader_without_prepare_still_loads(self):
+        from uitk.loaders import UiPreloader
+
+        class LoadOnly:
+            def __init__(self, inner):
+                self.load = inner.load
+
+        forms = UiPreloader(LoadOnly(self.sb._loader), self.filepaths).run()
+        self.assertEqual(len(self._names(forms)), len(self.NAMES))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 PACKAGE_ROOT = Path(__file__).parent.parent.absolute()
 if str(PACKAGE_ROOT) not in sys.path:
@@ -14,6 +15,7 @@ from conftest import setup_qt_application, BaseTestCase
 
 app = setup_qt_application()
 
+from qtpy import QtCore, QtGui
 from uitk.widgets.sequencer import (
     SequencerWidget,
     ClipData,
@@ -26,10 +28,18 @@ from uitk.widgets.sequencer import (
     _StaticRangeOverlay,
     _RULER_HEIGHT,
     _SUB_ROW_HEIGHT,
+    _TRACK_HEIGHT,
+    _TRACK_PADDING,
     _MIN_CLIP_DURATION,
     _DEFAULT_ATTRIBUTE_COLORS,
     _COMMON_ATTRIBUTES,
     PatternRegistry,
+    PatternSpec,
+    CurveUtils,
+    TimelineView,
+    WaveformPyramid,
+    KeyTimeIndex,
+    ClipIntervals,
 )
 
 
@@ -257,17 +267,9 @@ class TestSequencerWidget(BaseTestCase):
         self.assertEqual(len(received), 1)
         self.assertAlmostEqual(received[0], 25.0)
 
-    # -- _snapshot helper --------------------------------------------------
-    def test_snapshot_returns_positions(self):
-        tid = self.w.add_track("T")
-        c0 = self.w.add_clip(tid, 10, 50)
-        c1 = self.w.add_clip(tid, 80, 20)
-        snap = self.w._snapshot()
-        self.assertEqual(snap[c0], (10, 50))
-        self.assertEqual(snap[c1], (80, 20))
-
-    def test_snapshot_used_by_undo_redo(self):
-        """Verify undo/redo round-trip through the _snapshot helper."""
+    # -- _capture_undo helper ---------------------------------------------
+    def test_capture_undo_round_trip(self):
+        """Verify undo/redo round-trip through _capture_undo."""
         tid = self.w.add_track("T")
         cid = self.w.add_clip(tid, 0, 40)
         self.w._capture_undo()
@@ -1059,6 +1061,59 @@ class TestCurvePreviewRendering(BaseTestCase):
         item.paint(painter, QtWidgets.QStyleOptionGraphicsItem())
         painter.end()
 
+    def _paint_counting_builds(self, item, times=1):
+        from qtpy import QtWidgets
+
+        pixmap = QtGui.QPixmap(200, 30)
+        painter = QtGui.QPainter(pixmap)
+        with patch.object(
+            CurveUtils, "build_curve_path", wraps=CurveUtils.build_curve_path
+        ) as build:
+            for _ in range(times):
+                item.paint(painter, QtWidgets.QStyleOptionGraphicsItem())
+        painter.end()
+        return build.call_count
+
+    def test_curve_path_reused_across_repaints(self):
+        """Hover/selection/playhead repaints don't rebuild the curve path."""
+        clip, item = self._make_preview_clip(self.SAMPLE_PREVIEW)
+        self.assertEqual(self._paint_counting_builds(item, times=5), 1)
+        item.setSelected(True)
+        self.w.set_playhead(40)
+        self.assertEqual(self._paint_counting_builds(item, times=3), 0)
+
+    def test_curve_path_rebuilt_on_zoom_and_new_segments(self):
+        clip, item = self._make_preview_clip(self.SAMPLE_PREVIEW)
+        self._paint_counting_builds(item)
+        tl = self.w._timeline
+        tl.pixels_per_unit = tl.pixels_per_unit * 2
+        self.assertEqual(self._paint_counting_builds(item, times=2), 1)
+        preview = dict(clip.data["curve_preview"])
+        preview["segments"] = list(preview["segments"][:1])
+        clip.data["curve_preview"] = preview
+        self.assertEqual(self._paint_counting_builds(item), 1)
+        preview["val_max"] = 2.0
+        self.assertEqual(self._paint_counting_builds(item), 1)
+
+    def test_cached_path_is_clip_local(self):
+        """The cached path, offset by the clip rect, matches a scene-space build."""
+        clip, item = self._make_preview_clip(self.SAMPLE_PREVIEW)
+        self._paint_counting_builds(item)
+        rect = item.rect()
+        local = item._curve_path_cache[2].translated(rect.topLeft())
+        preview = clip.data["curve_preview"]
+        map_y, _ = CurveUtils.make_value_mapper(
+            rect.top(), rect.height(), preview["val_min"], preview["val_max"]
+        )
+        scene = CurveUtils.build_curve_path(
+            preview["segments"],
+            lambda t: rect.x() + (t - clip.start) / clip.duration * rect.width(),
+            map_y,
+        )
+        a, b = local.boundingRect(), scene.boundingRect()
+        for got, want in zip(a.getRect(), b.getRect()):
+            self.assertAlmostEqual(got, want, places=4)
+
 
 # =========================================================================
 # Keyframe Rendering (legacy keyframe_times path)
@@ -1944,6 +1999,136 @@ class TestWaveformRendering(BaseTestCase):
         self.assertIsNone(item._waveform_pixmap)
 
 
+class TestWaveformPyramid(BaseTestCase):
+    """Min/max peak pyramid built from synthetic WAV data."""
+
+    RATE = 8000
+
+    def _write_wav(self, frames, width=2, channels=1):
+        """Write integer *frames* (one tuple per frame) as a PCM WAV file."""
+        import os
+        import tempfile
+        import wave
+
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        offset = 128 if width == 1 else 0
+        raw = b"".join(
+            (v + offset).to_bytes(width, "little", signed=width > 1)
+            for frame in frames
+            for v in frame
+        )
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(width)
+            wf.setframerate(self.RATE)
+            wf.writeframes(raw)
+        return path
+
+    def _sine_wav(self, seconds=2.0, amp=0.5):
+        import math
+
+        peak = int(amp * 32767)
+        frames = [
+            (int(peak * math.sin(2 * math.pi * 220 * i / self.RATE)),) * 2
+            for i in range(int(seconds * self.RATE))
+        ]
+        return self._write_wav(frames, width=2, channels=2)
+
+    def test_levels_halve_down_to_one_bin(self):
+        pyramid = WaveformPyramid.from_wav(self._sine_wav(), block=64)
+        self.assertEqual(len(pyramid), 250)  # 16000 frames / 64
+        sizes = [len(lo) for lo, _hi in pyramid.levels]
+        self.assertEqual(sizes[-1], 1)
+        for finer, coarser in zip(sizes, sizes[1:]):
+            self.assertEqual(coarser, (finer + 1) // 2)
+        lo, hi = pyramid.levels[-1]
+        self.assertAlmostEqual(float(lo[0]), -0.5, places=2)
+        self.assertAlmostEqual(float(hi[0]), 0.5, places=2)
+
+    def test_columns_keep_narrow_peaks(self):
+        """A one-bin spike survives decimation to a few columns."""
+        envelope = [(-0.1, 0.1)] * 10000
+        envelope[7777] = (-0.9, 0.95)
+        pyramid = WaveformPyramid(envelope)
+        for width in (7, 100, 640, 5000):
+            lo, hi = pyramid.columns(width)
+            self.assertEqual(len(lo), width)
+            spike = hi.index(max(hi))
+            # Coarser levels shift a bin by at most two columns.
+            self.assertLessEqual(abs(spike - 7777 * width // 10000), 2)
+            self.assertAlmostEqual(hi[spike], 0.95, places=5)
+            self.assertAlmostEqual(lo[spike], -0.9, places=5)
+            rest = hi[:spike] + hi[spike + 1 :]
+            self.assertAlmostEqual(max(rest or [0.1]), 0.1, places=5)
+
+    def test_columns_upsample_short_envelope(self):
+        pyramid = WaveformPyramid([(-0.5, 0.5), (-0.2, 0.8)])
+        lo, hi = pyramid.columns(4)
+        for got, want in zip(hi, [0.5, 0.5, 0.8, 0.8]):
+            self.assertAlmostEqual(got, want, places=5)
+        for got, want in zip(lo, [-0.5, -0.5, -0.2, -0.2]):
+            self.assertAlmostEqual(got, want, places=5)
+
+    def test_pure_python_fallback_matches_numpy(self):
+        path = self._sine_wav(seconds=0.5)
+        vectorized = WaveformPyramid.from_wav(path, block=32)
+        with patch("uitk.widgets.sequencer._waveform.np", None):
+            fallback = WaveformPyramid.from_wav(path, block=32)
+            self.assertIsInstance(fallback.levels[0][0], list)
+            slow = [fallback.columns(w) for w in (3, 50, 125, 400)]
+        fast = [vectorized.columns(w) for w in (3, 50, 125, 400)]
+        for (flo, fhi), (slo, shi) in zip(fast, slow):
+            self.assertEqual(len(flo), len(slo))
+            for a, b in zip(flo + fhi, slo + shi):
+                self.assertAlmostEqual(a, b, places=5)
+
+    def test_vectorized_render_matches_line_drawing(self):
+        envelope = [(-0.25 - (i % 5) / 10.0, 0.1 + (i % 7) / 10.0) for i in range(300)]
+        color = QtGui.QColor(120, 220, 140, 255)
+        fast = WaveformPyramid(envelope).render(120, 24, color).toImage()
+        with patch("uitk.widgets.sequencer._waveform.np", None):
+            slow = WaveformPyramid(envelope).render(120, 24, color).toImage()
+        fmt = QtGui.QImage.Format_ARGB32
+        self.assertEqual(fast.convertToFormat(fmt), slow.convertToFormat(fmt))
+
+    def test_decodes_8_and_24_bit_pcm(self):
+        for width, full in ((1, 127), (3, (1 << 23) - 1)):
+            path = self._write_wav([(full,), (-full,), (0,)], width=width)
+            pyramid = WaveformPyramid.from_wav(path, block=1)
+            lo, hi = pyramid.levels[0]
+            self.assertAlmostEqual(float(hi[0]), 1.0, delta=0.01)
+            self.assertAlmostEqual(float(lo[1]), -1.0, delta=0.01)
+            self.assertAlmostEqual(float(hi[2]), 0.0, places=5)
+
+    def test_pyramid_built_only_when_the_pixmap_renders(self):
+        from qtpy import QtWidgets
+
+        w = SequencerWidget()
+        self.addCleanup(w.deleteLater)
+        tid = w.add_track("Audio")
+        envelope = [(-0.5, 0.5), (-0.3, 0.8)] * 500
+        pyramid = WaveformPyramid.from_wav(self._sine_wav(seconds=0.25))
+        env_item = w._clip_items[w.add_clip(tid, 0, 100, waveform=envelope)]
+        pyr_item = w._clip_items[w.add_clip(tid, 400, 100, waveform=pyramid)]
+        pixmap = QtGui.QPixmap(400, 30)
+        painter = QtGui.QPainter(pixmap)
+        option = QtWidgets.QStyleOptionGraphicsItem()
+        with patch.object(
+            WaveformPyramid, "_halve", wraps=WaveformPyramid._halve
+        ) as halve:
+            for _ in range(3):  # repaints hit the cached pixmap
+                env_item.paint(painter, option)
+                pyr_item.paint(painter, option)
+        painter.end()
+        self.assertIsNotNone(env_item._waveform_pixmap)
+        self.assertIs(pyr_item._waveform_pyramid[1], pyramid)
+        # Built once for the envelope clip; never for the clip given a pyramid.
+        levels = len(env_item._waveform_pyramid[1].levels)
+        self.assertEqual(halve.call_count, levels - 1)
+
+
 # =========================================================================
 # ShotLaneItem
 # =========================================================================
@@ -2462,6 +2647,165 @@ class TestKeyboardDispatch(BaseTestCase):
 # =========================================================================
 
 
+class TestKeyTimeIndex(BaseTestCase):
+    """Next/prev-key stops come from an incrementally updated sorted index."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+        self.tid = self.w.add_track("T")
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def test_shared_times_are_reference_counted(self):
+        index = KeyTimeIndex()
+        index.set("a", [10, 30])
+        index.set("b", [30, 50])
+        self.assertEqual(index.times, [10, 30, 50])
+        index.discard("a")
+        self.assertEqual(index.times, [30, 50])
+        index.set("b", [40])
+        self.assertEqual(index.times, [40])
+        self.assertEqual(index.next_after(40, 0.01), None)
+        self.assertEqual(index.prev_before(40.5, 0.01), 40)
+
+    def test_lookup_bisects_without_rescanning_clips(self):
+        for i in range(50):
+            self.w.add_clip(self.tid, i * 10, 5)
+        self.w._key_times()  # index every clip once
+        self.w.set_playhead(0.0)
+        with patch.object(
+            SequencerWidget, "_clip_key_times", autospec=True
+        ) as scan:
+            for _ in range(20):
+                self.w.go_to_next_key()
+        scan.assert_not_called()
+        self.assertAlmostEqual(self.w._timeline._scene.playhead.time, 100.0)
+
+    def test_edits_reindex_only_touched_clips(self):
+        a = self.w.add_clip(self.tid, 10, 10)
+        b = self.w.add_clip(self.tid, 40, 10)
+        self.assertEqual(self.w._key_times(), [10, 20, 40, 50])
+        self.w.swap_clips(a, b)
+        with patch.object(
+            SequencerWidget,
+            "_clip_key_times",
+            autospec=True,
+            side_effect=SequencerWidget._clip_key_times,
+        ) as scan:
+            self.assertEqual(self.w._key_times(), [10, 20, 40, 50])
+        self.assertEqual(scan.call_count, 2)
+        self.w.remove_clip(a)
+        self.assertEqual(self.w._key_times(), [10, 20])
+        self.w.undo()  # swap back; a is gone, so only b moves
+        self.assertEqual(self.w._key_times(), [40, 50])
+
+    def test_clip_drag_updates_stops(self):
+        cid = self.w.add_clip(self.tid, 0, 10)
+        self.w.resize(800, 400)
+        self.w.show()
+        item = self.w._clip_items[cid]
+        rect = item.sceneBoundingRect()
+        y = rect.center().y()
+        x0 = rect.center().x()
+        x1 = x0 + self.w._timeline.time_to_x(20)
+        ev = QtCore.QEvent
+        item.mousePressEvent(
+            _scene_mouse_event(ev.GraphicsSceneMousePress, QtCore.QPointF(x0, y))
+        )
+        item.mouseMoveEvent(
+            _scene_mouse_event(ev.GraphicsSceneMouseMove, QtCore.QPointF(x1, y))
+        )
+        item.mouseReleaseEvent(
+            _scene_mouse_event(ev.GraphicsSceneMouseRelease, QtCore.QPointF(x1, y))
+        )
+        self.assertEqual(self.w._key_times(), [20, 30])
+
+    def test_markers_are_stops(self):
+        self.w.add_clip(self.tid, 0, 10)
+        mid = self.w.add_marker(25.0)
+        self.w.set_playhead(10.0)
+        self.w.go_to_next_key()
+        self.assertAlmostEqual(self.w._timeline._scene.playhead.time, 25.0)
+        self.w.remove_marker(mid)
+        self.w.add_marker(40.0)
+        self.w.go_to_prev_key()
+        self.assertAlmostEqual(self.w._timeline._scene.playhead.time, 10.0)
+        self.w.clear_markers()
+        self.assertEqual(self.w._key_times(), [0, 10])
+
+    def test_clear_resets_index(self):
+        self.w.add_clip(self.tid, 5, 10)
+        self.w.add_marker(50.0)
+        self.w._key_times()
+        self.w.clear()
+        self.assertEqual(self.w._key_times(), [])
+
+
+class TestClipIntervals(BaseTestCase):
+    """Tracks and clips are indexed by id; each track keeps its clips
+    sorted by start for clips_in_range."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+        self.tid = self.w.add_track("T")
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def _ids(self, clips):
+        return [cd.clip_id for cd in clips]
+
+    def test_overlap_query_bounds(self):
+        spans_in = [(0, 100), (50, 5), (60, 0), (200, 10)]
+        clips = {i: ClipData(i, 0, t, d) for i, (t, d) in enumerate(spans_in)}
+        spans = ClipIntervals()
+        for cd in clips.values():
+            spans.add(cd)
+        # The long clip starting before the range still reaches into it.
+        self.assertEqual(spans.overlapping(clips, 55, 70), [0, 2])
+        self.assertEqual(spans.overlapping(clips, 100, 200), [])  # [start, end)
+        self.assertEqual(spans.overlapping(clips, 60, 61), [0, 2])
+        spans.discard(0)
+        self.assertEqual(spans.overlapping(clips, 0, 300), [1, 2, 3])
+
+    def test_track_clips_are_dict_by_id(self):
+        a = self.w.add_clip(self.tid, 0, 10)
+        b = self.w.add_clip(self.tid, 20, 10)
+        td = self.w.get_track(self.tid)
+        self.assertEqual(list(td.clips), [a, b])
+        self.assertIs(td.clips[a], self.w.get_clip(a))
+        self.w.remove_clip(a)
+        self.assertEqual(list(td.clips), [b])
+        self.assertEqual(self._ids(self.w.clips(self.tid)), [b])
+
+    def test_clips_in_range_follows_edits(self):
+        other = self.w.add_track("U")
+        a = self.w.add_clip(self.tid, 0, 10)
+        b = self.w.add_clip(self.tid, 40, 10)
+        c = self.w.add_clip(other, 45, 10)
+        self.assertEqual(self._ids(self.w.clips_in_range(5, 42)), [a, b])
+        self.assertEqual(self._ids(self.w.clips_in_range(42, 50, other)), [c])
+        self.w.swap_clips(a, b)  # b -> 0, a -> 30
+        self.assertEqual(self._ids(self.w.clips_in_range(0, 5, self.tid)), [b])
+        self.w.undo()
+        self.assertEqual(self._ids(self.w.clips_in_range(0, 5, self.tid)), [a])
+        self.w.remove_clip(a)
+        self.assertEqual(self._ids(self.w.clips_in_range(0, 100, self.tid)), [b])
+        self.assertEqual(self.w.clips_in_range(0, 100, track_id=999), [])
+
+    def test_remove_track_drops_sub_row_clips(self):
+        self.w.add_clip(self.tid, 0, 100)
+        self.w.expand_track(self.tid, sub_row_data=[("tx", [(0, 100, "tx")])])
+        self.assertEqual(len(self.w.clips()), 2)
+        self.w.remove_track(self.tid)
+        self.assertEqual(self.w.clips(), [])
+        self.assertIsNone(self.w.get_track(self.tid))
+        self.assertEqual(self.w.clips_in_range(0, 100), [])
+
+
 class TestKeyTimesExpanded(BaseTestCase):
     """_key_times includes keyframe_times from expanded sub-row clips."""
 
@@ -4019,6 +4363,104 @@ class TestLockedGapNoDrag(BaseTestCase):
 # =========================================================================
 
 
+class TestSceneExtentIndex(BaseTestCase):
+    """The scene rect reads a running extent index updated per edit, and
+    row changes re-sync only the tracks below them."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def _scan_end(self):
+        w = self.w
+        ends = [cd.end for cd in w.clips()] + [md.time for md in w.markers()]
+        ends += [gap._end for gap in w._gap_overlays]
+        if w._range_highlight is not None:
+            ends.append(w._range_highlight.end)
+        return max(ends, default=0.0)
+
+    def test_content_end_follows_edits(self):
+        w = self.w
+        tid = w.add_track("T")
+        a = w.add_clip(tid, 0, 50)
+        b = w.add_clip(tid, 100, 400)
+        self.assertEqual(w._content_end(), 500)
+        w.get_clip(a).start = 900  # as a drag does
+        w._touch_keys((a,))
+        self.assertEqual(w._content_end(), 950)
+        w.remove_clip(a)
+        self.assertEqual(w._content_end(), self._scan_end())
+        mid = w.add_marker(700)
+        self.assertEqual(w._content_end(), 700)
+        w._markers[mid].time = 50
+        w._touch_keys(marker_ids=(mid,))
+        self.assertEqual(w._content_end(), 500)
+        w.add_gap_overlay(480, 520)
+        gap = w._gap_overlays[0]
+        self.assertEqual(w._content_end(), 520)
+        gap._end = 1200
+        w._touch_gaps((gap,))
+        self.assertEqual(w._content_end(), 1200)
+        w.clear_gap_overlays()
+        w.set_range_highlight(0, 800)
+        self.assertEqual(w._content_end(), 800)
+        w.clear_range_highlight()
+        w.swap_clips(b, w.add_clip(tid, 600, 10))
+        self.assertEqual(w._content_end(), self._scan_end())
+        w.clear()
+        self.assertEqual(w._content_end(), 0.0)
+
+    def test_touch_clips_picks_up_in_place_edits(self):
+        w, tl = self.w, self.w._timeline
+        tid = w.add_track("T")
+        cid = w.add_clip(tid, 0, 5000)
+        wide = tl._scene.sceneRect().width()
+        cd = w.get_clip(cid)
+        cd.start, cd.duration = 200, 10
+        w.touch_clips([cid])
+        self.assertLess(tl._scene.sceneRect().width(), wide)
+        self.assertEqual([c.clip_id for c in w.clips_in_range(205, 206)], [cid])
+        self.assertEqual(w.clips_in_range(0, 100), [])
+        w.set_playhead(0)
+        w.go_to_next_key()
+        self.assertAlmostEqual(tl._scene.playhead.time, 200)
+        self.assertAlmostEqual(
+            w._clip_items[cid].rect().left(), tl.time_to_x(200)
+        )
+
+    def test_scene_rect_width_tracks_moved_clip(self):
+        w, tl = self.w, self.w._timeline
+        tid = w.add_track("T")
+        cid = w.add_clip(tid, 0, 5000)
+        wide = tl._scene.sceneRect().width()
+        w.get_clip(cid).duration = 10
+        w._touch_keys((cid,))
+        tl._update_scene_rect()
+        self.assertLess(tl._scene.sceneRect().width(), wide)
+
+    def test_expand_resyncs_only_rows_below(self):
+        from uitk.widgets.sequencer import ClipItem
+
+        w = self.w
+        tids = [w.add_track(f"T{i}") for i in range(4)]
+        cids = [w.add_clip(tid, 0, 10) for tid in tids]
+        with patch.object(
+            ClipItem,
+            "_sync_geometry",
+            autospec=True,
+            side_effect=ClipItem._sync_geometry,
+        ) as sync:
+            w.expand_track(tids[2], sub_row_data=[("tx", [(0, 10)])])
+        synced = {item.clip_data.track_id for (item,), _ in sync.call_args_list}
+        self.assertEqual(synced, {tids[2], tids[3]})
+        item = w._clip_items[cids[3]]
+        y, _h = w._row_position(tids[3], "")
+        self.assertEqual(item.rect().y(), y)
+
+
 class TestRulerBoundingRectExtent(BaseTestCase):
     """The ruler's boundingRect was a fixed 100000-px cap, so ticks/labels/
     background stopped painting past that many scene pixels at high zoom.
@@ -4334,5 +4776,329 @@ class TestZoneMenuEnabledAPI(BaseTestCase):
         self.assertEqual(received, [], "disabled zone menu must not emit")
 
 
+class TestRowLayoutIndex(BaseTestCase):
+    """The cached row layout must match a from-scratch walk of the rows
+    after every change that moves them."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def _walk(self):
+        """Reference layout: the plain accumulation the cache replaces."""
+        rows = []
+        y = self.w._content_top
+        for td in self.w._tracks:
+            rows.append((y, _TRACK_HEIGHT, False, td.track_id))
+            y += _TRACK_HEIGHT + _TRACK_PADDING
+            for _sr in self.w._expanded_tracks.get(td.track_id, []):
+                rows.append((y, self.w.sub_row_height, True, td.track_id))
+                y += self.w.sub_row_height + _TRACK_PADDING
+        return rows, y - self.w._content_top
+
+    def _assert_consistent(self):
+        rows, total = self._walk()
+        self.assertEqual(self.w._visual_rows(), rows)
+        self.assertEqual(self.w._total_row_height(), total)
+        for y, h, is_sub, tid in rows:
+            if not is_sub:
+                self.assertEqual(self.w._row_position(tid), (y, h))
+
+    def test_matches_walk_through_edits(self):
+        tids = [self.w.add_track(f"T{i}") for i in range(6)]
+        self._assert_consistent()
+        self.w.expand_track(tids[1], sub_row_data=[("tx", []), ("ty", [])])
+        self._assert_consistent()
+        self.w.expand_track(tids[4], sub_row_data=[("rz", [])])
+        self.w.sub_row_height = 30
+        self._assert_consistent()
+        self.w.remove_track(tids[0])
+        self._assert_consistent()
+        self.w.collapse_track(tids[1])
+        self.w.add_track("late")
+        self._assert_consistent()
+        self.w.clear()
+        self._assert_consistent()
+
+    def test_sub_row_positions_and_fallbacks(self):
+        t0 = self.w.add_track("A")
+        t1 = self.w.add_track("B")
+        self.w.expand_track(t0, sub_row_data=[("tx", []), ("ty", [])])
+        top = self.w._content_top
+        sub_y = top + _TRACK_HEIGHT + _TRACK_PADDING
+        self.assertEqual(self.w._row_position(t0, "tx"), (sub_y, _SUB_ROW_HEIGHT))
+        # Not expanded: just below the track's last row.
+        after = sub_y + 2 * (_SUB_ROW_HEIGHT + _TRACK_PADDING)
+        self.assertEqual(self.w._row_position(t0, "rz"), (after, _SUB_ROW_HEIGHT))
+        self.assertEqual(self.w._row_position(t1), (after, _TRACK_HEIGHT))
+        # Unknown track: first free y after all rows.
+        end = top + self.w._total_row_height()
+        self.assertEqual(self.w._row_position(99), (end, _TRACK_HEIGHT))
+
+    def test_row_at_bisects_bands(self):
+        t0 = self.w.add_track("A")
+        t1 = self.w.add_track("B")
+        self.w.expand_track(t0, sub_row_data=[("tx", [])])
+        layout = self.w._rows()
+        self.assertEqual(layout.row_at(0), 0)
+        self.assertEqual(layout.row_at(_TRACK_HEIGHT + 1), 0)  # padding band
+        self.assertEqual(layout.row_at(_TRACK_HEIGHT + _TRACK_PADDING), 1)
+        self.assertEqual(layout.rows[2][0].track_id, t1)
+        self.assertIsNone(layout.row_at(-1))
+        self.assertIsNone(layout.row_at(layout.total))
+
+    def test_track_lookup_after_remove(self):
+        tids = [self.w.add_track(f"T{i}") for i in range(3)]
+        self.w.remove_track(tids[1])
+        self.assertIsNone(self.w.get_track(tids[1]))
+        self.assertEqual(self.w._track_index(tids[2]), 1)
+        self.assertEqual(self.w.get_track(tids[2]).name, "T2")
+
+    def test_clip_moves_when_track_above_expands(self):
+        t0 = self.w.add_track("A")
+        t1 = self.w.add_track("B")
+        cid = self.w.add_clip(t1, start=0, duration=10)
+        item = self.w._clip_items[cid]
+        y_before = item.rect().y()
+        self.w.expand_track(t0, sub_row_data=[("tx", [])])
+        self.assertEqual(
+            item.rect().y() - y_before, _SUB_ROW_HEIGHT + _TRACK_PADDING
+        )
+
+
+class TestTimelineBackgroundCache(BaseTestCase):
+    """drawBackground paints only the exposed rows, from cached stripe
+    tiles, and reuses background curve paths until zoom or rows change."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+        self.tl = self.w._timeline
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def _paint(self, rect):
+        image = QtGui.QImage(
+            int(rect.width()), int(rect.height()), QtGui.QImage.Format_ARGB32
+        )
+        painter = QtGui.QPainter(image)
+        painter.translate(-rect.left(), -rect.top())
+        self.tl.drawBackground(painter, rect)
+        painter.end()
+        return image
+
+    def _count_tiles(self):
+        return patch.object(
+            TimelineView,
+            "_render_bg_tile",
+            autospec=True,
+            side_effect=TimelineView._render_bg_tile,
+        )
+
+    def test_stripe_colors_match_rows(self):
+        t0 = self.w.add_track("A")
+        self.w.add_track("B")
+        self.w.expand_track(t0, sub_row_data=[("tx", [])])
+        top = self.w._content_top
+        rect = QtCore.QRectF(1013, top, 40, 120)  # off a tile boundary
+        image = self._paint(rect)
+
+        def color_at(y):
+            return image.pixelColor(5, int(y - rect.top())).name()
+
+        rows = self.w._visual_rows()
+        self.assertEqual(color_at(rows[0][0] + 3), "#262626")  # main, even
+        self.assertEqual(color_at(rows[1][0] + 3), "#252525")  # sub, odd
+        self.assertEqual(color_at(rows[2][0] + 3), "#262626")  # main, even
+        self.assertEqual(color_at(rows[0][0] + rows[0][1]), "#1e1e1e")  # padding
+
+    def test_tiles_are_reused_until_rows_change(self):
+        tid = self.w.add_track("A")
+        rect = QtCore.QRectF(0, 0, 300, 200)
+        with self._count_tiles() as render:
+            self._paint(rect)
+            first = render.call_count
+            self._paint(rect.translated(500, 0))  # horizontal scroll
+            self.assertEqual(render.call_count, first)
+            self.w.expand_track(tid, sub_row_data=[("tx", [])])
+            self._paint(rect)
+            self.assertGreater(render.call_count, first)
+
+    def test_pattern_change_keeps_tiles(self):
+        tid = self.w.add_track("A")
+        rect = QtCore.QRectF(0, 0, 300, 100)
+        with self._count_tiles() as render:
+            self._paint(rect)
+            self.w.get_track(tid).pattern = PatternSpec("diagonal")
+            self._paint(rect)
+            self.assertEqual(render.call_count, 1)
+
+    def test_pattern_continuous_across_tile_seam(self):
+        tid = self.w.add_track("A")
+        # A spacing that does not divide the tile width.
+        self.w.get_track(tid).pattern = PatternSpec("vstripes", spacing=7)
+        y = self.w._visual_rows()[0][0] + 3
+        tw = TimelineView._BG_TILE_WIDTH
+        rect = QtCore.QRectF(tw - 21, y, 42, 1)
+        image = self._paint(rect)
+        for col in range(21):
+            self.assertEqual(image.pixel(col, 0), image.pixel(col + 7, 0))
+        # The same scene column paints the same wherever the exposed rect starts.
+        shifted = self._paint(rect.translated(3, 0))
+        self.assertEqual(image.pixel(10, 0), shifted.pixel(7, 0))
+
+    def test_only_exposed_tiles_render(self):
+        for i in range(200):
+            self.w.add_track(f"T{i}")
+        rect = QtCore.QRectF(0, 3000, 300, 60)
+        with self._count_tiles() as render:
+            self._paint(rect)
+        self.assertLessEqual(render.call_count, 2)
+        (row_span,) = {args[2] for args, _ in render.call_args_list[:1]}
+        self.assertLess(len(row_span), 20)
+
+    def test_bg_curve_paths_cached_and_culled(self):
+        tids = [self.w.add_track(f"T{i}") for i in range(40)]
+        preview = {
+            "segments": [{"t0": 0, "v0": 0.0, "t1": 10, "v1": 1.0}],
+            "val_min": 0.0,
+            "val_max": 1.0,
+        }
+        for tid in (tids[0], tids[-1]):
+            self.w.expand_track(tid, sub_row_data=[("tx", [])])
+            self.w.set_bg_curve_preview(tid, "tx", preview)
+        rect = QtCore.QRectF(0, 0, 300, 200)  # only the first track's rows
+        with patch.object(
+            CurveUtils, "build_curve_path", wraps=CurveUtils.build_curve_path
+        ) as build:
+            self._paint(rect)
+            self.assertEqual(build.call_count, 1)
+            self._paint(rect)
+            self.assertEqual(build.call_count, 1)
+            self.tl.pixels_per_unit = self.tl.pixels_per_unit * 2
+            self._paint(rect)
+            self.assertEqual(build.call_count, 2)
+            preview["segments"] = [{"t0": 0, "v0": 1.0, "t1": 10, "v1": 0.0}]
+            self._paint(rect)
+            self.assertEqual(build.call_count, 3)
+
+
+class TestDeltaUndo(BaseTestCase):
+    """Undo steps record only the clips an edit touched; continuous drags
+    merge into one step; add/remove inside undoable() round-trip."""
+
+    def setUp(self):
+        self.w = SequencerWidget()
+        self.tid = self.w.add_track("T")
+        with self.w.bulk_updates():
+            self.cids = [
+                self.w.add_clip(self.tid, start=i * 10, duration=5) for i in range(50)
+            ]
+
+    def tearDown(self):
+        self.w.close()
+        self.w.deleteLater()
+
+    def test_step_holds_only_touched_clips(self):
+        self.w.swap_clips(self.cids[3], self.cids[4])
+        self.assertEqual(len(self.w._undo_stack), 1)
+        self.assertEqual(set(self.w._undo_stack[-1].states), set(self.cids[3:5]))
+
+    def test_merge_key_keeps_first_state(self):
+        cid = self.cids[0]
+        for start in (1, 2, 3):
+            self.w._capture_undo([cid], merge_key="drag")
+            self.w._clips[cid].start = start
+        self.assertEqual(len(self.w._undo_stack), 1)
+        self.w.undo()
+        self.assertEqual(self.w.get_clip(cid).start, 0)
+        self.w.redo()
+        self.assertEqual(self.w.get_clip(cid).start, 3)
+
+    def test_merge_stops_after_another_step(self):
+        self.w._capture_undo([self.cids[0]], merge_key="a")
+        self.w._capture_undo([self.cids[1]])
+        self.w._capture_undo([self.cids[0]], merge_key="a")
+        self.assertEqual(len(self.w._undo_stack), 3)
+
+    def test_drag_is_one_step(self):
+        from qtpy import QtCore
+
+        item = self.w._clip_items[self.cids[0]]
+        origin = item.rect().center()
+        item.mousePressEvent(
+            _scene_mouse_event(QtCore.QEvent.GraphicsSceneMousePress, origin)
+        )
+        for dx in (10, 20, 30):
+            item.mouseMoveEvent(
+                _scene_mouse_event(
+                    QtCore.QEvent.GraphicsSceneMouseMove, origin + QtCore.QPointF(dx, 0)
+                )
+            )
+        item.mouseReleaseEvent(
+            _scene_mouse_event(
+                QtCore.QEvent.GraphicsSceneMouseRelease, origin + QtCore.QPointF(30, 0)
+            )
+        )
+        self.assertNotEqual(self.w.get_clip(self.cids[0]).start, 0)
+        self.assertEqual(len(self.w._undo_stack), 1)
+        self.w.undo()
+        self.assertEqual(self.w.get_clip(self.cids[0]).start, 0)
+
+    def test_stack_keeps_newest_max_undo(self):
+        for i in range(self.w._max_undo + 5):
+            self.w._capture_undo([self.cids[0]])
+            self.w._clips[self.cids[0]].start = i + 1
+        self.assertEqual(len(self.w._undo_stack), self.w._max_undo)
+        self.w.undo()
+        self.assertEqual(self.w.get_clip(self.cids[0]).start, self.w._max_undo + 4)
+
+    def test_undoable_remove_round_trip(self):
+        cid = self.cids[7]
+        with self.w.undoable():
+            self.w.remove_clip(cid)
+        self.assertIsNone(self.w.get_clip(cid))
+        self.w.undo()
+        self.assertEqual(self.w.get_clip(cid).start, 70)
+        self.assertIn(cid, self.w.get_track(self.tid).clips)
+        self.assertIs(self.w._clip_items[cid].scene(), self.w._timeline._scene)
+        self.w.redo()
+        self.assertIsNone(self.w.get_clip(cid))
+        self.assertNotIn(cid, self.w._clip_items)
+
+    def test_undoable_add_round_trip(self):
+        with self.w.undoable():
+            cid = self.w.add_clip(self.tid, start=900, duration=5, label="new")
+        self.w.undo()
+        self.assertIsNone(self.w.get_clip(cid))
+        self.w.redo()
+        self.assertEqual(self.w.get_clip(cid).label, "new")
+
+    def test_plain_add_remove_not_recorded(self):
+        self.w.remove_clip(self.cids[0])
+        self.w.add_clip(self.tid, start=0, duration=1)
+        self.assertEqual(len(self.w._undo_stack), 0)
+
+    def test_empty_undoable_leaves_no_step(self):
+        with self.w.undoable():
+            pass
+        self.assertEqual(len(self.w._undo_stack), 0)
+
+    def test_empty_undoable_keeps_redo(self):
+        tid = self.w.add_track("T")
+        cid = self.w.add_clip(tid, 0, 40)
+        self.w._capture_undo([cid])
+        self.w._clips[cid].start = 100
+        self.w.undo()
+        with self.w.undoable():
+            pass
+        self.w.redo()
+        self.assertAlmostEqual(self.w.get_clip(cid).start, 100)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ orgs (``test_uitk_*``) and clean up their own keys in tearDown.
 """
 
 import unittest
+import unittest.mock
 from typing import List, Tuple
 
 from qtpy import QtCore
@@ -407,5 +408,86 @@ class TestStringValueRoundTrip(BaseTestCase):
         self.assertEqual(mgr.value("my_key"), "ok")
 
 
+class TestDecodeCacheAndKeyIndex(BaseTestCase):
+    """``value()`` reuses decodes and ``keys()`` is served from a key index.
+
+    Both are shared per QSettings store (``_StoreIndex``) and must stay
+    coherent: values self-validate against the raw stored string, and the key
+    index follows every ``SettingsManager`` write — including writes made by a
+    *different* manager over the same file.
+    """
+
+    ORG = "test_uitk_index"
+    APP = "test_app"
+
+    def setUp(self):
+        super().setUp()
+        _wipe(self.ORG, self.APP)
+        self.root = SettingsManager(org=self.ORG, app=self.APP)
+
+    def tearDown(self):
+        _wipe(self.ORG, self.APP)
+        super().tearDown()
+
+    def test_repeat_reads_skip_json_decode(self):
+        self.root.setValue("w/text", "plain text")
+        self.root.setValue("w/num", 1.5)
+        self.root.value("w/text"), self.root.value("w/num")  # warm
+        with unittest.mock.patch.object(
+            SettingsManager, "decode_stored_value", side_effect=AssertionError
+        ):
+            for _ in range(100):
+                self.assertEqual(self.root.value("w/text"), "plain text")
+                self.assertEqual(self.root.value("w/num"), 1.5)
+
+    def test_raw_external_write_is_never_served_stale(self):
+        self.root.setValue("k", 1)
+        self.assertEqual(self.root.value("k"), 1)
+        QtCore.QSettings(self.ORG, self.APP).setValue("k", "2")
+        self.assertEqual(self.root.value("k"), 2)
+
+    def test_containers_are_not_shared_between_reads(self):
+        self.root.setValue("lst", [1, 2])
+        self.root.value("lst").append(3)
+        self.assertEqual(self.root.value("lst"), [1, 2])
+
+    def test_branch_keys_follow_writes_and_removes(self):
+        a = self.root.branch("a")
+        a.setValue("x", 1)
+        self.assertEqual(a.keys(), ["x"])  # builds the branch index
+        a.branch("sub").setValue("y", 2)
+        self.root.setValue("b/z", 3)  # outside the branch
+        self.assertEqual(sorted(a.keys()), ["sub/y", "x"])
+        self.assertEqual(a.branch("sub").keys(), ["y"])
+        a.remove("sub")  # removes the whole group
+        self.assertEqual(a.keys(), ["x"])
+        a.clear()
+        self.assertEqual(a.keys(), [])
+        self.assertEqual(self.root.keys(), ["b/z"])
+
+    def test_key_index_shared_across_managers_on_same_file(self):
+        other = SettingsManager(org=self.ORG, app=self.APP, namespace="a")
+        self.assertEqual(other.keys(), [])
+        self.root.branch("a").setValue("new", 1)  # separate QSettings object
+        self.assertEqual(other.keys(), ["new"])
+
+    def test_invalidate_after_raw_write(self):
+        ns = self.root.branch("ns")
+        self.assertEqual(ns.keys(), [])
+        self.root.settings.setValue("ns/raw", 1)  # bypasses the manager
+        ns.invalidate()
+        self.assertEqual(ns.keys(), ["raw"])
+
+    def test_keys_avoid_allkeys_scan_when_warm(self):
+        ns = self.root.branch("ns")
+        ns.setValue("k", 1)
+        ns.keys()
+        with unittest.mock.patch.object(
+            QtCore.QSettings, "allKeys", side_effect=AssertionError
+        ):
+            ns.setValue("k2", 2)
+            self.assertEqual(sorted(ns.keys()), ["k", "k2"])
+
+
 if __name__ == "__main__":
     unittest.main()
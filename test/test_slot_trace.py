@@ -0,0 +1,182 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for slot dispatch tracing (uitk.switchboard.trace).
+
+Covers:
+- SlotTracer: counts/totals/max, nearest-rank percentiles, histogram
+  buckets, slowest-first ordering, ``top``, reset, the env-var default.
+- Chrome trace export: one ``slot`` event per call with a nested
+  ``slot.body`` event; valid JSON on disk.
+- SlotWrapper integration: nothing recorded while disabled; body and
+  overhead split; exceptions counted and re-raised; fast-path slots traced;
+  ``Switchboard.slot_stats`` filtering.
+
+Run standalone: python -m test.test_slot_trace
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from conftest import QtBaseTestCase, setup_qt_application
+
+app = setup_qt_application()
+
+from qtpy import QtWidgets
+from uitk.switchboard import FastSlot, Switchboard
+from uitk.switchboard.slots import SlotWrapper
+from uitk.switchboard.trace import SLOT_TRACE_ENV_VAR, SlotTracer
+
+MS = 1_000_000  # ns
+
+
+def _fake_wrapper(name):
+    def slot():
+        pass
+
+    slot.__qualname__ = name
+    return SimpleNamespace(slot=slot, widget=None)
+
+
+class TestSlotTracer(unittest.TestCase):
+    def test_stats_percentiles_and_totals(self):
+        tracer = SlotTracer(enabled=True)
+        wrapper = _fake_wrapper("Slots.scrub")
+        for ms in range(1, 101):  # 1..100 ms
+            tracer.record(wrapper, 0, ms * MS, 0, ms * MS // 2)
+        s = tracer.stats()["Slots.scrub"]
+        self.assertEqual(s["calls"], 100)
+        self.assertEqual(s["p50_ms"], 50)
+        self.assertEqual(s["p95_ms"], 95)
+        self.assertEqual(s["max_ms"], 100)
+        self.assertAlmostEqual(s["total_ms"], 5050)
+        self.assertAlmostEqual(s["body_ms"] + s["overhead_ms"], s["mean_ms"])
+
+    def test_histogram_buckets(self):
+        tracer = SlotTracer(enabled=True)
+        wrapper = _fake_wrapper("Slots.a")
+        for ms in (0.5, 1, 3, 20, 5000):
+            tracer.record(wrapper, 0, int(ms * MS))
+        hist = tracer.stats()["Slots.a"]["histogram"]
+        self.assertEqual(hist["<=1ms"], 2)
+        self.assertEqual(hist["<=4ms"], 1)
+        self.assertEqual(hist["<=50ms"], 1)
+        self.assertEqual(hist[">4000ms"], 1)
+        self.assertEqual(sum(hist.values()), 5)
+
+    def test_slowest_first_and_top(self):
+        tracer = SlotTracer(enabled=True)
+        tracer.record(_fake_wrapper("Slots.fast"), 0, 1 * MS)
+        tracer.record(_fake_wrapper("Slots.slow"), 0, 90 * MS)
+        tracer.record(_fake_wrapper("Slots.mid"), 0, 10 * MS)
+        self.assertEqual(list(tracer.stats()), ["Slots.slow", "Slots.mid", "Slots.fast"])
+        self.assertEqual(list(tracer.stats(top=1)), ["Slots.slow"])
+
+    def test_reset(self):
+        tracer = SlotTracer(enabled=True)
+        tracer.record(_fake_wrapper("Slots.a"), 0, MS)
+        tracer.reset()
+        self.assertEqual(tracer.stats(), {})
+        self.assertEqual(tracer.trace_events(), [])
+
+    def test_env_var_default(self):
+        with mock.patch.dict(os.environ, {SLOT_TRACE_ENV_VAR: "1"}):
+            self.assertTrue(SlotTracer().enabled)
+        with mock.patch.dict(os.environ, {SLOT_TRACE_ENV_VAR: "0"}):
+            self.assertFalse(SlotTracer().enabled)
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(SlotTracer().enabled)
+
+    def test_chrome_trace_export(self):
+        tracer = SlotTracer(enabled=True)
+        tracer.record(_fake_wrapper("Slots.a"), 1000, 5000, 2000, 4000)
+        tracer.record(_fake_wrapper("Slots.b"), 6000, 7000)  # body never ran
+        tmp = tempfile.mkdtemp()
+        try:
+            path = tracer.export_chrome_trace(os.path.join(tmp, "trace.json"))
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        events = data["traceEvents"]
+        self.assertEqual([e["cat"] for e in events], ["slot", "slot.body", "slot"])
+        outer, body = events[0], events[1]
+        self.assertEqual(outer["ph"], "X")
+        self.assertEqual((outer["ts"], outer["dur"]), (1.0, 4.0))
+        self.assertEqual((body["ts"], body["dur"]), (2.0, 2.0))
+        self.assertEqual(outer["tid"], body["tid"])
+
+
+class TestSlotWrapperTracing(QtBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sb = Switchboard()
+        self.widget = self.track_widget(QtWidgets.QSlider())
+        self.widget.setObjectName("sld000")
+
+    def _wrap(self, slot):
+        return SlotWrapper(slot, self.widget, self.sb)
+
+    def test_disabled_records_nothing(self):
+        self.assertFalse(self.sb.slot_tracer.enabled)
+        self._wrap(lambda value: value)(1)
+        self.assertEqual(self.sb.slot_stats(), {})
+
+    def test_records_body_and_overhead(self):
+        def scrub(value, widget=None):
+            return value * 2
+
+        self.sb.slot_tracer.enable()
+        wrapper = self._wrap(scrub)
+        self.assertEqual(wrapper(3), 6)
+        self.assertEqual(wrapper(4), 8)
+        (name, s), = self.sb.slot_stats().items()
+        self.assertTrue(name.endswith("scrub"))
+        self.assertEqual(s["calls"], 2)
+        self.assertGreater(s["body_ms"], 0)
+        self.assertGreater(s["overhead_ms"], 0)
+        self.assertLessEqual(s["body_ms"], s["mean_ms"])
+        event = self.sb.slot_tracer.trace_events()[0]
+        self.assertEqual(event["args"]["widget"], "sld000")
+
+    def test_error_counted_and_reraised(self):
+        def broken(value):
+            raise ValueError("boom")
+
+        self.sb.slot_tracer.enable()
+        with self.assertRaises(ValueError):
+            self._wrap(broken)(1)
+        (s,) = self.sb.slot_stats().values()
+        self.assertEqual((s["calls"], s["errors"]), (1, 1))
+
+    def test_fast_path_slots_are_traced(self):
+        @FastSlot()
+        def fast(value):
+            return value
+
+        self.sb.slot_tracer.enable()
+        self._wrap(fast)(1)
+        (s,) = self.sb.slot_stats().values()
+        self.assertEqual(s["calls"], 1)
+
+    def test_slot_stats_filters(self):
+        def alpha(value):
+            pass
+
+        def beta(value):
+            pass
+
+        self.sb.slot_tracer.enable()
+        self._wrap(alpha)(1)
+        self._wrap(beta)(1)
+        names = list(self.sb.slot_stats(inc="*alpha"))
+        self.assertEqual(len(names), 1)
+        self.assertTrue(names[0].endswith("alpha"))
+        self.assertEqual(len(self.sb.slot_stats(top=1)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
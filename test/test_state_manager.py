@@ -367,5 +367,95 @@ class TestDefaultSurvivesWrapperSwap(QtBaseTestCase):
         )
 
 
+class _CountingSettings(QtCore.QSettings):
+    """An ini ``QSettings`` that counts its ``sync()`` calls."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.sync_calls = 0
+
+    def sync(self):
+        self.sync_calls += 1
+        super().sync()
+
+
+class TestWriteBehindSync(QtBaseTestCase):
+    """``save_value`` defers the disk ``sync()`` instead of issuing one per write.
+
+    A slider drag fires ``valueChanged`` on every step; with a per-save sync
+    that was one synchronous disk write (an ini rewrite on Linux/macOS) per
+    step. The value itself must still be readable immediately — only the
+    sync waits.
+    """
+
+    DRAG_STEPS = 500
+
+    def setUp(self):
+        super().setUp()
+        self._dir = tempfile.TemporaryDirectory()
+        self.ini = os.path.join(self._dir.name, "state.ini")
+        self.store = _CountingSettings(self.ini, QtCore.QSettings.IniFormat)
+
+    def tearDown(self):
+        self._dir.cleanup()
+        super().tearDown()
+
+    def _drag(self, sm):
+        for step in range(self.DRAG_STEPS):
+            sm.save_value("slider/valueChanged", step)
+
+    def test_drag_coalesces_to_one_sync(self):
+        sm = StateManager(self.store, write_behind_ms=10_000)
+        self._drag(sm)
+        self.assertEqual(self.store.sync_calls, 0)
+        self.assertEqual(sm.pending_keys, {"slider/valueChanged"})
+        sm.flush()
+        self.assertEqual(self.store.sync_calls, 1)
+        self.assertEqual(sm.pending_keys, set())
+
+    def test_value_readable_before_sync(self):
+        sm = StateManager(self.store, write_behind_ms=10_000)
+        self._drag(sm)
+        self.assertEqual(int(self.store.value("slider/valueChanged")), 499)
+        # A second QSettings on the same file shares Qt's in-process cache.
+        other = QtCore.QSettings(self.ini, QtCore.QSettings.IniFormat)
+        self.assertEqual(int(other.value("slider/valueChanged")), 499)
+
+    def test_timer_flushes_within_window(self):
+        from qtpy.QtTest import QTest
+
+        sm = StateManager(self.store, write_behind_ms=20)
+        self._drag(sm)
+        QTest.qWait(150)
+        self.assertEqual(self.store.sync_calls, 1)
+        self.assertEqual(sm.pending_keys, set())
+        with open(self.ini) as f:
+            self.assertIn("499", f.read())
+
+    def test_window_change_applies_to_next_schedule(self):
+        from qtpy.QtTest import QTest
+
+        sm = StateManager(self.store, write_behind_ms=10_000)
+        sm.save_value("a/valueChanged", 1)
+        sm.flush()
+        sm.write_behind_ms = 20
+        sm.save_value("a/valueChanged", 2)
+        QTest.qWait(150)
+        self.assertEqual(self.store.sync_calls, 2)
+
+    def test_zero_window_syncs_every_write(self):
+        sm = StateManager(self.store, write_behind_ms=0)
+        self._drag(sm)
+        self.assertEqual(self.store.sync_calls, self.DRAG_STEPS)
+
+    def test_flush_all_and_idle_flush(self):
+        sm = StateManager(self.store, write_behind_ms=10_000)
+        sm.flush()  # nothing pending: no sync
+        self.assertEqual(self.store.sync_calls, 0)
+        sm.save_value("a/valueChanged", 1)
+        StateManager.flush_all()
+        self.assertEqual(self.store.sync_calls, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 # !/usr/bin/python
 # coding=utf-8
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from qtpy import QtWidgets, QtGui, QtCore
 from conftest import QtBaseTestCase, setup_qt_application
 from uitk.themes.style_sheet import StyleSheet
@@ -366,6 +366,7 @@ class TestStyleSheetTemplateEngine(QtBaseTestCase):
         saved_configs = StyleSheet._widget_configs
         StyleSheet._widget_configs = {w: saved_configs[w] for w in widgets}
         StyleSheet._apply_template = staticmethod(counting)
+        StyleSheet._render_cache.clear()  # the set() calls above warmed it
         try:
             StyleSheet.reload()
             self.assertEqual(
@@ -466,5 +467,181 @@ class TestStyleSheetPublicApi(QtBaseTestCase):
             StyleSheet.reset_overrides()
 
 
+class TestStyleSheetRenderCache(QtBaseTestCase):
+    """Rendered QSS is cached by (template, theme, resolved vars)."""
+
+    def setUp(self):
+        super().setUp()
+        StyleSheet._render_cache.clear()
+        self.addCleanup(StyleSheet.reset_overrides)
+
+    def _vars(self, theme="dark", **overrides):
+        theme_vars = StyleSheet.themes[theme].copy()
+        theme_vars.update(overrides)
+        return theme_vars
+
+    def test_hit_returns_cached_render(self):
+        first = StyleSheet._render("style.qss", "uitk.themes", "dark", self._vars())
+        with patch.object(
+            StyleSheet, "_derive_internal_vars", side_effect=AssertionError
+        ):
+            again = StyleSheet._render("style.qss", "uitk.themes", "dark", self._vars())
+        self.assertIs(again, first)
+
+    def test_render_matches_uncached_assembly(self):
+        theme_vars = self._vars(BUTTON_HOVER="rgb(1,2,3)")
+        expected_vars = theme_vars.copy()
+        StyleSheet._derive_internal_vars(expected_vars)
+        expected = StyleSheet._apply_template(StyleSheet._get_template(), expected_vars)
+        qss = StyleSheet._render("style.qss", "uitk.themes", "dark", theme_vars)
+        self.assertEqual(qss, expected)
+        self.assertNotIn("BUTTON_HOVER_TINT", theme_vars)  # input not mutated
+
+    def test_different_vars_render_separately(self):
+        base = StyleSheet._render("style.qss", "uitk.themes", "dark", self._vars())
+        tinted = StyleSheet._render(
+            "style.qss", "uitk.themes", "dark", self._vars(BUTTON_HOVER="rgb(1,2,3)")
+        )
+        self.assertNotEqual(base, tinted)
+        self.assertEqual(len(StyleSheet._render_cache), 2)
+
+    def test_global_override_reaches_widget_through_cache(self):
+        widget = self.track_widget(QtWidgets.QWidget())
+        StyleSheet().set(widget, theme="light")
+        StyleSheet.set_variable("BUTTON_HOVER", "rgb(9,8,7)", theme="light")
+        self.assertIn("rgb(9,8,7)", widget.styleSheet())
+        StyleSheet.set_variable("BUTTON_HOVER", None, theme="light")
+        self.assertNotIn("rgb(9,8,7)", widget.styleSheet())
+
+    def test_bounded_lru(self):
+        size = StyleSheet.RENDER_CACHE_SIZE
+        for i in range(size + 3):
+            StyleSheet._render(
+                "style.qss", "uitk.themes", "dark", self._vars(RADIUS=f"{i}px")
+            )
+        self.assertEqual(len(StyleSheet._render_cache), size)
+        radii = {dict(key[2])["RADIUS"] for key in StyleSheet._render_cache}
+        self.assertNotIn("0px", radii)
+        self.assertIn(f"{size + 2}px", radii)
+
+    def test_clear_caches_drops_renders(self):
+        StyleSheet._render("style.qss", "uitk.themes", "dark", self._vars())
+        StyleSheet.clear_caches()
+        self.assertEqual(len(StyleSheet._render_cache), 0)
+
+
+class TestStyleSheetSharedScope(QtBaseTestCase):
+    """``shared_scope``: one installed sheet per window / per app."""
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(StyleSheet.set_shared_scope, "widget")
+
+    def _window(self, children=3):
+        window = self.track_widget(QtWidgets.QMainWindow())
+        central = QtWidgets.QWidget()
+        window.setCentralWidget(central)
+        for i in range(children):
+            QtWidgets.QPushButton(f"b{i}", central).setObjectName(f"b{i}")
+        return window
+
+    def _buttons(self, window):
+        return window.findChildren(QtWidgets.QPushButton)
+
+    def test_default_scope_styles_every_widget(self):
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        self.assertTrue(all(b.styleSheet() for b in self._buttons(window)))
+
+    def test_window_scope_installs_once_per_window(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        self.assertTrue(window.styleSheet())
+        self.assertFalse(any(b.styleSheet() for b in self._buttons(window)))
+        # Still registered, so theme switches reach them.
+        self.assertIn(self._buttons(window)[0], StyleSheet._widget_configs)
+
+    def test_window_scope_theme_switch_keeps_children_bare(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        light = window.styleSheet()
+        StyleSheet.set_theme("dark")
+        self.assertNotEqual(window.styleSheet(), light)
+        self.assertFalse(any(b.styleSheet() for b in self._buttons(window)))
+
+    def test_window_scope_variant_keeps_own_sheet(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        styler = StyleSheet()
+        styler.set(window, theme="light")
+        button = self._buttons(window)[0]
+        styler.set(button, theme="dark")  # renders differently from the window
+        self.assertTrue(button.styleSheet())
+        styler.set(button, theme="light", style_class="ActionButton")
+        self.assertFalse(button.styleSheet())
+        self.assertEqual(button.property("class"), "ActionButton")
+
+    def test_window_scope_variant_ancestor_keeps_child_sheet(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        styler = StyleSheet()
+        styler.set(window, theme="light")
+        central = window.centralWidget()
+        styler.set(central, theme="dark")  # a differing sheet between the two
+        button = self._buttons(window)[0]
+        styler.set(button, theme="light")
+        # The dark rules on ``central`` would cascade onto a bare button.
+        self.assertTrue(button.styleSheet())
+
+    def test_reload_styles_windows_before_children(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        styler = StyleSheet()
+        button = self._buttons(window)[0]
+        styler.set(button, theme="light")  # before the window has a sheet
+        self.assertTrue(button.styleSheet())
+        styler.set(window, theme="light")
+        StyleSheet.reload()
+        self.assertFalse(button.styleSheet())
+
+    def test_switching_back_to_widget_scope_restores_sheets(self):
+        StyleSheet.set_shared_scope("window")
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        StyleSheet.set_shared_scope("widget")
+        self.assertTrue(all(b.styleSheet() for b in self._buttons(window)))
+
+    def test_app_scope_installs_on_application(self):
+        app = QtWidgets.QApplication.instance()
+        self.assertFalse(app.styleSheet())
+        StyleSheet.set_shared_scope("app")
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        self.assertTrue(app.styleSheet())
+        self.assertFalse(window.styleSheet())
+        self.assertFalse(any(b.styleSheet() for b in self._buttons(window)))
+        StyleSheet.set_shared_scope("widget")
+        self.assertFalse(app.styleSheet())
+        self.assertTrue(window.styleSheet())
+
+    def test_app_scope_never_replaces_a_foreign_app_sheet(self):
+        app = QtWidgets.QApplication.instance()
+        app.setStyleSheet("QWidget { color: red; }")
+        self.addCleanup(app.setStyleSheet, "")
+        StyleSheet.set_shared_scope("app")
+        window = self._window()
+        StyleSheet().set(window, theme="light", recursive=True)
+        self.assertEqual(app.styleSheet(), "QWidget { color: red; }")
+        # Falls back to per-window sharing.
+        self.assertTrue(window.styleSheet())
+        self.assertFalse(any(b.styleSheet() for b in self._buttons(window)))
+
+    def test_unknown_scope_raises(self):
+        with self.assertRaises(ValueError):
+            StyleSheet.set_shared_scope("screen")
+
+
 if __name__ == "__main__":
     unittest.main()
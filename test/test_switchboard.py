@@ -1278,6 +1278,31 @@ class TestSwitchboardGetWidgetFromUI(QtBaseTestCase):
             Switchboard._get_widget_from_ui("not a widget", "button_a")
 
 
+class TestSwitchboardGetWidgetLazy(QtBaseTestCase):
+    """get_widget resolves widgets whose registration is still deferred."""
+
+    def test_get_widget_registers_deferred_widget(self):
+        sb = Switchboard()
+        stack = QtWidgets.QStackedWidget()
+        for i in range(2):
+            page = QtWidgets.QWidget()
+            button = QtWidgets.QPushButton(page)
+            button.setObjectName(f"lazy_b{i}")
+            stack.addWidget(page)
+        ui = self.track_widget(
+            sb.add_ui("lazy_stack", widget=stack, lazy_registration=True)
+        )
+        ui.register_children()
+        names = {w.objectName() for w in ui.widgets}
+        self.assertIn("lazy_b0", names)
+        self.assertNotIn("lazy_b1", names)
+
+        widget = sb.get_widget("lazy_b1", ui)
+        self.assertIsNotNone(widget)
+        self.assertIn(widget, ui.widgets)
+        self.assertIsNone(sb.get_widget("missing", ui))
+
+
 class TestSwitchboardIsWidget(QtBaseTestCase):
     """Tests for SwitchboardWidgetMixin is_widget method."""
 
@@ -1422,6 +1447,115 @@ class TestSlotWrapper(QtBaseTestCase):
         self.assertEqual(received_widget[0], self.ui.button_a)
 
 
+class TestSlotWrapperFastPath(QtBaseTestCase):
+    """FastSlot / widget.fast_slot / ui.fast_slots bypass dispatch overhead."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from uitk import examples
+
+        cls.example_module = examples
+
+    def setUp(self):
+        super().setUp()
+        self.sb = Switchboard(
+            ui_source=self.example_module,
+            slot_source=ExampleSlots,
+        )
+        self.ui = self.sb.loaded_ui.example
+        self.widget = self.ui.button_a
+        self.calls = []
+
+    def tearDown(self):
+        for attr in ("fast_slot", "slot_timeout"):
+            if attr in vars(self.widget):
+                delattr(self.widget, attr)
+        self.ui.fast_slots = False
+        self.ui.close()
+        super().tearDown()
+
+    def _wrap(self, fast=False):
+        from uitk.switchboard import FastSlot, SlotWrapper
+
+        def slot(value=None, widget=None):
+            self.calls.append((value, widget))
+            return value
+
+        return SlotWrapper(FastSlot()(slot) if fast else slot, self.widget, self.sb)
+
+    def _dispatch(self, wrapper, *args):
+        """Call *wrapper*, returning (result, setOverrideCursor call count)."""
+        with mock.patch.object(
+            QtWidgets.QApplication, "setOverrideCursor"
+        ) as set_cursor, mock.patch.object(
+            QtWidgets.QApplication, "restoreOverrideCursor"
+        ):
+            result = wrapper(*args)
+        return result, set_cursor.call_count
+
+    def test_decorated_slot_skips_cursor_and_history(self):
+        self.sb._last_slot_wrapper = None
+        wrapper = self._wrap(fast=True)
+        result, cursor_calls = self._dispatch(wrapper, 7)
+        self.assertEqual(result, 7)
+        self.assertEqual(self.calls, [(7, self.widget)])  # widget still injected
+        self.assertEqual(cursor_calls, 0)
+        self.assertIsNone(self.sb._last_slot_wrapper)
+        self.assertNotIn(wrapper.slot, self.sb.slot_history())
+
+    def test_plain_slot_keeps_full_dispatch(self):
+        wrapper = self._wrap()
+        _, cursor_calls = self._dispatch(wrapper, 1)
+        self.assertEqual(cursor_calls, 1)
+        self.assertIs(self.sb._last_slot_wrapper, wrapper)
+
+    def test_fast_slot_ignores_timeout_sources(self):
+        import pythontk as ptk
+
+        self.widget.slot_timeout = 5
+        wrapper = self._wrap(fast=True)
+        with mock.patch.object(
+            ptk.ExecutionMonitor, "execution_monitor"
+        ) as monitor:
+            self._dispatch(wrapper, 1)
+        monitor.assert_not_called()
+        self.assertEqual(len(self.calls), 1)
+
+    def test_widget_flag_enables_and_overrides(self):
+        self.widget.fast_slot = True
+        self.assertEqual(self._dispatch(self._wrap(), 1)[1], 0)
+        self.widget.fast_slot = False  # opts a decorated slot back out
+        self.assertEqual(self._dispatch(self._wrap(fast=True), 1)[1], 1)
+
+    def test_ui_wide_flag(self):
+        self.ui.fast_slots = True
+        self.assertEqual(self._dispatch(self._wrap(), 1)[1], 0)
+
+    def test_fast_slot_still_debounces(self):
+        self.widget.debounce = 50
+        try:
+            wrapper = self._wrap(fast=True)
+            self.assertIsNone(wrapper(1))
+            self.assertEqual(self.calls, [])
+            wrapper._flush_debounce()
+            self.assertEqual(self.calls, [(1, self.widget)])
+        finally:
+            self.widget.debounce = 0
+
+    def test_fast_slot_under_signals_decorator(self):
+        from uitk.switchboard import FastSlot, Signals, SlotWrapper
+
+        @Signals("valueChanged")
+        @FastSlot()
+        def slot(value):
+            self.calls.append(value)
+
+        wrapper = SlotWrapper(slot, self.widget, self.sb)
+        self.assertEqual(self._dispatch(wrapper, 3)[1], 0)
+        self.assertEqual(self.calls, [3])
+
+
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
@@ -1658,6 +1792,46 @@ class TestSwitchboardEdgeCasesWidgetResolution(QtBaseTestCase):
         self.assertIsInstance(self.sb.is_widget(widget_ref), bool)
 
 
+class TestLazyWidgetRegistry(QtBaseTestCase):
+    """``Switchboard(lazy_widgets=True)`` defers widget-module imports."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from uitk import examples
+
+        cls.example_module = examples
+
+    def setUp(self):
+        super().setUp()
+        self.sb = Switchboard(
+            ui_source=self.example_module,
+            slot_source=ExampleSlots,
+            lazy_widgets=True,
+        )
+
+    def test_builtin_widgets_are_recorded_unresolved(self):
+        registry = self.sb.registry.widget_registry
+        self.assertIn("SequencerWidget", registry.get("classname"))
+        row = next(
+            nt for nt in registry.named_tuples if nt.classname == "SequencerWidget"
+        )
+        self.assertIsNone(row.classobj)
+
+    def test_lookup_resolves_the_real_class(self):
+        from uitk.widgets.pushButton import PushButton
+
+        self.assertIs(self.sb.resolve_widget_class("PushButton"), PushButton)
+        self.assertIs(self.sb.registered_widgets.PushButton, PushButton)
+
+    def test_ui_loads_through_deferred_registry(self):
+        ui = self.sb.loaded_ui.example
+        self.addCleanup(ui.close)
+        self.assertIsNotNone(ui)
+        # Only classes the .ui referenced were bound; the rest stay deferred.
+        self.assertTrue(self.sb.registry.widget_registry._deferred_files)
+
+
 class TestSlotWrapperEdgeCases(QtBaseTestCase):
     """Edge case tests for SlotWrapper."""
 
@@ -55,7 +55,7 @@ DEFAULT_INCLUDE = {
     # (rather than the package facade) to preserve per-symbol lazy loading.
     # `from uitk import Signals` should not drag in the Switchboard machinery.
     "switchboard._core": "Switchboard",
-    "switchboard.slots": ["Signals", "SlotWrapper", "Cancelable"],
+    "switchboard.slots": ["Signals", "SlotWrapper", "Cancelable", "FastSlot"],
     "switchboard.shortcuts": "Shortcut",
     "events": ["EventFactoryFilter", "MouseTracking"],
     # Launchable-entry handlers. ``UiHandler`` / ``ExternalAppHandler`` are what a
@@ -70,7 +70,7 @@ DEFAULT_INCLUDE = {
     # uitk.managers.registry_manager); resolving them warns via the shim.
     "file_manager": ["FileContainer", "FileManager"],
     "compile": ["UiCompiler", "PrecompileJob"],
-    "loaders": ["CompiledLoader", "RuntimeLoader"],
+    "loaders": ["CompiledLoader", "RuntimeLoader", "UiPreloader", "UiMetadataCache"],
     # Qt Designer widget-box registrar (`python -m uitk.designer`).
     "designer._designer": ["DesignerPlugin", "DesignerWidget"],
     "widgets.marking_menu._marking_menu": "MarkingMenu",
@@ -168,11 +168,13 @@ DEFAULT_INCLUDE = {
         "TextOverlay",
     ],
     # Standalone services (uitk.managers / uitk.themes)
+    "managers.disk_cache": "DiskCache",
+    "managers.icon_disk_cache": "IconDiskCache",
     "managers.icon_manager": "IconManager",
     "managers.optional_package_manager": "OptionalPackageManager",
     "managers.preset_manager": "PresetManager",
     "managers.recent_values_store": "RecentValuesStore",
-    "managers.registry_manager": ["FileRegistry", "RegistryManager"],
+    "managers.registry_manager": ["FileRegistry", "RegistryManager", "ScanIndex"],
     "managers.settings_manager": "SettingsManager",
     "managers.shortcut_manager": "ShortcutManager",
     "managers.state_manager": "StateManager",
@@ -4,13 +4,15 @@
 
 The generated _ui.py file embeds metadata constants the switchboard reads
 at load time (uitk_tags, custom widgets, base class, source hash). Hash-
-based staleness detection keeps the .ui and _ui.py in sync without
-relying on file mtimes.
+based staleness detection keeps the .ui and _ui.py in sync; a persisted
+:class:`FreshnessManifest` of stat data lets the common unchanged case skip
+the hash, and never decides "fresh" on timestamps alone.
 
 CLI: ``python -m uitk.compile [paths...] [--check] [--force]``
 """
 
 import ast
+import atexit
 import hashlib
 import logging
 import os
@@ -18,10 +20,13 @@ import re
 import shutil
 import subprocess
 import threading
+import time
 import uuid
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from uitk.managers.disk_cache import DiskCache
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,15 @@ logger = logging.getLogger(__name__)
 UIC_TIMEOUT_SECONDS = 60
 
 
+# Which generator ``compile_ui`` uses by default:
+#   "auto"   -- the in-process generator (uitk.ui_codegen), falling back to a
+#               uic subprocess for .ui constructs it doesn't cover;
+#   "python" -- the in-process generator only (UnsupportedUiError otherwise);
+#   "uic"    -- always spawn uic (the pre-generator behaviour).
+UI_GENERATOR = "auto"
+UI_GENERATORS = ("auto", "python", "uic")
+
+
 UIC_BINDINGS = {
     "PySide6": "pyside6-uic",
     "PySide2": "pyside2-uic",
@@ -82,13 +96,205 @@ class PrecompileJob:
         return self.thread is not None and self.thread.is_alive()
 
 
+class FreshnessManifest:
+    """Persisted ``.ui -> (stat, hash, _ui.py stat)`` records for freshness checks.
+
+    ``is_compiled_fresh`` used to read and SHA-256 every .ui and re-read the
+    _ui.py header on every call, including every ``CompiledLoader`` load. Once
+    a hash compare has *proven* a pair fresh, this manifest records the
+    .ui's and the _ui.py's stat signatures (``st_mtime_ns``, ``st_size``,
+    ``st_ctime_ns``) next to the hash; while both signatures still match, the
+    pair is fresh without opening either file — two ``stat`` calls.
+
+    Any signature change sends the check back to the hash compare, so the
+    hash stays the tie-breaker. That keeps the mtime-preserving-transport
+    case (cloud sync, ``cp -p``, zip extraction delivering new bytes under an
+    old timestamp) correct on POSIX, where ``st_ctime_ns`` is the inode change
+    time: it can't be set from user space and moves with any content write.
+    On Windows ``st_ctime`` is the creation time, which survives in-place
+    writes (and, through NTFS name tunneling, even delete-and-recreate), so
+    no stat tuple proves content unchanged; there the fast path is off
+    (:attr:`STAT_FAST_PATH`) and every check hashes.
+
+    Entries are only recorded for a .ui whose mtime is at least
+    ``RACY_WINDOW_NS`` in the past (git's "racy clean" rule), so an edit
+    landing inside the filesystem's timestamp granularity right after a check
+    can't be masked on coarse-mtime filesystems.
+
+    Thread-safe (precompile and the UI preloader check from worker threads).
+    Records are kept in memory and written by :meth:`save` — once per
+    precompile batch or CLI run, and at interpreter exit for anything the
+    load path recorded. Entries are derived data under ``DiskCache``: a
+    corrupt, foreign-version or deleted manifest just means one hash per
+    file.
+
+    Attributes:
+        path (Path): The JSON file backing the manifest.
+    """
+
+    VERSION = 1
+    FILENAME = "ui_manifest.json"
+    #: A .ui modified less than this long ago is hashed, never fast-pathed.
+    RACY_WINDOW_NS = 2_000_000_000
+    #: Whether stat signatures may stand in for a hash (False on Windows).
+    STAT_FAST_PATH = os.name != "nt"
+
+    _shared: Optional["FreshnessManifest"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """
+        Args:
+            path: JSON file to persist to. Defaults to
+                ``<DiskCache.cache_root()>/ui_manifest.json``.
+        """
+        self.path = Path(path) if path is not None else DiskCache.path_for(self.FILENAME)
+        self._entries: Optional[Dict[str, list]] = None
+        # Recorded since the last save: {key: entry}.
+        self._dirty: Dict[str, list] = {}
+        self._atexit_registered = False
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> "FreshnessManifest":
+        """Return the process-wide manifest at the default cache location.
+
+        Re-created when the cache root moves (e.g. a test sandbox redirecting
+        ``UITK_CACHE_ROOT``).
+        """
+        default_path = DiskCache.path_for(cls.FILENAME)
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.path != default_path:
+                cls._shared = cls(default_path)
+            return cls._shared
+
+    @staticmethod
+    def _key(ui_path) -> str:
+        return os.path.normcase(os.path.abspath(ui_path))
+
+    @staticmethod
+    def signature(path) -> Optional[List[int]]:
+        """``[st_mtime_ns, st_size, st_ctime_ns]`` of *path*, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size, st.st_ctime_ns]
+
+    @classmethod
+    def _read_entries(cls, path) -> Dict[str, list]:
+        data = DiskCache.load_json(path)
+        if data.get("version") != cls.VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    @property
+    def entries(self) -> Dict[str, list]:
+        """``{normalized .ui path: [ui signature, hash, py path, py signature]}``."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_entries(self.path)
+            return self._entries
+
+    def lookup(self, ui_path, py_path, ui_signature: Optional[list] = None) -> Optional[str]:
+        """Return the recorded source hash if neither file changed since it was proven.
+
+        Args:
+            ui_signature: The .ui's :meth:`signature`, when the caller already has it.
+        """
+        if not self.STAT_FAST_PATH:
+            return None
+        entry = self.entries.get(self._key(ui_path))
+        if not entry or entry[2] != self._key(py_path):
+            return None
+        if ui_signature is None:
+            ui_signature = self.signature(ui_path)
+        if ui_signature is None or entry[0] != ui_signature:
+            return None
+        if entry[3] != self.signature(py_path):
+            return None
+        return entry[1]
+
+    def record(self, ui_path, py_path, source_hash: str, ui_signature: list) -> bool:
+        """Remember that *py_path* was proven fresh for *ui_path* at *ui_signature*.
+
+        ``ui_signature`` must be taken *before* the .ui bytes were hashed, so a
+        write racing the hash leaves a signature that no longer matches.
+
+        The entry is persisted by the next :meth:`save`.
+
+        Returns:
+            True if the entry was recorded.
+        """
+        if not self.STAT_FAST_PATH:
+            return False
+        if time.time_ns() - ui_signature[0] < self.RACY_WINDOW_NS:
+            return False  # racy: a same-tick edit could keep this signature
+        py_signature = self.signature(py_path)
+        if py_signature is None:
+            return False
+        key = self._key(ui_path)
+        entry = [ui_signature, source_hash, self._key(py_path), py_signature]
+        with self._lock:
+            if self.entries.get(key) == entry:
+                return True
+            self.entries[key] = entry
+            self._dirty[key] = entry
+            if not self._atexit_registered:
+                self._atexit_registered = True
+                atexit.register(self.save)
+        return True
+
+    def save(self) -> bool:
+        """Write entries recorded since the last save; no-op when nothing changed.
+
+        Entries another process wrote meanwhile are merged rather than
+        clobbered (ours win per file).
+
+        Returns:
+            True if the manifest file was written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            merged = self._read_entries(self.path)
+            merged.update(self._dirty)
+            if not DiskCache.save_json(
+                self.path, {"version": self.VERSION, "files": merged}
+            ):
+                return False
+            merged.update(self.entries)
+            self._entries = merged
+            self._dirty = {}
+            return True
+
+    def forget(self, ui_path) -> None:
+        """Drop the entry for *ui_path* from memory (the file keeps it until rewritten)."""
+        with self._lock:
+            key = self._key(ui_path)
+            self.entries.pop(key, None)
+            self._dirty.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every entry, in memory and on disk."""
+        with self._lock:
+            self._entries = {}
+            self._dirty = {}
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
 class _UiCompilerInternal(object):
     """Private helpers and mutable state backing :class:`UiCompiler`.
 
     Kept off the public class so the module's public surface is exactly the
-    ``UiCompiler`` staticmethods (plus ``PrecompileJob``). Intra-module
-    references are fully qualified (``_UiCompilerInternal._helper`` /
-    ``UiCompiler.public``) so the two-class split stays explicit.
+    ``UiCompiler`` staticmethods (plus ``PrecompileJob`` and
+    ``FreshnessManifest``). Intra-module references are fully qualified
+    (``_UiCompilerInternal._helper`` / ``UiCompiler.public``) so the
+    two-class split stays explicit.
     """
 
     _precompile_lock = threading.Lock()
@@ -216,6 +422,50 @@ class _UiCompilerInternal(object):
             )
         return source
 
+    @staticmethod
+    def _runtime_binding() -> str:
+        """Name of the binding qtpy resolved to (what generated code will run on)."""
+        try:
+            from qtpy import API_NAME
+
+            return API_NAME
+        except Exception:
+            return "PySide6"
+
+    @staticmethod
+    def _generate_body(ui_path: Path, generator: str) -> Tuple[str, str]:
+        """Return ``(binding, qtpy-importing form source)`` for ``ui_path``.
+
+        The in-process generator's output already imports from qtpy and is
+        binding-neutral, so its header records the runtime binding. uic's
+        output is rewritten to qtpy and records the binding of the uic used.
+        """
+        if generator not in UI_GENERATORS:
+            raise ValueError(
+                f"generator must be one of {UI_GENERATORS}, got {generator!r}"
+            )
+        if generator != "uic":
+            from uitk.ui_codegen import UiCodeGenerator, UnsupportedUiError
+
+            try:
+                body = UiCodeGenerator(ui_path).generate()
+                return _UiCompilerInternal._runtime_binding(), body
+            except UnsupportedUiError as e:
+                if generator == "python":
+                    raise
+                logger.debug("uitk compile: %s falls back to uic (%s)", ui_path.name, e)
+
+        binding, argv_prefix = _UiCompilerInternal._detect_uic_command()
+        proc = subprocess.run(
+            argv_prefix + [str(ui_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+            encoding="utf-8",
+            timeout=UIC_TIMEOUT_SECONDS,
+        )
+        return binding, _UiCompilerInternal._rewrite_imports_to_qtpy(proc.stdout)
+
     @staticmethod
     def _build_header(
         ui_path: Path, binding: str, metadata: dict, source_hash: str
@@ -279,24 +529,30 @@ class _UiCompilerInternal(object):
         from concurrent.futures import ThreadPoolExecutor
 
         # Threads, not processes:
-        #   - compile_ui's only heavy work is `subprocess.run(uic, ...)` which
-        #     releases the GIL, so threads achieve real parallelism here.
+        #   - compile_ui's heavy work is either the in-process generator
+        #     (about a millisecond per form) or, on fallback,
+        #     `subprocess.run(uic, ...)`, which releases the GIL -- threads
+        #     achieve real parallelism where it matters.
         #   - ProcessPoolExecutor on Windows uses spawn, which re-imports the
         #     caller's main module. When precompile_async is triggered by
         #     library code (e.g. MarkingMenu.__init__), workers recursively
         #     re-execute the import path → RuntimeError ("not in __main__").
         #     Threads sidestep that entirely.
         logger.info("uitk precompile: %d file(s) with %d worker(s)", len(targets), jobs)
-        if jobs <= 1 or len(targets) == 1:
-            for t in targets:
-                _, err = _UiCompilerInternal._compile_one(t)
-                if err:
-                    logger.warning("uitk precompile: %s failed: %s", t.name, err)
-            return
-        with ThreadPoolExecutor(max_workers=jobs) as pool:
-            for t, err in pool.map(_UiCompilerInternal._compile_one, targets):
-                if err:
-                    logger.warning("uitk precompile: %s failed: %s", t.name, err)
+        try:
+            if jobs <= 1 or len(targets) == 1:
+                for t in targets:
+                    _, err = _UiCompilerInternal._compile_one(t)
+                    if err:
+                        logger.warning("uitk precompile: %s failed: %s", t.name, err)
+                return
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                for t, err in pool.map(_UiCompilerInternal._compile_one, targets):
+                    if err:
+                        logger.warning("uitk precompile: %s failed: %s", t.name, err)
+        finally:
+            # One manifest write for the whole batch.
+            FreshnessManifest.shared().save()
 
 
 class UiCompiler(_UiCompilerInternal):
@@ -354,22 +610,35 @@ class UiCompiler(_UiCompilerInternal):
         format end-to-end: the embedded hash is the single source of truth
         for whether the artifact matches its .ui source.
 
-        The embedded-hash compare is the sole freshness test; there is no
-        mtime fast path (see the inline comment below for why an
-        mtime shortcut is unsound under mtime-preserving transports).
+        Fast path: a pair whose .ui and _ui.py stat signatures both still
+        match what :class:`FreshnessManifest` recorded when the hash was last
+        proven equal is fresh after two ``stat`` calls. Any signature change
+        falls through to the hash compare. There is no "py newer than ui"
+        shortcut (see the inline comment below for why that is unsound).
         """
         py_path = Path(py_path) if py_path else UiCompiler.compiled_path_for(ui_path)
+        manifest = FreshnessManifest.shared()
+        ui_signature = FreshnessManifest.signature(ui_path)
+        if ui_signature is not None and manifest.lookup(ui_path, py_path, ui_signature):
+            return True
         if not py_path.exists():
             return False
         embedded = UiCompiler.read_embedded_hash(py_path)
         if embedded is None:
             return False  # raw uic or hand-written: not our format
-        # The embedded-hash comparison is the SOLE source of truth. An mtime fast
+        # The embedded-hash comparison is the source of truth. An mtime fast
         # path ("py newer than ui -> fresh") is unsound: mtime-preserving transports
         # (cloud sync / cp -p / zip extraction) can deliver new .ui content with an
         # OLDER timestamp than an already-compiled artifact, which the fast path
-        # would wrongly accept as fresh forever. Hashing a few-KB .ui is cheap.
-        return embedded == UiCompiler.hash_ui_source(ui_path)
+        # would wrongly accept as fresh forever. The manifest only short-circuits
+        # on exact stat signatures (ctime included) recorded after a hash match,
+        # and never on Windows, where ctime is the creation time.
+        current = UiCompiler.hash_ui_source(ui_path)
+        if embedded != current:
+            return False
+        if ui_signature is not None:
+            manifest.record(ui_path, py_path, current, ui_signature)
+        return True
 
     @staticmethod
     def extract_metadata(ui_path) -> dict:
@@ -422,9 +691,15 @@ class UiCompiler(_UiCompilerInternal):
         }
 
     @staticmethod
-    def compile_ui(ui_path, out_path=None, header_resolver=None) -> Path:
+    def compile_ui(ui_path, out_path=None, header_resolver=None, generator=None) -> Path:
         """Compile a .ui file to a switchboard-augmented _ui.py.
 
+        The form class is produced in-process by :mod:`uitk.ui_codegen` when
+        the .ui stays within the subset it covers, and by a ``uic``
+        subprocess otherwise (see ``generator``). Both yield the same
+        qtpy-based module; the in-process path just skips ~150-200 ms of
+        process start-up per file.
+
         Args:
             ui_path: Source .ui path.
             out_path: Output .py path. Defaults to {stem}_ui.py next to source.
@@ -435,28 +710,28 @@ class UiCompiler(_UiCompilerInternal):
                 rewritten to use that path. Used to repair malformed
                 ``<header>`` declarations in legacy .ui files (typically wired
                 up by the switchboard via its widget_registry).
+            generator: ``"auto"``, ``"python"`` or ``"uic"``; defaults to the
+                module-level ``UI_GENERATOR`` (``"auto"``: in-process with a
+                uic fallback).
 
         Returns:
             Path to the written _ui.py file.
 
         Raises:
-            FileNotFoundError: No Qt uic compiler is on PATH.
+            uitk.ui_codegen.UnsupportedUiError: ``generator="python"`` and the
+                .ui uses a construct only uic handles.
+            FileNotFoundError: No Qt uic compiler is on PATH (and uic was needed).
             subprocess.CalledProcessError: uic failed on the .ui file.
             subprocess.TimeoutExpired: uic exceeded UIC_TIMEOUT_SECONDS.
         """
         ui_path = Path(ui_path)
         out_path = Path(out_path) if out_path else UiCompiler.compiled_path_for(ui_path)
+        # Stat before reading, so an edit racing this compile can't be recorded as fresh.
+        ui_signature = FreshnessManifest.signature(ui_path)
 
-        binding, argv_prefix = _UiCompilerInternal._detect_uic_command()
-        proc = subprocess.run(
-            argv_prefix + [str(ui_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-            encoding="utf-8",
-            timeout=UIC_TIMEOUT_SECONDS,
+        binding, body = _UiCompilerInternal._generate_body(
+            ui_path, generator or UI_GENERATOR
         )
-        body = _UiCompilerInternal._rewrite_imports_to_qtpy(proc.stdout)
 
         metadata = UiCompiler.extract_metadata(ui_path)
 
@@ -465,8 +740,9 @@ class UiCompiler(_UiCompilerInternal):
                 body, metadata["customwidgets"], header_resolver
             )
 
+        source_hash = UiCompiler.hash_ui_source(ui_path)
         header = _UiCompilerInternal._build_header(
-            ui_path, binding, metadata, UiCompiler.hash_ui_source(ui_path)
+            ui_path, binding, metadata, source_hash
         )
 
         # Unique per-call tmp suffix so concurrent writes (e.g. background
@@ -487,6 +763,8 @@ class UiCompiler(_UiCompilerInternal):
                 pass
             raise
 
+        if ui_signature is not None:
+            FreshnessManifest.shared().record(ui_path, out_path, source_hash, ui_signature)
         return out_path
 
     @staticmethod
@@ -525,8 +803,9 @@ class UiCompiler(_UiCompilerInternal):
         and will not block process exit.
 
         Use this on application startup to amortize cold-clone first-launch
-        latency: ~150-200ms per uic subprocess × dozens of UIs becomes a few
-        hundred ms of background work the user never feels.
+        latency. With the in-process generator most files cost about a
+        millisecond; those that fall back to uic still pay ~150-200ms per
+        subprocess, which this keeps off the caller's thread.
         """
         workers = jobs if jobs is not None else min(8, os.cpu_count() or 4)
         targets = (
@@ -641,7 +920,14 @@ class UiCompiler(_UiCompilerInternal):
                         failed.append(t)
                     else:
                         print(f"Compiled: {t}")
-
+            # Pool processes exit without running atexit, so their manifest
+            # records are lost; re-prove the written pairs here (one hash
+            # each) and save them below in one write.
+            for t in todo:
+                if t not in failed:
+                    UiCompiler.is_compiled_fresh(t, UiCompiler.compiled_path_for(t))
+
+        FreshnessManifest.shared().save()
         if failed:
             raise SystemExit(1)
 
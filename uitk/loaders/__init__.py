@@ -11,9 +11,14 @@ Two implementations of the same three-method contract — pick via
   hashed ``_ui.py`` per .ui; loaded through Python imports. Pairs with
   :mod:`uitk.compile` for the build/CLI side.
 
-Both expose: ``load(file)``, ``read_ui_tags(path)``, ``on_tags_written(path)``.
+Both expose: ``load(file)``, ``read_ui_tags(path)``, ``on_tags_written(path)``,
+plus the optional ``prepare(file)`` that :class:`uitk.loaders.preload.UiPreloader`
+runs on worker threads. Both read .ui metadata through the process-wide
+:class:`uitk.loaders.metadata.UiMetadataCache`.
 """
 from uitk.loaders.compiled import CompiledLoader
 from uitk.loaders.runtime import RuntimeLoader
+from uitk.loaders.preload import UiPreloader
+from uitk.loaders.metadata import UiMetadataCache
 
-__all__ = ["CompiledLoader", "RuntimeLoader"]
+__all__ = ["CompiledLoader", "RuntimeLoader", "UiPreloader", "UiMetadataCache"]
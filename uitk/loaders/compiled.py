@@ -13,6 +13,9 @@ three operations through it:
 - ``read_ui_tags(path)``      returns uitk_tags from the .ui XML directly
 - ``on_tags_written(path)``   regenerates _ui.py after save_ui_tags
 
+plus the optional ``prepare(file)`` (the thread-safe, non-GUI part of
+``load``) used by :class:`uitk.loaders.preload.UiPreloader`.
+
 The .ui remains the canonical source-of-truth; this loader auto-compiles a
 fresh _ui.py whenever one is missing or its embedded hash diverges from the
 .ui contents.
@@ -20,15 +23,16 @@ fresh _ui.py whenever one is missing or its embedded hash diverges from the
 
 import hashlib
 import importlib.util
-import os
 import sys
+import threading
 from pathlib import Path
 from typing import Dict
 
 import pythontk as ptk
 from qtpy import QtWidgets
 
-from uitk.compile import UiCompiler
+from uitk.compile import FreshnessManifest, UiCompiler
+from uitk.loaders.metadata import UiMetadataCache
 
 
 class CompiledLoader:
@@ -95,13 +99,17 @@ class CompiledLoader:
 
     def __init__(self, switchboard):
         self.sb = switchboard
-        # ui_path → (ui_mtime, py_path, module). Set after a successful
-        # load so subsequent loads of the same .ui (with unchanged mtime)
-        # skip both ``ensure_compiled`` (freshness re-check) and
+        # ui_path → (ui_signature, py_path, module). Set after a successful
+        # load so subsequent loads of the same .ui (with an unchanged
+        # FreshnessManifest.signature: mtime_ns, size, ctime_ns) skip both
+        # ``ensure_compiled`` (freshness re-check) and
         # ``_import_compiled_module`` (Python module re-exec). The module
         # is reused; only ``Ui_*().setupUi(form)`` runs per load to build
         # a fresh widget tree.
         self._load_cache: Dict[str, tuple] = {}
+        # ``prepare`` fills _load_cache from UiPreloader workers while the
+        # GUI thread may be reading it in ``load``.
+        self._load_lock = threading.Lock()
         # Class names already promoted to Switchboard.registered_widgets
         # via this loader. registered_widgets membership is the source of
         # truth, but caching the answer collapses the per-load
@@ -125,18 +133,34 @@ class CompiledLoader:
             return None
         return getattr(cls, "__module__", None)
 
+    def _resolve_header_readonly(self, class_name: str, original_header: str):
+        """Worker-thread :meth:`_resolve_header` that never mutates the registry.
+
+        A ``classobj`` lookup on a lazy registry rewrites its rows, which only
+        the GUI thread may do. This warms the module through its canonical
+        import instead and derives the module path from the registered file.
+        Loose files have no canonical path and return None.
+        """
+        registry = self.sb.registry.widget_registry
+        registry.warm_deferred(classname=class_name)
+        filepath = registry.get(classname=class_name, return_field="filepath")
+        if not filepath:
+            return None
+        return ptk.FileUtils.canonical_module_path(filepath) or None
+
     def read_ui_tags(self, ui_path: str) -> set:
         """Return the uitk_tags set for a .ui file via direct XML extraction.
 
         Reads from the .ui XML rather than from a compiled _ui.py header so
         registration is tolerant of malformed or stub fixtures and never
         spawns a uic subprocess just to enumerate tags. The compiled module
-        is only built when a UI is actually loaded.
+        is only built when a UI is actually loaded. Parses go through the
+        process-wide :class:`UiMetadataCache` shared with the RuntimeLoader.
         """
         if not ui_path:
             return set()
         try:
-            return set(UiCompiler.extract_metadata(ui_path)["uitk_tags"])
+            return set(UiMetadataCache.shared().get(ui_path)["uitk_tags"])
         except Exception:
             return set()
 
@@ -151,33 +175,11 @@ class CompiledLoader:
         Repeat loads of the same .ui in this Switchboard session reuse the
         already-imported module (via ``_load_cache``) — only setupUi runs
         per load to build a fresh widget tree. Cache invalidates when the
-        .ui's mtime changes.
+        .ui's stat signature (mtime, size, ctime) changes; a first load of a
+        pair the freshness manifest already proved costs two ``stat`` calls,
+        not a hash.
         """
-        ui_path = Path(ui_file)
-        cache_key = str(ui_path.resolve())
-        try:
-            ui_mtime = os.path.getmtime(ui_path)
-        except OSError:
-            ui_mtime = None
-
-        cached = self._load_cache.get(cache_key)
-        if cached is not None and cached[0] == ui_mtime:
-            _, py_path, module = cached
-        else:
-            py_path = UiCompiler.ensure_compiled(
-                ui_path, header_resolver=self._resolve_header
-            )
-            try:
-                module = CompiledLoader._import_compiled_module(py_path)
-            except ImportError:
-                self.sb.logger.info(
-                    f"[{py_path.name}] import failed; regenerating with resolver"
-                )
-                UiCompiler.compile_ui(
-                    ui_path, py_path, header_resolver=self._resolve_header
-                )
-                module = CompiledLoader._import_compiled_module(py_path)
-            self._load_cache[cache_key] = (ui_mtime, py_path, module)
+        py_path, module = self._resolve_module(ui_file)
 
         for cls_name, _header in getattr(module, "__customwidgets__", []):
             if cls_name in self._registered_classes:
@@ -202,11 +204,56 @@ class CompiledLoader:
         self.sb.logger.debug(f"[{name}] UI loaded via compiled module {py_path.name}")
         return form
 
+    def prepare(self, ui_file: str) -> None:
+        """Do the non-GUI half of :meth:`load` ahead of time; safe on a worker thread.
+
+        Runs the freshness check (regenerating the _ui.py when stale) and
+        imports the _ui.py module into ``_load_cache``, leaving ``load`` with
+        ``setupUi`` — the only step that constructs widgets. Headers resolve
+        through :meth:`_resolve_header_readonly`, so the widget registry is
+        only read. Concurrent prepares converge: compiles are atomic
+        replaces of identical output.
+        """
+        self._resolve_module(ui_file, header_resolver=self._resolve_header_readonly)
+
+    def _resolve_module(self, ui_file: str, header_resolver=None) -> tuple:
+        """Return ``(py_path, module)`` for *ui_file*, compiling/importing on a cache miss.
+
+        *header_resolver* defaults to :meth:`_resolve_header`, which is only
+        safe on the GUI thread.
+        """
+        if header_resolver is None:
+            header_resolver = self._resolve_header
+        ui_path = Path(ui_file)
+        cache_key = str(ui_path.resolve())
+        ui_signature = FreshnessManifest.signature(ui_path)
+
+        with self._load_lock:
+            cached = self._load_cache.get(cache_key)
+        if cached is not None and cached[0] == ui_signature:
+            return cached[1], cached[2]
+
+        py_path = UiCompiler.ensure_compiled(ui_path, header_resolver=header_resolver)
+        try:
+            module = CompiledLoader._import_compiled_module(py_path)
+        except ImportError:
+            self.sb.logger.info(
+                f"[{py_path.name}] import failed; regenerating with resolver"
+            )
+            UiCompiler.compile_ui(ui_path, py_path, header_resolver=header_resolver)
+            module = CompiledLoader._import_compiled_module(py_path)
+        with self._load_lock:
+            self._load_cache[cache_key] = (ui_signature, py_path, module)
+        return py_path, module
+
     def on_tags_written(self, ui_path: str) -> None:
         """Regenerate _ui.py after the .ui has been written with new tags.
 
-        Invalidates the load cache so the next ``load(ui_path)`` re-imports
-        the regenerated module instead of reusing the stale one.
+        Invalidates the load cache (and the shared metadata cache) so the
+        next ``load(ui_path)`` re-imports the regenerated module instead of
+        reusing the stale one.
         """
         UiCompiler.compile_ui(ui_path, header_resolver=self._resolve_header)
-        self._load_cache.pop(str(Path(ui_path).resolve()), None)
+        with self._load_lock:
+            self._load_cache.pop(str(Path(ui_path).resolve()), None)
+        UiMetadataCache.shared().invalidate(ui_path)
@@ -0,0 +1,207 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Process-wide cache of parsed .ui metadata, shared by every loader.
+
+``UiCompiler.extract_metadata`` (base class, form class, custom widgets,
+uitk_tags) is an XML parse of the whole .ui. Loaders need it for every
+``read_ui_tags`` and every ``load``; before this cache each
+``RuntimeLoader`` kept a private dict, so two Switchboards over the same
+sources parsed every file twice, and the dict wasn't safe to fill from the
+preloader's worker threads without leaning on GIL atomicity.
+
+:class:`UiMetadataCache` is one lock-protected map for the process, keyed
+by normalized path and validated by the file's stat signature
+(``st_mtime_ns``, ``st_size``, ``st_ctime_ns`` — see
+:meth:`uitk.compile.FreshnessManifest.signature`). Parsing runs outside the
+lock, so workers parse different files in parallel; two threads racing on
+one file store equal entries. An optional disk tier persists entries under
+:class:`~uitk.managers.disk_cache.DiskCache` so a fresh process skips the
+parse for unchanged files.
+
+Classes:
+    UiMetadataCache: Shared, thread-safe ``.ui -> metadata`` cache with an
+        optional on-disk tier.
+"""
+import atexit
+import os
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from uitk.compile import FreshnessManifest, UiCompiler
+from uitk.managers.disk_cache import DiskCache
+
+
+class UiMetadataCache:
+    """Shared, lock-protected ``.ui path -> extract_metadata()`` cache.
+
+    Use :meth:`shared` for the process-wide instance the loaders consult.
+    Returned dicts are shared between callers; treat them as read-only.
+
+    Attributes:
+        path (Path): JSON file backing the disk tier.
+        persist (bool): Whether parsed entries are written to ``path``.
+    """
+
+    VERSION = 1
+    FILENAME = "ui_metadata.json"
+    #: Default for :attr:`persist` on the shared instance. Set True (before
+    #: the first Switchboard loads a UI) to enable the disk tier.
+    PERSIST = False
+
+    _shared: Optional["UiMetadataCache"] = None
+    _shared_lock = threading.Lock()
+
+    # What extract_metadata yields for an unreadable .ui (missing file,
+    # cloud-sync mid-write). Kept in memory only, never persisted.
+    _FALLBACK = {
+        "base_class": "QWidget",
+        "form_class": "Form",
+        "customwidgets": [],
+        "uitk_tags": [],
+    }
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        persist: Optional[bool] = None,
+    ) -> None:
+        """
+        Args:
+            path: JSON file for the disk tier. Defaults to
+                ``<DiskCache.cache_root()>/ui_metadata.json``.
+            persist: Enable the disk tier. Defaults to :attr:`PERSIST`.
+        """
+        self.path = Path(path) if path is not None else DiskCache.path_for(self.FILENAME)
+        self.persist = self.PERSIST if persist is None else persist
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[list, dict]] = {}
+        self._disk: Optional[Dict[str, list]] = None
+        self._dirty: Dict[str, list] = {}
+        self._atexit_registered = False
+
+    @classmethod
+    def shared(cls) -> "UiMetadataCache":
+        """Return the process-wide cache.
+
+        Re-created when the cache root moves (e.g. a test sandbox redirecting
+        ``UITK_CACHE_ROOT``), like :meth:`uitk.compile.FreshnessManifest.shared`.
+        """
+        default_path = DiskCache.path_for(cls.FILENAME)
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.path != default_path:
+                cls._shared = cls(default_path)
+            return cls._shared
+
+    @staticmethod
+    def key(ui_path) -> str:
+        """Normalized cache key for *ui_path*."""
+        return str(Path(ui_path).resolve())
+
+    # ---- mapping-style introspection ---------------------------------------
+
+    def __contains__(self, ui_path) -> bool:
+        with self._lock:
+            return self.key(ui_path) in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ---- lookup -------------------------------------------------------------
+
+    def get(self, ui_path) -> dict:
+        """Return the metadata for *ui_path*, parsing only when the file changed.
+
+        Thread-safe. Never raises for an unreadable file; it yields the
+        empty fallback metadata (re-parsed on the next call whose stat
+        signature differs).
+        """
+        key = self.key(ui_path)
+        signature = FreshnessManifest.signature(ui_path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            if self.persist and signature is not None:
+                metadata = self._from_disk(key, signature)
+                if metadata is not None:
+                    self._entries[key] = (signature, metadata)
+                    return metadata
+
+        try:
+            metadata = UiCompiler.extract_metadata(ui_path)
+            parsed = True
+        except (ET.ParseError, OSError):
+            # Tolerant of partial/corrupt reads (e.g. cloud-sync mid-write).
+            metadata, parsed = dict(self._FALLBACK), False
+
+        with self._lock:
+            self._entries[key] = (signature, metadata)
+            if self.persist and parsed and signature is not None:
+                self._dirty[key] = [signature, metadata]
+                self._register_atexit()
+        return metadata
+
+    def _from_disk(self, key: str, signature: list) -> Optional[dict]:
+        """Disk-tier hit for *key* at *signature*; call with the lock held."""
+        if self._disk is None:
+            data = DiskCache.load_json(self.path)
+            files = data.get("files") if data.get("version") == self.VERSION else None
+            self._disk = files if isinstance(files, dict) else {}
+        entry = self._disk.get(key)
+        if not entry or entry[0] != signature:
+            return None
+        metadata = dict(entry[1])
+        # JSON has no tuples; restore extract_metadata's (class, header) pairs.
+        metadata["customwidgets"] = [tuple(cw) for cw in metadata.get("customwidgets", [])]
+        return metadata
+
+    def _register_atexit(self) -> None:
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.save)
+
+    # ---- maintenance --------------------------------------------------------
+
+    def save(self) -> bool:
+        """Write entries parsed since the last save to the disk tier.
+
+        Entries another process wrote meanwhile are merged rather than
+        clobbered (ours win per file). No-op without :attr:`persist` or new
+        entries.
+
+        Returns:
+            True if the file was written.
+        """
+        with self._lock:
+            if not self.persist or not self._dirty:
+                return False
+            data = DiskCache.load_json(self.path)
+            merged = data.get("files") if data.get("version") == self.VERSION else None
+            merged = merged if isinstance(merged, dict) else {}
+            merged.update(self._dirty)
+            if not DiskCache.save_json(
+                self.path, {"version": self.VERSION, "files": merged}
+            ):
+                return False
+            self._disk = merged
+            self._dirty = {}
+            return True
+
+    def invalidate(self, ui_path) -> None:
+        """Drop *ui_path* from both tiers' in-memory state (content changed)."""
+        key = self.key(ui_path)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._dirty.pop(key, None)
+            if self._disk is not None:
+                self._disk.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every in-memory entry (the disk tier file is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty.clear()
+            self._disk = None
@@ -0,0 +1,192 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Load many .ui files with everything but widget construction off the GUI thread.
+
+Loading a UI is two kinds of work:
+
+- **Non-GUI** — reading and parsing the .ui XML, the compiled loader's
+  freshness hash (and uic run when stale), importing the _ui.py or the
+  custom-widget modules it names. None of it touches a QWidget, so it can
+  run on worker threads.
+- **GUI** — ``QUiLoader.load`` / ``setupUi``, which construct widgets and
+  must run on the GUI thread.
+
+A loader delegate opts in by exposing ``prepare(file)`` — the non-GUI half,
+which fills the delegate's own caches — after which its ``load(file)`` is
+left with the construction alone. Delegates without ``prepare`` still work;
+every step then simply runs in ``load`` on the GUI thread.
+
+:class:`UiPreloader` submits every ``prepare`` to a thread pool up front,
+then builds on the GUI thread either:
+
+- **blocking** (:meth:`UiPreloader.run`) — in order, each as soon as its
+  prepare is done, so parsing/importing of later files overlaps the
+  construction of earlier ones; or
+- **in the background** (:meth:`UiPreloader.start`) — from a zero-interval
+  ``QTimer``, building ready UIs until a ``slice_ms`` budget is spent and
+  then yielding to the event loop, so a warm-all pass at host startup no
+  longer freezes the host. The slice is whole-UI granular: one UI's
+  construction is never split, so a single heavy form can still overrun it.
+
+Classes:
+    UiPreloader: Thread-pool prepare + GUI-thread (optionally time-sliced) build.
+"""
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from qtpy import QtCore, QtWidgets
+import pythontk as ptk
+
+
+class UiPreloader(QtCore.QObject, ptk.LoggingMixin):
+    """Prepare .ui files on worker threads and build them on the GUI thread.
+
+    Signals:
+        progress (str, int, int): Filepath just built, count built, total.
+        finished (list): Built widgets in ``filepaths`` order (``None`` for
+            a file that failed in background mode; see :attr:`errors`).
+
+    Attributes:
+        results: Built widgets, filled in as they are built.
+        errors: ``{filepath: exception}`` for background-mode build failures.
+    """
+
+    progress = QtCore.Signal(str, int, int)
+    finished = QtCore.Signal(list)
+
+    #: GUI-thread budget per event-loop turn in background mode (ms).
+    SLICE_MS = 8
+    #: Upper bound on worker threads when ``workers`` isn't given.
+    MAX_WORKERS = 4
+    #: Poll interval (ms) while the next file's prepare is still running —
+    #: long enough not to starve the workers of the GIL with a spinning loop.
+    WAIT_MS = 2
+
+    def __init__(
+        self,
+        loader,
+        filepaths: Iterable[str],
+        workers: Optional[int] = None,
+        slice_ms: Optional[float] = None,
+        parent: Optional[QtCore.QObject] = None,
+        log_level: str = "WARNING",
+    ):
+        """
+        Args:
+            loader: A Switchboard loader delegate (``load(file)``, optionally
+                ``prepare(file)``).
+            filepaths: The .ui files to load, in result order.
+            workers: Worker threads for ``prepare``; ``0`` prepares inline on
+                the GUI thread (the fully serial behaviour). Default:
+                ``min(MAX_WORKERS, cpu_count)``.
+            slice_ms: Background-mode GUI budget per event-loop turn.
+            parent: QObject parent (keeps a background run alive when the
+                caller drops its reference).
+        """
+        super().__init__(parent)
+        self.set_log_level(log_level)
+        self.loader = loader
+        self.filepaths: List[str] = list(filepaths)
+        self.workers = (
+            min(self.MAX_WORKERS, os.cpu_count() or 1) if workers is None else workers
+        )
+        self.slice_ms = self.SLICE_MS if slice_ms is None else slice_ms
+        self.results: List[Optional[QtWidgets.QWidget]] = [None] * len(self.filepaths)
+        self.errors: Dict[str, BaseException] = {}
+        self._futures: Dict[str, Future] = {}
+        self._next = 0
+        self._timer: Optional[QtCore.QTimer] = None
+
+    def is_finished(self) -> bool:
+        """True once every file has been built (or has failed)."""
+        return self._next >= len(self.filepaths)
+
+    # ---- public -----------------------------------------------------------
+
+    def run(self) -> list:
+        """Load every file, blocking until done; build errors propagate.
+
+        Returns:
+            (list) The built widgets, in ``filepaths`` order.
+        """
+        self._submit()
+        try:
+            while not self.is_finished():
+                self._build_next(raise_errors=True)
+        except BaseException:
+            self._cancel_pending()
+            raise
+        self.finished.emit(self.results)
+        return self.results
+
+    def start(self) -> "UiPreloader":
+        """Begin a non-blocking, time-sliced load; returns ``self``.
+
+        Requires a running Qt event loop. Listen on :attr:`finished` (or poll
+        :meth:`is_finished`) for completion.
+        """
+        self._submit()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop a background run; files not yet built are skipped (no ``finished``)."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._cancel_pending()
+        self._next = len(self.filepaths)
+
+    # ---- internals --------------------------------------------------------
+
+    def _submit(self) -> None:
+        prepare = getattr(self.loader, "prepare", None)
+        if prepare is None or self.workers <= 0:
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="uitk-preload"
+        )
+        for path in dict.fromkeys(self.filepaths):  # one prepare per file
+            self._futures[path] = pool.submit(prepare, path)
+        # Queued work still runs; this only stops the pool accepting more.
+        pool.shutdown(wait=False)
+
+    def _cancel_pending(self) -> None:
+        for future in self._futures.values():
+            future.cancel()
+
+    def _build_next(self, raise_errors: bool) -> None:
+        i = self._next
+        path = self.filepaths[i]
+        self._next += 1
+        future = self._futures.get(path)
+        if future is not None and future.exception() is not None:
+            # ``load`` redoes the failed step on this thread and raises (or
+            # recovers) exactly as an unprepared load would.
+            self.logger.debug(f"[preload] prepare failed for {path}: {future.exception()}")
+        try:
+            self.results[i] = self.loader.load(path)
+        except Exception as e:
+            if raise_errors:
+                raise
+            self.errors[path] = e
+            self.logger.warning(f"[preload] failed to load {path}: {e}")
+        self.progress.emit(path, self._next, len(self.filepaths))
+
+    def _tick(self) -> None:
+        deadline = time.perf_counter() + self.slice_ms / 1000.0
+        while not self.is_finished():
+            future = self._futures.get(self.filepaths[self._next])
+            if future is not None and not future.done():
+                self._timer.setInterval(self.WAIT_MS)
+                return
+            self._build_next(raise_errors=False)
+            if time.perf_counter() >= deadline:
+                self._timer.setInterval(0)
+                return
+        self._timer.stop()
+        self.finished.emit(self.results)
@@ -8,48 +8,47 @@ same Switchboard-facing contract:
 - ``load(file)``              builds a widget tree from a .ui XML
 - ``read_ui_tags(path)``      returns uitk_tags from the .ui XML
 - ``on_tags_written(path)``   notifies the loader that .ui content changed
+- ``prepare(file)``           optional; the thread-safe, non-GUI part of ``load``
 
 Trade-offs vs. CompiledLoader:
 
 - **No subprocess.** ``QtUiTools.QUiLoader`` reads the .ui XML directly
   and constructs the widget tree in C++ — no ``pyside6-uic`` invocation,
   no Python compile step, no _ui.py artifact written or imported.
-- **No on-disk artifact.** Every load re-parses the .ui. The metadata
-  cache below collapses repeated loads of the same unchanged file to a
-  single XML read; the heavy widget-tree construction is delegated to
-  Qt's C++ implementation each time.
+- **No on-disk artifact.** Every load re-parses the .ui for Qt. The
+  process-wide :class:`uitk.loaders.metadata.UiMetadataCache` collapses
+  repeated metadata reads of an unchanged file — across loader instances
+  and Switchboards — to a single XML parse (none at all across processes
+  when its disk tier is on); the heavy widget-tree construction is
+  delegated to Qt's C++ implementation each time.
 - **Custom widget promotion** goes through ``QUiLoader.registerCustomWidget``
   (each loader instance keeps its own QUiLoader to avoid polluting any
   other loader sharing the application).
 - **No header_resolver path.** Custom widgets must be importable by their
   resolved class — the same registry the CompiledLoader feeds is reused.
-- **Cache freshness uses mtime, not content-hash.** Cheaper to check
-  (one stat call vs. reading the whole file), and adequate for a
-  Qt-Designer + filesystem-watcher workflow on NTFS / ext4 (sub-µs
-  resolution). On filesystems with coarser mtime resolution (FAT32:
-  2s, some network shares: 1s) two writes within the resolution window
-  can collide; ``on_tags_written`` should be called after any
-  programmatic write to invalidate explicitly. The CompiledLoader's
-  hash-based check handles this case; pick that loader if your
-  workflow regularly mutates .ui files faster than mtime resolution.
-- **Not thread-safe.** ``_metadata_cache`` is a plain dict mutated
-  without a lock. Qt UI code is single-threaded by convention (the GUI
-  thread), and Switchboard's call sites all run there. If a future
-  caller needs to read tags from a worker thread, wrap it in a
-  ``QtCore.QMutex`` or call from the main thread.
+- **Cache freshness uses the stat signature, not content-hash.** Cheaper
+  to check (one stat call vs. reading the whole file): mtime (ns), size
+  and ctime must all match. Adequate for a Qt-Designer +
+  filesystem-watcher workflow on NTFS / ext4 (sub-µs resolution). On
+  filesystems with coarser resolution (FAT32: 2s, some network shares:
+  1s) two same-size writes within the resolution window can collide;
+  ``on_tags_written`` should be called after any programmatic write to
+  invalidate explicitly. The CompiledLoader's hash-based check handles
+  this case; pick that loader if your workflow regularly mutates .ui
+  files faster than mtime resolution.
+- **Threading.** ``load`` constructs widgets and must run on the GUI
+  thread. ``prepare`` (and ``read_ui_tags``) only parse XML and import
+  modules, so :class:`uitk.loaders.preload.UiPreloader` runs them on
+  worker threads. The metadata cache is lock-protected and parses
+  outside its lock, so workers fill it in parallel.
 
 Switchboard chooses between the two delegates via its ``loader`` kwarg.
 """
 
-import os
-import xml.etree.ElementTree as ET
-from pathlib import Path
-from typing import Dict
-
 from qtpy import QtUiTools, QtWidgets
 import pythontk as ptk
 
-from uitk.compile import UiCompiler
+from uitk.loaders.metadata import UiMetadataCache
 
 
 class RuntimeLoader:
@@ -61,9 +60,9 @@ class RuntimeLoader:
         # state is scoped to this Switchboard and doesn't leak into any
         # other loader sharing the application.
         self._uic = QtUiTools.QUiLoader()
-        # File-path → (mtime, metadata-dict) so repeated loads of the same
-        # unchanged .ui collapse to a single XML parse.
-        self._metadata_cache: Dict[str, tuple] = {}
+        # Process-wide, shared with every other loader: repeated loads of
+        # the same unchanged .ui collapse to a single XML parse.
+        self._metadata_cache = UiMetadataCache.shared()
         # Class names already registered with self._uic. registerCustomWidget
         # is idempotent on the Qt side, but each call still crosses the
         # Python→C++ boundary; skipping repeats saves N×M dispatches when
@@ -96,6 +95,19 @@ class RuntimeLoader:
         self.sb.logger.debug(f"[{name}] UI loaded via QUiLoader from {ui_file}")
         return loaded
 
+    def prepare(self, ui_file: str) -> None:
+        """Do the non-GUI half of :meth:`load` ahead of time; safe on a worker thread.
+
+        Parses the .ui metadata into the cache and imports the modules of any
+        deferred (lazy-registry) custom widgets it names, leaving ``load``
+        with the ``QUiLoader`` widget construction alone.
+        """
+        metadata = self._get_metadata(ui_file)
+        registry = self.sb.registry.widget_registry
+        for class_name, _header in metadata["customwidgets"]:
+            if class_name not in self._registered_classes:
+                registry.warm_deferred(classname=class_name)
+
     def read_ui_tags(self, ui_path: str) -> set:
         """Return the uitk_tags set for a .ui file via direct XML parse.
 
@@ -144,30 +156,11 @@ class RuntimeLoader:
         self._registered_classes.add(class_name)
 
     def _cache_key(self, ui_path: str) -> str:
-        return str(Path(ui_path).resolve())
+        return UiMetadataCache.key(ui_path)
 
     def _get_metadata(self, ui_path: str) -> dict:
-        """Return cached metadata if .ui mtime is unchanged; otherwise reparse."""
-        key = self._cache_key(ui_path)
-        try:
-            mtime = os.path.getmtime(ui_path)
-        except OSError:
-            mtime = None
-        cached = self._metadata_cache.get(key)
-        if cached is not None and cached[0] == mtime:
-            return cached[1]
-        try:
-            metadata = UiCompiler.extract_metadata(ui_path)
-        except (ET.ParseError, OSError):
-            # Tolerant of partial/corrupt reads (e.g. cloud-sync mid-write).
-            metadata = {
-                "base_class": "QWidget",
-                "form_class": "Form",
-                "customwidgets": [],
-                "uitk_tags": [],
-            }
-        self._metadata_cache[key] = (mtime, metadata)
-        return metadata
+        """Return cached metadata if the .ui is unchanged; otherwise reparse."""
+        return self._metadata_cache.get(ui_path)
 
     def _invalidate_cache(self, ui_path: str) -> None:
-        self._metadata_cache.pop(self._cache_key(ui_path), None)
+        self._metadata_cache.invalidate(ui_path)
@@ -0,0 +1,91 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Location and JSON I/O for uitk's rebuildable on-disk caches.
+
+Everything written here is *derived* data (scan results, parsed metadata,
+rendered artifacts) that can be regenerated from source at any time, so it
+lives under the per-user **cache** directory rather than the config root the
+preset and settings stores use: deleting it must never cost the user anything
+but a slower next launch.
+
+Classes:
+    DiskCache: Resolves the cache root and reads/writes JSON documents in it.
+"""
+import os
+import platform
+import logging
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+import pythontk as ptk
+
+logger = logging.getLogger(__name__)
+
+# Env var that redirects every uitk cache wholesale (used as given; ``~`` and
+# ``%VAR%`` expanded). ``uitk.testing.TestSandbox`` points it at a temp dir so
+# a test run never reads a developer's warm cache or leaves entries in it.
+CACHE_ROOT_ENV_VAR = "UITK_CACHE_ROOT"
+_ECOSYSTEM_WRAPPER = "uitk"
+
+
+class DiskCache:
+    """Resolve uitk's per-user cache directory and persist JSON documents in it.
+
+    Writes are best-effort: a cache that cannot be written (read-only home,
+    full disk, a locked file on a network profile) degrades to "no cache",
+    never to an exception at startup.
+    """
+
+    CACHE_ROOT_ENV_VAR: str = CACHE_ROOT_ENV_VAR
+
+    @staticmethod
+    def cache_root() -> Path:
+        """The per-user cache directory (not created).
+
+        * Windows: ``%LOCALAPPDATA%/uitk/cache``
+        * macOS:   ``~/Library/Caches/uitk``
+        * Linux:   ``$XDG_CACHE_HOME/uitk`` (else ``~/.cache/uitk``)
+
+        ``$UITK_CACHE_ROOT`` overrides all of the above.
+        """
+        override = os.environ.get(CACHE_ROOT_ENV_VAR)
+        if override:
+            p = Path(os.path.expandvars(override)).expanduser()
+            return p if p.is_absolute() else p.absolute()
+
+        system = platform.system().lower()
+        if system == "windows":
+            base = os.environ.get("LOCALAPPDATA") or os.path.join(
+                os.path.expanduser("~"), "AppData", "Local"
+            )
+            root = Path(base) / _ECOSYSTEM_WRAPPER / "cache"
+        elif system == "darwin":
+            root = Path.home() / "Library" / "Caches" / _ECOSYSTEM_WRAPPER
+        else:
+            base = os.environ.get("XDG_CACHE_HOME", "")
+            if not os.path.isabs(base):
+                base = os.path.join(os.path.expanduser("~"), ".cache")
+            root = Path(base) / _ECOSYSTEM_WRAPPER
+        return root if root.is_absolute() else root.absolute()
+
+    @classmethod
+    def path_for(cls, name: str) -> Path:
+        """Return ``<cache_root>/<name>`` (not created)."""
+        return cls.cache_root() / name
+
+    @staticmethod
+    def load_json(path: Union[str, os.PathLike]) -> dict:
+        """Load a JSON object from *path*; ``{}`` when missing or unreadable."""
+        if not os.path.isfile(path):
+            return {}
+        return ptk.UserConfig.load_file(path)
+
+    @staticmethod
+    def save_json(path: Union[str, os.PathLike], data: Mapping[str, Any]) -> bool:
+        """Atomically write *data* to *path*; returns False instead of raising."""
+        try:
+            ptk.UserConfig.save_file(path, data)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"DiskCache: could not write {path}: {e}")
+            return False
+        return True
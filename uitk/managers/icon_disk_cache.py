@@ -0,0 +1,217 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Persistent cache of rasterized icons, shared across launches.
+
+Every launch of every tool used to repeat the same work for identical
+icons: regex-colorize the SVG source, then ``QSvgRenderer`` it at each
+device pixel ratio. :class:`IconDiskCache` stores each rendered image as a
+PNG under :class:`~uitk.managers.disk_cache.DiskCache`, so a later launch
+reads the PNG and skips both steps.
+
+Entries are keyed by a hash of the *uncolorized* SVG source (an edited icon
+file therefore misses on its own), the color, the logical size, the scale
+(DPR) and the Qt version (renderer output may differ between releases).
+The directory is versioned (``icons/v<VERSION>``); bumping :attr:`VERSION`
+when the rasterizer changes orphans the old directory, which the next write
+deletes. The total size is capped by :attr:`MAX_BYTES`: a write that
+crosses it evicts the least recently used files (a hit refreshes a file's
+mtime).
+
+Everything here is derived data: an unwritable or corrupt cache only costs
+a re-render, never an exception.
+
+Classes:
+    IconDiskCache: Versioned, size-capped PNG store for rendered icons.
+"""
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from qtpy import QtCore, QtGui
+
+from uitk.managers.disk_cache import DiskCache
+
+
+class IconDiskCache:
+    """Versioned, size-capped PNG store for rendered icon images.
+
+    Thread-safe: :class:`~uitk.managers.icon_manager.IconManager` reads and
+    writes it from its background render workers as well as the GUI thread.
+    Only ``QImage`` is used, never ``QPixmap``.
+
+    Attributes:
+        root (Path): Parent of the per-version directories.
+        path (Path): The directory holding this version's PNGs.
+        persist (bool): Whether :class:`IconManager` consults the cache.
+        max_bytes (int): Size cap for :attr:`path`.
+    """
+
+    VERSION = 1
+    DIRNAME = "icons"
+    #: Default for :attr:`persist` on the shared instance. Set True (before
+    #: the first icon is rendered) to enable the cache.
+    PERSIST = False
+    #: Default cap; a tool set's icons at a few sizes and DPRs are ~1-5 MB.
+    MAX_BYTES = 32 * 1024 * 1024
+    #: Eviction trims down to this fraction of the cap, so a full cache
+    #: doesn't rescan the directory on every following write.
+    PRUNE_TO = 0.75
+
+    _shared: Optional["IconDiskCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: Optional[Union[str, os.PathLike]] = None,
+        persist: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            root: Cache directory. Defaults to ``<DiskCache.cache_root()>/icons``.
+            persist: Enable the cache. Defaults to :attr:`PERSIST`.
+            max_bytes: Size cap. Defaults to :attr:`MAX_BYTES`.
+        """
+        self.root = Path(root) if root is not None else DiskCache.path_for(self.DIRNAME)
+        self.path = self.root / f"v{self.VERSION}"
+        self.persist = self.PERSIST if persist is None else persist
+        self.max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None  # bytes under path, scanned lazily
+        self._swept = False  # stale version directories removed
+
+    @classmethod
+    def shared(cls) -> "IconDiskCache":
+        """Return the process-wide cache.
+
+        Re-created when the cache root moves (e.g. a test sandbox redirecting
+        ``UITK_CACHE_ROOT``), like :meth:`uitk.compile.FreshnessManifest.shared`.
+        """
+        default_root = DiskCache.path_for(cls.DIRNAME)
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.root != default_root:
+                cls._shared = cls(default_root)
+            return cls._shared
+
+    # ---- keys ---------------------------------------------------------------
+
+    @staticmethod
+    def content_hash(svg_content: str) -> str:
+        """Hash of an SVG source, the content part of :meth:`key`."""
+        return hashlib.sha1(svg_content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def key(content_hash: str, color: Optional[str], size: tuple, scale: float) -> str:
+        """File stem for one rendered image."""
+        raw = (
+            f"{content_hash}|{color or ''}|{size[0]}x{size[1]}@{scale:g}"
+            f"|qt{QtCore.qVersion()}"
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.png"
+
+    # ---- lookup / store -----------------------------------------------------
+
+    def load(self, key: str) -> Optional[QtGui.QImage]:
+        """The stored image for *key*, or None on a miss or unreadable file."""
+        file = self._file(key)
+        image = QtGui.QImage(str(file))
+        if image.isNull():
+            return None
+        try:
+            os.utime(file)  # recency for LRU eviction
+        except OSError:
+            pass
+        return image
+
+    def store(self, key: str, image: QtGui.QImage) -> bool:
+        """Write *image* as the PNG for *key*; returns False instead of raising."""
+        file = self._file(key)
+        # Unique per writer; os.replace makes the final file appear whole.
+        tmp = file.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(tmp), "PNG"):
+                return False
+            os.replace(tmp, file)
+            written = file.stat().st_size
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+
+        with self._lock:
+            if not self._swept:
+                self._swept = True
+                self._sweep_versions()
+            if self._total is None:
+                self._total = self._scan()[1]
+            else:
+                self._total += written
+            if self._total > self.max_bytes:
+                self._prune()
+        return True
+
+    # ---- maintenance --------------------------------------------------------
+
+    def _scan(self):
+        """``([(mtime, size, path), ...], total_bytes)`` for this version's PNGs."""
+        entries = []
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            pass
+        return entries, sum(size for _, size, _ in entries)
+
+    def _prune(self) -> None:
+        """Evict least recently used PNGs down to ``PRUNE_TO * max_bytes``; lock held."""
+        entries, total = self._scan()
+        target = self.max_bytes * self.PRUNE_TO
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._total = total
+
+    def _sweep_versions(self) -> None:
+        """Delete directories left by other :attr:`VERSION` values; lock held."""
+        try:
+            stale = [
+                p for p in self.root.iterdir()
+                if p.is_dir() and p.name.startswith("v") and p != self.path
+            ]
+        except OSError:
+            return
+        for p in stale:
+            shutil.rmtree(p, ignore_errors=True)
+
+    def size_bytes(self) -> int:
+        """Bytes currently stored for this version."""
+        with self._lock:
+            self._total = self._scan()[1]
+            return self._total
+
+    def clear(self) -> None:
+        """Delete every stored icon, all versions."""
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self._total = None
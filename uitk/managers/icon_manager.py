@@ -2,10 +2,34 @@
 # coding=utf-8
 import re
 import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from qtpy import QtGui, QtCore, QtWidgets
 import importlib.resources
 from pathlib import Path
 
+from uitk.managers.icon_disk_cache import IconDiskCache
+
+
+class _IconGroup:
+    """The icon-bearing widgets of one top-level window (see ``_icon_windows``)."""
+
+    __slots__ = ("members", "swept", "deferred")
+
+    def __init__(self):
+        self.members = set()  # widget ids, resolved through _widget_icons
+        self.swept = None  # color every member was last swept to; None = dirty
+        self.deferred = []  # [(weakref(root), color), ...] awaiting Show
+
+
+class _DeferredSweepFilter(QtCore.QObject):
+    """Runs a hidden window's deferred icon sweeps when it is first shown."""
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Show:
+            IconManager._flush_deferred(watched)
+        return False
+
 
 class IconManager:
     """Theme-aware SVG icon loader with caching and color customization.
@@ -13,20 +37,57 @@ class IconManager:
     Features:
         - SVG colorization with proper handling of fill/stroke attributes
         - High-DPI aware icon rendering with smooth scaling
-        - Efficient caching with LRU-style eviction
+        - O(1) LRU icon cache and a byte-bounded SVG source cache, with
+          hit/miss/eviction counters (:meth:`get_cache_stats`)
         - Weak references for widget tracking to prevent memory leaks
         - Multiple icon states support (normal, disabled, active, selected)
+        - Optional background rasterization (:attr:`async_rendering`):
+          colorize + render on a worker thread, swap the icon in when ready
+        - Optional persistent PNG cache of rendered images across launches
+          (:class:`~uitk.managers.icon_disk_cache.IconDiskCache`)
+        - Theme sweeps indexed by top-level window: only the swept window's
+          icons are visited, and hidden windows can be deferred to first show
     """
 
     _MAX_CACHE_SIZE = 500  # Maximum number of cached icons
-    _cache = {}
-    _cache_order = []  # Track access order for LRU eviction
+    # Raw SVG text kept across a long DCC session: a tool set's glyphs are a
+    # few KB each, so this holds the whole working set with room to spare.
+    _MAX_SVG_CACHE_BYTES = 4 * 1024 * 1024
+    _cache = OrderedDict()  # (name, size, color) -> QIcon, least recent first
     _icon_dirs = []  # List of extra Path objects to search before defaults
-    _svg_cache = {}  # Cache for raw SVG content
+    _svg_cache = OrderedDict()  # name -> raw SVG content, least recent first
+    _svg_cache_bytes = 0  # Running UTF-8 size of _svg_cache's values
+    _stats = dict.fromkeys(
+        ("hits", "misses", "evictions", "svg_hits", "svg_misses", "svg_evictions"),
+        0,
+    )
     _widget_icons = weakref.WeakValueDictionary()  # Weak refs to widgets
     _widget_icon_info = {}  # Icon settings keyed by id(widget)
     _default_color = None  # Default icon color (set by theme)
     _last_update_color = {}  # Track last color applied per widget
+    _icon_refs = {}  # id(widget) -> weakref whose callback purges its entries
+    # Top-level window -> _IconGroup. A widget is filed under its window when
+    # set_icon registers it; one registered before being parented starts in
+    # a group of its own that is merged into its window's at the next sweep.
+    _icon_windows = weakref.WeakKeyDictionary()
+    _icon_trees = weakref.WeakSet()  # TreeWidgets holding themed item icons
+    _tree_colors = weakref.WeakKeyDictionary()  # tree -> color last refreshed to
+    _sweep_filter = None  # _DeferredSweepFilter, created on first deferral
+
+    #: Default for ``set_icon(async_render=None)``: rasterize on a worker
+    #: thread and show a placeholder until the icon is ready. Off by
+    #: default — callers that grab pixels right after ``set_icon`` (e.g.
+    #: ``set_label_icon``) need the synchronous path.
+    async_rendering = False
+    RENDER_WORKERS = 2  # Threads colorizing/rasterizing in the background
+    RENDER_POLL_MS = 4  # GUI-thread poll for finished renders
+    _render_pool = None  # ThreadPoolExecutor, created on first async render
+    _render_timer = None  # QTimer driving _deliver_renders
+    _pending_renders = {}  # icon key -> (Future, [(id(widget), weakref), ...])
+    _requested_keys = {}  # id(widget) -> icon key it is waiting for
+    #: IconDiskCache for rendered images; None uses ``IconDiskCache.shared()``
+    #: (inactive unless ``IconDiskCache.PERSIST`` is set).
+    disk_cache = None
 
     @classmethod
     def set_default_color(cls, color: str):
@@ -34,13 +95,10 @@ class IconManager:
 
         This is typically called when a theme is applied.
         """
-        color = cls._normalize_color(color)
-        if cls._default_color != color:
-            cls._default_color = color
-            # Clear caches to force re-creation with new color
-            cls._cache.clear()
-            cls._cache_order.clear()
-            cls._last_update_color.clear()
+        # Rendered icons are keyed by their resolved color, so entries for
+        # the old default stay valid (and are reused when switching back);
+        # widgets are recolored by update_widget_icons, per window.
+        cls._default_color = cls._normalize_color(color)
 
     @staticmethod
     def _normalize_color(color: str) -> str:
@@ -83,16 +141,36 @@ class IconManager:
 
     @classmethod
     def _evict_cache_if_needed(cls):
-        """Evict oldest cache entries if cache exceeds max size."""
-        while len(cls._cache) > cls._MAX_CACHE_SIZE and cls._cache_order:
-            oldest_key = cls._cache_order.pop(0)
-            cls._cache.pop(oldest_key, None)
+        """Evict least recently used icons while the cache exceeds max size."""
+        while len(cls._cache) > cls._MAX_CACHE_SIZE:
+            cls._cache.popitem(last=False)
+            cls._stats["evictions"] += 1
+
+    @classmethod
+    def _cache_svg(cls, name: str, svg_content: str) -> None:
+        """Store *svg_content*, evicting least recently used sources over budget.
+
+        A single source larger than the whole budget is not cached at all.
+        """
+        size = len(svg_content.encode("utf-8"))
+        if size > cls._MAX_SVG_CACHE_BYTES:
+            return
+        cls._svg_cache[name] = svg_content
+        cls._svg_cache_bytes += size
+        while cls._svg_cache_bytes > cls._MAX_SVG_CACHE_BYTES:
+            _, evicted = cls._svg_cache.popitem(last=False)
+            cls._svg_cache_bytes -= len(evicted.encode("utf-8"))
+            cls._stats["svg_evictions"] += 1
 
     @classmethod
     def _load_svg_content(cls, name: str) -> str:
         """Load raw SVG content from file."""
-        if name in cls._svg_cache:
-            return cls._svg_cache[name]
+        svg_content = cls._svg_cache.get(name)
+        if svg_content is not None:
+            cls._svg_cache.move_to_end(name)
+            cls._stats["svg_hits"] += 1
+            return svg_content
+        cls._stats["svg_misses"] += 1
 
         svg_content = None
 
@@ -120,7 +198,7 @@ class IconManager:
                 svg_content = file_path.read_text(encoding="utf-8")
 
         if svg_content:
-            cls._svg_cache[name] = svg_content
+            cls._cache_svg(name, svg_content)
 
         return svg_content
 
@@ -202,76 +280,66 @@ class IconManager:
         return 1.0
 
     @classmethod
-    def _create_icon_from_svg(
-        cls, svg_content: str, size: tuple, for_states: bool = True
-    ) -> QtGui.QIcon:
-        """Create a QIcon from SVG content string with high-DPI support.
+    def _render_scales(cls) -> list:
+        """Device pixel ratios to rasterize at (GUI thread: reads the screen)."""
+        dpr = cls._get_device_pixel_ratio()
+        scales = [1.0]
+        if dpr > 1.0:
+            scales.append(dpr)
+        if dpr > 1.5:
+            scales.append(2.0)
+        return scales
 
-        Args:
-            svg_content: The SVG XML content
-            size: Requested logical size (width, height)
-            for_states: If True, creates pixmaps for different icon states
+    @staticmethod
+    def _rasterize(svg_content: str, size: tuple, scales) -> list:
+        """Render *svg_content* into one QImage per scale.
+
+        Touches no QPixmap or widget — only a private QSvgRenderer painting
+        into QImages — so it is safe on a worker thread (see
+        :meth:`_render_async`).
 
         Returns:
-            QIcon with proper scaling and anti-aliasing
+            list of ``(scale, QImage)``; empty when the SVG is invalid.
         """
         if not svg_content:
-            return QtGui.QIcon()
+            return []
 
         from qtpy import QtSvg
 
-        svg_data = svg_content.encode("utf-8")
-        renderer = QtSvg.QSvgRenderer(QtCore.QByteArray(svg_data))
-
+        renderer = QtSvg.QSvgRenderer(QtCore.QByteArray(svg_content.encode("utf-8")))
         if not renderer.isValid():
-            return QtGui.QIcon()
-
-        icon = QtGui.QIcon()
-        dpr = cls._get_device_pixel_ratio()
-
-        # Create pixmaps at multiple scales for high-DPI displays
-        scales = [1.0]
-        if dpr > 1.0:
-            scales.append(dpr)
-        if dpr > 1.5:
-            scales.append(2.0)
+            return []
 
+        svg_size = renderer.defaultSize()
+        images = []
         for scale in scales:
             # Calculate physical pixel size
-            physical_size = QtCore.QSize(int(size[0] * scale), int(size[1] * scale))
+            width, height = int(size[0] * scale), int(size[1] * scale)
 
-            pixmap = QtGui.QPixmap(physical_size)
-            pixmap.fill(QtCore.Qt.transparent)
-            pixmap.setDevicePixelRatio(scale)
+            image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+            image.fill(QtCore.Qt.transparent)
 
-            painter = QtGui.QPainter(pixmap)
+            painter = QtGui.QPainter(image)
             # Enable anti-aliasing and smooth transformations
             painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
             painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, True)
 
             # Calculate viewport to maintain aspect ratio
-            svg_size = renderer.defaultSize()
             if svg_size.isValid() and svg_size.width() > 0 and svg_size.height() > 0:
-                # Scale SVG to fit while maintaining aspect ratio
-                target_rect = QtCore.QRectF(
-                    0, 0, physical_size.width(), physical_size.height()
-                )
                 svg_aspect = svg_size.width() / svg_size.height()
-                target_aspect = physical_size.width() / physical_size.height()
+                target_aspect = width / height
 
                 if svg_aspect > target_aspect:
                     # SVG is wider - fit to width
-                    new_height = physical_size.width() / svg_aspect
-                    y_offset = (physical_size.height() - new_height) / 2
+                    new_height = width / svg_aspect
                     target_rect = QtCore.QRectF(
-                        0, y_offset, physical_size.width(), new_height
+                        0, (height - new_height) / 2, width, new_height
                     )
                 else:
                     # SVG is taller - fit to height
-                    new_width = physical_size.height() * svg_aspect
-                    x_offset = (physical_size.width() - new_width) / 2
+                    new_width = height * svg_aspect
                     target_rect = QtCore.QRectF(
-                        x_offset, 0, new_width, physical_size.height()
+                        (width - new_width) / 2, 0, new_width, height
                     )
 
                 renderer.render(painter, target_rect)
@@ -279,27 +347,186 @@ class IconManager:
                 renderer.render(painter)
 
             painter.end()
+            images.append((scale, image))
+        return images
 
+    @staticmethod
+    def _icon_from_images(images) -> QtGui.QIcon:
+        """Wrap rasterized ``(scale, QImage)`` pairs in a QIcon (GUI thread)."""
+        icon = QtGui.QIcon()
+        for scale, image in images:
+            pixmap = QtGui.QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(scale)
             # Add for normal mode
             icon.addPixmap(pixmap, QtGui.QIcon.Normal, QtGui.QIcon.Off)
-
         return icon
 
     @classmethod
-    def get(
-        cls, name: str, size=(16, 16), color: str = None, use_theme: bool = True
+    def _create_icon_from_svg(
+        cls, svg_content: str, size: tuple, for_states: bool = True
     ) -> QtGui.QIcon:
-        """Get an icon, optionally colorized.
+        """Create a QIcon from SVG content string with high-DPI support.
 
         Args:
-            name: Icon name (without .svg extension)
-            size: Icon size tuple (width, height)
-            color: Optional hex color to apply (e.g., "#ffffff").
-            use_theme: If True and no color specified, uses the default theme color.
+            svg_content: The SVG XML content
+            size: Requested logical size (width, height)
+            for_states: If True, creates pixmaps for different icon states
 
         Returns:
-            QIcon instance
+            QIcon with proper scaling and anti-aliasing
         """
+        if not svg_content:
+            return QtGui.QIcon()
+        images = cls._rasterize(svg_content, size, cls._render_scales())
+        if not images:
+            return QtGui.QIcon()
+        return cls._icon_from_images(images)
+
+    # ---- background rasterization ---------------------------------------------
+
+    @classmethod
+    def _colorize_and_rasterize(cls, svg_content, color, size, scales) -> list:
+        """Colorize *svg_content* and rasterize it at each of *scales*.
+
+        Goes through the persistent disk cache when it is enabled: scales
+        found on disk are loaded as PNGs, and only the missing ones are
+        colorized, rendered and written back. Thread-safe — this is the
+        worker half of :meth:`_render_async` and the body of a synchronous
+        :meth:`get` miss.
+
+        Returns:
+            list of ``(scale, QImage)``, ascending; empty for an invalid SVG.
+        """
+        disk = IconDiskCache.shared() if cls.disk_cache is None else cls.disk_cache
+        if not disk.persist:
+            if color:
+                svg_content = cls._colorize_svg(svg_content, color)
+            return cls._rasterize(svg_content, size, scales)
+
+        content_hash = disk.content_hash(svg_content)
+        images, missing = [], []
+        for scale in scales:
+            key = disk.key(content_hash, color, size, scale)
+            image = disk.load(key)
+            if image is None:
+                missing.append((scale, key))
+            else:
+                images.append((scale, image))
+        if missing:
+            if color:
+                svg_content = cls._colorize_svg(svg_content, color)
+            rendered = cls._rasterize(svg_content, size, [s for s, _ in missing])
+            if not rendered:
+                return []
+            for (scale, image), (_, key) in zip(rendered, missing):
+                disk.store(key, image)
+            images.extend(rendered)
+            images.sort(key=lambda entry: entry[0])
+        return images
+
+    @classmethod
+    def _render_async(cls, icon_key: tuple, widget) -> bool:
+        """Queue *icon_key* for background rendering and swap it onto *widget*.
+
+        The SVG source is read on the calling (GUI) thread — it is almost
+        always an ``_svg_cache`` hit — and the colorize + rasterize work is
+        submitted to a small thread pool. Requests for a key already in
+        flight share its job. Finished jobs are collected by a GUI-thread
+        ``QTimer`` (:meth:`_deliver_renders`), which builds the pixmaps,
+        caches the icon and sets it on every waiting widget that is still
+        alive and still wants that key.
+
+        Returns:
+            bool: False when nothing was queued (no SVG source, or *widget*
+            can't be weakly referenced) — the caller renders synchronously.
+        """
+        name, size, color = icon_key
+        try:
+            ref = weakref.ref(widget)
+        except TypeError:
+            return False
+
+        pending = cls._pending_renders.get(icon_key)
+        if pending is None:
+            svg_content = cls._load_svg_content(name)
+            if not svg_content:
+                return False
+            if cls._render_pool is None:
+                cls._render_pool = ThreadPoolExecutor(
+                    max_workers=cls.RENDER_WORKERS, thread_name_prefix="uitk-icons"
+                )
+            future = cls._render_pool.submit(
+                cls._colorize_and_rasterize,
+                svg_content,
+                color,
+                size,
+                cls._render_scales(),
+            )
+            pending = cls._pending_renders[icon_key] = (future, [])
+        pending[1].append((id(widget), ref))
+        cls._requested_keys[id(widget)] = icon_key
+
+        if cls._render_timer is None:
+            cls._render_timer = QtCore.QTimer()
+            cls._render_timer.setInterval(cls.RENDER_POLL_MS)
+            cls._render_timer.timeout.connect(cls._deliver_renders)
+        if not cls._render_timer.isActive():
+            cls._render_timer.start()
+        return True
+
+    @classmethod
+    def _deliver_renders(cls, wait: bool = False) -> int:
+        """Swap finished background renders in; returns how many icons landed.
+
+        Parameters:
+            wait (bool): Block on every in-flight job instead of collecting
+                only those already done.
+        """
+        delivered = 0
+        for icon_key, (future, refs) in list(cls._pending_renders.items()):
+            if not wait and not future.done():
+                continue
+            del cls._pending_renders[icon_key]
+            try:
+                images = future.result()
+            except Exception:
+                images = []
+            icon = cls._icon_from_images(images) if images else QtGui.QIcon()
+            cls._cache[icon_key] = icon
+            cls._evict_cache_if_needed()
+            delivered += 1
+            for widget_id, ref in refs:
+                # A later set_icon may have asked this widget for another
+                # glyph/color meanwhile — don't clobber it with a stale one.
+                if cls._requested_keys.get(widget_id) != icon_key:
+                    continue
+                del cls._requested_keys[widget_id]
+                widget = ref()
+                if widget is None:
+                    continue
+                try:
+                    widget.setIcon(icon)
+                except RuntimeError:  # C++ object already deleted
+                    pass
+        if not cls._pending_renders and cls._render_timer is not None:
+            cls._render_timer.stop()
+        return delivered
+
+    @classmethod
+    def finish_pending_renders(cls) -> int:
+        """Block until every background render has landed on its widgets.
+
+        For code that is about to grab or measure a window (screenshots,
+        tests) and needs final pixels rather than placeholders.
+
+        Returns:
+            int: The number of icons delivered.
+        """
+        return cls._deliver_renders(wait=True)
+
+    @classmethod
+    def _icon_key(cls, name: str, size, color: str = None, use_theme: bool = True):
+        """The ``(name, (w, h), color)`` cache key :meth:`get` resolves to."""
         # Normalize size to tuple
         if isinstance(size, (int, float)):
             size = (int(size), int(size))
@@ -311,37 +538,66 @@ class IconManager:
         if effective_color is None and use_theme and cls._default_color:
             effective_color = cls._default_color
 
-        icon_key = (name, size, effective_color)
+        return (name, tuple(size), effective_color)
 
-        # Check cache and update access order
-        if icon_key in cls._cache:
-            # Move to end of access order (most recently used)
-            if icon_key in cls._cache_order:
-                cls._cache_order.remove(icon_key)
-            cls._cache_order.append(icon_key)
-            return cls._cache[icon_key]
+    @classmethod
+    def _set_widget_icon(cls, widget, name: str, size: tuple, color, async_render):
+        """``widget.setIcon`` for *name*, rendered now or in the background.
 
-        # Create the icon
-        if effective_color:
-            # Load and colorize SVG
-            svg_content = cls._load_svg_content(name)
-            if svg_content:
-                colorized_svg = cls._colorize_svg(svg_content, effective_color)
-                icon = cls._create_icon_from_svg(colorized_svg, size)
-            else:
-                icon = QtGui.QIcon()
+        On a cache miss with *async_render* on, the widget keeps whatever it
+        shows (the previous glyph on a theme switch or state swap, nothing on
+        first use) at its final ``iconSize`` until the worker's render lands.
+        """
+        icon_key = cls._icon_key(name, size, color)
+        if async_render and icon_key not in cls._cache:
+            if cls._render_async(icon_key, widget):
+                cls._stats["misses"] += 1
+                return
+        # A synchronous set supersedes any render still in flight for it.
+        cls._requested_keys.pop(id(widget), None)
+        widget.setIcon(cls.get(name, size, color))
+
+    @classmethod
+    def get(
+        cls, name: str, size=(16, 16), color: str = None, use_theme: bool = True
+    ) -> QtGui.QIcon:
+        """Get an icon, optionally colorized.
+
+        Args:
+            name: Icon name (without .svg extension)
+            size: Icon size tuple (width, height)
+            color: Optional hex color to apply (e.g., "#ffffff").
+            use_theme: If True and no color specified, uses the default theme color.
+
+        Returns:
+            QIcon instance
+        """
+        icon_key = cls._icon_key(name, size, color, use_theme)
+        name, size, effective_color = icon_key
+
+        # Check cache and mark the entry most recently used
+        icon = cls._cache.get(icon_key)
+        if icon is not None:
+            cls._cache.move_to_end(icon_key)
+            cls._stats["hits"] += 1
+            return icon
+        cls._stats["misses"] += 1
+
+        # Create the icon (colorized unless there's no color to apply)
+        svg_content = cls._load_svg_content(name)
+        if svg_content:
+            images = cls._colorize_and_rasterize(
+                svg_content, effective_color, size, cls._render_scales()
+            )
+            icon = cls._icon_from_images(images) if images else QtGui.QIcon()
+        elif effective_color:
+            icon = QtGui.QIcon()
         else:
-            # Load icon without colorization - still use our renderer for consistency
-            svg_content = cls._load_svg_content(name)
-            if svg_content:
-                icon = cls._create_icon_from_svg(svg_content, size)
-            else:
-                # Fallback to direct file loading if SVG content couldn't be loaded
-                icon = cls._load_icon_from_file(name)
+            # Fallback to direct file loading if SVG content couldn't be loaded
+            icon = cls._load_icon_from_file(name)
 
         # Cache the icon with LRU eviction
         cls._cache[icon_key] = icon
-        cls._cache_order.append(icon_key)
         cls._evict_cache_if_needed()
 
         return icon
@@ -477,6 +733,7 @@ class IconManager:
         size=(16, 16),
         color: str = None,
         auto_theme: bool = True,
+        async_render: bool = None,
     ):
         """Set an icon on a widget.
 
@@ -486,6 +743,8 @@ class IconManager:
             size: Icon size tuple (width, height) or single int for square
             color: Optional hex color. If None and auto_theme is True, uses theme color.
             auto_theme: If True and no color specified, uses the widget's theme color.
+            async_render: Rasterize an uncached icon on a worker thread and
+                swap it in when ready. None uses :attr:`async_rendering`.
         """
         # Normalize size
         if isinstance(size, (int, float)):
@@ -495,8 +754,9 @@ class IconManager:
 
         color, pinned = cls._resolve_icon_color(widget, color, auto_theme)
 
-        icon = cls.get(name, size, color)
-        widget.setIcon(icon)
+        if async_render is None:
+            async_render = cls.async_rendering
+        cls._set_widget_icon(widget, name, size, color, async_render)
         widget.setIconSize(QtCore.QSize(*size))
 
         # Register widget (weak reference) for theme updates and re-fits.
@@ -507,16 +767,17 @@ class IconManager:
         if auto_theme or pinned:
             try:
                 cls._widget_icons[widget_id] = widget
-                cls._widget_icon_info[widget_id] = {
-                    "name": name,
-                    "size": size,
-                    "color": pinned,
-                }
-                cls._last_update_color[widget_id] = color
             except TypeError:
                 # Widget doesn't support weak references — leave it
                 # untracked (it won't receive theme sweeps or re-fits).
-                pass
+                return
+            cls._widget_icon_info[widget_id] = {
+                "name": name,
+                "size": size,
+                "color": pinned,
+            }
+            cls._last_update_color[widget_id] = color
+            cls._index_widget(widget_id, widget, color)
 
     @classmethod
     def set_label_icon(
@@ -606,35 +867,165 @@ class IconManager:
             return None
         return info
 
+    # ---- theme sweep index ------------------------------------------------------
+
+    @classmethod
+    def _forget(cls, widget_id: int) -> None:
+        """Drop every registry entry for *widget_id* (its widget died)."""
+        cls._widget_icons.pop(widget_id, None)
+        cls._widget_icon_info.pop(widget_id, None)
+        cls._last_update_color.pop(widget_id, None)
+        cls._requested_keys.pop(widget_id, None)
+        cls._icon_refs.pop(widget_id, None)
+
     @classmethod
-    def update_widget_icons(cls, root_widget: QtWidgets.QWidget, color: str):
+    def _group(cls, window) -> _IconGroup:
+        group = cls._icon_windows.get(window)
+        if group is None:
+            group = cls._icon_windows[window] = _IconGroup()
+        return group
+
+    @classmethod
+    def _index_widget(cls, widget_id: int, widget, color) -> None:
+        """File a registered widget under its current top-level window."""
+        if widget_id not in cls._icon_refs:
+            # Purge the id-keyed entries the moment the widget dies, so a
+            # sweep never has to scan the whole registry for orphans (and a
+            # recycled id can't match a dead widget's entry).
+            cls._icon_refs[widget_id] = weakref.ref(
+                widget, lambda _ref, wid=widget_id: cls._forget(wid)
+            )
+        group = cls._group(widget.window())
+        group.members.add(widget_id)
+        if group.swept != color:
+            group.swept = None
+
+    @classmethod
+    def register_icon_tree(cls, tree) -> None:
+        """Have theme sweeps refresh *tree*'s item icons (``refresh_item_icons``).
+
+        Called by :class:`~uitk.widgets.treeWidget.TreeWidget` whenever it
+        stores a themed item icon; marks the tree as needing a refresh.
+        """
+        cls._icon_trees.add(tree)
+        cls._tree_colors.pop(tree, None)
+
+    @classmethod
+    def _merge_stray_groups(cls) -> None:
+        """Fold groups of since-parented widgets into their window's group."""
+        for key, group in list(cls._icon_windows.items()):
+            try:
+                window = key.window()
+            except RuntimeError:  # C++ object already deleted
+                cls._icon_windows.pop(key, None)
+                continue
+            if window is key:
+                continue
+            del cls._icon_windows[key]
+            target = cls._group(window)
+            target.members |= group.members
+            target.swept = None
+            target.deferred.extend(group.deferred)
+
+    @classmethod
+    def _defer(cls, window, group: _IconGroup, root, color: str) -> None:
+        """Queue a sweep of *root* until *window* is shown."""
+        if root is window:
+            group.deferred = []  # a whole-window sweep supersedes the rest
+        else:
+            for ref, queued in group.deferred:
+                queued_root = ref()
+                if queued == color and queued_root is not None and (
+                    queued_root is root or queued_root.isAncestorOf(root)
+                ):
+                    return
+        group.deferred.append((weakref.ref(root), color))
+        if cls._sweep_filter is None:
+            cls._sweep_filter = _DeferredSweepFilter()
+        # Installing twice is a no-op move to the front of the filter list.
+        window.installEventFilter(cls._sweep_filter)
+
+    @classmethod
+    def _flush_deferred(cls, window) -> None:
+        """Run the sweeps queued for *window* (it is being shown)."""
+        window.removeEventFilter(cls._sweep_filter)
+        group = cls._icon_windows.get(window)
+        if group is None:
+            return
+        deferred, group.deferred = group.deferred, []
+        for ref, color in deferred:
+            root = ref()
+            if root is not None:
+                cls.update_widget_icons(root, color)
+
+    @classmethod
+    def update_widget_icons(
+        cls, root_widget: QtWidgets.QWidget, color: str, defer_hidden: bool = False
+    ):
         """Update all registered icons under a widget tree with a new color.
 
-        Called when theme changes. Skips widgets already at the target color.
-        Also refreshes tree widget item icons.
+        Called when theme changes. Only the widgets indexed under
+        *root_widget*'s top-level window are visited, and a window already
+        swept to *color* (with nothing registered since) returns at once —
+        so a recursive ``StyleSheet.set`` costs one sweep per window, not
+        one full registry scan per styled widget. Skips widgets already at
+        the target color, and refreshes registered tree widget item icons.
+
+        Args:
+            root_widget: Root of the tree to update.
+            color: The new icon color.
+            defer_hidden: If the root's window isn't visible, queue the sweep
+                and run it when the window is shown instead (used by
+                ``StyleSheet.set``, so a theme switch only re-renders the
+                windows on screen).
         """
         color = cls._normalize_color(color)
+        cls._merge_stray_groups()
+        window = root_widget.window()
+        group = cls._group(window)
 
-        # Clean up stale references and update valid widgets
-        stale_ids = []
+        if defer_hidden and not window.isVisible():
+            cls._defer(window, group, root_widget, color)
+            return
+
+        whole = root_widget is window
+        if not (whole and group.swept == color):
+            cls._sweep(window, group, root_widget, color)
+            if whole:
+                group.swept = color
 
-        for widget_id, widget in list(cls._widget_icons.items()):
+        # Also refresh tree widget item icons
+        for tree in list(cls._icon_trees):
+            try:
+                if cls._tree_colors.get(tree) == color or tree.window() is not window:
+                    continue
+                if whole or tree is root_widget or root_widget.isAncestorOf(tree):
+                    tree.refresh_item_icons(color)
+                    cls._tree_colors[tree] = color
+            except RuntimeError:  # C++ object already deleted
+                cls._icon_trees.discard(tree)
+
+    @classmethod
+    def _sweep(cls, window, group: _IconGroup, root_widget, color: str) -> None:
+        """Recolor *group*'s theme-managed icons under *root_widget*."""
+        whole = root_widget is window
+        for widget_id in list(group.members):
+            widget = cls._widget_icons.get(widget_id)
             info = cls._widget_icon_info.get(widget_id)
-            if info is None:
-                stale_ids.append(widget_id)
+            if widget is None or info is None:
+                group.members.discard(widget_id)
                 continue
 
             try:
-                # Check if widget still exists and is valid
-                if widget is None:
-                    stale_ids.append(widget_id)
+                # Reparented into another window since it was filed: move it.
+                current = widget.window()
+                if current is not window:
+                    group.members.discard(widget_id)
+                    cls._index_widget(widget_id, widget, None)
                     continue
 
-                # Verify widget is still valid by accessing a property
-                _ = widget.objectName()
-
                 # Check if this widget is root or a descendant of root
-                if widget is root_widget or root_widget.isAncestorOf(widget):
+                if whole or widget is root_widget or root_widget.isAncestorOf(widget):
                     # Pinned (explicitly colored) icons are state-owned —
                     # repainting them with the theme color here was the
                     # "stateful icons start out of sync until first click"
@@ -646,39 +1037,16 @@ class IconManager:
                     if cls._last_update_color.get(widget_id) == color:
                         continue
 
-                    icon = cls.get(info["name"], info["size"], color)
-                    widget.setIcon(icon)
+                    cls._set_widget_icon(
+                        widget, info["name"], info["size"], color, cls.async_rendering
+                    )
                     widget.setIconSize(QtCore.QSize(*info["size"]))
                     cls._last_update_color[widget_id] = color
 
             except (RuntimeError, ReferenceError):
                 # Widget was deleted
-                stale_ids.append(widget_id)
-
-        # Clean up stale entries
-        for widget_id in stale_ids:
-            cls._widget_icons.pop(widget_id, None)
-            cls._widget_icon_info.pop(widget_id, None)
-            cls._last_update_color.pop(widget_id, None)
-
-        # Purge entries orphaned by the weak registry dropping their dead
-        # widgets — the id-keyed side dicts never self-clean (the loop above
-        # only visits ids still present in _widget_icons), which both leaked
-        # per dead widget and left stale entries a recycled id could match.
-        live_ids = set(cls._widget_icons.keys())
-        for side in (cls._widget_icon_info, cls._last_update_color):
-            for orphan_id in [k for k in side if k not in live_ids]:
-                side.pop(orphan_id, None)
-
-        # Also refresh tree widget item icons
-        try:
-            from uitk.widgets.treeWidget import TreeWidget
-
-            for tree in root_widget.findChildren(TreeWidget):
-                if hasattr(tree, "refresh_item_icons"):
-                    tree.refresh_item_icons(color)
-        except ImportError:
-            pass  # TreeWidget not available
+                group.members.discard(widget_id)
+                cls._forget(widget_id)
 
     @classmethod
     def clear_cache(cls):
@@ -687,24 +1055,59 @@ class IconManager:
         Useful for releasing memory or forcing a complete reload.
         """
         cls._cache.clear()
-        cls._cache_order.clear()
         cls._svg_cache.clear()
+        cls._svg_cache_bytes = 0
         cls._last_update_color.clear()
+        # The per-widget colors are gone, so no window counts as swept.
+        for group in cls._icon_windows.values():
+            group.swept = None
+        cls._tree_colors.clear()
 
     @classmethod
     def get_cache_stats(cls) -> dict:
-        """Get statistics about the icon cache.
+        """Get statistics about the icon caches, for tuning their limits.
+
+        Counters accumulate from process start (or the last
+        :meth:`reset_cache_stats`); a high ``evictions`` next to a low hit
+        rate means ``_MAX_CACHE_SIZE`` is too small for the tool set in use.
 
         Returns:
-            dict with cache size, SVG cache size, and registered widgets count
+            dict with ``icon_cache_size`` / ``max_cache_size``, ``hits`` /
+            ``misses`` / ``evictions`` / ``hit_rate`` for rendered icons, the
+            same ``svg_*`` counters plus ``svg_cache_size``,
+            ``svg_cache_bytes`` / ``max_svg_cache_bytes`` for SVG sources,
+            ``registered_widgets``, ``indexed_windows`` (top-level windows in
+            the theme-sweep index) and ``pending_renders`` (background
+            renders still in flight).
         """
+        stats = cls._stats
+        lookups = stats["hits"] + stats["misses"]
+        svg_lookups = stats["svg_hits"] + stats["svg_misses"]
         return {
             "icon_cache_size": len(cls._cache),
+            "max_cache_size": cls._MAX_CACHE_SIZE,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
             "svg_cache_size": len(cls._svg_cache),
+            "svg_cache_bytes": cls._svg_cache_bytes,
+            "max_svg_cache_bytes": cls._MAX_SVG_CACHE_BYTES,
+            "svg_hits": stats["svg_hits"],
+            "svg_misses": stats["svg_misses"],
+            "svg_evictions": stats["svg_evictions"],
+            "svg_hit_rate": stats["svg_hits"] / svg_lookups if svg_lookups else 0.0,
             "registered_widgets": len(cls._widget_icons),
-            "max_cache_size": cls._MAX_CACHE_SIZE,
+            "indexed_windows": len(cls._icon_windows),
+            "pending_renders": len(cls._pending_renders),
         }
 
+    @classmethod
+    def reset_cache_stats(cls) -> None:
+        """Zero the hit/miss/eviction counters (cache contents are kept)."""
+        for key in cls._stats:
+            cls._stats[key] = 0
+
 
 # -----------------------------------------------------------------------------
 # Notes
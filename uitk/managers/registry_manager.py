@@ -14,6 +14,8 @@ Classes:
         collection logic on ``extend``.
     RegistryManager: Creates and owns named ``FileRegistry`` containers and
         resolves caller-relative paths.
+    ScanIndex: Persisted ``file -> class names`` map keyed by path, mtime and
+        size, so a class-scanning registry re-reads only files that changed.
 
 Example:
     Creating and querying a registry::
@@ -31,13 +33,168 @@ Note:
     available as deprecated aliases via that module.
 """
 import os
+import ast
 import sys
 import inspect
+import importlib
+import importlib.util
 from collections import namedtuple
-from typing import Any, List, Optional, Tuple, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pythontk as ptk
 
+from uitk.managers.disk_cache import DiskCache
+
+
+class ScanIndex:
+    """Persisted ``filepath -> class names`` map for class-scanning registries.
+
+    The slot and widget registries need the names of the classes each ``.py``
+    file defines.  Working that out means reading and parsing every file under
+    every source directory at every startup; this index records the answer per
+    file, keyed by its normalized path plus ``st_mtime_ns`` and ``st_size``, and
+    writes it to the user cache dir so the next process only re-parses files
+    whose stat data changed.  A file that defines no class is recorded too (an
+    empty list), so it is skipped without being opened again.
+
+    Entries are derived data: a corrupt, foreign-version or deleted index file
+    just means one full scan.
+
+    Attributes:
+        path (Path): The JSON file backing the index.
+    """
+
+    VERSION = 1
+    FILENAME = "scan_index.json"
+
+    _shared: Optional["ScanIndex"] = None
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Initialize the index; the backing file is read on first lookup.
+
+        Args:
+            path: JSON file to persist to.  Defaults to
+                ``<DiskCache.cache_root()>/scan_index.json``.
+        """
+        self.path = Path(path) if path is not None else DiskCache.path_for(self.FILENAME)
+        self._entries: Optional[Dict[str, list]] = None
+        self._dirty: Dict[str, list] = {}
+
+    @classmethod
+    def shared(cls) -> "ScanIndex":
+        """Return the process-wide index at the default cache location.
+
+        Re-created when the cache root moves (e.g. a test sandbox redirecting
+        ``UITK_CACHE_ROOT`` after the first Switchboard was built).
+        """
+        default_path = DiskCache.path_for(cls.FILENAME)
+        if cls._shared is None or cls._shared.path != default_path:
+            cls._shared = cls(default_path)
+        return cls._shared
+
+    @staticmethod
+    def _key(filepath: str) -> str:
+        return os.path.normcase(os.path.abspath(filepath))
+
+    @classmethod
+    def _read_entries(cls, path) -> Dict[str, list]:
+        data = DiskCache.load_json(path)
+        if data.get("version") != cls.VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    @property
+    def entries(self) -> Dict[str, list]:
+        """``{normalized_path: [mtime_ns, size, [class names]]}`` (loaded lazily)."""
+        if self._entries is None:
+            self._entries = self._read_entries(self.path)
+        return self._entries
+
+    @staticmethod
+    def _parse_class_names(filepath: str) -> List[str]:
+        """Every class defined in *filepath*, nested ones included.
+
+        Mirrors ``ptk.get_classes_from_path(..., top_level_only=False)``,
+        including its ``ast.walk`` (breadth-first) order: top-level classes
+        first, nested ones after, so rows built from the index line up with
+        what a direct scan returns.
+        """
+        with open(filepath, "r", encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read())
+        return [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+
+    def lookup(self, filepath: str) -> Optional[List[str]]:
+        """Return the recorded class names if *filepath* is unchanged, else None."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        entry = self.entries.get(self._key(filepath))
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return list(entry[2])
+        return None
+
+    def classes(self, filepath: str) -> List[str]:
+        """Return the class names *filepath* defines, parsing only on a miss.
+
+        Raises:
+            SyntaxError: If the file has to be parsed and is not valid Python
+                (the same failure a direct scan reports).
+        """
+        names = self.lookup(filepath)
+        if names is not None:
+            return names
+        st = os.stat(filepath)
+        names = self._parse_class_names(filepath)
+        entry = [st.st_mtime_ns, st.st_size, names]
+        key = self._key(filepath)
+        self.entries[key] = entry
+        self._dirty[key] = entry
+        return list(names)
+
+    def save(self) -> bool:
+        """Write entries recorded since the last save; no-op when nothing changed.
+
+        Entries another process wrote meanwhile are merged rather than
+        clobbered (ours win per file).
+
+        Returns:
+            True if the index file was written.
+        """
+        if not self._dirty:
+            return False
+        merged = self._read_entries(self.path)
+        merged.update(self._dirty)
+        if not DiskCache.save_json(
+            self.path, {"version": self.VERSION, "files": merged}
+        ):
+            return False
+        self._entries = merged
+        self._dirty = {}
+        return True
+
+    def prune(self) -> int:
+        """Drop entries whose file no longer exists; returns the number removed."""
+        stale = [k for k in self.entries if not os.path.isfile(k)]
+        for k in stale:
+            del self.entries[k]
+        if stale:
+            DiskCache.save_json(
+                self.path, {"version": self.VERSION, "files": self.entries}
+            )
+        return len(stale)
+
+    def clear(self) -> None:
+        """Forget every entry, in memory and on disk."""
+        self._entries = {}
+        self._dirty = {}
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
 
 class FileRegistry(ptk.NamedTupleContainer):
     """A named tuple container of file records.
@@ -47,6 +204,12 @@ class FileRegistry(ptk.NamedTupleContainer):
     modules, classes) is routed through the owning :class:`RegistryManager`'s
     collection logic, using the registry's stored filters and honouring its
     ``allow_duplicates`` metadata.
+
+    With ``lazy=True`` metadata, class rows are recorded from the scan index
+    with ``classobj``/``module`` left unset, and a module is imported the
+    first time :meth:`get` asks for a matching row's live object.  Code that
+    walks ``named_tuples`` directly sees the unresolved rows; call
+    :meth:`resolve_deferred` first if it needs them bound.
     """
 
     def __init__(self, manager: "RegistryManager", **kwargs):
@@ -58,6 +221,9 @@ class FileRegistry(ptk.NamedTupleContainer):
         """
         super().__init__(**kwargs)
         self.manager = manager
+        # Files whose class rows were recorded by name only (``lazy`` collection).
+        # Their modules are imported on the first lookup that needs a live object.
+        self._deferred_files: set = set()
 
     @property
     def file_manager(self) -> "RegistryManager":
@@ -129,8 +295,15 @@ class FileRegistry(ptk.NamedTupleContainer):
         processing_metadata.setdefault("fields", self.fields)
 
         rows: List[Tuple] = []
-        for obj in ptk.make_iterable(objects):
-            rows.extend(self.manager._collect_file_info(obj, **processing_metadata))
+        try:
+            for obj in ptk.make_iterable(objects):
+                rows.extend(
+                    self.manager._collect_file_info(obj, **processing_metadata)
+                )
+        finally:
+            # Persist whatever the scan learned, even if a later source raised.
+            if self.manager.scan_index is not None:
+                self.manager.scan_index.save()
 
         if not rows:
             return
@@ -138,8 +311,97 @@ class FileRegistry(ptk.NamedTupleContainer):
             raise ValueError(
                 f"{type(self).__name__} has no fields; cannot convert file records"
             )
+        if processing_metadata.get("lazy") and "filepath" in self.fields:
+            fp_i = self.fields.index("filepath")
+            self._deferred_files.update(row[fp_i] for row in rows)
         super().extend([self._tuple_class(*row) for row in rows], **metadata)
 
+    def get(self, return_field: Optional[str] = None, **conditions) -> Any:
+        """Query the registry, importing deferred modules the result depends on.
+
+        Only lookups that can return a live object (whole rows, ``classobj``
+        or ``module``) resolve; name and path queries never import.
+        """
+        if self._deferred_files and return_field in (None, "classobj", "module"):
+            self.resolve_deferred(**conditions)
+        return super().get(return_field, **conditions)
+
+    def resolve_deferred(self, **conditions) -> int:
+        """Import the deferred files behind rows matching *conditions*.
+
+        Rows from a file that fails to import are dropped, as an eager scan
+        would never have added them.
+
+        Args:
+            **conditions: Field filters (as for :meth:`get`); none resolves
+                every deferred file.
+
+        Returns:
+            The number of files imported.
+        """
+        paths = []
+        for nt in self.named_tuples:
+            path = getattr(nt, "filepath", None)
+            if (
+                path in self._deferred_files
+                and path not in paths
+                and all(getattr(nt, f, None) == v for f, v in conditions.items())
+            ):
+                paths.append(path)
+
+        for path in paths:
+            self._deferred_files.discard(path)
+            module = self.manager._import_scanned_module(path)
+            if module is None:
+                self.named_tuples = [
+                    nt for nt in self.named_tuples if nt.filepath != path
+                ]
+                continue
+            for i, nt in enumerate(self.named_tuples):
+                if nt.filepath != path:
+                    continue
+                updates = {}
+                if "classobj" in nt._fields and nt.classobj is None:
+                    updates["classobj"] = module.__dict__.get(nt.classname)
+                if "module" in nt._fields:
+                    updates["module"] = module
+                if updates:
+                    self.named_tuples[i] = nt._replace(**updates)
+        return len(paths)
+
+    def warm_deferred(self, **conditions) -> int:
+        """Import the modules behind deferred rows matching *conditions*, leaving rows as-is.
+
+        The worker-thread half of :meth:`resolve_deferred`: it only reads the
+        registry and imports through the canonical package path (serialised
+        by Python's import lock), so the GUI thread's later resolve finds the
+        module already in ``sys.modules`` and just patches its rows. Loose
+        files, which have no canonical name, are left to that resolve.
+
+        Returns:
+            The number of modules imported.
+        """
+        if not self._deferred_files:
+            return 0
+        paths = {
+            nt.filepath
+            for nt in list(self.named_tuples)
+            if getattr(nt, "filepath", None) in self._deferred_files
+            and all(getattr(nt, f, None) == v for f, v in conditions.items())
+        }
+        warmed = 0
+        for path in paths:
+            name = ptk.FileUtils.canonical_module_path(path)
+            if not name:
+                continue
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.manager.logger.debug(f"warm_deferred: {path}: {e}")
+                continue
+            warmed += 1
+        return warmed
+
 
 class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
     """Creates and owns named file registries.
@@ -152,17 +414,29 @@ class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
         containers (List[FileRegistry]): All containers created by this manager.
         processing_stack (List[str]): Directories currently being processed
             (guards against recursive re-entry).
+        scan_index (ScanIndex | None): Class-name index consulted by the
+            class-scanning registries, or None to parse every file each scan.
     """
 
-    def __init__(self, log_level: str = "WARNING") -> None:
+    def __init__(
+        self,
+        log_level: str = "WARNING",
+        scan_index: Union[bool, ScanIndex, None] = True,
+    ) -> None:
         """Initialize the manager.
 
         Args:
             log_level: Logging level for the manager.
+            scan_index: ``True`` (default) uses the process-wide
+                :meth:`ScanIndex.shared` index; a :class:`ScanIndex` instance
+                is used as-is; ``False``/``None`` disables indexing.
         """
         self.set_log_level(log_level)
         self.containers: List[FileRegistry] = []
         self.processing_stack: List[str] = []
+        if scan_index is True:
+            scan_index = ScanIndex.shared()
+        self.scan_index: Optional[ScanIndex] = scan_index or None
 
     def get_base_dir(self, caller_info: Union[str, int, Any] = 0) -> Optional[str]:
         """Identify a base directory from a path, a caller frame index, or an object.
@@ -298,6 +572,8 @@ class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
                 - base_dir: Anchor for relative paths — a directory path, a
                   caller frame index, or a Python object.
                 - allow_duplicates: Keep duplicate entries on extend.
+                - lazy: Record class rows by name only and import each
+                  module on first lookup (see :class:`FileRegistry`).
 
         Returns:
             The created FileRegistry (also available as
@@ -408,6 +684,7 @@ class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
                 f in ("classname", "classobj", "module") for f in fields
             )
             recursive = bool(metadata.get("recursive", False))
+            lazy = bool(metadata.get("lazy", False))
 
             if needs_classes:
                 class_name = obj.__name__ if inspect.isclass(obj) else None
@@ -426,15 +703,22 @@ class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
 
                 file_info: List[Tuple] = []
                 for f_path in py_files:
-                    file_info.extend(
-                        ptk.get_classes_from_path(
-                            f_path,
-                            fields,
-                            inc=class_name,
-                            top_level_only=False,
-                            force_tuples=True,
+                    if self.scan_index is None and not lazy:
+                        file_info.extend(
+                            ptk.get_classes_from_path(
+                                f_path,
+                                fields,
+                                inc=class_name,
+                                top_level_only=False,
+                                force_tuples=True,
+                            )
+                        )
+                    else:
+                        file_info.extend(
+                            self._collect_indexed_class_rows(
+                                f_path, fields, class_name, lazy=lazy
+                            )
                         )
-                    )
 
                 # When registering a class object directly, patch in the live
                 # object where the scanner could not import one.
@@ -474,6 +758,82 @@ class RegistryManager(ptk.HelpMixin, ptk.LoggingMixin):
             if dir_path in self.processing_stack:
                 self.processing_stack.remove(dir_path)
 
+    def _collect_indexed_class_rows(
+        self,
+        filepath: str,
+        fields: List[str],
+        class_name: Optional[str] = None,
+        lazy: bool = False,
+    ) -> List[Tuple]:
+        """Class rows for one ``.py`` file, with class names read from the scan index.
+
+        Produces the same rows as ``ptk.get_classes_from_path(filepath, fields,
+        inc=class_name, top_level_only=False, force_tuples=True)``, but the
+        module is imported only when a requested field needs a live object
+        (``classobj``/``module``) and the file defines a wanted class.  With
+        *lazy*, it is not imported at all and those fields are left None.
+        """
+        if not filepath.endswith(".py"):
+            return []
+        if self.scan_index is not None:
+            names = self.scan_index.classes(filepath)
+        else:
+            names = ScanIndex._parse_class_names(filepath)
+        if class_name:
+            names = [n for n in names if n == class_name]
+        if not names:
+            return []
+
+        module = None
+        if not lazy and ("classobj" in fields or "module" in fields):
+            module = self._import_scanned_module(filepath)
+            if module is None:
+                return []
+
+        basename = os.path.basename(filepath)
+        rows = []
+        for name in names:
+            info = {
+                "file": basename,
+                "filename": os.path.splitext(basename)[0],
+                "filepath": filepath,
+                "classobj": module.__dict__.get(name) if module else None,
+                "classname": name,
+                "module": module,
+            }
+            rows.append(tuple(info[f] for f in fields))
+        return rows
+
+    def _import_scanned_module(self, filepath: str) -> Optional[Any]:
+        """Import *filepath* the way ``ptk.get_classes_from_path`` does.
+
+        The canonical package import is preferred so class objects are
+        identical to ``from <pkg>.<mod> import Cls``; a loose file is executed
+        under a throwaway module name that is removed from ``sys.modules``
+        afterwards.  Returns None when the file fails to execute.
+        """
+        canonical_name = ptk.FileUtils.canonical_module_path(filepath)
+        if canonical_name:
+            try:
+                return importlib.import_module(canonical_name)
+            except Exception:
+                pass
+
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        unique_name = f"{stem}_ptk_loader_{id(filepath)}"
+        spec = importlib.util.spec_from_file_location(unique_name, filepath)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[unique_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception as e:
+            self.logger.debug(f"Skipping {filepath}: {e}")
+            return None
+        finally:
+            if sys.modules.get(unique_name) is module:
+                del sys.modules[unique_name]
+        return module
+
     def contains_location(
         self, location: Union[str, Any], container_descriptor: str
     ) -> bool:
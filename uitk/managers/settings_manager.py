@@ -2,7 +2,8 @@
 # coding=utf-8
 import json
 import logging
-from typing import Any, Callable, List, Optional, Set, Tuple
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from qtpy import QtCore
 
 _log = logging.getLogger(__name__)
@@ -78,6 +79,148 @@ _MIGRATED_REGISTRY_PAIRS: Set[Tuple[str, str]] = set()
 # so a caller-supplied default is returned verbatim rather than decoded.
 _MISSING = object()
 
+# Decoded types safe to hand out from a cache. Containers are excluded: a
+# fresh ``json.loads`` per read is what keeps a caller mutating a returned
+# list/dict from corrupting every later read.
+_CACHEABLE_DECODED = (str, int, float, bool, type(None))
+
+
+class _StoreIndex:
+    """Decoded-value cache and per-namespace key index for one QSettings object.
+
+    Shared by every :class:`SettingsManager` over the same QSettings object (a
+    manager and all of its :meth:`~SettingsManager.branch` children), so a
+    window-show state restore reading hundreds of keys and a ``keys()`` per
+    branch cost a dict lookup each instead of a ``json.loads`` (whose failure
+    path, taken by every plain stored string, is the expensive one) and a
+    prefix scan over *every* key in the file.
+
+    Coherence:
+
+    - **Values** are validated, not trusted: an entry holds the raw stored
+      string alongside its decode and is only used when the raw value read
+      back from QSettings still matches. A write from anywhere — another
+      QSettings object, a raw ``.settings.setValue`` — can therefore never be
+      served stale; it just costs one decode.
+    - **Keys** are maintained incrementally from the manager write paths
+      (``setValue`` — the same chokepoint that fires the ``on_change``
+      callbacks — ``setByteArray``, ``remove``, ``clear``), and each write is
+      broadcast to the indexes of every other QSettings object on the same
+      file, so independent managers over the shared store (the switchboard's,
+      a marking menu's, a widget's own) agree. ``sync()`` — which merges
+      other processes' changes — drops the index. A raw QSettings write that
+      bypasses the manager should be followed by
+      :meth:`SettingsManager.invalidate`.
+    """
+
+    # QSettings object -> its index (weak: the index dies with the store).
+    _by_settings: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    # (fileName, format) -> indexes of every live QSettings on that file.
+    _peers: Dict[Tuple[str, Any], "weakref.WeakSet"] = {}
+
+    def __init__(self, file_key: Tuple[str, Any]):
+        self.file_key = file_key
+        self.values: Dict[str, Tuple[str, Any]] = {}
+        # Ordered (dict) so keys() keeps QSettings' ordering for loaded keys.
+        self._all_keys: Optional[Dict[str, None]] = None
+        self._branches: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def for_settings(cls, qsettings: QtCore.QSettings) -> "_StoreIndex":
+        """Return (creating on first use) the index for *qsettings*."""
+        try:
+            index = cls._by_settings.get(qsettings)
+        except TypeError:  # not weak-referenceable (a duck-typed store)
+            return cls((id(qsettings), None))
+        if index is None:
+            try:
+                file_key = (qsettings.fileName(), qsettings.format())
+            except Exception:  # noqa: BLE001 — duck-typed stores
+                file_key = (id(qsettings), None)
+            index = cls(file_key)
+            cls._by_settings[qsettings] = index
+            cls._peers.setdefault(file_key, weakref.WeakSet()).add(index)
+        return index
+
+    def _same_file(self):
+        peers = self._peers.get(self.file_key)
+        return list(peers) if peers else [self]
+
+    # ---- values ----------------------------------------------------------
+
+    def decode(self, full_key: str, raw: Any) -> Any:
+        """Decode *raw* (just read at *full_key*), reusing a still-valid decode."""
+        if not isinstance(raw, str):
+            return raw  # decode_stored_value only transforms strings
+        hit = self.values.get(full_key)
+        if hit is not None and hit[0] == raw:
+            return hit[1]
+        decoded = SettingsManager.decode_stored_value(raw)
+        if isinstance(decoded, _CACHEABLE_DECODED):
+            self.values[full_key] = (raw, decoded)
+        else:
+            self.values.pop(full_key, None)
+        return decoded
+
+    # ---- keys ------------------------------------------------------------
+
+    def keys(self, qsettings: QtCore.QSettings, namespace: Optional[str]) -> list:
+        """Keys under *namespace* (all keys when None), minus internal ones."""
+        if self._all_keys is None:
+            self._all_keys = dict.fromkeys(
+                k for k in qsettings.allKeys() if k not in _INTERNAL_KEYS
+            )
+            self._branches.clear()
+        if not namespace:
+            return list(self._all_keys)
+        branch = self._branches.get(namespace)
+        if branch is None:
+            prefix = f"{namespace}/"
+            branch = dict.fromkeys(
+                k[len(prefix) :] for k in self._all_keys if k.startswith(prefix)
+            )
+            self._branches[namespace] = branch
+        return list(branch)
+
+    def note_set(self, full_key: str) -> None:
+        """Record a write of *full_key* in every index over the same file."""
+        for index in self._same_file():
+            index._add_key(full_key)
+
+    def note_removed(self, full_key: Optional[str] = None) -> None:
+        """Drop cached state after a ``remove`` (of a key *and* its group) or ``clear``."""
+        for index in self._same_file():
+            index.reset(full_key)
+
+    def note_synced(self) -> None:
+        """Drop the key index of every index over the same file (values self-validate)."""
+        for index in self._same_file():
+            index._all_keys = None
+            index._branches.clear()
+
+    def _add_key(self, full_key: str) -> None:
+        if self._all_keys is None or full_key in self._all_keys:
+            return
+        if full_key in _INTERNAL_KEYS:
+            return
+        self._all_keys[full_key] = None
+        parts = full_key.split("/")
+        for depth in range(1, len(parts)):
+            branch = self._branches.get("/".join(parts[:depth]))
+            if branch is not None:
+                branch["/".join(parts[depth:])] = None
+
+    def reset(self, full_key: Optional[str] = None) -> None:
+        """Forget the key index, and cached values at/under *full_key* (all when None)."""
+        self._all_keys = None
+        self._branches.clear()
+        if not full_key:
+            self.values.clear()
+            return
+        group = f"{full_key}/"
+        for key in [k for k in self.values if k == full_key or k.startswith(group)]:
+            del self.values[key]
+
 
 class SettingsManager:
     """Manages persistent storage and retrieval of settings via QSettings.
@@ -156,6 +299,7 @@ class SettingsManager:
             "SettingItem",
             "branch",
             "set_defaults",
+            "invalidate",
         }
     )
 
@@ -179,6 +323,7 @@ class SettingsManager:
             SettingsManager._maybe_migrate_legacy_registry(org, app)
             object.__setattr__(self, "settings", QtCore.QSettings(org, app))
         object.__setattr__(self, "namespace", namespace)
+        object.__setattr__(self, "_index", _StoreIndex.for_settings(self.settings))
 
     def __getattr__(self, name: str) -> "SettingItem":
         """Attribute-style access returns a SettingItem proxy."""
@@ -217,13 +362,14 @@ class SettingsManager:
                 self.setValue(key, value)
 
     def value(self, key: str, default: Any = None) -> Any:
-        value = self.settings.value(self._ns_key(key), _MISSING)
+        full_key = self._ns_key(key)
+        value = self.settings.value(full_key, _MISSING)
         # Decode belongs to STORED values only: a missing key returns the
         # caller's default verbatim (running it through the decode turned a
         # default of "1.10" into the float 1.1 with nothing stored at all).
         if value is _MISSING:
             return default
-        return SettingsManager.decode_stored_value(value)
+        return self._index.decode(full_key, value)
 
     @staticmethod
     def decode_stored_value(value: Any) -> Any:
@@ -285,9 +431,9 @@ class SettingsManager:
         # Containers are JSON-encoded; ambiguous strings ("1.10", "true", …)
         # are JSON-quoted so value()'s decode restores them verbatim instead
         # of a number/bool. See encode_stored_value.
-        self.settings.setValue(
-            self._ns_key(key), SettingsManager.encode_stored_value(value)
-        )
+        full_key = self._ns_key(key)
+        self.settings.setValue(full_key, SettingsManager.encode_stored_value(value))
+        self._index.note_set(full_key)
 
         # Trigger callbacks
         callbacks = object.__getattribute__(self, "_callbacks")
@@ -322,15 +468,24 @@ class SettingsManager:
         the migration code is retired (see deprecation block above),
         remove just that comprehension condition.
         """
-        all_keys = [k for k in self.settings.allKeys() if k not in _INTERNAL_KEYS]
-        if self.namespace:
-            prefix = f"{self.namespace}/"
-            return [k[len(prefix) :] for k in all_keys if k.startswith(prefix)]
-        return list(all_keys)
+        # Served from the shared per-store index (see _StoreIndex), which
+        # applies the _INTERNAL_KEYS filter when it first loads allKeys().
+        return self._index.keys(self.settings, self.namespace)
+
+    def invalidate(self) -> None:
+        """Drop the cached key index and decoded values for this store.
+
+        Only needed after writing through the raw ``settings`` QSettings
+        (bypassing this manager); every write made through a
+        ``SettingsManager`` keeps the cache current on its own.
+        """
+        self._index.note_removed()
 
     def setByteArray(self, key: str, value: QtCore.QByteArray) -> None:
         """Set a QByteArray value directly without JSON serialization."""
-        self.settings.setValue(self._ns_key(key), value)
+        full_key = self._ns_key(key)
+        self.settings.setValue(full_key, value)
+        self._index.note_set(full_key)
 
     def getByteArray(
         self, key: str, default: QtCore.QByteArray = None
@@ -347,7 +502,9 @@ class SettingsManager:
         ``SettingItem`` proxy for the name, so ``store.remove(key)`` failed
         with a ``TypeError`` at call time.)
         """
-        self.settings.remove(self._ns_key(key))
+        full_key = self._ns_key(key)
+        self.settings.remove(full_key)
+        self._index.note_removed(full_key)
 
     def clear(self, key: Optional[str] = None) -> None:
         """Clears a specific key, or all keys in the current namespace."""
@@ -355,11 +512,16 @@ class SettingsManager:
             self.remove(key)
         elif self.namespace:
             self.settings.remove(self.namespace)
+            self._index.note_removed(self.namespace)
         else:
             self.settings.clear()
+            self._index.note_removed()
 
     def sync(self) -> None:
         self.settings.sync()
+        # sync() merges changes other processes made to the file; cached
+        # values self-validate, but every key index over it is now suspect.
+        self._index.note_synced()
 
     # ------------------------------------------------------------------
     # Encapsulated legacy-registry migration (formerly module-level)
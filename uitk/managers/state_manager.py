@@ -27,8 +27,23 @@ class StateManager(ptk.LoggingMixin):
     - Skips applying None values to text-based widgets to prevent clearing valid text
     - Only saves primitive types (int, float, str, bool) to prevent state corruption
     - Handles non-stateful signals (like 'clicked') by not triggering state sync
+
+    Write-behind:
+    - :meth:`save_value` sets the value immediately but defers the store's
+      disk ``sync()`` by up to ``write_behind_ms``, so a slider drag or a
+      wheel-scrub costs one disk write per window rather than one per step.
+      :meth:`flush` forces it; ``MainWindow`` flushes on hide/close and every
+      manager flushes at ``QCoreApplication.aboutToQuit``.
     """
 
+    #: Default write-behind window (ms) for the disk sync behind
+    #: :meth:`save_value`. ``0`` restores the per-write sync.
+    WRITE_BEHIND_MS = 250
+
+    # Managers holding an unsynced write; flushed together at app quit.
+    _unsynced = weakref.WeakSet()
+    _quit_hooked = False
+
     # Sentinel returned by ``_coerce_for_store`` for values QSettings can't
     # round-trip — distinct from a legitimately stored ``None``.
     _UNSUPPORTED = object()
@@ -54,10 +69,18 @@ class StateManager(ptk.LoggingMixin):
         self,
         qsettings: Union[QtCore.QSettings, SettingsManager],
         log_level="WARNING",
+        write_behind_ms: Optional[int] = None,
     ):
         super().__init__()
         self.set_log_level(log_level)
         self.qsettings = qsettings
+        self.write_behind_ms = (
+            self.WRITE_BEHIND_MS if write_behind_ms is None else write_behind_ms
+        )
+        # Keys written since the last disk sync, and the single-shot timer
+        # that bounds how long they wait (created on first deferred write).
+        self._pending_keys = set()
+        self._flush_timer = None
         # A SettingsManager store owns serialization (its setValue encodes,
         # its value() decodes); encoding here too would double-encode. For a
         # raw QSettings (or any other duck-typed store) this manager encodes.
@@ -304,8 +327,8 @@ class StateManager(ptk.LoggingMixin):
     def save_value(self, key: str, value: Any) -> None:
         """Serialize and persist ``value`` at an explicit state ``key``.
 
-        Lower-level companion to :meth:`save`: it writes (and per-write
-        syncs) without needing a live widget wrapper, so a value can be
+        Lower-level companion to :meth:`save`: it writes (and schedules the
+        write-behind sync) without needing a live widget wrapper, so a value can be
         mirrored into a *related surface's* store — see
         ``MainWindow.sync_widget_values``. Shares save()'s serialization and
         the no-selection guard, keeping a single write chokepoint.
@@ -329,24 +352,84 @@ class StateManager(ptk.LoggingMixin):
             return
 
         try:
-            store = self.qsettings
-            store.setValue(key, stored)
-            # Belt-and-braces sync alongside the canonical
-            # ``MainWindow.on_close``/``on_hide`` sync wires. Some host
-            # apps (notably Maya on Windows) can exit without delivering
-            # closeEvent to child windows, dropping QSettings' in-memory
-            # write cache. Per-save sync makes state durable regardless
-            # of how the process tears down. Cheap on Windows (registry
-            # writes are sub-millisecond); for high-frequency signals
-            # (slider drag) on slower QSettings backends, consider
-            # adding a debounce in ``sync_widget_values`` upstream
-            # rather than removing this sync.
-            sync = getattr(store, "sync", None)
-            if callable(sync):
-                sync()
+            self.qsettings.setValue(key, stored)
             self.logger.debug(f"Stored state: {key} -> {stored}")
         except Exception as e:
             self.logger.warning(f"Failed to store state for {key}: {e}")
+            return
+        # Belt-and-braces sync alongside the canonical ``MainWindow.on_close``/
+        # ``on_hide`` wires: some hosts (notably Maya on Windows) can exit
+        # without delivering closeEvent to child windows, dropping QSettings'
+        # in-memory write cache. The sync is write-behind rather than per-save —
+        # a slider drag otherwise issued hundreds of synchronous disk writes a
+        # second. ``setValue`` above already landed in QSettings' in-process
+        # cache (shared by every QSettings on the same file), so readers stay
+        # coherent; only durability waits, for at most ``write_behind_ms``.
+        self._schedule_sync(key)
+
+    # ---- write-behind ----------------------------------------------------
+
+    def _schedule_sync(self, key: str) -> None:
+        """Mark *key* unsynced and arm the flush timer (or sync now if disabled)."""
+        sync = getattr(self.qsettings, "sync", None)
+        if not callable(sync):
+            return
+        if self.write_behind_ms <= 0 or not self._ensure_flush_timer():
+            self._sync_store()
+            return
+        self._pending_keys.add(key)
+        StateManager._unsynced.add(self)
+        # Not restarted per write: the window bounds latency even while a
+        # drag keeps writing, instead of debouncing the sync away entirely.
+        if not self._flush_timer.isActive():
+            # Re-read each window so a later ``write_behind_ms`` change applies.
+            self._flush_timer.setInterval(self.write_behind_ms)
+            self._flush_timer.start()
+
+    def _ensure_flush_timer(self) -> bool:
+        """Create the single-shot flush timer; False when no Qt app can drive it."""
+        if self._flush_timer is not None:
+            return True
+        app = QtCore.QCoreApplication.instance()
+        if app is None:
+            return False
+        timer = QtCore.QTimer()
+        timer.setSingleShot(True)
+        # Weak: the connection must not keep a discarded manager alive.
+        ref = weakref.ref(self)
+        timer.timeout.connect(lambda: ref() is not None and ref().flush())
+        self._flush_timer = timer
+        if not StateManager._quit_hooked:
+            app.aboutToQuit.connect(StateManager.flush_all)
+            StateManager._quit_hooked = True
+        return True
+
+    def _sync_store(self) -> None:
+        try:
+            self.qsettings.sync()
+        except Exception as e:
+            self.logger.warning(f"Failed to sync state store: {e}")
+
+    @property
+    def pending_keys(self) -> set:
+        """Keys written since the last disk sync."""
+        return set(self._pending_keys)
+
+    def flush(self) -> None:
+        """Sync any write-behind writes to disk now. No-op when nothing is pending."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        StateManager._unsynced.discard(self)
+        if not self._pending_keys:
+            return
+        self._pending_keys.clear()
+        self._sync_store()
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Flush every manager holding unsynced writes (connected to ``aboutToQuit``)."""
+        for manager in list(cls._unsynced):
+            manager.flush()
 
     def load(self, widget: QtWidgets.QWidget) -> None:
         """Load the saved value from QSettings and apply it to the widget."""
@@ -17,6 +17,8 @@ Switchboard class and all its dependencies):
     SlotWrapper   — slot invocation wrapper
     Shortcut      — slot keyboard-shortcut decorator
     Cancelable    — slot decorator enabling Esc-cancel + warning dialog
+    FastSlot      — slot decorator for cheap high-frequency slots (no
+                    busy cursor / timeout / history per call)
     OverrideCursorGuard — leak-proof application override cursor
 
 ``OverrideCursorGuard`` is published because this package owns the
@@ -33,6 +35,7 @@ __all__ = [
     "SlotWrapper",
     "Shortcut",
     "Cancelable",
+    "FastSlot",
     "OverrideCursorGuard",
 ]
 
@@ -46,6 +49,7 @@ _LAZY = {
     "SlotWrapper": ("slots", "SlotWrapper"),
     "Shortcut": ("shortcuts", "Shortcut"),
     "Cancelable": ("slots", "Cancelable"),
+    "FastSlot": ("slots", "FastSlot"),
     "OverrideCursorGuard": ("utils", "OverrideCursorGuard"),
 }
 
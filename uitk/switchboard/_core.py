@@ -22,11 +22,12 @@ from uitk.switchboard.namespace import SwitchboardNamespaceMixin
 
 # Generic infrastructure (shared with non-Switchboard widgets):
 from uitk.switchboard.history import History
+from uitk.switchboard.trace import SlotTracer
 from uitk.managers.registry_manager import RegistryManager
 from uitk.widgets.mixins.convert import ConvertMixin
 from uitk.widgets.mixins.tooltip_mixin import TooltipNamespace
 from uitk.managers.settings_manager import SettingsManager
-from uitk.loaders import CompiledLoader, RuntimeLoader
+from uitk.loaders import CompiledLoader, RuntimeLoader, UiPreloader
 
 
 class Switchboard(
@@ -126,6 +127,7 @@ class Switchboard(
         loader="runtime",
         context_tags=None,
         on_missing_slot=None,
+        lazy_widgets: bool = False,
     ) -> None:
         """Initialize a Switchboard and populate its source registries.
 
@@ -156,6 +158,12 @@ class Switchboard(
                 finds no slot for a signal-bearing widget. ``None`` is silent
                 (production default); set ``UITK_MARK_MISSING_SLOTS`` to install
                 the built-in grey-out marker.
+            lazy_widgets (bool): Record widget classes (this package's
+                built-ins and ``widget_source``) by name and module path only;
+                each widget module is imported the first time a ``.ui`` file or
+                a ``registered_widgets`` lookup references its class. Most
+                tools use a handful of the built-in widgets, so this skips
+                importing the rest at construction.
         """
         super().__init__(parent)
         self.logger.setLevel(log_level)
@@ -226,6 +234,10 @@ class Switchboard(
         sources = self._get_registry_config(
             ui_source, slot_source, widget_source, icon_source
         )
+        # Stored on the registry's metadata so later ``register(widget_location=...)``
+        # calls (and the built-in extend below) honour the same mode.
+        self.lazy_widgets = bool(lazy_widgets)
+        sources["widget_registry"]["lazy"] = self.lazy_widgets
 
         # Initialize registries
         for descriptor, config in sources.items():
@@ -300,6 +312,9 @@ class Switchboard(
         # Set while repeat_last() re-dispatches so the re-run doesn't overwrite
         # the captured wrapper (a repeat bound as a slot would capture itself).
         self._suppress_slot_capture = False
+        # Per-slot dispatch timings (off unless enabled or UITK_SLOT_TRACE is
+        # set); SlotWrapper feeds it. See slot_stats().
+        self.slot_tracer = SlotTracer()
         # UI-less, shortcut-bindable commands (see SwitchboardShortcutMixin):
         # name -> spec, and name -> live GlobalShortcut. Bound lazily once a
         # host window exists (on_ui_loaded), so registration order is free.
@@ -790,14 +805,43 @@ class Switchboard(
                 if source_tags_changed:
                     self.on_handler_entries_changed.emit("ui")
 
-    def load_all_ui(self) -> list:
-        """Extends the 'load_ui' method to load all UI from a given path.
+    def load_all_ui(
+        self,
+        background: bool = False,
+        workers: Optional[int] = None,
+        slice_ms: Optional[float] = None,
+    ) -> Union[list, UiPreloader]:
+        """Load every registered UI, with the non-GUI work on worker threads.
+
+        Reading/parsing each .ui, the compiled loader's freshness check and
+        module imports run in a thread pool (the loader's ``prepare``); only
+        widget construction stays on the GUI thread. See
+        :mod:`uitk.loaders.preload`.
+
+        Parameters:
+            background (bool): Return immediately and build from the event
+                loop in ``slice_ms`` chunks, so a warm-all pass doesn't freeze
+                the host. Default blocks until every UI is built.
+            workers (int): Prepare threads; ``0`` loads fully serially.
+            slice_ms (float): GUI-thread budget per event-loop turn in
+                background mode.
 
         Returns:
-            (list) QWidget(s).
+            (list) QWidget(s), or — with ``background=True`` — the running
+            :class:`UiPreloader` (its ``finished`` signal carries the list).
         """
-        filepaths = self.registry.ui_registry.get("filepath")
-        return [self.load_ui(f) for f in filepaths]
+        filepaths = self.registry.ui_registry.get("filepath") or []
+        preloader = UiPreloader(
+            self._loader,
+            filepaths,
+            workers=workers,
+            slice_ms=slice_ms,
+            parent=self,
+            log_level=self.logger.level,
+        )
+        if background:
+            return preloader.start()
+        return preloader.run()
 
     def load_ui(self, file: str) -> QtWidgets.QMainWindow:
         """Load a UI from the given .ui path via the configured loader delegate."""
@@ -124,6 +124,39 @@ class Cancelable:
         return func
 
 
+class FastSlot:
+    """Decorator: dispatch a cheap, high-frequency slot on the fast path.
+
+    Every :class:`SlotWrapper` dispatch normally pushes a
+    :data:`Qt.WaitCursor` override, installs a :class:`_ModalBusyCursorFilter`
+    on the ``QApplication``, resolves a :class:`Cancelable` timeout and
+    records the call in the slot history. That fixed cost is noise for a
+    button click but dominates slots bound to ``valueChanged`` on a slider,
+    ``textChanged`` or a table scrub, which fire dozens of times a second
+    and return in microseconds. A fast slot skips all four and calls the
+    slot directly. Argument injection and ``widget.debounce`` still apply.
+
+    The trade-offs are the point: a fast slot shows no busy cursor, can't
+    be Esc-cancelled (any timeout source is ignored), and is never the
+    target of ``repeat_last`` / ``slot_history`` — so reserve it for slots
+    that return quickly.
+
+    The runtime equivalents, checked per dispatch, are
+    ``widget.fast_slot = True`` and UI-wide ``ui.fast_slots = True``. An
+    explicit ``widget.fast_slot = False`` opts a widget back out.
+
+    Example::
+
+        @FastSlot()
+        def sld_opacity(self, value, widget):
+            self.preview.setOpacity(value / 100.0)
+    """
+
+    def __call__(self, func: Callable) -> Callable:
+        func._fast_slot = True
+        return func
+
+
 class _ModalBusyCursorFilter(QtCore.QObject):
     """Suspend the slot busy-cursor while a modal dialog blocks the app.
 
@@ -197,6 +230,13 @@ class SlotWrapper:
     the slot call is deferred until that many ms elapse without another
     signal.  Each new signal restarts the timer so rapid changes (e.g.
     spinner increments) coalesce into a single slot invocation.
+
+    Fast path
+    ---------
+    Slots marked cheap (:class:`FastSlot`, ``widget.fast_slot``,
+    ``ui.fast_slots``) skip the busy cursor, the modal-dialog cursor
+    filter, timeout resolution and history tracking; see
+    :meth:`_is_fast_path`.
     """
 
     # Class-level cache: slot FUNCTION object -> (param_names frozenset,
@@ -210,6 +250,33 @@ class SlotWrapper:
     # defining class is dropped.
     _sig_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
+    # (type, attribute name) -> whether the class defines it. See _flag.
+    _class_attr_cache: dict = {}
+
+    @staticmethod
+    def _flag(obj, name: str, default=None):
+        """Read a dispatch-control attribute (``debounce``, ``fast_slot``, …).
+
+        These are nearly always plain instance attributes set in a slot's
+        ``*_init`` — and nearly always *unset*. A ``getattr`` miss on a Qt
+        object falls through shiboken's lookup (~6 µs, several per dispatch),
+        and on a uitk ``MainWindow`` into its widget-resolving
+        ``__getattr__``. So read the instance ``__dict__`` first and only
+        fall back to ``getattr`` when the class itself defines the name (a
+        property or class-level default); that answer is cached per type.
+        """
+        try:
+            attrs = obj.__dict__
+        except AttributeError:
+            return getattr(obj, name, default)
+        if name in attrs:
+            return attrs[name]
+        key = (type(obj), name)
+        defined = SlotWrapper._class_attr_cache.get(key)
+        if defined is None:
+            defined = SlotWrapper._class_attr_cache[key] = hasattr(key[0], name)
+        return getattr(obj, name, default) if defined else default
+
     @staticmethod
     def _slot_busy_opt_out(widget, sb) -> bool:
         """True when the slot dispatcher should skip the busy-cursor change.
@@ -221,7 +288,7 @@ class SlotWrapper:
         must not propagate into slot dispatch.
         """
         try:
-            if getattr(widget, "no_busy_indicator", False):
+            if SlotWrapper._flag(widget, "no_busy_indicator", False):
                 return True
         except Exception:
             pass
@@ -229,7 +296,7 @@ class SlotWrapper:
         if ui is None:
             ui = getattr(sb, "_current_ui", None)
         try:
-            if ui is not None and getattr(ui, "no_busy_indicator", False):
+            if ui is not None and SlotWrapper._flag(ui, "no_busy_indicator", False):
                 return True
         except Exception:
             pass
@@ -242,6 +309,9 @@ class SlotWrapper:
         self._debounce_timer = None
         self._debounce_args = None
         self._debounce_kwargs = None
+        # Decorator metadata can't change after definition; read it once.
+        # The widget/UI attributes are runtime state, checked per dispatch.
+        self._fast_declared = bool(getattr(slot, "_fast_slot", False))
 
         # Cache inspect.signature per slot function to avoid repeated
         # introspection. Key on the underlying function object so id reuse of
@@ -267,6 +337,30 @@ class SlotWrapper:
                         self.wants_widget,
                     )
 
+    def _is_fast_path(self) -> bool:
+        """True when this dispatch should take the fast path.
+
+        Resolution order (first explicit value wins):
+
+        1. ``widget.fast_slot`` — per-widget runtime switch; ``False``
+           opts a widget out of a fast UI.
+        2. :class:`FastSlot` decorator metadata on the slot.
+        3. ``ui.fast_slots`` — UI-wide opt-in.
+
+        Defensive like :meth:`_slot_busy_opt_out`: a misbehaving
+        ``@property`` falls back to the normal (safe) path.
+        """
+        try:
+            flag = self._flag(self.widget, "fast_slot")
+            if flag is not None:
+                return bool(flag)
+            if self._fast_declared:
+                return True
+            ui = self._flag(self.widget, "ui")
+            return bool(ui is not None and self._flag(ui, "fast_slots", False))
+        except Exception:
+            return False
+
     def _get_timeout(self):
         """Resolve the cancel-timeout for this slot, if any.
 
@@ -284,7 +378,7 @@ class SlotWrapper:
         and rely only on the dispatcher's wait cursor for feedback.
         """
         # 1. per-widget runtime override
-        timeout = getattr(self.widget, "slot_timeout", None)
+        timeout = self._flag(self.widget, "slot_timeout")
 
         # 2. decorator metadata (``@Cancelable(timeout=N)``)
         if timeout is None:
@@ -293,12 +387,10 @@ class SlotWrapper:
                 timeout = meta.get("timeout")
 
         # 3. UI-wide fallback (only when a host has explicitly opted in)
-        if (
-            timeout is None
-            and hasattr(self.widget, "ui")
-            and hasattr(self.widget.ui, "default_slot_timeout")
-        ):
-            timeout = self.widget.ui.default_slot_timeout
+        if timeout is None:
+            ui = self._flag(self.widget, "ui")
+            if ui is not None:
+                timeout = self._flag(ui, "default_slot_timeout")
 
         if timeout:
             self.sb.logger.debug(
@@ -315,10 +407,14 @@ class SlotWrapper:
             kwargs["widget"] = self.widget
 
         # Filter kwargs to match signature (prevents TypeErrors)
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in self.param_names}
+        filtered_kwargs = (
+            {k: v for k, v in kwargs.items() if k in self.param_names}
+            if kwargs
+            else kwargs
+        )
 
         # Debounce: defer the call if the widget requests it
-        debounce_ms = getattr(self.widget, "debounce", 0) or 0
+        debounce_ms = self._flag(self.widget, "debounce", 0) or 0
         if debounce_ms > 0:
             self._debounce_args = args
             self._debounce_kwargs = filtered_kwargs
@@ -358,8 +454,26 @@ class SlotWrapper:
         responsive between work chunks.
 
         Per-slot opt-out via ``widget.no_busy_indicator = True`` (or on
-        the UI) is honoured for rapid-fire signals.
+        the UI) is honoured for rapid-fire signals. Fast-path slots (see
+        :class:`FastSlot`) bypass all of it and call the slot directly.
+
+        When :attr:`Switchboard.slot_tracer` is enabled the dispatch is
+        timed (see :mod:`uitk.switchboard.trace`); otherwise this costs one
+        attribute check on top of :meth:`_dispatch`.
         """
+        tracer = getattr(self.sb, "slot_tracer", None)
+        if tracer is not None and tracer.enabled:
+            return tracer.run(self, args, kwargs)
+        return self._dispatch(self.slot, args, kwargs)
+
+    def _dispatch(self, slot, args, kwargs):
+        """Run the dispatch steps, calling *slot* where the slot body runs.
+
+        *slot* is ``self.slot`` or, under the tracer, a timing shim around
+        it; history and messages always refer to ``self.slot``.
+        """
+        if self._is_fast_path():
+            return slot(*args, **kwargs)
 
         # History Tracking. slot_history keeps bare methods (back-compat:
         # prev_slot consumers read __doc__/__name__ off them). The live wrapper
@@ -422,7 +536,7 @@ class SlotWrapper:
                     logger=self.sb.logger,
                     allow_escape_cancel=True,
                     indicator=True,
-                )(self.slot)
+                )(slot)
 
                 try:
                     return monitored_slot(*args, **kwargs)
@@ -432,7 +546,7 @@ class SlotWrapper:
                     )
                     return None
             else:
-                return self.slot(*args, **kwargs)
+                return slot(*args, **kwargs)
         finally:
             if modal_filter is not None:
                 try:
@@ -1279,6 +1393,31 @@ class SwitchboardSlotsMixin:
             hist.remove(remove)
         return hist.get(index, allow_duplicates=allow_duplicates, inc=inc, exc=exc)
 
+    def slot_stats(self, top=None, inc=None, exc=None):
+        """Get per-slot dispatch timings recorded by :attr:`slot_tracer`.
+
+        Tracing is off by default; enable it with ``sb.slot_tracer.enable()``
+        (or ``UITK_SLOT_TRACE=1`` in the environment). Export the individual
+        calls with ``sb.slot_tracer.export_chrome_trace(path)``.
+
+        Parameters:
+            top (int, optional): Only the *top* slots by cumulative time.
+            inc (str/list): Slot qualnames to include; supports '*' wildcards
+                like :meth:`slot_history`.
+            exc (str/list): Slot qualnames to exclude; takes precedence.
+
+        Returns:
+            (dict): ``{qualname: stats}``, slowest cumulative time first. See
+                :meth:`uitk.switchboard.trace.SlotTracer.stats` for the keys.
+        """
+        stats = self.slot_tracer.stats()
+        if inc or exc:
+            keep = set(ptk.filter_list(list(stats), inc=inc, exc=exc))
+            stats = {name: s for name, s in stats.items() if name in keep}
+        if top is not None:
+            stats = dict(list(stats.items())[:top])
+        return stats
+
 
 # --------------------------------------------------------------------------------------------
 
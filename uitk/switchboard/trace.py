@@ -0,0 +1,271 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Slot dispatch tracing: per-slot latency statistics and Chrome trace export.
+
+Backs :attr:`Switchboard.slot_tracer`. Every signal-driven slot call already
+passes through :class:`uitk.switchboard.slots.SlotWrapper`, so the wrapper is
+where timings are taken: when the tracer is enabled it measures the whole
+dispatch and, separately, the slot body, so the difference is the wrapper's
+own overhead (busy cursor, modal filter, history, timeout monitor). That
+answers the production question "which tool slot is the hang?" without
+hand-placed timers.
+
+Disabled (the default) it costs the dispatcher one attribute check. Enable
+it per Switchboard with ``sb.slot_tracer.enable()``, or for every
+Switchboard in the process by setting ``UITK_SLOT_TRACE=1`` before the host
+starts.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Dict, Optional
+
+SLOT_TRACE_ENV_VAR = "UITK_SLOT_TRACE"
+
+
+class _SlotStats:
+    """Running totals for one slot plus a window of recent samples."""
+
+    __slots__ = ("calls", "errors", "total_ns", "body_ns", "max_ns", "samples", "buckets")
+
+    def __init__(self, window: int, bucket_count: int):
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.body_ns = 0
+        self.max_ns = 0
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * bucket_count
+
+
+class SlotTracer:
+    """Collects per-slot dispatch timings from :class:`SlotWrapper`.
+
+    Statistics are keyed by the slot's ``__qualname__`` (``"MySlots.btn_ok"``).
+    Counts, totals, max and the latency histogram cover every call since the
+    last :meth:`reset`; percentiles are computed over the most recent
+    :attr:`WINDOW` calls per slot so a long session stays bounded. Individual
+    calls are kept for :meth:`export_chrome_trace` in a ring of
+    :attr:`MAX_EVENTS`.
+
+    Parameters:
+        enabled (bool|None): Initial state. ``None`` reads
+            ``UITK_SLOT_TRACE`` (any non-empty value other than ``0``).
+    """
+
+    #: Recent samples per slot used for p50/p95.
+    WINDOW = 1024
+    #: Individual calls retained for the Chrome trace.
+    MAX_EVENTS = 20000
+    #: Histogram upper bounds in ms: one frame, perceptible lag, a hang.
+    BUCKETS_MS = (1, 4, 16, 50, 100, 250, 1000, 4000)
+
+    def __init__(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.environ.get(SLOT_TRACE_ENV_VAR, "") not in ("", "0")
+        self.enabled = bool(enabled)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _SlotStats] = {}
+        self._events = deque(maxlen=self.MAX_EVENTS)
+        self._bounds_ns = tuple(int(ms * 1e6) for ms in self.BUCKETS_MS)
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all statistics and recorded events."""
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
+
+    # ---- recording ----------------------------------------------------------
+
+    def run(self, wrapper, args: tuple, kwargs: dict):
+        """Dispatch *wrapper* with timing; the traced twin of ``_invoke``.
+
+        The slot body is timed inside the dispatcher's own call site (the
+        callable handed to :meth:`SlotWrapper._dispatch`), so everything
+        outside it — cursor, filter, history, monitor — counts as overhead.
+        Exceptions propagate unchanged and are counted as errors.
+        """
+        slot = wrapper.slot
+        body = [0, 0]
+
+        @wraps(slot)  # the timeout monitor reads the slot's name/metadata
+        def timed(*a, **k):
+            body[0] = time.perf_counter_ns()
+            try:
+                return slot(*a, **k)
+            finally:
+                body[1] = time.perf_counter_ns()
+
+        error = True
+        start = time.perf_counter_ns()
+        try:
+            result = wrapper._dispatch(timed, args, kwargs)
+            error = False
+            return result
+        finally:
+            end = time.perf_counter_ns()
+            self.record(wrapper, start, end, body[0], body[1], error)
+
+    def record(
+        self,
+        wrapper,
+        start_ns: int,
+        end_ns: int,
+        body_start_ns: int = 0,
+        body_end_ns: int = 0,
+        error: bool = False,
+    ) -> None:
+        """Record one dispatch. ``body_*`` stay 0 if the slot never ran."""
+        slot = wrapper.slot
+        name = getattr(slot, "__qualname__", None) or getattr(
+            slot, "__name__", repr(slot)
+        )
+        total = end_ns - start_ns
+        body = body_end_ns - body_start_ns
+        widget = wrapper.widget
+        try:
+            widget_name = widget.objectName() if widget is not None else ""
+        except RuntimeError:  # C++ object already deleted
+            widget_name = ""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _SlotStats(
+                    self.WINDOW, len(self._bounds_ns) + 1
+                )
+            stats.calls += 1
+            stats.errors += error
+            stats.total_ns += total
+            stats.body_ns += body
+            if total > stats.max_ns:
+                stats.max_ns = total
+            stats.samples.append(total)
+            stats.buckets[self._bucket(total)] += 1
+            self._events.append(
+                (
+                    name,
+                    widget_name,
+                    start_ns,
+                    total,
+                    body_start_ns,
+                    body,
+                    threading.get_ident(),
+                    error,
+                )
+            )
+
+    def _bucket(self, total_ns: int) -> int:
+        for i, bound in enumerate(self._bounds_ns):
+            if total_ns <= bound:
+                return i
+        return len(self._bounds_ns)
+
+    # ---- reporting ----------------------------------------------------------
+
+    @staticmethod
+    def _percentile(ordered: list, q: float) -> int:
+        """Nearest-rank percentile of an ascending list (empty -> 0)."""
+        if not ordered:
+            return 0
+        rank = max(1, -(-len(ordered) * q // 100))  # ceil without float drift
+        return ordered[int(rank) - 1]
+
+    def stats(self, top: Optional[int] = None) -> Dict[str, dict]:
+        """Per-slot statistics, slowest cumulative time first.
+
+        Parameters:
+            top (int|None): Return only the *top* slots by ``total_ms``.
+
+        Returns:
+            dict: ``{qualname: {...}}`` where each entry has ``calls``,
+            ``errors``, ``total_ms``, ``mean_ms``, ``p50_ms``, ``p95_ms``,
+            ``max_ms``, ``body_ms`` / ``overhead_ms`` (means per call: slot
+            body vs. dispatcher), and ``histogram`` — call counts per
+            :attr:`BUCKETS_MS` bound (``"<=16ms"``, …, ``">4000ms"``).
+        """
+        labels = [f"<={ms}ms" for ms in self.BUCKETS_MS]
+        labels.append(f">{self.BUCKETS_MS[-1]}ms")
+        with self._lock:
+            snapshot = [
+                (name, s.calls, s.errors, s.total_ns, s.body_ns, s.max_ns,
+                 sorted(s.samples), list(s.buckets))
+                for name, s in self._stats.items()
+            ]
+        result = {}
+        snapshot.sort(key=lambda row: row[3], reverse=True)
+        for name, calls, errors, total, body, peak, ordered, buckets in snapshot[:top]:
+            result[name] = {
+                "calls": calls,
+                "errors": errors,
+                "total_ms": total / 1e6,
+                "mean_ms": total / calls / 1e6,
+                "p50_ms": self._percentile(ordered, 50) / 1e6,
+                "p95_ms": self._percentile(ordered, 95) / 1e6,
+                "max_ms": peak / 1e6,
+                "body_ms": body / calls / 1e6,
+                "overhead_ms": (total - body) / calls / 1e6,
+                "histogram": dict(zip(labels, buckets)),
+            }
+        return result
+
+    def trace_events(self) -> list:
+        """Recorded calls as Chrome trace-event dicts (``ph: "X"``).
+
+        Each dispatch is a ``slot`` event; the slot body is a nested
+        ``slot.body`` event on the same thread, so ``chrome://tracing`` /
+        Perfetto draw the wrapper overhead as the uncovered part of the bar.
+        """
+        pid = os.getpid()
+        with self._lock:
+            recorded = list(self._events)
+        events = []
+        for name, widget, start, total, body_start, body, tid, error in recorded:
+            events.append(
+                {
+                    "name": name,
+                    "cat": "slot",
+                    "ph": "X",
+                    "ts": start / 1e3,
+                    "dur": total / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"widget": widget, "error": error},
+                }
+            )
+            if body_start:
+                events.append(
+                    {
+                        "name": f"{name} (body)",
+                        "cat": "slot.body",
+                        "ph": "X",
+                        "ts": body_start / 1e3,
+                        "dur": body / 1e3,
+                        "pid": pid,
+                        "tid": tid,
+                    }
+                )
+        return events
+
+    def export_chrome_trace(self, path) -> str:
+        """Write :meth:`trace_events` as a Chrome trace JSON file.
+
+        Load it in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        Returns:
+            str: The path written.
+        """
+        path = os.fspath(path)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f
+            )
+        return path
@@ -272,7 +272,11 @@ class SwitchboardWidgetMixin:
         if ui is None or isinstance(ui, str):
             ui = self.get_ui(ui)
 
-        return next((w for w in ui.widgets if w.objectName() == name), None)
+        widget = next((w for w in ui.widgets if w.objectName() == name), None)
+        if widget is None and getattr(ui, "_deferred_registrations", None):
+            # Lazy registration: the widget may sit in a not-yet-shown subtree.
+            widget = ui._register_deferred_named(name)
+        return widget
 
     def get_widget_from_slot(self, method):
         """Get the corresponding widget from a given method.
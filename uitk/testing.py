@@ -29,6 +29,7 @@ class _TestSandboxInternal:
 
     _qsettings_dir = None
     _presets_dir = None
+    _cache_dir = None
 
     @staticmethod
     def _throwaway_dir(name):
@@ -125,14 +126,34 @@ class TestSandbox(_TestSandboxInternal):
         os.environ[CONFIG_ROOT_ENV_VAR] = cls._presets_dir
         return cls._presets_dir
 
+    @classmethod
+    def cache(cls):
+        """Redirect uitk's on-disk caches (``uitk.managers.disk_cache``).
+
+        Returns the temp dir.
+
+        Not user *state* — everything there is rebuildable — but a suite that reads a
+        developer's warm cache tests the cache rather than the code behind it, and one that
+        writes there leaves entries keyed to temp fixture files that no longer exist.
+        """
+        if cls._cache_dir is not None:
+            return cls._cache_dir
+        from uitk.managers.disk_cache import CACHE_ROOT_ENV_VAR
+
+        cls._cache_dir = cls._throwaway_dir("cache")
+        os.environ[CACHE_ROOT_ENV_VAR] = cls._cache_dir
+        return cls._cache_dir
+
     @classmethod
     def activate(cls):
-        """Redirect both stores; returns ``(qsettings_dir, presets_dir)``.
+        """Redirect both stores (and the cache root); returns ``(qsettings_dir, presets_dir)``.
 
         What a suite wants unless it has a reason to isolate only one. Safe to call more than once
         — a second call returns the dirs the first created rather than re-redirecting (which would
-        strand state already written to the first pair).
+        strand state already written to the first pair). The cache redirect rides along without
+        changing the return shape downstream suites already unpack.
         """
+        cls.cache()
         return cls.qsettings(), cls.presets()
 
     @classmethod
@@ -3,6 +3,7 @@
 import logging
 import re
 import importlib.resources
+from collections import OrderedDict
 from typing import Union
 from qtpy import QtWidgets, QtCore, QtGui
 import pythontk as ptk
@@ -334,12 +335,34 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
                 disabled, checked, cls._disabled_checked_mix
             )
 
+    # Where rendered QSS is installed (see :meth:`set_shared_scope`):
+    #   "widget" — on every styled widget (each one parses its own copy).
+    #   "window" — once on the widget's top-level window; styled descendants
+    #              whose render matches it carry no sheet of their own.
+    #   "app"    — once on the QApplication, likewise.
+    # Per-widget variants ride on dynamic properties (``class``, …) matched by
+    # selectors in the shared sheet; a widget whose *render* differs (another
+    # theme, per-widget overrides or kwargs) still gets its own sheet.
+    SHARED_SCOPES = ("widget", "window", "app")
+    shared_scope: str = "widget"
+    # QSS this class installed on the QApplication ("app" scope). A foreign
+    # app sheet (a DCC host's) is never replaced. While ``_app_claim_open``
+    # (a full reload is in progress) the next styled widget re-claims it.
+    _app_qss: Union[str, None] = None
+    _app_claim_open = False
+
     _qss_cache: dict[str, str] = {}
     # Parsed-template cache: cache_key -> [literal, TOKEN, literal, TOKEN, ...].
     # Built once per (package, resource) on first load; assembly is then a
     # single ``''.join`` of dict lookups, replacing N full-string ``str.replace``
     # passes (one per token) with one pass.
     _template_cache: dict[str, list[str]] = {}
+    # Rendered-QSS cache: (package:resource, theme, resolved vars) -> final
+    # QSS, least recently used first. The derived tokens are a pure function
+    # of the resolved vars, so a hit also skips ``_derive_internal_vars``.
+    _render_cache: "OrderedDict[tuple, str]" = OrderedDict()
+    #: Rendered sheets kept (~41 KB each): every theme x override set in play.
+    RENDER_CACHE_SIZE = 32
     # Track current theme per widget for icon color lookups
     _widget_themes: dict = {}
     # Track configuration for reloading
@@ -507,7 +530,16 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
             widget: Specific widget to reload. If None, reloads all registered widgets.
         """
         targets = [widget] if widget else list(cls._widget_configs.keys())
+        if len(targets) > 1:
+            # Ancestors first: a child can only drop its private copy once
+            # the window (and anything between) already holds the sheet.
+            targets.sort(key=cls._depth)
         styler = cls()
+        if widget is None and cls.shared_scope == "app":
+            # Full pass: the first widget styled claims the app sheet again,
+            # so a theme switch moves the shared sheet instead of turning
+            # every widget into a per-widget variant.
+            cls._release_app_sheet(restore=False)
         # Per-call cache: (theme, resource, package, frozenset(kwargs.items())) -> qss_final
         assembled: dict = {}
 
@@ -539,12 +571,9 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
                 for k, v in kwargs.items():
                     if k in theme_vars:
                         theme_vars[k] = str(v)
-                # Derive into theme_vars here — it's not emitted from this
-                # path (the slow path in ``set`` handles signal emission
-                # with its own derivation-free dict).
-                cls._derive_internal_vars(theme_vars)
-                parts = cls._get_template(config["resource"], config["package"])
-                qss_final = cls._apply_template(parts, theme_vars)
+                qss_final = cls._render(
+                    config["resource"], config["package"], config["theme"], theme_vars
+                )
                 assembled[key] = qss_final
 
             try:
@@ -552,6 +581,129 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
             except RuntimeError:
                 cls._widget_configs.pop(w, None)
 
+    @staticmethod
+    def _depth(widget: QtWidgets.QWidget) -> int:
+        """Number of ancestors above *widget* (0 for a deleted widget)."""
+        depth = 0
+        try:
+            parent = widget.parentWidget()
+            while parent is not None:
+                depth += 1
+                parent = parent.parentWidget()
+        except RuntimeError:
+            pass
+        return depth
+
+    @classmethod
+    def set_shared_scope(cls, scope: str) -> None:
+        """Choose where rendered QSS is installed, and restyle every widget.
+
+        ``"widget"`` (the default) calls ``setStyleSheet`` with the full
+        rendered theme on each styled widget, so Qt parses and cascades a
+        private copy per widget: fine for a handful of windows, costly for
+        ``recursive`` styling or many windows. ``"window"`` installs it once
+        per top-level window and ``"app"`` once on the QApplication; styled
+        widgets whose render matches the shared sheet drop their own copy and
+        select their variant through dynamic properties (``style_class``).
+        Widgets rendering differently (another theme, per-widget overrides or
+        kwargs) keep a sheet of their own, so results are identical in every
+        scope.
+
+        ``"app"`` styles every widget in the process, so it suits standalone
+        tools; under a host application that owns the app stylesheet it falls
+        back to ``"window"`` behaviour rather than replacing it.
+
+        Args:
+            scope: One of :attr:`SHARED_SCOPES`.
+        """
+        if scope not in cls.SHARED_SCOPES:
+            raise ValueError(
+                f"Unknown scope {scope!r}. Available: {list(cls.SHARED_SCOPES)}"
+            )
+        if scope == cls.shared_scope:
+            return
+        if cls.shared_scope == "app":
+            cls._release_app_sheet(restore=True)
+        cls.shared_scope = scope
+        cls.reload()
+
+    @classmethod
+    def _release_app_sheet(cls, restore: bool) -> None:
+        """Let the next styled widget re-claim the app sheet; with *restore*,
+        uninstall it instead."""
+        if not restore:
+            cls._app_claim_open = True
+            return
+        app = QtWidgets.QApplication.instance()
+        if app is not None and cls._app_qss is not None:
+            if app.styleSheet() == cls._app_qss:
+                app.setStyleSheet("")
+        cls._app_qss = None
+        cls._app_claim_open = False
+
+    @classmethod
+    def _shared_host(cls, widget: QtWidgets.QWidget, qss: str):
+        """Return the object holding the shared sheet *widget* can rely on, or None.
+
+        ``None`` means the widget must carry *qss* itself: the scope is
+        ``"widget"``, the widget is its own window, the host's sheet renders
+        differently (a per-widget variant), or an ancestor below the host
+        holds a different sheet whose rules would otherwise cascade onto it.
+        """
+        host = cls._shared_scope_host(widget, qss)
+        if host is None:
+            return None
+        parent = widget.parentWidget()
+        while parent is not None and parent is not host:
+            own = parent.styleSheet()
+            if own and own != qss:
+                return None
+            parent = parent.parentWidget()
+        return host
+
+    @classmethod
+    def _shared_scope_host(cls, widget: QtWidgets.QWidget, qss: str):
+        """The app or window whose sheet matches *qss* under the current scope, or None."""
+        scope = cls.shared_scope
+        if scope == "app":
+            app = QtWidgets.QApplication.instance()
+            if app is not None:
+                current = app.styleSheet()
+                ours = cls._app_qss is not None and current == cls._app_qss
+                if not current or (ours and cls._app_claim_open):
+                    if current != qss:
+                        app.setStyleSheet(qss)
+                    cls._app_qss = qss
+                    cls._app_claim_open = False
+                    return app
+                if ours:
+                    return app if qss == cls._app_qss else None
+            scope = "window"  # no app, or a foreign app sheet
+        if scope == "window":
+            window = widget.window()
+            if window is not widget and window.styleSheet() == qss:
+                return window
+        return None
+
+    @classmethod
+    def _install(cls, widget: QtWidgets.QWidget, qss: str, repolish: bool) -> None:
+        """Apply *qss* to *widget* according to :attr:`shared_scope`.
+
+        A widget covered by a shared sheet drops any private copy; with
+        *repolish* (its ``class`` property was just stamped) it is re-polished
+        so property selectors re-match, which ``setStyleSheet`` would
+        otherwise have done.
+        """
+        if cls.shared_scope == "widget" or cls._shared_host(widget, qss) is None:
+            widget.setStyleSheet(qss)
+            return
+        if widget.styleSheet():
+            widget.setStyleSheet("")
+        elif repolish:
+            style = QtWidgets.QWidget.style(widget)
+            style.unpolish(widget)
+            style.polish(widget)
+
     @classmethod
     def clear_caches(cls) -> None:
         """Drop QSS + parsed-template caches.
@@ -561,6 +713,7 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
         """
         cls._qss_cache.clear()
         cls._template_cache.clear()
+        cls._render_cache.clear()
 
     @classmethod
     def set_variable(
@@ -755,10 +908,13 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
         cache_key = f"{package}:{resource}"
         if cache_key not in cls._qss_cache:
             try:
+                # utf-8-sig: style.qss carries a BOM, which Qt drops on
+                # setStyleSheet. Keeping it out of the rendered QSS keeps that
+                # equal to what Qt stores (shared-scope sheet comparisons).
                 with (
                     importlib.resources.files(package)
                     .joinpath(resource)
-                    .open("r", encoding="utf-8") as f
+                    .open("r", encoding="utf-8-sig") as f
                 ):
                     cls._qss_cache[cache_key] = f.read()
             except Exception as e:
@@ -784,6 +940,32 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
             cls._template_cache[cache_key] = parts
         return parts
 
+    @classmethod
+    def _render(
+        cls, resource: str, package: str, theme: str, theme_vars: dict
+    ) -> str:
+        """Return the final QSS for resolved *theme_vars*, rendering on a miss.
+
+        *theme_vars* is the resolved, derivation-free dict (base theme +
+        global overrides + widget overrides + kwargs); it is not mutated.
+        A miss derives the internal tokens into a copy and assembles the
+        template; hits return the cached string, so re-theming N windows or
+        toggling back to a theme already seen costs a dict lookup.
+        """
+        key = (f"{package}:{resource}", theme, frozenset(theme_vars.items()))
+        cache = cls._render_cache
+        qss = cache.get(key)
+        if qss is not None:
+            cache.move_to_end(key)
+            return qss
+        assembly_vars = theme_vars.copy()
+        cls._derive_internal_vars(assembly_vars)
+        qss = cls._apply_template(cls._get_template(resource, package), assembly_vars)
+        cache[key] = qss
+        if len(cache) > cls.RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return qss
+
     @staticmethod
     def _apply_template(parts: list[str], theme_vars: dict) -> str:
         """Assemble a QSS string from a parsed template and a vars dict.
@@ -873,19 +1055,16 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
 
             # Reuse a precomputed QSS string if the caller (typically
             # ``reload()``) has already assembled it for our config group.
-            # Derive internal tints into a scratch dict so the signal payload
-            # below carries only user-facing tokens.
+            # ``_render`` derives internal tints into its own scratch dict,
+            # so the signal payload below carries only user-facing tokens.
             if _qss_final is None:
-                assembly_vars = theme_vars.copy()
-                self._derive_internal_vars(assembly_vars)
-                parts = self._get_template(resource, package)
-                qss_final = self._apply_template(parts, assembly_vars)
+                qss_final = self._render(resource, package, theme, theme_vars)
             else:
                 qss_final = _qss_final
             self.logger.debug(
                 f"Applying QSS to widget '{widget.objectName()}':\n---BEGIN QSS---\n{qss_final}\n---END QSS---"
             )
-            widget.setStyleSheet(qss_final)
+            self._install(widget, qss_final, repolish=bool(style_class))
             self.logger.info(
                 f"Applied QSS style to widget: {widget.objectName()} (theme='{theme}', class='{style_class}')"
             )
@@ -920,7 +1099,7 @@ class StyleSheet(QtCore.QObject, ptk.LoggingMixin):
             from uitk.managers.icon_manager import IconManager
 
             IconManager.set_default_color(icon_color)
-            IconManager.update_widget_icons(widget, icon_color)
+            IconManager.update_widget_icons(widget, icon_color, defer_hidden=True)
 
             # Emit signal for any custom handlers
             self.theme_changed.emit(widget, theme, theme_vars)
@@ -47,6 +47,7 @@ class MainWindow(
         fit_to_content_on_show: bool = True,
         default_slot_timeout: Optional[float] = None,
         settings: Optional[SettingsManager] = None,
+        lazy_registration: bool = False,
         **kwargs,
     ) -> None:
         """Initializes the main window and its properties.
@@ -79,6 +80,10 @@ class MainWindow(
                 True.
             default_slot_timeout: Default timeout in seconds for slots in this window. None disables monitoring.
             settings: Optional SettingsManager to use. Defaults to a new instance.
+            lazy_registration: Defer registering the widgets inside hidden
+                subtrees (unopened tab / stacked pages, collapsed group content)
+                until each subtree is first shown, instead of walking the whole
+                tree on first show. See ``register_children``. Defaults to False.
             **kwargs: Additional keyword arguments
         """
         super().__init__(parent)
@@ -128,6 +133,13 @@ class MainWindow(
         # persist into a sibling's store without loading its window.
         self._relative_states = {}
         self._deferred = {}
+        self.lazy_registration = lazy_registration
+        # Hidden subtree roots whose registration waits for their first Show
+        # (lazy_registration); the window filters their events to catch it.
+        self._deferred_registrations = {}
+        # Widget a register_children walk is registering right now, so the
+        # nested register_children its init_slot triggers can be skipped.
+        self._walk_registering = None
         self.lock_style = False
         self.original_style = ""
 
@@ -151,6 +163,9 @@ class MainWindow(
         self.set_attributes(WA_NoChildEventsForParent=True, **kwargs)
         self.setFocusPolicy(QtCore.Qt.ClickFocus)
 
+        # Flush write-behind state writes first, then the window's own store.
+        self.on_close.connect(self.flush_state)
+        self.on_hide.connect(self.flush_state)
         self.on_close.connect(self.settings.sync)
         self.on_hide.connect(self.settings.sync)
         self.on_child_changed.connect(self.sync_widget_values)
@@ -638,6 +653,14 @@ class MainWindow(
             self.state.load(widget)
             self.restored_widgets.add(widget)
 
+    def flush_state(self) -> None:
+        """Sync any write-behind widget-state writes (this window's and those
+        mirrored into sibling stores) to disk now.
+        """
+        self.state.flush()
+        for state in self._relative_states.values():
+            state.flush()
+
     def _relative_state(self, ui_name: str) -> StateManager:
         """Lazily build (and cache) a StateManager for a sibling surface's
         settings branch, so its store can be written without loading its
@@ -752,6 +775,11 @@ class MainWindow(
             if isinstance(child, QtWidgets.QWidget):
                 if child.objectName() and child not in self.widgets:
                     self.register_widget(child)
+        elif (
+            event.type() == QtCore.QEvent.Show
+            and watched in self._deferred_registrations
+        ):
+            self._register_deferred_root(watched)
         return super().eventFilter(watched, event)
 
     # -------------------------------------------------------------------------
@@ -1133,19 +1161,47 @@ class MainWindow(
         self.is_initialized = True
 
     def register_children(
-        self, root_widget: Optional[QtWidgets.QWidget] = None
+        self,
+        root_widget: Optional[QtWidgets.QWidget] = None,
+        lazy: Optional[bool] = None,
     ) -> None:
-        """Registers all child widgets starting from the given widget (or central widget if None)."""
+        """Registers all child widgets starting from the given widget (or central widget if None).
+
+        Registration is batched into one walk: the ``register_children`` that
+        a widget's ``init_slot`` triggers while the walk registers it is
+        skipped, since the walk descends into the same children next anyway.
+
+        Parameters:
+            root_widget: Widget to start from. Defaults to the central widget.
+            lazy: Defer explicitly hidden subtrees (unopened tab / stacked
+                pages, collapsed group content) until they are first shown.
+                Such a subtree gets only a pending record; its widgets are
+                registered when it receives its first Show event, when one of
+                them is looked up (``ui.<name>`` / ``sb.get_widget``), or on
+                ``register_deferred()``. Defaults to ``self.lazy_registration``.
+        """
+        root = root_widget or self.centralWidget()
+        if root is not None and root is self._walk_registering:
+            return
+        if lazy is None:
+            lazy = self.lazy_registration
 
         def _walk_and_register(widget) -> None:
             if widget.objectName() and widget not in self.widgets:
-                self.register_widget(widget)
+                outer = self._walk_registering
+                self._walk_registering = widget
+                try:
+                    self.register_widget(widget)
+                finally:
+                    self._walk_registering = outer
             for child in widget.findChildren(
                 QtWidgets.QWidget, options=QtCore.Qt.FindDirectChildrenOnly
             ):
-                _walk_and_register(child)
+                if lazy and self._is_unopened(child):
+                    self._defer_registration(child)
+                else:
+                    _walk_and_register(child)
 
-        root = root_widget or self.centralWidget()
         if root:
             _walk_and_register(root)
 
@@ -1167,6 +1223,82 @@ class MainWindow(
             finally:
                 self._flushing_menu_registrations = False
 
+    @staticmethod
+    def _is_unopened(widget: QtWidgets.QWidget) -> bool:
+        """True for content hidden on purpose: an inactive tab / stacked page,
+        collapsed group content. Every widget reads ``isHidden()`` until its
+        window first shows, so only an explicit hide counts. Popups (menus,
+        option-box windows) stay eager; they're hidden by nature, and their
+        items register through ``Menu``'s own queue.
+        """
+        return (
+            widget.isHidden()
+            and widget.testAttribute(QtCore.Qt.WA_WState_ExplicitShowHide)
+            and not widget.isWindow()
+            # A hidden leaf (e.g. a tab bar's scroll button) saves nothing.
+            and widget.findChild(
+                QtWidgets.QWidget, options=QtCore.Qt.FindDirectChildrenOnly
+            )
+            is not None
+        )
+
+    def _defer_registration(self, widget: QtWidgets.QWidget) -> None:
+        """Record *widget*'s subtree for registration on its first Show."""
+        if widget in self._deferred_registrations:
+            return
+        self._deferred_registrations[widget] = None
+        widget.installEventFilter(self)
+
+    def _register_deferred_root(self, widget: QtWidgets.QWidget) -> None:
+        """Register a deferred subtree now, and stop watching its root."""
+        if widget not in self._deferred_registrations:
+            return
+        del self._deferred_registrations[widget]
+        widget.removeEventFilter(self)
+        # Still lazy: a page within the page stays deferred until it shows.
+        self.register_children(widget, lazy=True)
+
+    def register_deferred(self) -> int:
+        """Register every subtree still deferred by lazy registration.
+
+        Use before code that enumerates ``self.widgets`` wholesale (e.g.
+        batch state operations); single lookups resolve on their own.
+
+        Returns:
+            int: The number of deferred subtrees registered.
+        """
+        count = 0
+        while self._deferred_registrations:
+            root = next(iter(self._deferred_registrations))
+            try:
+                self._deferred_registrations.pop(root)
+                root.removeEventFilter(self)
+                self.register_children(root, lazy=False)
+            except RuntimeError:  # root destroyed while deferred
+                continue
+            count += 1
+        return count
+
+    def _register_deferred_named(self, name: str) -> Optional[QtWidgets.QWidget]:
+        """Register and return the still-deferred widget named *name*, if any."""
+        if not self._deferred_registrations:
+            return None
+        for root in list(self._deferred_registrations):
+            try:
+                found = (
+                    root
+                    if root.objectName() == name
+                    else root.findChild(QtWidgets.QWidget, name)
+                )
+            except RuntimeError:  # root destroyed while deferred
+                self._deferred_registrations.pop(root, None)
+                continue
+            if found is not None:
+                if found.objectName() and found not in self.widgets:
+                    self.register_widget(found)
+                return found
+        return None
+
     def focusInEvent(self, event) -> None:
         """Override the focus event to set the current UI when this window gains focus."""
         self.sb.current_ui = self
@@ -26,6 +26,9 @@ from uitk.widgets.sequencer._data import (  # noqa: F401
     _DEFAULT_ATTRIBUTE_COLORS,
     MenuUtils,
     CurveUtils,
+    RowLayout,
+    KeyTimeIndex,
+    ClipIntervals,
     HATCH_DENSE,
     HATCH_MEDIUM,
     HATCH_SPARSE,
@@ -35,6 +38,7 @@ from uitk.widgets.sequencer._data import (  # noqa: F401
 )
 
 from uitk.widgets.sequencer._drag_tooltip import FrameTooltip  # noqa: F401
+from uitk.widgets.sequencer._waveform import WaveformPyramid  # noqa: F401
 from uitk.widgets.sequencer._clip import ClipItem  # noqa: F401
 from uitk.widgets.sequencer._keyframe import KeyframeItem  # noqa: F401
 from uitk.widgets.sequencer._overlays import (  # noqa: F401
@@ -45,6 +49,7 @@ from uitk.widgets.sequencer._overlays import (  # noqa: F401
 from uitk.widgets.sequencer._ruler import RulerItem  # noqa: F401
 from uitk.widgets.sequencer._playhead import PlayheadItem  # noqa: F401
 from uitk.widgets.sequencer._markers import MarkerItem  # noqa: F401
+from uitk.widgets.sequencer._undo import ClipEdit  # noqa: F401
 from uitk.widgets.sequencer._timeline import (  # noqa: F401
     _ElidingLabel,
     TrackHeaderWidget,
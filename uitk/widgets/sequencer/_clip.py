@@ -22,6 +22,7 @@ from uitk.widgets.sequencer._data import (
     HATCH_DENSE,
 )
 from uitk.widgets.sequencer._keyframe import KeyframeItem
+from uitk.widgets.sequencer._waveform import WaveformPyramid
 from uitk.widgets.sequencer._drag_tooltip import FrameTooltip
 from uitk.widgets.sequencer._draggable import DraggableItemMixin
 
@@ -38,9 +39,14 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
         self._drag_origin_start = 0.0
         self._drag_origin_duration = 0.0
         self._drag_peers: list = []  # [(ClipItem, original_start), ...]
+        self._undo_merge_key = None  # per-drag token: one undo step per drag
         self._drag_tooltip = FrameTooltip()
         self._waveform_pixmap: Optional[QtGui.QPixmap] = None
         self._waveform_pixmap_size: Optional[tuple] = None
+        # (envelope, WaveformPyramid) — reduced once per envelope object.
+        self._waveform_pyramid: Optional[tuple] = None
+        # (segments, key, path) — see _curve_path
+        self._curve_path_cache: Optional[tuple] = None
         self._keyframe_items: list = []  # KeyframeItem children for sub-rows
         self._keys_dragging = False  # True while any child KeyframeItem is mid-drag
         self.setAcceptHoverEvents(True)
@@ -407,10 +413,12 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
         """Render a waveform envelope inside the clip rectangle.
 
         The waveform is pre-rendered to a QPixmap and cached.  The cache
-        is invalidated when the clip width changes (zoom/resize).
+        is invalidated when the clip width changes (zoom/resize) or the
+        envelope object is replaced; only then is the clip's
+        :class:`WaveformPyramid` read, so a re-render costs O(width)
+        however long the audio is and a cached repaint costs nothing.
         """
-        n_bins = len(waveform)
-        if n_bins == 0:
+        if not len(waveform):
             return
 
         w = int(rect.width() - 2)
@@ -419,9 +427,20 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
             return
 
         size_key = (w, h)
-        if self._waveform_pixmap is None or self._waveform_pixmap_size != size_key:
+        cached = self._waveform_pyramid
+        if (
+            self._waveform_pixmap is None
+            or self._waveform_pixmap_size != size_key
+            or cached is None
+            or cached[0] is not waveform
+        ):
+            if cached is None or cached[0] is not waveform:
+                cached = self._waveform_pyramid = (
+                    waveform,
+                    WaveformPyramid.of(waveform),
+                )
             self._waveform_pixmap = self._render_waveform_pixmap(
-                waveform, w, h, base_color
+                cached[1], w, h, base_color
             )
             self._waveform_pixmap_size = size_key
 
@@ -431,29 +450,11 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
         )
 
     @staticmethod
-    def _render_waveform_pixmap(waveform, w, h, base_color):
+    def _render_waveform_pixmap(pyramid, w, h, base_color):
         """Pre-render waveform lines into a transparent QPixmap."""
-        pixmap = QtGui.QPixmap(w, h)
-        pixmap.fill(QtCore.Qt.transparent)
-
-        n_bins = len(waveform)
-        cy = h / 2.0
-
         wave_color = base_color.lighter(170)
         wave_color.setAlpha(200)
-
-        p = QtGui.QPainter(pixmap)
-        p.setPen(QtGui.QPen(wave_color, 1))
-
-        for col in range(w):
-            idx = min(int(col * n_bins / w), n_bins - 1)
-            lo, hi = waveform[idx]
-            y_top = cy - hi * (h / 2)
-            y_bot = cy - lo * (h / 2)
-            p.drawLine(QtCore.QPointF(col, y_top), QtCore.QPointF(col, y_bot))
-
-        p.end()
-        return pixmap
+        return pyramid.render(w, h, wave_color)
 
     def _paint_curve_preview(self, painter, rect, preview, color, fg):
         """Draw a normalised mini graph-editor view inside a sub-row clip.
@@ -517,15 +518,8 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
             map_start = self._data.start
             map_dur = self._data.duration
 
-        def map_x(t):
-            if map_dur > 1e-6:
-                frac = (t - map_start) / map_dur
-            else:
-                frac = 0.5
-            return rect.x() + frac * rect.width()
-
-        map_y, _is_flat = CurveUtils.make_value_mapper(
-            rect.top(), rect.height(), val_min, val_max
+        path = self._curve_path(
+            segments, map_start, map_dur, rect.width(), rect.height(), val_min, val_max
         )
 
         # --- draw curve path (clipped to paint_rect so dragged curves remain visible) ---
@@ -538,11 +532,40 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
         painter.setPen(QtGui.QPen(curve_color, 1.2))
         painter.setBrush(QtCore.Qt.NoBrush)
 
-        painter.drawPath(CurveUtils.build_curve_path(segments, map_x, map_y))
+        painter.translate(rect.topLeft())
+        painter.drawPath(path)
 
         painter.restore()
         # Key dots are rendered by KeyframeItem children (un-cropped).
 
+    def _curve_path(
+        self, segments, map_start, map_dur, width, height, val_min, val_max
+    ):
+        """The curve-preview path in clip-local coordinates (origin at the
+        rect's top-left), cached across paints.
+
+        Hover, selection and playhead repaints reuse the path; it is rebuilt
+        when the segments list is replaced (a new preview, or keys dragged
+        live), the value range changes, or the time mapping or clip size
+        does (zoom, resize, move).
+        """
+        key = (map_start, map_dur, width, height, val_min, val_max)
+        cached = self._curve_path_cache
+        if cached is not None and cached[0] is segments and cached[1] == key:
+            return cached[2]
+
+        def map_x(t):
+            if map_dur > 1e-6:
+                frac = (t - map_start) / map_dur
+            else:
+                frac = 0.5
+            return frac * width
+
+        map_y, _is_flat = CurveUtils.make_value_mapper(0.0, height, val_min, val_max)
+        path = CurveUtils.build_curve_path(segments, map_x, map_y)
+        self._curve_path_cache = (segments, key, path)
+        return path
+
     # -- hover cursor -------------------------------------------------------
     def hoverMoveEvent(self, event):
         if self._data.locked or self._data.sub_row:
@@ -588,10 +611,12 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
                         item._drag_mode = "move"
                         item._drag_origin_start = item._data.start
                         item._drag_origin_duration = item._data.duration
-            # Undo snapshot is captured lazily on the first real move —
-            # capturing on press meant every selection click pushed a
-            # no-op undo entry and wiped the redo stack.
+            # Undo is captured lazily on the first real move — capturing
+            # on press meant every selection click pushed a no-op undo
+            # entry and wiped the redo stack.  Every move of this drag
+            # merges into that one step (see _capture_undo).
             self._undo_captured = False
+            self._undo_merge_key = object()
             self.setCursor(QtCore.Qt.ClosedHandCursor)
             self.update()  # repaint to show drag frame labels
             self._show_clip_drag_tooltip(event.scenePos())
@@ -603,9 +628,11 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
         if self._drag_mode is None:
             return super().mouseMoveEvent(event)
 
-        if not getattr(self, "_undo_captured", False):
-            self._undo_captured = True
-            self._timeline.parent_sequencer._capture_undo()
+        self._undo_captured = True
+        sq = self._timeline.parent_sequencer
+        clip_ids = [self._data.clip_id] + [p._data.clip_id for p, _ in self._drag_peers]
+        sq._capture_undo(clip_ids, merge_key=self._undo_merge_key)
+        sq._touch_keys(clip_ids)
 
         tl = self._timeline
         dx_time = tl.x_to_time(event.scenePos().x()) - tl.x_to_time(self._drag_origin_x)
@@ -652,6 +679,9 @@ class ClipItem(DraggableItemMixin, QtWidgets.QGraphicsRectItem):
     def _restore_drag_state(self) -> None:
         self._data.start = self._drag_origin_start
         self._data.duration = self._drag_origin_duration
+        self._timeline.parent_sequencer._touch_keys(
+            [self._data.clip_id] + [peer._data.clip_id for peer, _ in self._drag_peers]
+        )
         for peer, origin_start in self._drag_peers:
             peer._data.start = origin_start
             peer._drag_mode = None
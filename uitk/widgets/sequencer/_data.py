@@ -2,6 +2,8 @@
 # coding=utf-8
 """Data models and shared constants for the sequencer widget."""
 
+import bisect
+import itertools
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
@@ -67,7 +69,7 @@ class TrackData:
     name: str
     color: Optional[str] = None
     text_color: Optional[str] = None
-    clips: List[int] = field(default_factory=list)
+    clips: Dict[int, ClipData] = field(default_factory=dict)  # by id, add order
     pattern: Optional[PatternSpec] = None
     # Header-label presentation, stored so label rebuilds (e.g. after
     # remove_track) re-apply the full style instead of degrading every
@@ -224,6 +226,224 @@ class CurveUtils:
         return path
 
 
+# ---------------------------------------------------------------------------
+#  Row layout — prefix-summed index of track rows and expanded sub-rows
+# ---------------------------------------------------------------------------
+class RowLayout:
+    """Vertical layout of every visual row, built once per layout change.
+
+    Row tops are a running (prefix) sum of ``height + _TRACK_PADDING``, so
+    a track or sub-row resolves to its ``(y, height)`` through a dict and
+    the row under a y coordinate through ``bisect``.  Offsets are relative
+    to the first row; callers add the widget's ``_content_top``.
+
+    Attributes:
+        rows: ``[(track, sub_name_or_None, y, height), ...]`` in paint order.
+        tops: ``y`` of each entry in :attr:`rows` (ascending, for bisect).
+        spans: ``track_id -> (track_index, first_row, end_row)``.
+        sub_rows: ``(track_id, sub_name) -> row index``.
+        total: Height of all rows including trailing padding.
+        revision: Unique per built layout, so caches keyed on it (e.g. the
+            timeline's background tiles) miss once rows move.  Tracks
+            appended in place keep the revision; they only add rows below.
+    """
+
+    __slots__ = (
+        "rows", "tops", "spans", "sub_rows", "total", "sub_row_height", "revision"
+    )
+    _revisions = itertools.count()
+
+    def __init__(self, tracks, expanded: Dict[int, List[str]], sub_row_height: int):
+        self.revision = next(RowLayout._revisions)
+        self.rows: List[tuple] = []
+        self.tops: List[float] = []
+        self.spans: Dict[int, tuple] = {}
+        self.sub_rows: Dict[tuple, int] = {}
+        self.total = 0.0
+        self.sub_row_height = sub_row_height
+        for td in tracks:
+            self.append_track(td, expanded.get(td.track_id, ()))
+
+    def _append_row(self, td, sub_name, height) -> None:
+        self.rows.append((td, sub_name, self.total, height))
+        self.tops.append(self.total)
+        self.total += height + _TRACK_PADDING
+
+    def append_track(self, td, sub_names=()) -> None:
+        """Add *td* (and its expanded *sub_names*) below the last row."""
+        first = len(self.rows)
+        self._append_row(td, None, _TRACK_HEIGHT)
+        for sr in sub_names:
+            # Duplicate names resolve to the first row, as a linear scan would.
+            self.sub_rows.setdefault((td.track_id, sr), len(self.rows))
+            self._append_row(td, sr, self.sub_row_height)
+        self.spans[td.track_id] = (len(self.spans), first, len(self.rows))
+
+    def position(self, track_id: int, sub_row: str = "") -> tuple:
+        """``(y, height)`` of a track's main row or one of its sub-rows.
+
+        A sub-row that isn't expanded resolves to just below the track's
+        last row; an unknown track to just below the last row overall.
+        """
+        span = self.spans.get(track_id)
+        if span is None:
+            return self.total, _TRACK_HEIGHT
+        if sub_row:
+            idx = self.sub_rows.get((track_id, sub_row))
+            if idx is None:
+                _td, _sr, y, h = self.rows[span[2] - 1]
+                return y + h + _TRACK_PADDING, self.sub_row_height
+        else:
+            idx = span[1]
+        _td, _sr, y, h = self.rows[idx]
+        return y, h
+
+    def row_at(self, y: float) -> Optional[int]:
+        """Index into :attr:`rows` of the row whose band contains *y*, or None.
+
+        A row's band includes the padding below it.
+        """
+        if y < 0 or y >= self.total:
+            return None
+        return bisect.bisect_right(self.tops, y) - 1
+
+    def rows_between(self, y0: float, y1: float) -> range:
+        """Indices into :attr:`rows` of the rows whose bands overlap ``[y0, y1)``."""
+        if y1 <= 0 or y0 >= self.total or y1 <= y0:
+            return range(0)
+        start = max(0, bisect.bisect_right(self.tops, y0) - 1)
+        return range(start, bisect.bisect_left(self.tops, y1))
+
+
+# ---------------------------------------------------------------------------
+#  Clip intervals — one track's clips sorted by start, for range queries
+# ---------------------------------------------------------------------------
+class ClipIntervals:
+    """One track's clips sorted by start time.
+
+    Clips overlapping ``[start, end)`` are found by bisecting to the
+    first clip that could still reach *start* — ``start - max_duration``
+    — and scanning only up to *end*, so a range query costs
+    O(log n + clips in or near the range) and adding or removing a clip
+    O(log n) plus a list insert.
+
+    Attributes:
+        entries: ``[(start, clip_id), ...]`` ascending.
+        starts: ``clip_id -> start`` as indexed (to find its entry again).
+        max_duration: Upper bound on any indexed clip's duration; it only
+            resets once the track is empty.
+    """
+
+    __slots__ = ("entries", "starts", "max_duration")
+
+    def __init__(self) -> None:
+        self.entries: List[tuple] = []
+        self.starts: Dict[int, float] = {}
+        self.max_duration = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, cd: ClipData) -> None:
+        """Index *cd* at its current start (re-indexes it if present)."""
+        self.discard(cd.clip_id)
+        bisect.insort(self.entries, (cd.start, cd.clip_id))
+        self.starts[cd.clip_id] = cd.start
+        if cd.duration > self.max_duration:
+            self.max_duration = cd.duration
+
+    def update(self, cd: ClipData) -> None:
+        """Re-index *cd* after a move or resize (cheap when its start held)."""
+        if self.starts.get(cd.clip_id) != cd.start:
+            self.add(cd)
+        elif cd.duration > self.max_duration:
+            self.max_duration = cd.duration
+
+    def discard(self, clip_id: int) -> None:
+        start = self.starts.pop(clip_id, None)
+        if start is None:
+            return
+        entries = self.entries
+        del entries[bisect.bisect_left(entries, (start, clip_id))]
+        if not entries:
+            self.max_duration = 0.0
+
+    def overlapping(self, clips: Dict[int, ClipData], start: float, end: float):
+        """Ids of clips intersecting ``[start, end)``, in start order.
+
+        A zero-duration clip counts when its time lies in the range.
+        """
+        entries = self.entries
+        lo = bisect.bisect_left(entries, (start - self.max_duration,))
+        hi = bisect.bisect_left(entries, (end,))
+        found = []
+        for _s, cid in entries[lo:hi]:
+            cd = clips[cid]
+            if cd.start + cd.duration > start or cd.start >= start:
+                found.append(cid)
+        return found
+
+
+# ---------------------------------------------------------------------------
+#  Key-time index — sorted navigation stops for next/prev key
+# ---------------------------------------------------------------------------
+class KeyTimeIndex:
+    """Sorted, reference-counted key times contributed by owners.
+
+    Each owner (a clip or a marker) contributes a set of times; a time
+    stays in :attr:`times` while any owner contributes it.  Replacing an
+    owner's contribution costs O(k log n) for its k times, so the index is
+    updated incrementally instead of re-sorted per query, and next/prev
+    lookups are a single ``bisect``.
+
+    Attributes:
+        times: Sorted unique times (ascending).
+    """
+
+    __slots__ = ("times", "_counts", "_owners")
+
+    def __init__(self) -> None:
+        self.times: List[float] = []
+        self._counts: Dict[float, int] = {}
+        self._owners: Dict[Any, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def set(self, owner: Any, times) -> None:
+        """Replace *owner*'s contribution with *times* (empty removes it)."""
+        new = tuple(set(times))
+        old = self._owners.pop(owner, ())
+        if new:
+            self._owners[owner] = new
+        for t in old:
+            count = self._counts[t] - 1
+            if count:
+                self._counts[t] = count
+            else:
+                del self._counts[t]
+                del self.times[bisect.bisect_left(self.times, t)]
+        for t in new:
+            count = self._counts.get(t, 0)
+            if not count:
+                bisect.insort(self.times, t)
+            self._counts[t] = count + 1
+
+    def discard(self, owner: Any) -> None:
+        """Remove *owner*'s contribution, if any."""
+        self.set(owner, ())
+
+    def next_after(self, t: float, tolerance: float = 0.0) -> Optional[float]:
+        """The first time greater than ``t + tolerance``, or None."""
+        i = bisect.bisect_right(self.times, t + tolerance)
+        return self.times[i] if i < len(self.times) else None
+
+    def prev_before(self, t: float, tolerance: float = 0.0) -> Optional[float]:
+        """The last time less than ``t - tolerance``, or None."""
+        i = bisect.bisect_left(self.times, t - tolerance)
+        return self.times[i - 1] if i else None
+
+
 _DEFAULT_ATTRIBUTE_COLORS = {
     "translateX": "#E06666",
     "translateY": "#6AA84F",
@@ -345,10 +565,11 @@ class PatternRegistry:
         painter: QtGui.QPainter,
         rect: QtCore.QRectF,
         spec: PatternSpec,
+        origin: Optional[QtCore.QPointF] = None,
     ) -> None:
-        """Fill ``rect`` with ``spec``; tile is anchored to ``rect.topLeft()``."""
+        """Fill ``rect`` with ``spec``; tile is anchored to *origin* (default ``rect.topLeft()``)."""
         prev_origin = painter.brushOrigin()
-        painter.setBrushOrigin(rect.topLeft().toPoint())
+        painter.setBrushOrigin((origin or rect.topLeft()).toPoint())
         try:
             painter.fillRect(rect, spec.brush())
         finally:
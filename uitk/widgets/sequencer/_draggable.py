@@ -16,11 +16,11 @@ class DraggableItemMixin:
     """Standard Escape-to-cancel support for QGraphicsItems.
 
     Subclasses override :meth:`_is_drag_active` and :meth:`_restore_drag_state`.
-    Items that push an undo snapshot do so lazily on the first real
-    mouse move and record it in the instance flag ``_undo_captured`` —
-    ``_cancel_active_drag`` pops the snapshot only when that flag is
-    set (a press-without-move never captures, so a plain click can't
-    burn an undo step or wipe the redo stack).
+    Items that push an undo step do so lazily on the first real mouse
+    move and record it in the instance flag ``_undo_captured`` —
+    ``_cancel_active_drag`` pops the step only when that flag is set (a
+    press-without-move never captures, so a plain click can't burn an
+    undo step or wipe the redo stack).
     """
 
     _undo_captured: bool = False
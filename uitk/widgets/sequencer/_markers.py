@@ -194,6 +194,7 @@ class MarkerItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
             0.0, DraggableItemMixin.snap_time(self._drag_origin_time + dx_time, tl)
         )
         self._data.time = new_time
+        tl.parent_sequencer._touch_keys(marker_ids=(self._data.marker_id,))
         self.sync()
         self.update()
         outside = self._cursor_outside_window()
@@ -208,6 +209,7 @@ class MarkerItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
 
     def _restore_drag_state(self) -> None:
         self._data.time = self._drag_origin_time
+        self._timeline.parent_sequencer._touch_keys(marker_ids=(self._data.marker_id,))
         self._drag_active = False
         self.sync()
         self.unsetCursor()
@@ -341,6 +343,7 @@ class MarkerItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
             new_time = self._data.time
         if abs(new_time - self._data.time) > 1e-6:
             self._data.time = max(0.0, new_time)
+            widget._touch_keys(marker_ids=(self._data.marker_id,))
             self.sync()
             self.update()
             widget.marker_moved.emit(self._data.marker_id, self._data.time)
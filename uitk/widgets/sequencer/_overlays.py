@@ -214,7 +214,7 @@ class _GapOverlayItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
         self._drag_origin_end = self._end
         sq = self._timeline.parent_sequencer
         sq.shift_held_at_press = bool(event.modifiers() & QtCore.Qt.ShiftModifier)
-        # Undo snapshot is captured lazily on the first real move — a
+        # Undo step is captured lazily on the first real move — a
         # plain click must not burn an undo step or wipe redo.
         self._undo_captured = False
         self._show_gap_drag_tooltip(event.scenePos())
@@ -226,7 +226,7 @@ class _GapOverlayItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
             return
         if not self._undo_captured:
             self._undo_captured = True
-            self._timeline.parent_sequencer._capture_undo()
+            self._timeline.parent_sequencer._capture_undo(())
         dx = event.scenePos().x() - self._drag_origin_x
         ppu = self._timeline._pixels_per_unit
         dt = dx / ppu if ppu else 0
@@ -259,6 +259,7 @@ class _GapOverlayItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
             self._end = new_start + span
             self._update_tooltip()
             self.update()
+        self._timeline.parent_sequencer._touch_gaps((self,))
         self._update_gap_drag_tooltip(event.scenePos())
         event.accept()
 
@@ -287,6 +288,7 @@ class _GapOverlayItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
         self.prepareGeometryChange()
         self._start = self._drag_origin_start
         self._end = self._drag_origin_end
+        self._timeline.parent_sequencer._touch_gaps((self,))
         if self._drag_mode == "move":
             self.setCursor(QtCore.Qt.OpenHandCursor)
         self._drag_mode = None
@@ -553,7 +555,7 @@ class RangeHighlightItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
         self._drag_origin_end = self._end
         sq = self._timeline.parent_sequencer
         sq.shift_held_at_press = bool(event.modifiers() & QtCore.Qt.ShiftModifier)
-        # Undo snapshot is captured lazily on the first real move — a
+        # Undo step is captured lazily on the first real move — a
         # plain click must not burn an undo step or wipe redo.
         self._undo_captured = False
         if self._drag_mode == "move":
@@ -567,7 +569,7 @@ class RangeHighlightItem(DraggableItemMixin, QtWidgets.QGraphicsItem):
             return
         if not self._undo_captured:
             self._undo_captured = True
-            self._timeline.parent_sequencer._capture_undo()
+            self._timeline.parent_sequencer._capture_undo(())
         dx = event.scenePos().x() - self._drag_origin_x
         dt = (
             dx / self._timeline._pixels_per_unit
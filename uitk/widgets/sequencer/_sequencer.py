@@ -14,8 +14,9 @@ Example
 >>> w.add_clip(t, start=100, duration=50, label="Fade In/Out")
 >>> w.show()
 """
+from collections import deque
 from contextlib import contextmanager
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional
 
 from qtpy import QtWidgets, QtGui, QtCore
 
@@ -31,9 +32,10 @@ from uitk.widgets.sequencer._data import (
     ClipData,
     TrackData,
     MarkerData,
-    _TRACK_HEIGHT,
+    RowLayout,
+    KeyTimeIndex,
+    ClipIntervals,
     _SUB_ROW_HEIGHT,
-    _TRACK_PADDING,
     _RULER_HEIGHT,
     _DEFAULT_ATTRIBUTE_COLORS,
     _COMMON_ATTRIBUTES,
@@ -47,6 +49,7 @@ from uitk.widgets.sequencer._overlays import (
 )
 from uitk.widgets.sequencer._markers import MarkerItem
 from uitk.widgets.sequencer._timeline import TrackHeaderWidget, TimelineView
+from uitk.widgets.sequencer._undo import ClipEdit, merge_target
 
 
 # ---------------------------------------------------------------------------
@@ -221,9 +224,11 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         self._next_track_id = 0
         self._next_clip_id = 0
         self._snap_interval: float = 1.0  # 1 = per-frame snap (default)
-        self._undo_stack: List[Dict[int, tuple]] = []  # (start, duration) per clip_id
-        self._redo_stack: List[Dict[int, tuple]] = []
+        # Delta steps (see _undo.py); oldest dropped past _max_undo.
+        self._undo_stack: Deque[ClipEdit] = deque()
+        self._redo_stack: Deque[ClipEdit] = deque()
         self._max_undo = 50
+        self._undo_recording: Optional[ClipEdit] = None  # open undoable() step
         self._markers: Dict[int, MarkerData] = {}
         self._marker_items: Dict[int, MarkerItem] = {}
         self._next_marker_id = 0
@@ -231,6 +236,22 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         self._expanded_tracks: Dict[int, List[str]] = {}  # track_id â†’ sub-row names
         self._bulk_depth: int = 0  # >0 inside bulk_updates() — defer scene-rect
         self._sub_row_height: int = _SUB_ROW_HEIGHT
+        # Cached row layout; None after a change that moves rows
+        # (see _invalidate_rows), rebuilt on the next lookup.
+        self._row_layout: Optional[RowLayout] = None
+        # Sorted next/prev-key stops.  Edits mark clips/markers dirty
+        # (see _touch_keys); the next lookup re-indexes just those.
+        self._key_index = KeyTimeIndex()
+        self._keys_dirty: set = set()
+        # track_id → TrackData, and each track's clips sorted by start for
+        # range queries; touched clips are re-sorted on the next query.
+        self._tracks_by_id: Dict[int, TrackData] = {}
+        self._track_intervals: Dict[int, ClipIntervals] = {}
+        self._intervals_dirty: set = set()
+        # Right edges of clips, markers and gap overlays for the scene
+        # rect; touched owners are re-indexed by the next _content_end().
+        self._extent_index = KeyTimeIndex()
+        self._extents_dirty: set = set()
         self._sub_row_provider = None  # callable(track_id, track_name) â†’ [(sub_name, [(start,dur,label,color), ...]), ...]
         self._range_highlight: Optional[RangeHighlightItem] = None
         self._range_overlays: List[QtWidgets.QGraphicsItem] = []
@@ -570,6 +591,10 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
             italic=italic,
         )
         self._tracks.append(td)
+        self._tracks_by_id[tid] = td
+        self._track_intervals[tid] = ClipIntervals()
+        if self._row_layout is not None:
+            self._row_layout.append_track(td)  # rows above are unchanged
         self._header.add_track_label(
             name,
             icon=icon,
@@ -586,10 +611,10 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
     def bulk_updates(self):
         """Suppress per-add scene-rect recomputation during a rebuild.
 
-        ``_update_scene_rect`` walks every clip, marker, and gap overlay;
-        calling it once per ``add_clip``/``add_track`` makes a full
-        rebuild O(n²).  Wrap the rebuild in this context manager and one
-        recompute runs on exit::
+        ``_update_scene_rect`` resizes the scene, its scrollbars, the
+        ruler and the header; doing that once per ``add_clip``/``add_track``
+        makes a rebuild pay for every intermediate extent.  Wrap the
+        rebuild in this context manager and one recompute runs on exit::
 
             with widget.bulk_updates():
                 widget.clear()
@@ -639,33 +664,60 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
             sub_row=sub_row,
             data=data,
         )
-        self._clips[cid] = cd
+        self._insert_clip(cd, require_track=False)
+        if self._undo_recording is not None:
+            self._undo_recording.record_added(cid)
+        return cid
 
-        # register on track
-        for td in self._tracks:
-            if td.track_id == track_id:
-                td.clips.append(cid)
-                break
+    def _insert_clip(self, cd: ClipData, require_track: bool = True) -> bool:
+        """Register *cd* under its own id, on its track, with a scene item.
+
+        Shared by :meth:`add_clip` and undo/redo re-inserting a removed
+        clip; the latter passes ``require_track`` so a clip whose track is
+        gone is not resurrected.  Returns False when nothing was inserted.
+        """
+        td = self.get_track(cd.track_id)
+        if td is None and require_track:
+            return False
+        self._clips[cd.clip_id] = cd
+        if td is not None:
+            td.clips[cd.clip_id] = cd
+            self._track_intervals[td.track_id].add(cd)
 
         # create visual item
         item = ClipItem(cd, self._timeline)
-        self._clip_items[cid] = item
+        self._clip_items[cd.clip_id] = item
         self._timeline._scene.addItem(item)
+        # Intervals were updated above; keys and extent are indexed lazily.
+        self._keys_dirty.add(cd.clip_id)
+        self._extents_dirty.add(cd.clip_id)
         if not self._bulk_depth:
             self._timeline._update_scene_rect()
-        return cid
+        return True
 
     def remove_clip(self, clip_id: int):
         """Remove a clip by id."""
         if clip_id not in self._clips:
             return
-        cd = self._clips.pop(clip_id)
+        if self._undo_recording is not None:
+            self._undo_recording.record_removed(self._clips[clip_id])
+        self._detach_clip(clip_id)
+
+    def _detach_clip(self, clip_id: int) -> Optional[ClipData]:
+        """Drop a clip's record, scene item, and track registration."""
+        cd = self._clips.pop(clip_id, None)
+        if cd is None:
+            return None
         item = self._clip_items.pop(clip_id, None)
         if item and item.scene():
             item.scene().removeItem(item)
-        for td in self._tracks:
-            if cd.clip_id in td.clips:
-                td.clips.remove(cd.clip_id)
+        td = self._tracks_by_id.get(cd.track_id)
+        if td is not None:
+            td.clips.pop(clip_id, None)
+            self._track_intervals[td.track_id].discard(clip_id)
+        self._keys_dirty.add(clip_id)
+        self._extents_dirty.add(clip_id)
+        return cd
 
     def set_clip_label(self, clip_id: int, label: str):
         """Set the display label for a clip."""
@@ -693,27 +745,42 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
                 item.setSelected(False)
             item.update()
 
+    def touch_clips(self, clip_ids: Iterable[int]) -> None:
+        """Pick up in-place edits to the given clips' records.
+
+        Call after changing ``start``, ``duration``, ``keyframe_times`` or
+        ``curve_preview`` directly on a :class:`ClipData` from
+        :meth:`get_clip` or :meth:`clips`.  Key navigation,
+        :meth:`clips_in_range` and the scene extent re-index just these
+        clips, and their items re-sync to the new geometry.  Inside
+        :meth:`bulk_updates` the scene rect is updated once, on exit.
+        """
+        clip_ids = [cid for cid in clip_ids if cid in self._clips]
+        if not clip_ids:
+            return
+        self._touch_keys(clip_ids)
+        for cid in clip_ids:
+            item = self._clip_items.get(cid)
+            if item:
+                item._sync_geometry()
+                item.update()
+        if not self._bulk_depth:
+            self._timeline._update_scene_rect()
+
     def remove_track(self, track_id: int):
         """Remove a track and all its clips."""
-        td = None
-        for i, t in enumerate(self._tracks):
-            if t.track_id == track_id:
-                td = t
-                self._tracks.pop(i)
-                break
+        td = self._tracks_by_id.get(track_id)
         if td is None:
             return
+        idx = self._tracks.index(td)
+        self._tracks.remove(td)
         self._expanded_tracks.pop(track_id, None)
+        self._invalidate_rows()
+        # Sub-row clips are registered on their track too.
         for cid in list(td.clips):
             self.remove_clip(cid)
-        # Also remove sub-row clips
-        sub_cids = [
-            cid
-            for cid, cd in self._clips.items()
-            if cd.track_id == track_id and cd.sub_row
-        ]
-        for cid in sub_cids:
-            self.remove_clip(cid)
+        del self._tracks_by_id[track_id]
+        del self._track_intervals[track_id]
         # Drop this track's background curve previews (mirrors
         # collapse_track) — stale entries keyed to a recycled track_id
         # would paint another object's curve across the wrong row.
@@ -737,7 +804,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
             sub_names = self._expanded_tracks.get(t.track_id)
             if sub_names:
                 self._header.set_track_expanded(i, sub_names, self._sub_row_height)
-        self._timeline._refresh_all()
+        self._timeline._refresh_rows(idx)  # rows above are unchanged
 
     def get_clip(self, clip_id: int) -> Optional[ClipData]:
         """Return the data for a clip, or None."""
@@ -745,10 +812,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
 
     def get_track(self, track_id: int) -> Optional[TrackData]:
         """Return the data for a track, or None."""
-        for td in self._tracks:
-            if td.track_id == track_id:
-                return td
-        return None
+        return self._tracks_by_id.get(track_id)
 
     def tracks(self) -> List[TrackData]:
         """Return a list of all track data."""
@@ -758,8 +822,45 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         """Return clip data, optionally filtered by track."""
         if track_id is None:
             return list(self._clips.values())
+        td = self._tracks_by_id.get(track_id)
+        if td is not None:
+            return list(td.clips.values())
+        # Clips added to a track id that doesn't exist (yet) aren't indexed.
         return [cd for cd in self._clips.values() if cd.track_id == track_id]
 
+    def clips_in_range(
+        self, start: float, end: float, track_id: Optional[int] = None
+    ) -> List[ClipData]:
+        """Return clips intersecting ``[start, end)``, optionally on one track.
+
+        Results are in start order per track.  A zero-duration clip
+        counts when its time lies in the range.
+        """
+        self._flush_intervals()
+        if track_id is None:
+            track_ids = self._track_intervals
+        elif track_id in self._track_intervals:
+            track_ids = (track_id,)
+        else:
+            return []
+        clips = self._clips
+        return [
+            clips[cid]
+            for tid in track_ids
+            for cid in self._track_intervals[tid].overlapping(clips, start, end)
+        ]
+
+    def _flush_intervals(self) -> None:
+        """Re-sort clips touched since the last range query."""
+        # Iterate then clear(): after a bulk add, pop() on the drained set
+        # rescans its oversized table on every later flush.
+        dirty = self._intervals_dirty
+        for cid in dirty:
+            cd = self._clips.get(cid)
+            if cd is not None and cd.track_id in self._track_intervals:
+                self._track_intervals[cd.track_id].update(cd)
+        dirty.clear()
+
     def swap_clips(self, clip_id_a: int, clip_id_b: int) -> None:
         """Swap the timeline positions of two clips and emit ``clips_reordered``.
 
@@ -784,10 +885,11 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         new_b_start = a.start
         new_a_start = a.start + b.duration + gap
 
-        self._capture_undo()
+        self._capture_undo((a.clip_id, b.clip_id))
 
         a.start = new_a_start
         b.start = new_b_start
+        self._touch_keys((a.clip_id, b.clip_id))
 
         # Refresh visual items
         for cid in (a.clip_id, b.clip_id):
@@ -845,6 +947,14 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         self._clips.clear()
         self._tracks.clear()
         self._expanded_tracks.clear()
+        self._invalidate_rows()
+        self._key_index = KeyTimeIndex()
+        self._keys_dirty.clear()
+        self._tracks_by_id.clear()
+        self._track_intervals.clear()
+        self._intervals_dirty.clear()
+        self._extent_index = KeyTimeIndex()
+        self._extents_dirty.clear()
         # Background curve previews are keyed by (track_id, sub_row);
         # with _next_track_id reset below, a stale entry would attach to
         # whatever track recycles that id and paint the wrong curve.
@@ -903,6 +1013,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
             opacity=opacity,
         )
         self._markers[mid] = md
+        self._touch_keys(marker_ids=(mid,))
         item = MarkerItem(md, self._timeline)
         self._marker_items[mid] = item
         self._timeline._scene.addItem(item)
@@ -926,6 +1037,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         """
         existed = marker_id in self._markers
         self._markers.pop(marker_id, None)
+        self._touch_keys(marker_ids=(marker_id,))
         item = self._marker_items.pop(marker_id, None)
         if item and item.scene():
             item.scene().removeItem(item)
@@ -942,6 +1054,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
 
     def clear_markers(self):
         """Remove all markers."""
+        self._touch_keys(marker_ids=list(self._markers))
         for mid in list(self._markers):
             item = self._marker_items.pop(mid, None)
             if item and item.scene():
@@ -1021,12 +1134,15 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         item.setVisible(self._show_gap_overlays)
         self._timeline._scene.addItem(item)
         self._gap_overlays.append(item)
+        self._extents_dirty.add(item)
 
     def clear_gap_overlays(self):
         """Remove all gap overlays."""
         for item in self._gap_overlays:
             if item.scene():
                 item.scene().removeItem(item)
+            self._extent_index.discard(item)
+            self._extents_dirty.discard(item)
         self._gap_overlays.clear()
 
     def set_all_gap_overlays_locked(self, locked: bool):
@@ -1117,48 +1233,103 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         step = self._snap_interval if self._snap_interval > 0 else 1.0
         self._move_playhead(max(0.0, self._timeline._scene.playhead.time - step))
 
+    def _clip_key_times(self, cd: ClipData) -> list:
+        """Navigation stops contributed by one clip.
+
+        Its boundaries, plus individual keyframe times when it is a
+        sub-row clip of an expanded track.
+        """
+        times = [cd.start]
+        if cd.duration > 0:
+            times.append(cd.end)
+        # Keys arrive either as legacy "keyframe_times" or inside a
+        # "curve_preview" dict (the form real consumers supply) —
+        # without the latter, next/prev-key navigation skips every
+        # visible key dot and only lands on clip boundaries.
+        if cd.sub_row and cd.track_id in self._expanded_tracks:
+            kf = cd.data.get("keyframe_times")
+            if not kf:
+                preview = cd.data.get("curve_preview") or {}
+                kf = preview.get("keys") or []
+            for entry in kf:
+                times.append(entry[0] if isinstance(entry, (list, tuple)) else entry)
+        return times
+
+    def _touch_keys(self, clip_ids: Iterable[int] = (), marker_ids: Iterable[int] = ()):
+        """Mark clips / markers whose key times may have changed.
+
+        Call after moving, resizing, adding or removing one (consumers
+        editing a record in place use :meth:`touch_clips`); the next
+        key lookup, :meth:`clips_in_range` or scene-rect update re-indexes
+        only what was touched.
+        """
+        clip_ids = tuple(clip_ids)
+        marker_ids = tuple(("marker", mid) for mid in marker_ids)
+        self._keys_dirty.update(clip_ids, marker_ids)
+        self._intervals_dirty.update(clip_ids)
+        self._extents_dirty.update(clip_ids, marker_ids)
+
+    def _touch_gaps(self, items: Iterable[QtWidgets.QGraphicsItem]) -> None:
+        """Mark gap overlays whose end moved, for the next scene-rect update."""
+        self._extents_dirty.update(items)
+
+    def _content_end(self) -> float:
+        """The latest clip end, marker, gap-overlay or range-highlight end.
+
+        Reads the sorted extent index after re-indexing touched owners, so
+        it costs O(touched) instead of a walk over every item.  Returns 0.0
+        for an empty timeline.
+        """
+        index = self._extent_index
+        dirty = self._extents_dirty
+        for owner in dirty:
+            if isinstance(owner, tuple):
+                md = self._markers.get(owner[1])
+                index.set(owner, () if md is None else (md.time,))
+            elif isinstance(owner, int):
+                cd = self._clips.get(owner)
+                index.set(owner, () if cd is None else (cd.end,))
+            else:  # a live gap overlay; cleared ones are discarded directly
+                index.set(owner, (owner._end,))
+        dirty.clear()  # see _flush_intervals
+        end = index.times[-1] if index.times else 0.0
+        if self._range_highlight is not None:
+            end = max(end, self._range_highlight.end)
+        return end
+
+    def _keys(self) -> KeyTimeIndex:
+        """The key-time index, with touched clips and markers re-indexed."""
+        index = self._key_index
+        dirty = self._keys_dirty
+        for owner in dirty:
+            if isinstance(owner, tuple):
+                md = self._markers.get(owner[1])
+                index.set(owner, () if md is None else (md.time,))
+            else:
+                cd = self._clips.get(owner)
+                index.set(owner, () if cd is None else self._clip_key_times(cd))
+        dirty.clear()  # see _flush_intervals
+        return index
+
     def _key_times(self) -> list:
-        """Return sorted unique visible key times.
+        """Return sorted unique navigation stops.
 
-        Includes clip boundaries for all clips and individual keyframe
-        times from expanded sub-row clips.
+        Includes clip boundaries for all clips, individual keyframe
+        times from expanded sub-row clips, and marker times.
         """
-        times: set = set()
-        for cd in self._clips.values():
-            times.add(cd.start)
-            if cd.duration > 0:
-                times.add(cd.end)
-            # Include keyframe times from expanded sub-row clips.  Keys
-            # arrive either as legacy "keyframe_times" or inside a
-            # "curve_preview" dict (the form real consumers supply) —
-            # without the latter, next/prev-key navigation skips every
-            # visible key dot and only lands on clip boundaries.
-            if cd.sub_row and cd.track_id in self._expanded_tracks:
-                kf = cd.data.get("keyframe_times")
-                if not kf:
-                    preview = cd.data.get("curve_preview") or {}
-                    kf = preview.get("keys") or []
-                for entry in kf:
-                    times.add(
-                        entry[0] if isinstance(entry, (list, tuple)) else entry
-                    )
-        return sorted(times)
+        return list(self._keys().times)
 
     def go_to_next_key(self):
-        """Jump the playhead to the next clip boundary."""
-        current = self._timeline._scene.playhead.time
-        for t in self._key_times():
-            if t > current + 0.01:
-                self._move_playhead(t)
-                return
+        """Jump the playhead to the next clip boundary, key, or marker."""
+        t = self._keys().next_after(self._timeline._scene.playhead.time, 0.01)
+        if t is not None:
+            self._move_playhead(t)
 
     def go_to_prev_key(self):
-        """Jump the playhead to the previous clip boundary."""
-        current = self._timeline._scene.playhead.time
-        for t in reversed(self._key_times()):
-            if t < current - 0.01:
-                self._move_playhead(t)
-                return
+        """Jump the playhead to the previous clip boundary, key, or marker."""
+        t = self._keys().prev_before(self._timeline._scene.playhead.time, 0.01)
+        if t is not None:
+            self._move_playhead(t)
 
     def go_to_start(self):
         """Jump the playhead to frame 0."""
@@ -1210,7 +1381,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         """Abort any in-progress drag on the timeline.
 
         Iterates scene items, calls their ``cancel_drag`` method, and pops
-        the pre-drag undo snapshot so Escape leaves no spurious undo step.
+        the drag's undo step so Escape leaves no spurious undo step.
         Returns True if something was cancelled.
         """
         scene = self._timeline._scene
@@ -1230,28 +1401,76 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         return cancelled
 
     # -- undo / redo -------------------------------------------------------
-    def _snapshot(self) -> Dict[int, tuple]:
-        """Return a snapshot of all clip positions: ``{clip_id: (start, duration)}``."""
-        return {cid: (cd.start, cd.duration) for cid, cd in self._clips.items()}
-
-    def _capture_undo(self):
-        """Push current clip positions onto the undo stack."""
-        self._undo_stack.append(self._snapshot())
-        if len(self._undo_stack) > self._max_undo:
-            self._undo_stack.pop(0)
+    def _capture_undo(self, clip_ids: Optional[Iterable[int]] = None, merge_key=None):
+        """Record the current geometry of the clips an edit is about to change.
+
+        Parameters
+        ----------
+        clip_ids : iterable of int, optional
+            Clips the edit will move or resize.  Pass an empty tuple for an
+            edit that changes no clips (overlay drags, key deletion) — it
+            still takes an undo step, so ``undo_requested`` consumers see a
+            step to revert.  ``None`` records every clip.
+        merge_key : hashable, optional
+            Continuous edits (one drag) pass the same key on every step;
+            while that step is still on top of the stack, later captures
+            extend it — keeping each clip's first recorded state — rather
+            than pushing.
+
+        Inside an :meth:`undoable` block the capture joins the open step,
+        which the block pushes on exit if it recorded anything.
+        """
+        if clip_ids is None:
+            clip_ids = list(self._clips)
+        if self._undo_recording is not None:
+            self._undo_recording.record(self._clips, clip_ids)
+            return
+        step = merge_target(self._undo_stack, merge_key)
+        if step is None:
+            step = ClipEdit(merge_key)
+            self._undo_stack.append(step)
+            while len(self._undo_stack) > self._max_undo:
+                self._undo_stack.popleft()
+        step.record(self._clips, clip_ids)
         self._redo_stack.clear()
 
-    def _restore_snapshot(self, snapshot: Dict[int, tuple]):
-        """Apply a saved snapshot to all clips."""
-        for cid, (start, dur) in snapshot.items():
-            cd = self._clips.get(cid)
-            if cd is not None:
-                cd.start = start
-                cd.duration = dur
-        self._timeline._refresh_all()
+    @contextmanager
+    def undoable(self, merge_key=None):
+        """Record everything inside the block as one undo step.
+
+        ``add_clip`` and ``remove_clip`` calls are recorded only inside
+        this block (plain calls are the content rebuilds consumers drive
+        through :meth:`clear`), alongside any captured moves::
+
+            with widget.undoable():
+                for cid in doomed:
+                    widget.remove_clip(cid)
+        """
+        if self._undo_recording is not None:  # nested: join the outer step
+            yield
+            return
+        step = merge_target(self._undo_stack, merge_key)
+        merged = step is not None
+        if not merged:
+            step = ClipEdit(merge_key)
+        self._undo_recording = step
+        try:
+            yield
+        finally:
+            self._undo_recording = None
+            if step:  # an empty block takes no step and keeps redo
+                if not merged:
+                    self._undo_stack.append(step)
+                    while len(self._undo_stack) > self._max_undo:
+                        self._undo_stack.popleft()
+                self._redo_stack.clear()
+
+    def _apply_undo_step(self, step: ClipEdit) -> ClipEdit:
+        with self.bulk_updates():  # one scene-rect pass for re-added clips
+            return step.apply(self)
 
     def undo(self):
-        """Revert to the previous clip state.
+        """Revert the most recent clip edit.
 
         Emits :signal:`undo_requested` first.  When a controller handles
         that signal and rebuilds the widget (calling :meth:`clear`), the
@@ -1260,8 +1479,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         self.undo_requested.emit()
         if not self._undo_stack:
             return
-        self._redo_stack.append(self._snapshot())
-        self._restore_snapshot(self._undo_stack.pop())
+        self._redo_stack.append(self._apply_undo_step(self._undo_stack.pop()))
 
     def redo(self):
         """Re-apply a previously undone change.
@@ -1271,8 +1489,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         self.redo_requested.emit()
         if not self._redo_stack:
             return
-        self._undo_stack.append(self._snapshot())
-        self._restore_snapshot(self._redo_stack.pop())
+        self._undo_stack.append(self._apply_undo_step(self._redo_stack.pop()))
 
     # -- snapping -----------------------------------------------------------
     @property
@@ -1383,7 +1600,8 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
     @sub_row_height.setter
     def sub_row_height(self, value: int):
         self._sub_row_height = max(8, value)
-        self._timeline._refresh_all()
+        self._invalidate_rows()
+        self._timeline._refresh_rows()
 
     @property
     def sub_row_provider(self):
@@ -1421,13 +1639,11 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
 
         sub_names = [name for name, _ in sub_row_data]
         self._expanded_tracks[track_id] = sub_names
+        self._invalidate_rows()
 
         # Remove stale sub-row clips for this track
-        stale = [
-            cid
-            for cid, cd in self._clips.items()
-            if cd.track_id == track_id and cd.sub_row
-        ]
+        td = self.get_track(track_id)
+        stale = [cid for cid, cd in td.clips.items() if cd.sub_row] if td else []
         for cid in stale:
             self.remove_clip(cid)
 
@@ -1451,7 +1667,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         idx = self._track_index(track_id)
         if idx is not None:
             self._header.set_track_expanded(idx, sub_names, self._sub_row_height)
-        self._timeline._refresh_all()
+        self._timeline._refresh_rows(idx or 0)
         self.track_expanded.emit(track_id)
 
     def set_bg_curve_preview(
@@ -1479,22 +1695,20 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         if track_id not in self._expanded_tracks:
             return
         self._expanded_tracks.pop(track_id)
+        self._invalidate_rows()
         # Remove background curve previews for this track
         stale_bg = [k for k in self._bg_curve_previews if k[0] == track_id]
         for k in stale_bg:
             del self._bg_curve_previews[k]
         # Remove sub-row clips
-        to_remove = [
-            cid
-            for cid, cd in self._clips.items()
-            if cd.track_id == track_id and cd.sub_row
-        ]
+        td = self.get_track(track_id)
+        to_remove = [cid for cid, cd in td.clips.items() if cd.sub_row] if td else []
         for cid in to_remove:
             self.remove_clip(cid)
         idx = self._track_index(track_id)
         if idx is not None:
             self._header.set_track_collapsed(idx)
-        self._timeline._refresh_all()
+        self._timeline._refresh_rows(idx or 0)
         self.track_collapsed.emit(track_id)
 
     def is_track_expanded(self, track_id: int) -> bool:
@@ -1508,51 +1722,50 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         else:
             self.expand_track(track_id)
 
+    def _invalidate_rows(self) -> None:
+        """Drop the cached row layout after tracks or sub-rows change.
+
+        Call after any change that moves rows: removing a track, expanding
+        or collapsing one, or a new sub-row height.  (``add_track`` extends
+        the cache in place.)
+        """
+        self._row_layout = None
+
+    def _rows(self) -> RowLayout:
+        """Return the row layout, rebuilding it after an invalidation."""
+        layout = self._row_layout
+        if layout is None:
+            layout = self._row_layout = RowLayout(
+                self._tracks, self._expanded_tracks, self._sub_row_height
+            )
+        return layout
+
     def _iter_rows(self):
         """Yield ``(track, sub_name_or_None, y, height)`` for every visual row.
 
-        Single source of the row-layout accumulation (track height +
-        padding + per-sub-row height + padding) — ``_row_position``,
-        ``_total_row_height``, and ``_visual_rows`` are all expressed
-        through it so the metrics can't silently diverge.
+        Rows come from the cached :class:`RowLayout` — the single source of
+        the row-layout accumulation (track height + padding + per-sub-row
+        height + padding) that ``_row_position``, ``_total_row_height``,
+        and ``_visual_rows`` all read, so the metrics can't silently
+        diverge.
         """
-        y = self._content_top
-        for td in self._tracks:
-            yield td, None, y, _TRACK_HEIGHT
-            y += _TRACK_HEIGHT + _TRACK_PADDING
-            for sr in self._expanded_tracks.get(td.track_id, []):
-                yield td, sr, y, self._sub_row_height
-                y += self._sub_row_height + _TRACK_PADDING
+        top = self._content_top
+        for td, sr, y, h in self._rows().rows:
+            yield td, sr, top + y, h
 
     def _row_position(self, track_id: int, sub_row: str = "") -> tuple:
-        """Return ``(y, height)`` for a given track and optional sub-row."""
-        fallback = None
-        for td, sr, y, h in self._iter_rows():
-            if td.track_id != track_id:
-                continue
-            if not sub_row:
-                if sr is None:
-                    return y, h
-            elif sr == sub_row:
-                return y, h
-            # Remember the last row of the matching track: a requested
-            # sub-row that isn't expanded falls through to just after
-            # the track's final row (legacy behavior).
-            fallback = (y + h + _TRACK_PADDING, self._sub_row_height)
-        if sub_row and fallback is not None:
-            return fallback
-        # Past the end — first free y after all rows.
-        end_y = self._content_top
-        for _td, _sr, y, h in self._iter_rows():
-            end_y = y + h + _TRACK_PADDING
-        return end_y, _TRACK_HEIGHT
+        """Return ``(y, height)`` for a given track and optional sub-row.
+
+        A sub-row that isn't expanded falls through to just after the
+        track's final row; an unknown track to the first free y after all
+        rows.
+        """
+        y, h = self._rows().position(track_id, sub_row)
+        return self._content_top + y, h
 
     def _total_row_height(self) -> float:
         """Total pixel height of all tracks including expanded sub-rows."""
-        h = 0.0
-        for _td, _sr, _y, row_h in self._iter_rows():
-            h += row_h + _TRACK_PADDING
-        return h
+        return self._rows().total
 
     def _visual_rows(self) -> List[tuple]:
         """Return ``[(y, height, is_sub_row, track_id), ...]`` for background painting."""
@@ -1563,10 +1776,8 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
 
     def _track_index(self, track_id: int) -> Optional[int]:
         """Return the list index for *track_id*, or None."""
-        for i, td in enumerate(self._tracks):
-            if td.track_id == track_id:
-                return i
-        return None
+        span = self._rows().spans.get(track_id)
+        return None if span is None else span[0]
 
     def _on_header_expand(self, label_idx: int):
         """Handle double-click on a header label to toggle expansion."""
@@ -1631,7 +1842,7 @@ class SequencerWidget(QtWidgets.QSplitter, AttributesMixin):
         if not by_clip:
             return
 
-        self._capture_undo()
+        self._capture_undo(())  # the consumer removes the keys
         for clip_id, times in by_clip.items():
             self.keys_deleted.emit(clip_id, times)
 
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Dict, List, TYPE_CHECKING
 
 from qtpy import QtWidgets, QtGui, QtCore
@@ -20,11 +21,7 @@ from uitk.widgets.sequencer._data import (
     PatternRegistry,
 )
 from uitk.widgets.sequencer._clip import ClipItem
-from uitk.widgets.sequencer._overlays import (
-    _StaticRangeOverlay,
-    _GapOverlayItem,
-    RangeHighlightItem,
-)
+from uitk.widgets.sequencer._overlays import _GapOverlayItem
 from uitk.widgets.sequencer._ruler import RulerItem
 from uitk.widgets.sequencer._playhead import PlayheadItem
 from uitk.widgets.sequencer._markers import MarkerItem
@@ -353,6 +350,18 @@ class TimelineScene(QtWidgets.QGraphicsScene):
 class TimelineView(QtWidgets.QGraphicsView):
     """QGraphicsView providing zoom, pan, and coordinate mapping."""
 
+    _BG_COLOR = "#1E1E1E"
+    _BG_MAIN = ("#262626", "#2A2A2A")  # alternating main-row stripes
+    _BG_SUB = ("#222222", "#252525")  # alternating sub-row stripes
+    _CENTER_LINE = "#3A3A3A"
+    # Row stripes are horizontally uniform, so they are rendered once into
+    # tiles of this size (scene px) and blitted across the exposed width.
+    # Track patterns are not baked in: their spacing is free-form, so they
+    # are painted per exposed row with a scene-anchored brush instead.
+    _BG_TILE_WIDTH = 480
+    _BG_TILE_HEIGHT = 256
+    _BG_TILE_MAX = 32  # LRU bound on cached tiles
+
     def __init__(self, parent_sequencer: "SequencerWidget", parent=None):
         self.parent_sequencer = parent_sequencer
         self._pixels_per_unit = 2.0  # default zoom
@@ -378,6 +387,8 @@ class TimelineView(QtWidgets.QGraphicsView):
         self._marquee_modifier = 0  # modifier held at press time
         self._space_held = False
         self._space_last_pos = QtCore.QPoint()
+        # Background stripe tiles, see _bg_tile.
+        self._bg_tiles: "OrderedDict[tuple, QtGui.QPixmap]" = OrderedDict()
         # Now that the scene/view wiring is complete, sync deferred items
         self._scene.playhead.sync()
         # Keep ruler pinned to the viewport top during vertical scroll
@@ -443,8 +454,8 @@ class TimelineView(QtWidgets.QGraphicsView):
         # Overlay boundingRects depend on viewport height — refresh so
         # the scene index tracks the new geometry, or clicks/repaints in
         # a newly exposed strip miss the gap/range overlays until the
-        # next zoom or clip edit.
-        self._refresh_all()
+        # next zoom or clip edit.  Clip geometry doesn't depend on it.
+        self._refresh_overlays()
 
     # -- zoom ---------------------------------------------------------------
     def wheelEvent(self, event):
@@ -792,16 +803,39 @@ class TimelineView(QtWidgets.QGraphicsView):
 
     # -- internal refresh ---------------------------------------------------
     def _refresh_all(self):
-        for item in self._scene.items():
-            if isinstance(item, ClipItem):
-                item._sync_geometry()
-            elif isinstance(item, MarkerItem):
-                item.sync()
-            elif isinstance(item, RangeHighlightItem):
-                item.sync()
-            elif isinstance(item, (_StaticRangeOverlay, _GapOverlayItem)):
-                item.prepareGeometryChange()
-                item.update()
+        """Re-sync every item's geometry after a zoom or content reset."""
+        sq = self.parent_sequencer
+        for item in sq._clip_items.values():
+            item._sync_geometry()
+        for item in sq._marker_items.values():
+            item.sync()
+        if sq._range_highlight is not None:
+            sq._range_highlight.sync()
+        self._refresh_overlays()
+
+    def _refresh_rows(self, first_track: int = 0):
+        """Re-sync after rows from track index *first_track* down moved.
+
+        Only clips on those tracks (sub-rows included) change position;
+        rows above keep theirs, and markers don't depend on rows.
+        """
+        sq = self.parent_sequencer
+        items = sq._clip_items
+        for td in sq._tracks[first_track:]:
+            for cid in td.clips:
+                item = items.get(cid)
+                if item is not None:
+                    item._sync_geometry()
+        if sq._range_highlight is not None:
+            sq._range_highlight.sync()  # spans the total row height
+        self._refresh_overlays()
+
+    def _refresh_overlays(self):
+        """Re-sync the viewport-height overlays, pinned items and scene rect."""
+        sq = self.parent_sequencer
+        for item in (*sq._range_overlays, *sq._gap_overlays):
+            item.prepareGeometryChange()
+            item.update()
         self._sync_ruler_pos()
         self._scene.playhead.sync()
         self._update_scene_rect()
@@ -809,19 +843,10 @@ class TimelineView(QtWidgets.QGraphicsView):
 
     def _update_scene_rect(self):
         sq = self.parent_sequencer
-        max_end = 100.0
-        for cd in sq._clips.values():
-            max_end = max(max_end, cd.end)
-        for md in sq._markers.values():
-            max_end = max(max_end, md.time)
-        if sq._range_highlight is not None:
-            max_end = max(max_end, sq._range_highlight.end)
-        for gap in sq._gap_overlays:
-            max_end = max(max_end, gap._end)
         visible_right = self.x_to_time(
             self.horizontalScrollBar().value() + self.viewport().width()
         )
-        max_end = max(max_end, visible_right)
+        max_end = max(100.0, sq._content_end(), visible_right)
         w = self.time_to_x(max_end) + self.viewport().width()
         row_h = max(sq._total_row_height(), self.viewport().height() - sq._content_top)
         h = sq._content_top + row_h
@@ -835,72 +860,146 @@ class TimelineView(QtWidgets.QGraphicsView):
         sq._header.setMinimumHeight(int(h + hbar_h))
 
     def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF):
-        painter.fillRect(rect, QtGui.QColor("#1E1E1E"))
+        painter.fillRect(rect, QtGui.QColor(self._BG_COLOR))
         sq = self.parent_sequencer
-        _BG_MAIN = (QtGui.QColor("#262626"), QtGui.QColor("#2A2A2A"))
-        _BG_SUB = (QtGui.QColor("#222222"), QtGui.QColor("#252525"))
-        _CENTER_LINE = QtGui.QColor("#3A3A3A")
-        for i, (y, h, is_sub, track_id) in enumerate(sq._visual_rows()):
-            palette = _BG_SUB if is_sub else _BG_MAIN
-            bg = palette[i % 2]
-            row_rect = QtCore.QRectF(rect.left(), y, rect.width(), h)
-            painter.fillRect(row_rect, bg)
-            if not is_sub:
-                td = sq.get_track(track_id)
-                if td is not None and td.pattern is not None:
-                    PatternRegistry.paint_pattern(painter, row_rect, td.pattern)
-            if is_sub:
-                cy = y + h / 2.0
-                painter.setPen(QtGui.QPen(_CENTER_LINE, 1))
-                painter.drawLine(
-                    QtCore.QPointF(rect.left(), cy),
-                    QtCore.QPointF(rect.right(), cy),
-                )
-                painter.setPen(QtCore.Qt.NoPen)
-
-        # --- full-range background curves for expanded sub-rows ---
-        # Exclude each visible clip rect so curves don't overlap clip-level
-        # curve previews.  The mask follows clips in real-time during drag.
-        bg_previews = getattr(sq, "_bg_curve_previews", {})
-        if bg_previews:
-            painter.save()
-            clip_items = getattr(sq, "_clip_items", {})
-            if clip_items:
-                full = QtGui.QRegion(rect.toAlignedRect())
-                exclude = QtGui.QRegion()
-                for item in clip_items.values():
-                    if item.isVisible():
-                        sr = item.mapToScene(item.boundingRect()).boundingRect()
-                        cr = sr.toAlignedRect()
-                        if not cr.isEmpty():
-                            exclude += QtGui.QRegion(cr)
-                if not exclude.isEmpty():
-                    painter.setClipRegion(full.subtracted(exclude))
-            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-            for (track_id, sub_row), entry in bg_previews.items():
-                preview = entry["preview"]
-                segs = preview.get("segments", [])
-                if not segs:
-                    continue
-                row_y, row_h = sq._row_position(track_id, sub_row)
-                map_y, _is_flat = CurveUtils.make_value_mapper(
-                    row_y,
-                    row_h,
-                    preview.get("val_min", 0.0),
-                    preview.get("val_max", 1.0),
-                )
-                path = CurveUtils.build_curve_path(segs, self.time_to_x, map_y)
-                c = QtGui.QColor(entry.get("color", "#CCCCCC"))
-                c.setAlpha(180)
-                painter.setPen(QtGui.QPen(c, 1.2))
-                painter.setBrush(QtCore.Qt.NoBrush)
-                painter.drawPath(path)
-            painter.restore()
+        layout = sq._rows()
+        top = sq._content_top
+        self._draw_row_stripes(painter, rect, layout, top)
+        self._draw_bg_curves(painter, rect)
 
         ar = sq._active_range
         if ar is not None:
             x0 = self.time_to_x(ar[0])
             x1 = self.time_to_x(ar[1])
-            top = sq._content_top
-            h = max(sq._total_row_height(), self.viewport().height() - top)
+            h = max(layout.total, self.viewport().height() - top)
             painter.fillRect(QtCore.QRectF(x0, top, x1 - x0, h), sq._active_range_color)
+
+    # -- background: row stripes ------------------------------------------
+
+    def _draw_row_stripes(self, painter, rect, layout, top) -> None:
+        """Blit the cached stripe tiles that intersect *rect*, then track patterns."""
+        y0 = max(rect.top(), top)
+        y1 = min(rect.bottom(), top + layout.total)
+        if y1 <= y0:
+            return
+        tw, th = self._BG_TILE_WIDTH, self._BG_TILE_HEIGHT
+        dpr = self.viewport().devicePixelRatioF()
+        for k in range(int((y0 - top) // th), int((y1 - top) // th) + 1):
+            tile_top = top + k * th
+            band_top = max(y0, tile_top)
+            band_bottom = min(y1, tile_top + th)
+            if band_bottom <= band_top:
+                continue
+            painter.drawTiledPixmap(
+                QtCore.QRectF(
+                    rect.left(), band_top, rect.width(), band_bottom - band_top
+                ),
+                self._bg_tile(layout, k, dpr),
+                QtCore.QPointF(rect.left() % tw, band_top - tile_top),
+            )
+        for i in layout.rows_between(y0 - top, y1 - top):
+            td, sr, y, h = layout.rows[i]
+            if sr is None and td.pattern is not None:
+                # Anchored at scene x=0 so the pattern doesn't shift with
+                # the exposed rect.
+                PatternRegistry.paint_pattern(
+                    painter,
+                    QtCore.QRectF(rect.left(), top + y, rect.width(), h),
+                    td.pattern,
+                    origin=QtCore.QPointF(0, top + y),
+                )
+
+    def _bg_tile(self, layout, k: int, dpr: float) -> QtGui.QPixmap:
+        """Return the stripe tile for the *k*-th band of rows, rendering on a miss.
+
+        Keyed by the layout revision and the rows the band covers, so an
+        expand/collapse or a removed or appended track renders a fresh
+        tile.  Zoom and
+        horizontal scroll don't change the stripes; vertical scroll only
+        selects which tiles are blitted.
+        """
+        th = self._BG_TILE_HEIGHT
+        rows = layout.rows_between(k * th, (k + 1) * th)
+        key = (layout.revision, k, rows.start, rows.stop, dpr)
+        tile = self._bg_tiles.get(key)
+        if tile is not None:
+            self._bg_tiles.move_to_end(key)
+            return tile
+        tile = self._render_bg_tile(layout, rows, k * th, dpr)
+        self._bg_tiles[key] = tile
+        if len(self._bg_tiles) > self._BG_TILE_MAX:
+            self._bg_tiles.popitem(last=False)
+        return tile
+
+    def _render_bg_tile(self, layout, rows: range, tile_y: float, dpr: float):
+        tw, th = self._BG_TILE_WIDTH, self._BG_TILE_HEIGHT
+        tile = QtGui.QPixmap(int(tw * dpr), int(th * dpr))
+        tile.setDevicePixelRatio(dpr)
+        tile.fill(QtGui.QColor(self._BG_COLOR))
+        painter = QtGui.QPainter(tile)
+        center_pen = QtGui.QPen(QtGui.QColor(self._CENTER_LINE), 1)
+        for i in rows:
+            _, sr, y, h = layout.rows[i]
+            row_rect = QtCore.QRectF(0, y - tile_y, tw, h)
+            palette = self._BG_MAIN if sr is None else self._BG_SUB
+            painter.fillRect(row_rect, QtGui.QColor(palette[i % 2]))
+            if sr is not None:
+                cy = row_rect.center().y()
+                painter.setPen(center_pen)
+                painter.drawLine(QtCore.QPointF(0, cy), QtCore.QPointF(tw, cy))
+        painter.end()
+        return tile
+
+    # -- background: sub-row curves ---------------------------------------
+
+    def _draw_bg_curves(self, painter, rect) -> None:
+        """Paint full-range background curves for expanded sub-rows.
+
+        Only curves whose row intersects *rect* are drawn; each keeps its
+        path on its preview entry, rebuilt only when the zoom, its row,
+        its value range or its segments list changes.  Clip rects in
+        *rect* are excluded so curves don't overlap clip-level curve
+        previews; the mask follows clips in real-time during drag.
+        """
+        sq = self.parent_sequencer
+        visible = []
+        for (track_id, sub_row), entry in sq._bg_curve_previews.items():
+            preview = entry["preview"]
+            segs = preview.get("segments", [])
+            if not segs:
+                continue
+            row_y, row_h = sq._row_position(track_id, sub_row)
+            if row_y >= rect.bottom() or row_y + row_h <= rect.top():
+                continue
+            val_min = preview.get("val_min", 0.0)
+            val_max = preview.get("val_max", 1.0)
+            key = (self._pixels_per_unit, row_y, row_h, val_min, val_max)
+            cached = entry.get("path")
+            if cached is None or cached[0] is not segs or cached[1] != key:
+                map_y, _is_flat = CurveUtils.make_value_mapper(
+                    row_y, row_h, val_min, val_max
+                )
+                path = CurveUtils.build_curve_path(segs, self.time_to_x, map_y)
+                cached = entry["path"] = (segs, key, path)
+            visible.append((cached[2], entry.get("color", "#CCCCCC")))
+        if not visible:
+            return
+
+        painter.save()
+        exclude = QtGui.QRegion()
+        for item in self._scene.items(rect, QtCore.Qt.IntersectsItemBoundingRect):
+            if isinstance(item, ClipItem) and item.isVisible():
+                cr = item.sceneBoundingRect().toAlignedRect()
+                if not cr.isEmpty():
+                    exclude += QtGui.QRegion(cr)
+        if not exclude.isEmpty():
+            full = QtGui.QRegion(rect.toAlignedRect())
+            painter.setClipRegion(full.subtracted(exclude))
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        for path, color in visible:
+            c = QtGui.QColor(color)
+            c.setAlpha(180)
+            painter.setPen(QtGui.QPen(c, 1.2))
+            painter.drawPath(path)
+        painter.restore()
@@ -0,0 +1,98 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Delta records for the sequencer's built-in undo/redo.
+
+An undo step stores the prior state of only the clips an edit touched,
+so its size (and the cost of capturing, undoing, and redoing it) scales
+with the edit rather than with the timeline.  A clip's recorded state is
+one of:
+
+- ``(start, duration)`` — the clip was moved or resized;
+- ``None`` — the clip did not exist yet (it was added);
+- a :class:`ClipData` copy — the clip was removed.
+
+Applying a step restores those states and returns its inverse, built from
+the same clips' current states, which goes onto the opposite stack.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from uitk.widgets.sequencer._sequencer import SequencerWidget
+
+from uitk.widgets.sequencer._data import ClipData
+
+
+class ClipEdit:
+    """One undo step: the prior state of each clip the edit touched.
+
+    Attributes:
+        states: ``clip_id -> (start, duration) | None | ClipData``; see the
+            module docstring.
+        merge_key: While this step is on top of the undo stack, captures
+            passing an equal key extend it instead of pushing a new step
+            (one step per continuous drag).  ``None`` never merges.
+    """
+
+    __slots__ = ("states", "merge_key")
+
+    def __init__(self, merge_key: Any = None) -> None:
+        self.states: Dict[int, Any] = {}
+        self.merge_key = merge_key
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def record(self, clips: Dict[int, ClipData], clip_ids: Iterable[int]) -> None:
+        """Record the geometry of *clip_ids*, keeping any earlier record."""
+        states = self.states
+        for cid in clip_ids:
+            if cid not in states:
+                cd = clips.get(cid)
+                if cd is not None:
+                    states[cid] = (cd.start, cd.duration)
+
+    def record_added(self, clip_id: int) -> None:
+        self.states.setdefault(clip_id, None)
+
+    def record_removed(self, cd: ClipData) -> None:
+        self.states.setdefault(cd.clip_id, dataclasses.replace(cd))
+
+    def apply(self, sq: "SequencerWidget") -> "ClipEdit":
+        """Restore the recorded states on *sq*; return the inverse step."""
+        inverse = ClipEdit()
+        touched = []
+        for cid, state in self.states.items():
+            cd = sq._clips.get(cid)
+            if isinstance(state, tuple):
+                if cd is None:
+                    continue  # removed outside undo tracking
+                inverse.states[cid] = (cd.start, cd.duration)
+                cd.start, cd.duration = state
+                touched.append(cid)
+            elif state is None:
+                # Added by the edit: take it away again.
+                if cd is not None:
+                    inverse.states[cid] = dataclasses.replace(cd)
+                    sq._detach_clip(cid)
+            elif cd is None and sq._insert_clip(dataclasses.replace(state)):
+                inverse.states[cid] = None  # removed by the edit: put it back
+        sq._touch_keys(touched)
+        for cid in touched:
+            item = sq._clip_items.get(cid)
+            if item is not None:
+                item._sync_geometry()
+                item.update()
+        return inverse
+
+
+def merge_target(stack, merge_key: Any) -> Optional[ClipEdit]:
+    """The top of *stack* when it is still open for *merge_key*, else None."""
+    if merge_key is None or not stack:
+        return None
+    top = stack[-1]
+    if isinstance(top, ClipEdit) and top.merge_key == merge_key:
+        return top
+    return None
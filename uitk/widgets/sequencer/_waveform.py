@@ -0,0 +1,216 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Multi-resolution min/max peak pyramid for clip waveform overlays.
+
+A clip's ``waveform`` envelope (``[(lo, hi), ...]`` in ``-1..1``) is
+reduced once into levels of halving length, each bin holding the min
+and max of the two bins below it.  Rendering ``w`` pixel columns reads
+the coarsest level that still has at least ``w`` bins and folds it to
+exactly ``w`` columns, so a zoom step costs O(w) regardless of how long
+the audio is, and no peak falls between sampled columns.
+
+With numpy, decoding, decimation and rasterizing the columns into an
+image are vectorized; the pure Python fallback produces identical
+columns and draws them one line each.
+
+Example
+-------
+>>> pyramid = WaveformPyramid.from_wav("/path/to/dialog.wav")
+>>> w.add_clip(tid, 0, 240, waveform=pyramid)
+"""
+from __future__ import annotations
+
+import wave
+from typing import Any, List, Sequence, Tuple
+
+from qtpy import QtGui, QtCore
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency; pure Python decimation is used.
+    np = None
+
+
+class WaveformPyramid:
+    """Min/max peak pyramid over a waveform envelope.
+
+    Attributes:
+        levels: ``[(lo, hi), ...]`` from finest (the source envelope) to a
+            single bin.  ``lo`` / ``hi`` are float32 arrays with numpy,
+            float lists without.
+    """
+
+    __slots__ = ("levels",)
+
+    def __init__(self, envelope: Sequence[Tuple[float, float]]) -> None:
+        if np is not None:
+            env = np.asarray(envelope, dtype=np.float32).reshape(-1, 2)
+            lo, hi = env[:, 0].copy(), env[:, 1].copy()
+        else:
+            lo = [float(pair[0]) for pair in envelope]
+            hi = [float(pair[1]) for pair in envelope]
+        self.levels: List[tuple] = [(lo, hi)]
+        while len(lo) > 1:
+            lo, hi = self._halve(lo, hi)
+            self.levels.append((lo, hi))
+
+    def __len__(self) -> int:
+        return len(self.levels[0][0])
+
+    @staticmethod
+    def _halve(lo, hi) -> tuple:
+        """Pairwise min/max; an odd trailing bin carries over unchanged."""
+        if np is not None:
+            starts = np.arange(0, len(lo), 2)
+            return np.minimum.reduceat(lo, starts), np.maximum.reduceat(hi, starts)
+        n = len(lo)
+        return (
+            [min(lo[i : i + 2]) for i in range(0, n, 2)],
+            [max(hi[i : i + 2]) for i in range(0, n, 2)],
+        )
+
+    # -- construction -------------------------------------------------------
+    @classmethod
+    def of(cls, waveform: Any) -> "WaveformPyramid":
+        """*waveform* as a pyramid: returned as-is if it already is one, else built.
+
+        Callers keep the result (``ClipItem`` holds it per clip), so an
+        envelope is reduced once rather than on every paint.
+        """
+        if isinstance(waveform, WaveformPyramid):
+            return waveform
+        return cls(waveform)
+
+    @classmethod
+    def from_samples(cls, samples, block: int = 64) -> "WaveformPyramid":
+        """Build from mono samples in ``-1..1``, one bin per *block* samples."""
+        block = max(1, int(block))
+        if np is not None:
+            samples = np.asarray(samples, dtype=np.float32).ravel()
+            if not len(samples):
+                return cls([])
+            starts = np.arange(0, len(samples), block)
+            lo = np.minimum.reduceat(samples, starts)
+            hi = np.maximum.reduceat(samples, starts)
+            return cls(np.stack([lo, hi], axis=1))
+        samples = list(samples)
+        return cls(
+            [
+                (min(samples[i : i + block]), max(samples[i : i + block]))
+                for i in range(0, len(samples), block)
+            ]
+        )
+
+    @classmethod
+    def from_wav(cls, path: str, block: int = 64) -> "WaveformPyramid":
+        """Decode an 8/16/24/32-bit PCM WAV file; channels are mixed down."""
+        with wave.open(str(path), "rb") as wf:
+            width = wf.getsampwidth()
+            channels = wf.getnchannels()
+            raw = wf.readframes(wf.getnframes())
+        return cls.from_samples(cls._decode_pcm(raw, width, channels), block)
+
+    @staticmethod
+    def _decode_pcm(raw: bytes, width: int, channels: int):
+        """PCM bytes to mono float samples in ``-1..1`` (channel mean)."""
+        if width not in (1, 2, 3, 4):
+            raise ValueError(f"Unsupported WAV sample width: {width} bytes")
+        scale = float(1 << (8 * width - 1))
+        if np is not None:
+            if width == 3:
+                b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+                ints = (b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)) << 8 >> 8
+            elif width == 1:
+                ints = np.frombuffer(raw, dtype=np.uint8).astype(np.int32) - 128
+            else:
+                ints = np.frombuffer(raw, dtype="<i%d" % width)
+            samples = ints.astype(np.float32) / scale
+            return samples.reshape(-1, channels).mean(axis=1)
+        if width == 1:
+            ints = [b - 128 for b in raw]
+        else:
+            ints = [
+                int.from_bytes(raw[i : i + width], "little", signed=True)
+                for i in range(0, len(raw) - width + 1, width)
+            ]
+        return [
+            sum(ints[i : i + channels]) / (channels * scale)
+            for i in range(0, len(ints) - channels + 1, channels)
+        ]
+
+    # -- queries ------------------------------------------------------------
+    def level_for(self, width: int) -> int:
+        """Index of the coarsest level with at least *width* bins (else 0)."""
+        for k in range(len(self.levels) - 1, -1, -1):
+            if len(self.levels[k][0]) >= width:
+                return k
+        return 0
+
+    def columns(self, width: int) -> tuple:
+        """``(lo, hi)`` float lists of exactly *width* pixel columns.
+
+        Column ``c`` covers bins ``[c*n/width, (c+1)*n/width)`` of the
+        chosen level and takes their min/max; when the envelope has fewer
+        bins than columns, each column repeats the bin under it.
+        """
+        lo, hi = self._columns(width)
+        if np is not None:
+            return lo.tolist(), hi.tolist()
+        return lo, hi
+
+    def _columns(self, width: int) -> tuple:
+        """:meth:`columns` as arrays with numpy."""
+        if width < 1 or not len(self):
+            return (np.empty(0), np.empty(0)) if np is not None else ([], [])
+        lo, hi = self.levels[self.level_for(width)]
+        n = len(lo)
+        if np is not None:
+            starts = np.arange(width) * n // width
+            if n < width:
+                return lo[starts], hi[starts]
+            return np.minimum.reduceat(lo, starts), np.maximum.reduceat(hi, starts)
+        if n < width:
+            return (
+                [lo[c * n // width] for c in range(width)],
+                [hi[c * n // width] for c in range(width)],
+            )
+        bounds = [c * n // width for c in range(width + 1)]
+        return (
+            [min(lo[bounds[c] : bounds[c + 1]]) for c in range(width)],
+            [max(hi[bounds[c] : bounds[c + 1]]) for c in range(width)],
+        )
+
+    # -- rendering ----------------------------------------------------------
+    def render(self, width: int, height: int, color: QtGui.QColor) -> QtGui.QPixmap:
+        """A transparent ``width x height`` pixmap with one min/max line per column.
+
+        Values map to ``y = height/2 - v * height/2`` (high values up).
+        """
+        lo, hi = self._columns(width)
+        half = height / 2.0
+        if np is not None:
+            top = np.floor(half - hi * half)
+            bot = np.floor(half - lo * half)
+            rows = np.arange(height)[:, None]
+            mask = (rows >= top) & (rows <= bot)
+            pixels = np.where(mask, np.uint32(color.rgba()), np.uint32(0))
+            # QImage wraps the buffer without copying; keep it alive
+            # until fromImage has copied the pixels out.
+            buf = pixels.tobytes()
+            image = QtGui.QImage(
+                buf,
+                width,
+                height,
+                4 * width,
+                QtGui.QImage.Format_ARGB32,
+            )
+            return QtGui.QPixmap.fromImage(image)
+
+        pixmap = QtGui.QPixmap(width, height)
+        pixmap.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(pixmap)
+        p.setPen(QtGui.QPen(color, 1))
+        for col, (bot, top) in enumerate(zip(lo, hi)):
+            p.drawLine(col, int(half - top * half), col, int(half - bot * half))
+        p.end()
+        return pixmap
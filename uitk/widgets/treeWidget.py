@@ -1234,6 +1234,7 @@ class TreeWidget(
             icon = IconManager.get(icon_name, size=(16, 16), color=color)
             item.setIcon(0, icon)
             # Store icon info for theme updates
+            IconManager.register_icon_tree(self)
             item.setData(
                 0,
                 QtCore.Qt.UserRole + 100,
@@ -1262,6 +1263,7 @@ class TreeWidget(
             icon = IconManager.get(icon_name, size=(16, 16), color=color)
             item.setIcon(column, icon)
             # Store icon info for theme updates
+            IconManager.register_icon_tree(self)
             item.setData(
                 column,
                 QtCore.Qt.UserRole + 100,